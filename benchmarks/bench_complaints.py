@@ -0,0 +1,88 @@
+"""
+불만 유형 분류 벤치마크
+one_star_review.ipynb의 행 단위 classify_complaint(apply)와 컴파일된 ComplaintClassifier 비교
+
+실행: python benchmarks/bench_complaints.py [--input data/review_ko/one_star_reviews_translated.csv] [--scale 5]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.complaints import COMPLAINT_KEYWORDS, OTHER_LABEL, ComplaintClassifier, complaint_types_to_str
+
+
+def classify_complaint(text):
+    """노트북 Step 4 구현 (다중 라벨)"""
+    if pd.isna(text):
+        return []
+
+    text = str(text).lower()
+    categories = []
+
+    for category, keywords in COMPLAINT_KEYWORDS.items():
+        if any(keyword in text for keyword in keywords):
+            categories.append(category)
+
+    return categories if categories else [OTHER_LABEL]
+
+
+def notebook_classify(texts: pd.Series) -> pd.Series:
+    """apply + ', '.join (complaint_types_str 저장까지)"""
+    return texts.apply(classify_complaint).apply(lambda x: ', '.join(x) if x else float('nan'))
+
+
+def time_call(func, *args, repeat: int = 3, **kwargs) -> float:
+    """repeat회 실행 중 최소 시간(초)"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args, **kwargs)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--input', type=Path,
+                        default=Path(__file__).parent.parent / "data" / "review_ko" / "one_star_reviews_translated.csv")
+    parser.add_argument('--column', default='message_ko')
+    parser.add_argument('--scale', type=int, default=5, help="텍스트를 이 배수만큼 복제 (전체 리뷰 규모 흉내)")
+    parser.add_argument('--n-jobs', type=int, default=2)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    texts = pd.read_csv(args.input, encoding='utf-8-sig')[args.column]
+    # 복제본마다 접미사를 붙여 고유 텍스트 수도 늘림 (중복 제거 효과 제외)
+    scaled = pd.concat([texts + f" #{i}" for i in range(args.scale)], ignore_index=True)
+
+    classifier = ComplaintClassifier()
+
+    # 결과 일치 확인
+    expected = notebook_classify(texts)
+    actual = complaint_types_to_str(classifier.classify(texts))
+    mismatch = (expected.fillna('') != actual.fillna('')).sum()
+    if mismatch:
+        print(f"❌ 분류 결과 불일치: {mismatch:,d}건")
+        sys.exit(1)
+    print("✅ 노트북 분류 결과와 일치\n")
+
+    print(f"{'dataset':>16s} | {'apply':>8s} | {'compiled':>8s} | {f'n_jobs={args.n_jobs}':>8s} | {'speedup':>7s}")
+    print("-" * 62)
+
+    for label, data in ((f'{len(texts):,d}', texts), (f'{len(scaled):,d} ({args.scale}x)', scaled)):
+        legacy = time_call(notebook_classify, data, repeat=args.repeat)
+        compiled = time_call(classifier.classify, data, repeat=args.repeat)
+        parallel = time_call(classifier.classify, data, repeat=args.repeat,
+                             n_jobs=args.n_jobs, chunksize=max(len(data) // args.n_jobs, 1))
+        print(f"{label:>16s} | {legacy:>7.3f}s | {compiled:>7.3f}s | {parallel:>7.3f}s | "
+              f"{legacy / min(compiled, parallel):>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
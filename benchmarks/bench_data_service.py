@@ -0,0 +1,114 @@
+"""
+상주 데이터 서비스 벤치마크
+스크립트 하나가 프레임을 얻는 시간 비교
+- cold    : 새 프로세스처럼 load_all_tables(Parquet 캐시) + src.master 단계 계산
+- service : scripts/data_service.py 서비스에서 Arrow IPC로 받아오기
+
+실행: python benchmarks/bench_data_service.py [--scale 1] [--clients 4]
+"""
+
+import argparse
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from benchmarks.synthetic import ensure_olist
+from src.data_loader import load_all_tables
+from src.data_service import DataServiceClient, build_derived_frames
+
+FRAMES = ['orders', 'order_reviews', 'master_orders', 'master_sellers']
+
+
+def time_call(func, *args, repeat: int = 3, **kwargs) -> float:
+    """repeat회 실행 중 최소 시간(초)"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args, **kwargs)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def cold_frame(data_path: Path, name: str) -> pd.DataFrame:
+    tables = load_all_tables(data_path, verbose=False, lazy=True)
+    if name in tables:
+        return tables[name]
+    return build_derived_frames(tables, [name])[name]
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def start_service(data_path: Path, port: int) -> subprocess.Popen:
+    root = Path(__file__).resolve().parent.parent
+    proc = subprocess.Popen([sys.executable, str(root / 'scripts' / 'data_service.py'),
+                             '--data-path', str(data_path), '--port', str(port), '--quiet'],
+                            cwd=root, stdout=subprocess.DEVNULL)
+    client = DataServiceClient(f"http://127.0.0.1:{port}")
+    start = time.perf_counter()
+    while not client.is_available():
+        if proc.poll() is not None or time.perf_counter() - start > 300:
+            raise RuntimeError("서비스 시작 실패")
+        time.sleep(0.2)
+    return proc
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--data-path', type=Path, default=None, help="지정하지 않으면 합성 데이터 사용")
+    parser.add_argument('--scale', type=float, default=1.0)
+    parser.add_argument('--clients', type=int, default=4, help="동시 요청 수")
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    data_path = args.data_path or ensure_olist(
+        Path(tempfile.gettempdir()) / "olist_synthetic" / f"sf{args.scale:g}", scale=args.scale)
+    load_all_tables(data_path, verbose=False)   # Parquet 캐시 준비
+
+    port = free_port()
+    start = time.perf_counter()
+    proc = start_service(data_path, port)
+    print(f"📂 {data_path}, 서비스 준비 {time.perf_counter() - start:.2f}s (1회)\n")
+    client = DataServiceClient(f"http://127.0.0.1:{port}")
+    try:
+        # 1) 결과 일치 확인
+        for name in FRAMES:
+            pd.testing.assert_frame_equal(client.frame(name), cold_frame(data_path, name))
+        print(f"✅ {', '.join(FRAMES)} 일치\n")
+
+        # 2) 프레임별 시간
+        print(f"{'frame':>15s} | {'cold':>8s} | {'service':>8s} | {'speedup':>7s}")
+        print("-" * 48)
+        for name in FRAMES:
+            cold = time_call(cold_frame, data_path, name, repeat=args.repeat)
+            warm = time_call(client.frame, name, repeat=args.repeat)
+            print(f"{name:>15s} | {cold:>7.3f}s | {warm:>7.3f}s | {cold / warm:>6.1f}x")
+
+        # 3) 동시 요청 (각 클라이언트가 FRAMES 전체를 받음)
+        def fetch_all(_):
+            return [client.frame(name).shape for name in FRAMES]
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(args.clients) as executor:
+            shapes = list(executor.map(fetch_all, range(args.clients)))
+        elapsed = time.perf_counter() - start
+        assert all(s == shapes[0] for s in shapes)
+        print(f"\n🔀 동시 클라이언트 {args.clients}개 × 프레임 {len(FRAMES)}개: {elapsed:.3f}s")
+    finally:
+        client.shutdown()
+        proc.wait(timeout=30)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+convert_to_datetime 벤치마크
+기존 방식(전체 복사 + 포맷 추론)과 fast 모드(고정 포맷 + 고유값 1회 파싱)의
+orders 테이블 5개 타임스탬프 컬럼 변환 시간/최대 메모리 비교
+
+실행: python benchmarks/bench_datetime.py [--data-path data/processed_v2]
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.data_loader import DATA_PATH, read_table
+from src.utils import convert_to_datetime
+
+
+DATE_COLUMNS = [
+    'order_purchase_timestamp',
+    'order_approved_at',
+    'order_delivered_carrier_date',
+    'order_delivered_customer_date',
+    'order_estimated_delivery_date'
+]
+
+
+def measure(func, repeat: int = 3):
+    """(최소 실행 시간 초, 최대 추가 메모리 MB)"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak / 1024**2
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--data-path', type=Path, default=DATA_PATH)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    # 스키마 미적용(문자열) 상태의 orders로 비교
+    orders = read_table('orders', args.data_path, typed=False)
+    print(f"orders: {len(orders):,d} rows\n")
+
+    cases = {
+        'legacy (copy + infer)': lambda: convert_to_datetime(orders, DATE_COLUMNS, verbose=False),
+        'fast': lambda: convert_to_datetime(orders, DATE_COLUMNS, fast=True, verbose=False),
+        'fast + inplace': lambda: convert_to_datetime(orders.copy(deep=False), DATE_COLUMNS,
+                                                      fast=True, inplace=True, verbose=False),
+    }
+
+    print(f"{'mode':>22s} | {'time':>8s} | {'peak mem':>9s}")
+    print("-" * 46)
+    for label, func in cases.items():
+        elapsed, peak = measure(func, repeat=args.repeat)
+        print(f"{label:>22s} | {elapsed:>7.3f}s | {peak:>6.1f} MB")
+
+    _, report = convert_to_datetime(orders, DATE_COLUMNS, fast=True, verbose=False, return_report=True)
+    print(f"\nNaT로 변환된 값: {report}")
+
+
+if __name__ == "__main__":
+    main()
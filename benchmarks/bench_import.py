@@ -0,0 +1,96 @@
+"""
+import 시간 벤치마크
+새 인터프리터(subprocess)에서 src 모듈 import 시간과 첫 테이블 로드까지 시간을 측정하고 예산 확인
+
+- 예산: pandas import 시간 + --overhead-ms (src 모듈이 pandas 위에 더하는 시간 제한)
+- import만으로 불러오면 안 되는 모듈(matplotlib/seaborn/multiprocessing/선택 의존성) 확인
+- 예산을 넘거나 금지 모듈이 로드되면 exit 1
+
+실행: python benchmarks/bench_import.py [--repeat 5] [--overhead-ms 150] [--scale 0.1]
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# import만으로 로드되면 안 되는 모듈 (처음 쓰는 함수에서 import)
+FORBIDDEN_MODULES = ['matplotlib', 'seaborn', 'multiprocessing', 'duckdb', 'transformers', 'deep_translator']
+
+# 예산을 확인할 대상 (이름, import 문)
+BUDGETED = {
+    'src.data_loader': "import src.data_loader",
+    'src.utils': "import src.utils",
+}
+
+CHILD_CODE = """
+import json, sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(json.dumps({{'seconds': elapsed, 'modules': sorted(sys.modules)}}))
+"""
+
+
+def measure(statement: str, repeat: int) -> dict:
+    """새 인터프리터에서 statement 실행 시간 (repeat회 중 최소) + 로드된 모듈 목록"""
+    best = None
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, '-c', CHILD_CODE.format(statement=statement)],
+                                cwd=ROOT, capture_output=True, text=True, check=True).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        if best is None or result['seconds'] < best['seconds']:
+            best = result
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--overhead-ms', type=float, default=150.0,
+                        help="pandas import 대비 허용하는 추가 시간 (ms)")
+    parser.add_argument('--data-path', type=Path, default=None, help="첫 테이블 로드 측정용 (기본: 합성 데이터)")
+    parser.add_argument('--scale', type=float, default=0.1)
+    args = parser.parse_args()
+
+    from benchmarks.synthetic import ensure_olist
+    from src.data_loader import read_table
+
+    data_path = args.data_path or ensure_olist(
+        Path(tempfile.gettempdir()) / "olist_synthetic" / f"sf{args.scale:g}", scale=args.scale)
+    read_table('orders', data_path)   # Parquet 캐시 준비
+
+    baseline = measure("import pandas", args.repeat)['seconds']
+    budget = baseline + args.overhead_ms / 1000
+    print(f"🐼 import pandas: {baseline * 1000:.0f}ms → 예산 {budget * 1000:.0f}ms (+{args.overhead_ms:.0f}ms)\n")
+
+    cases = dict(BUDGETED)
+    cases['first table'] = (f"from src.data_loader import read_table; "
+                            f"read_table('orders', {str(data_path)!r})")
+
+    failed = False
+    print(f"{'target':>16s} | {'time':>8s} | {'budget':>6s} | forbidden")
+    print("-" * 56)
+    for name, statement in cases.items():
+        result = measure(statement, args.repeat)
+        loaded = [m for m in FORBIDDEN_MODULES if m in result['modules']]
+        over = name in BUDGETED and result['seconds'] > budget
+        status = ('❌' if over else '✅') if name in BUDGETED else '  '
+        print(f"{name:>16s} | {result['seconds'] * 1000:>6.0f}ms | {status:>6s} | "
+              f"{', '.join(loaded) if loaded else '-'}")
+        failed = failed or over or bool(loaded)
+
+    if failed:
+        print("\n❌ import 예산 초과 또는 금지 모듈 로드")
+        sys.exit(1)
+    print("\n✅ import 예산 통과")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+계측 오버헤드 벤치마크
+src.instrument 데코레이터를 끈 상태/켠 상태(시간만, 메모리 포함)와 원래 함수(__wrapped__) 비교
+
+실행: python benchmarks/bench_instrument.py --data-path /tmp/olist_sf1
+      (합성 데이터: python benchmarks/synthetic.py --scale 1 --output /tmp/olist_sf1)
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src import data_loader, utils
+from src.instrument import instrument, print_summary
+from src.data_loader import DATA_PATH
+
+
+def time_call(func, *args, repeat: int = 3, **kwargs) -> float:
+    """repeat회 실행 중 최소 시간(초)"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args, **kwargs)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def pipeline(data_path: Path, raw: bool = False):
+    """로드 → 관계 검증 → 시간 차이 → 품질/통계 (raw=True면 계측 없는 원래 함수)"""
+    get = (lambda f: f.__wrapped__) if raw else (lambda f: f)
+    tables = get(data_loader.load_all_tables)(data_path, verbose=False)
+    get(data_loader.validate_relationships)(tables)
+    orders = get(utils.calculate_time_diffs)(tables['orders'])
+    get(utils.check_data_quality)(orders, 'orders')
+    items = tables['order_items']
+    get(utils.calculate_summary_stats_batch)(items, ['price', 'freight_value'], groupby='seller_id')
+    get(utils.detect_outliers_iqr_batch)(items, ['price', 'freight_value'])
+    get(utils.safe_divide)(items['freight_value'], items['price'])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--data-path', type=Path, default=DATA_PATH)
+    parser.add_argument('--calls', type=int, default=200_000, help="호출당 오버헤드 측정 반복 수")
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    # 호출당 오버헤드: 가장 가벼운 함수(percentage)로 측정
+    def loop(func):
+        for i in range(args.calls):
+            func(i, 7)
+
+    raw = time_call(loop, utils.percentage.__wrapped__, repeat=args.repeat) / args.calls
+    off = time_call(loop, utils.percentage, repeat=args.repeat) / args.calls
+    print(f"📏 호출당 오버헤드 (계측 꺼짐): {(off - raw) * 1e9:,.0f} ns "
+          f"(percentage {raw * 1e9:,.0f} ns → {off * 1e9:,.0f} ns)\n")
+
+    pipeline(args.data_path)  # Parquet 캐시 준비
+    results = {
+        'original': time_call(pipeline, args.data_path, raw=True, repeat=args.repeat),
+        'off': time_call(pipeline, args.data_path, repeat=args.repeat),
+    }
+    with instrument(track_memory=False):
+        results['on (time)'] = time_call(pipeline, args.data_path, repeat=args.repeat)
+    with instrument(track_memory=True) as events:
+        results['on (time+memory)'] = time_call(pipeline, args.data_path, repeat=args.repeat)
+
+    print(f"{'mode':>18s} | {'seconds':>8s} | {'overhead':>8s}")
+    print("-" * 42)
+    for mode, seconds in results.items():
+        print(f"{mode:>18s} | {seconds:>7.3f}s | {(seconds / results['original'] - 1) * 100:>7.1f}%")
+
+    print_summary(events, top=10)
+
+
+if __name__ == "__main__":
+    main()
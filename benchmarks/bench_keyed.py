@@ -0,0 +1,123 @@
+"""
+정수 key 조인 벤치마크
+one_star_review.ipynb Step 7~10의 문자열 order_id merge 반복과 KeyedTables(전역 사전 + key 인덱스) 조인 비교
+
+실행: python benchmarks/bench_keyed.py [--data-path data/processed_v2] [--score 1] [--repeat 3]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.data_loader import DATA_PATH, load_all_tables
+from src.keyed import (
+    TIMELINE_ORDER_COLUMNS, TIMELINE_REVIEW_COLUMNS, KeyedTables,
+    attach_complaint_types, build_one_star_timeline
+)
+from src.master import run_steps
+
+# Step 8 / 9 / 10이 각각 타임라인에 불만 유형을 다시 붙이는 횟수
+N_ANALYSES = 3
+
+
+def notebook_timeline(translated: pd.DataFrame, reviews: pd.DataFrame, master_orders: pd.DataFrame) -> pd.DataFrame:
+    """노트북 Step 7 (merge 2회 + pd.to_datetime + .dt.days)"""
+    df = translated.merge(
+        reviews[['order_id'] + TIMELINE_REVIEW_COLUMNS], on='order_id', how='inner'
+    ).merge(
+        master_orders[['order_id'] + TIMELINE_ORDER_COLUMNS], on='order_id', how='inner'
+    )
+    df['order_purchase'] = pd.to_datetime(df['order_purchase_timestamp'])
+    df['order_delivered'] = pd.to_datetime(df['order_delivered_customer_date'])
+    df['order_estimated'] = pd.to_datetime(df['order_estimated_delivery_date'])
+    df['survey_sent'] = pd.to_datetime(df['review_creation_date'])
+    df['review_answered'] = pd.to_datetime(df['review_answer_timestamp'])
+    df['days_order_to_answer'] = (df['review_answered'] - df['order_purchase']).dt.days
+    df['days_delivery_to_answer'] = (df['review_answered'] - df['order_delivered']).dt.days
+    df['days_survey_to_answer'] = (df['review_answered'] - df['survey_sent']).dt.days
+    return df
+
+
+def notebook_session(translated, reviews, master_orders, classified):
+    """Step 7 타임라인 + Step 8~10 분석마다 불만 유형 left merge"""
+    timeline = notebook_timeline(translated, reviews, master_orders)
+    for _ in range(N_ANALYSES):
+        timeline.merge(classified[['order_id', 'complaint_types_str']], on='order_id', how='left')
+    return timeline
+
+
+def keyed_session(translated, reviews, master_orders, classified, keyed=None):
+    """같은 과정을 KeyedTables로 (keyed를 넘기면 인코딩/인덱스 재사용)"""
+    keyed = KeyedTables() if keyed is None else keyed
+    timeline = build_one_star_timeline(translated, reviews, master_orders, keyed)
+    if 'classified' not in keyed:
+        keyed.register('classified', classified)
+    for _ in range(N_ANALYSES):
+        attach_complaint_types(keyed, 'timeline', 'classified')
+    return timeline
+
+
+def time_call(func, *args, repeat: int = 3, **kwargs) -> float:
+    """repeat회 실행 중 최소 시간(초)"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args, **kwargs)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--data-path', type=Path, default=DATA_PATH)
+    parser.add_argument('--score', type=int, default=1, help="타임라인을 만들 리뷰 점수")
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    tables = load_all_tables(args.data_path, verbose=False)
+    missing = sorted(name for name in ('orders', 'order_items', 'order_payments', 'order_reviews', 'customers')
+                     if tables.get(name) is None)
+    if missing:
+        print(f"❌ 테이블 없음: {', '.join(missing)} ({args.data_path})")
+        sys.exit(1)
+
+    reviews = tables['order_reviews']
+    master_orders = run_steps(tables, ['master_orders'])['master_orders']
+    # 번역 CSV 대신 원문을 그대로 message_ko로 사용 (조인 비용만 비교)
+    translated = reviews.loc[reviews['review_score'] == args.score,
+                             ['order_id', 'review_comment_title', 'review_comment_message']]
+    translated = translated.assign(message_ko=translated['review_comment_message'],
+                                   title_ko=translated['review_comment_title'])
+    classified = translated[['order_id']].drop_duplicates().assign(complaint_types_str='기타')
+
+    # 결과 일치 확인
+    expected = notebook_timeline(translated, reviews, master_orders)
+    actual = build_one_star_timeline(translated, reviews, master_orders)
+    try:
+        pd.testing.assert_frame_equal(expected.reset_index(drop=True), actual, check_dtype=False)
+    except AssertionError as e:
+        print(f"❌ 타임라인 불일치: {e}")
+        sys.exit(1)
+    print(f"✅ 노트북 타임라인과 일치 ({len(actual):,d}행)\n")
+
+    inputs = (translated, reviews, master_orders, classified)
+    warm = KeyedTables()
+    keyed_session(*inputs, keyed=warm)
+
+    legacy = time_call(notebook_session, *inputs, repeat=args.repeat)
+    cold = time_call(keyed_session, *inputs, repeat=args.repeat)
+    reuse = time_call(keyed_session, *inputs, keyed=warm, repeat=args.repeat)
+
+    print(f"{'step 7 + 8~10':>16s} | {'merge':>8s} | {'keyed':>8s} | {'reuse':>8s} | {'speedup':>7s}")
+    print("-" * 62)
+    print(f"{f'{len(translated):,d} reviews':>16s} | {legacy:>7.3f}s | {cold:>7.3f}s | {reuse:>7.3f}s | "
+          f"{legacy / cold:>5.1f}x / {legacy / reuse:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
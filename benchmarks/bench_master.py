@@ -0,0 +1,131 @@
+"""
+마스터 테이블 빌드 벤치마크
+src.master 월 파티션 빌드(전체/증분)와 기간 조회(load_master_sellers start/end)를 측정하고,
+기간 조회 결과가 load_master_orders(start, end) 주문만으로 다시 집계한 값과 같은지,
+입력(리뷰 한 건, 판매자 도시)을 바꾼 뒤 증분 빌드 결과가 전체 빌드와 같은지 확인
+
+실행: python benchmarks/bench_master.py [--scale 1] [--data-path data/processed_v2]
+      (합성 데이터는 benchmarks/synthetic.py로 생성/재사용)
+"""
+
+import argparse
+import contextlib
+import io
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict
+
+import pandas as pd
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from benchmarks.synthetic import ensure_olist
+from src.data_loader import load_all_tables
+from src.master import (BEGIN2017, _seller_month, build_master_tables, combine_seller_partials,
+                        load_master_orders, load_master_sellers, run_steps)
+
+# (start, end) 조회 범위 - 월 첫날 경계 / 월 중간 경계 / 한쪽만
+RANGES = [
+    (BEGIN2017, '2018-01-01'),
+    ('2017-03-15', '2017-11-20 12:00:00'),
+    (BEGIN2017, None),
+    (None, '2017-07-01'),
+]
+
+
+def expected_sellers(order_seller: pd.DataFrame, sellers: pd.DataFrame, store_path: Path,
+                     start, end) -> pd.DataFrame:
+    """load_master_orders(start, end)에 있는 주문의 (주문, 판매자) 행만 다시 집계"""
+    order_ids = load_master_orders(start, end, store_path=store_path)['order_id']
+    in_range = order_seller[order_seller['order_id'].isin(order_ids)]
+    return combine_seller_partials(_seller_month(in_range), sellers)
+
+
+def assert_sellers_equal(actual: pd.DataFrame, expected: pd.DataFrame) -> None:
+    actual = actual.set_index('seller_id').sort_index()
+    expected = expected.set_index('seller_id').sort_index()
+    pd.testing.assert_frame_equal(actual, expected[actual.columns], check_dtype=False,
+                                  check_categorical=False, check_index_type=False)
+
+
+def modified_tables(tables: Dict[str, pd.DataFrame]) -> Dict[str, pd.DataFrame]:
+    """리뷰 점수 한 건과 판매자 한 명의 도시를 바꾼 테이블 (증분 빌드 확인용)"""
+    changed = dict(tables)
+    reviews = tables['order_reviews'].copy()
+    reviews.loc[reviews.index[0], 'review_score'] = 6 - reviews['review_score'].iloc[0]
+    changed['order_reviews'] = reviews
+    sellers = tables['sellers'].copy()
+    sellers['seller_city'] = sellers['seller_city'].astype(object)
+    sellers.loc[sellers.index[0], 'seller_city'] = 'bench city'
+    changed['sellers'] = sellers
+    return changed
+
+
+def time_call(func, *args, repeat: int = 3, **kwargs) -> float:
+    """repeat회 실행 중 최소 시간(초)"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args, **kwargs)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--data-path', type=Path, default=None, help="지정하지 않으면 합성 데이터 사용")
+    parser.add_argument('--scale', type=float, default=1.0)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    data_path = args.data_path or ensure_olist(
+        Path(tempfile.gettempdir()) / "olist_synthetic" / f"sf{args.scale:g}", scale=args.scale)
+    tables = load_all_tables(data_path, verbose=False)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store_path = Path(tmp) / "master"
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            build_master_tables(tables, store_path=store_path)
+        full_build = time.perf_counter() - start
+        print(f"📂 {data_path}, 전체 빌드 {full_build:.2f}s\n")
+
+        # 1) 기간 조회 결과 확인
+        order_seller = run_steps(tables, ['order_seller'])['order_seller']
+        for range_start, range_end in RANGES:
+            actual = load_master_sellers(range_start, range_end, store_path=store_path,
+                                         sellers=tables['sellers'])
+            expected = expected_sellers(order_seller, tables['sellers'], store_path, range_start, range_end)
+            assert_sellers_equal(actual, expected)
+            print(f"✅ [{range_start}, {range_end}): 판매자 {len(actual):,d}명 일치")
+
+        # 2) 입력 변경 후 증분 빌드 == 전체 빌드
+        changed = modified_tables(tables)
+        incremental_store = Path(tmp) / "incremental"
+        full_store = Path(tmp) / "full"
+        with contextlib.redirect_stdout(io.StringIO()):
+            build_master_tables(tables, store_path=incremental_store)
+            result = build_master_tables(changed, store_path=incremental_store)
+            build_master_tables(changed, store_path=full_store)
+        assert result['seller_info'] and len(result['rebuilt']) == 1, result
+        for range_start, range_end in [(None, None), *RANGES]:
+            assert_sellers_equal(load_master_sellers(range_start, range_end, store_path=incremental_store),
+                                 load_master_sellers(range_start, range_end, store_path=full_store))
+        print(f"✅ 증분 빌드 (재계산 {result['rebuilt']}, 판매자 정보 갱신) == 전체 빌드")
+
+        # 3) 시간
+        print(f"\n{'task':>40s} | {'time':>8s}")
+        print("-" * 52)
+        with contextlib.redirect_stdout(io.StringIO()):
+            incremental = time_call(build_master_tables, tables, store_path=store_path, repeat=args.repeat)
+        print(f"{'build (변경 없음)':>40s} | {incremental:>7.3f}s")
+        for range_start, range_end in RANGES:
+            elapsed = time_call(load_master_sellers, range_start, range_end, store_path=store_path,
+                                sellers=tables['sellers'], repeat=args.repeat)
+            print(f"{f'sellers [{range_start}, {range_end})':>40s} | {elapsed:>7.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+메모이제이션 벤치마크
+src.derived 파생 프레임을 매번 계산할 때와 src.memo 캐시(메모리/디스크 계층)에서 받을 때 비교
+(캐시 적중 시간에는 입력 프레임 digest 계산이 포함됨)
+
+실행: python benchmarks/bench_memo.py [--scale 1]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from benchmarks.synthetic import ensure_olist
+from src import memo
+from src.complaints import COMPLAINT_KEYWORDS, OTHER_LABEL, TYPES_SEPARATOR
+from src.data_loader import load_all_tables
+from src.derived import clean_products, delivered_orders, explode_complaint_types, review_with_text
+from src.master import run_steps
+
+
+def time_call(func, *args, repeat: int = 3, **kwargs) -> float:
+    """repeat회 실행 중 최소 시간(초)"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args, **kwargs)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def complaint_frame(order_reviews: pd.DataFrame, seed: int = 42) -> pd.DataFrame:
+    """1점 리뷰에 불만 유형 문자열을 임의로 붙인 분류 결과 흉내"""
+    rng = np.random.default_rng(seed)
+    labels = np.array(list(COMPLAINT_KEYWORDS) + [OTHER_LABEL], dtype=object)
+    reviews = order_reviews.loc[order_reviews['review_score'] == 1, ['order_id', 'review_id']].reset_index(drop=True)
+    n_types = rng.integers(1, 4, size=len(reviews))
+    reviews['complaint_types_str'] = [TYPES_SEPARATOR.join(rng.choice(labels, size=k, replace=False))
+                                      for k in n_types]
+    return reviews
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--data-path', type=Path, default=None, help="지정하지 않으면 합성 데이터 사용")
+    parser.add_argument('--scale', type=float, default=1.0)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    data_path = args.data_path or ensure_olist(
+        Path(tempfile.gettempdir()) / "olist_synthetic" / f"sf{args.scale:g}", scale=args.scale)
+    tables = load_all_tables(data_path, verbose=False)
+    master_orders = run_steps(tables, ['master_orders'])['master_orders']
+    complaints = complaint_frame(tables['order_reviews'])
+
+    cases = {
+        'delivered_orders': (delivered_orders, (tables['orders'],)),
+        'clean_products': (clean_products, (tables['products'],)),
+        'review_with_text': (review_with_text, (master_orders, tables['order_reviews'])),
+        'explode_complaints': (explode_complaint_types, (complaints,)),
+    }
+
+    with tempfile.TemporaryDirectory() as disk_path:
+        cache = memo.MemoCache(disk_path=Path(disk_path))
+        memo._DEFAULT_CACHE = cache
+        print(f"📂 {data_path}\n")
+        print(f"{'derivation':>18s} | {'compute':>8s} | {'memory':>8s} | {'disk':>8s} | {'speedup':>7s}")
+        print("-" * 64)
+        for name, (func, inputs) in cases.items():
+            expected = func.__wrapped__(*inputs)
+            pd.testing.assert_frame_equal(func(*inputs), expected)   # 미적중 → 저장
+            pd.testing.assert_frame_equal(func(*inputs), expected)   # 메모리 적중
+
+            compute = time_call(func.__wrapped__, *inputs, repeat=args.repeat)
+            hit = time_call(func, *inputs, repeat=args.repeat)
+
+            # 메모리 계층을 비우고 디스크 계층에서 읽기
+            key = func.cache_key(*inputs)
+            cache._write_disk(key, expected)
+            disk = float('inf')
+            for _ in range(args.repeat):
+                cache.clear()
+                start = time.perf_counter()
+                pd.testing.assert_frame_equal(func(*inputs), expected) if _ == 0 else func(*inputs)
+                disk = min(disk, time.perf_counter() - start)
+            print(f"{name:>18s} | {compute:>7.3f}s | {hit:>7.3f}s | {disk:>7.3f}s | {compute / hit:>6.1f}x")
+
+        info = cache.info()
+        print(f"\n🎯 적중 {info['hits']} / 디스크 적중 {info['disk_hits']} / 미적중 {info['misses']}")
+
+
+if __name__ == "__main__":
+    main()
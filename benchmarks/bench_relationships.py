@@ -0,0 +1,90 @@
+"""
+check_relationships 벤치마크
+기존 Python set 방식과 벡터화 검증(validate_relationships)의 실행 시간 비교
+
+실행: python benchmarks/bench_relationships.py [--data-path data/processed_v2] [--scale 10]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Dict
+
+import pandas as pd
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.data_loader import DATA_PATH, RELATIONSHIP_CHECKS, load_all_tables, validate_relationships
+
+
+KEY_COLUMNS = ['order_id', 'customer_id', 'product_id', 'seller_id']
+
+
+def legacy_check_relationships(tables: Dict[str, pd.DataFrame]) -> Dict[str, int]:
+    """기존 구현: 검증마다 key 컬럼으로 Python set을 만들어 차집합"""
+    result = {}
+    for check in RELATIONSHIP_CHECKS:
+        parent_keys = set(tables[check['parent']][check['key']].dropna())
+        child_keys = set(tables[check['child']][check['key']].dropna())
+        result[check['name']] = len(parent_keys - child_keys)
+    return result
+
+
+def replicate_tables(tables: Dict[str, pd.DataFrame], scale: int) -> Dict[str, pd.DataFrame]:
+    """
+    key 관계를 유지한 채 테이블을 scale배로 복제
+
+    복제본마다 key 값에 접미사를 붙여 key 카디널리티도 scale배가 되게 한다.
+    """
+    replicated = {}
+    for name, df in tables.items():
+        if df is None:
+            replicated[name] = None
+            continue
+        copies = []
+        for i in range(scale):
+            copy = df.copy()
+            for col in KEY_COLUMNS:
+                if col in copy.columns:
+                    copy[col] = copy[col].astype(str) + f"_{i}"
+            copies.append(copy)
+        replicated[name] = pd.concat(copies, ignore_index=True)
+    return replicated
+
+
+def time_call(func, *args, repeat: int = 3) -> float:
+    """repeat회 실행 중 최소 시간(초)"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--data-path', type=Path, default=DATA_PATH)
+    parser.add_argument('--scale', type=int, default=10)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    tables = load_all_tables(args.data_path, verbose=False)
+    needed = {name for check in RELATIONSHIP_CHECKS for name in (check['parent'], check['child'])}
+    missing = sorted(name for name in needed if tables.get(name) is None)
+    if missing:
+        print(f"❌ 테이블 없음: {', '.join(missing)} ({args.data_path})")
+        sys.exit(1)
+
+    print(f"{'dataset':>10s} | {'legacy (set)':>12s} | {'vectorized':>10s} | {'speedup':>7s}")
+    print("-" * 50)
+
+    for label, data in (('1x', tables), (f'{args.scale}x', replicate_tables(tables, args.scale))):
+        legacy = time_call(legacy_check_relationships, data, repeat=args.repeat)
+        vectorized = time_call(validate_relationships, data, repeat=args.repeat)
+        print(f"{label:>10s} | {legacy:>11.3f}s | {vectorized:>9.3f}s | {legacy / vectorized:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
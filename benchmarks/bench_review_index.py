@@ -0,0 +1,100 @@
+"""
+리뷰 역색인 벤치마크
+one_star_review.ipynb Step 5 방식의 str.contains 전체 스캔과 ReviewIndex 검색 비교
+
+실행: python benchmarks/bench_review_index.py [--input data/review_ko/one_star_reviews_translated.csv] [--scale 10]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.review_index import ReviewIndex, analyze
+
+# (str.contains 포함 키워드, 제외 키워드, 역색인 쿼리)
+# 역색인은 단어 단위 검색이라 str.contains(부분 문자열)와 건수가 조금 다를 수 있다
+QUERIES = [
+    (['환불'], [], '환불*'),
+    (['받지 못했습니다'], [], '"받지 못했습니다"'),
+    (['환불', '반품'], [], '환불* OR 반품*'),
+    (['배송'], ['환불'], '배송* NOT 환불*'),
+]
+
+
+def contains_scan(texts: pd.Series, keywords, excludes) -> np.ndarray:
+    """str.contains 전체 스캔 (포함 키워드 OR, 제외 키워드 NOT)"""
+    mask = pd.Series(False, index=texts.index)
+    for keyword in keywords:
+        mask |= texts.str.contains(keyword, na=False, regex=False)
+    for keyword in excludes:
+        mask &= ~texts.str.contains(keyword, na=False, regex=False)
+    return np.flatnonzero(mask.to_numpy())
+
+
+def token_scan(texts: pd.Series, term: str) -> np.ndarray:
+    """검증용: 행마다 토큰화해서 단어 포함 여부 확인"""
+    return np.array([i for i, text in enumerate(texts)
+                     if isinstance(text, str) and term in analyze(text)], dtype='int64')
+
+
+def time_call(func, *args, repeat: int = 3, **kwargs) -> float:
+    """repeat회 실행 중 최소 시간(초)"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args, **kwargs)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--input', type=Path,
+                        default=Path(__file__).parent.parent / "data" / "review_ko" / "one_star_reviews_translated.csv")
+    parser.add_argument('--field', default='message_ko')
+    parser.add_argument('--scale', type=int, default=10, help="리뷰를 이 배수만큼 복제 (전체 리뷰 규모 흉내)")
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    base = pd.read_csv(args.input, encoding='utf-8-sig')
+    scaled = pd.concat([base.assign(order_id=base['order_id'] + f"-{i}") for i in range(args.scale)],
+                       ignore_index=True)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, df in ((f'{len(base):,d}', base), (f'{len(scaled):,d} ({args.scale}x)', scaled)):
+            texts = df[args.field]
+            start = time.perf_counter()
+            index = ReviewIndex(Path(tmp) / label.split()[0], key_columns=['order_id'])
+            index.update(df, verbose=False)
+            build = time.perf_counter() - start
+
+            # 단어 검색 결과 검증
+            for term in ('환불', '배송'):
+                if not np.array_equal(index.query(term, field=args.field), token_scan(texts, term)):
+                    print(f"❌ 검색 결과 불일치: {term}")
+                    sys.exit(1)
+
+            start = time.perf_counter()
+            ReviewIndex(Path(tmp) / label.split()[0])
+            load = time.perf_counter() - start
+            print(f"\n📇 {label}: 색인 생성 {build:.3f}s / 로드 {load:.3f}s (검색 결과 검증 ✅)")
+
+            print(f"{'query':>26s} | {'contains':>8s} | {'index':>8s} | {'hits':>13s} | {'speedup':>7s}")
+            print("-" * 76)
+            for keywords, excludes, query in QUERIES:
+                scan = time_call(contains_scan, texts, keywords, excludes, repeat=args.repeat)
+                lookup = time_call(index.search, query, field=args.field, repeat=args.repeat)
+                hits = f"{len(contains_scan(texts, keywords, excludes)):,d}/{len(index.query(query, field=args.field)):,d}"
+                print(f"{query:>26s} | {scan * 1000:>6.2f}ms | {lookup * 1000:>6.2f}ms | {hits:>13s} | "
+                      f"{scan / lookup:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""
+판매자 지표 집계 벤치마크
+노트북 방식(groupby 2회 + merge 2회 + lambda agg)과 정수 인코딩 bincount 커널 비교,
+그리고 월별 30/90일 이동 지표를 월마다 다시 집계하는 방식과 정렬 + 누적합 방식 비교 (결과/최대 메모리)
+
+실행: python benchmarks/bench_seller_metrics.py [--data-path data/processed_v2] [--repeat 3]
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Dict, List
+
+import pandas as pd
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.data_loader import DATA_PATH, load_all_tables
+from src.master import run_steps
+from src.seller_metrics import ROLLING_WINDOWS, aggregate_seller_metrics, encode_seller_orders, rolling_seller_metrics
+
+
+def notebook_master_sellers(order_items: pd.DataFrame,
+                            clean_orders: pd.DataFrame,
+                            clean_reviews: pd.DataFrame,
+                            sellers: pd.DataFrame) -> pd.DataFrame:
+    """notebooks/data_quality_analysis.ipynb의 master_sellers 생성 과정"""
+    order_seller = (
+        order_items
+        .groupby(['order_id', 'seller_id'])
+        .agg(
+            items_in_order=('order_item_id', 'count'),
+            revenue_in_order=('price', 'sum'),
+            freight_in_order=('freight_value', 'sum')
+        )
+        .reset_index()
+        .merge(clean_orders[['order_id', 'order_purchase_timestamp',
+                             'total_delivery_time', 'is_delayed']],
+               on='order_id', how='left')
+        .merge(clean_reviews[['order_id', 'review_score']], on='order_id', how='left')
+    )
+
+    master_sellers = (
+        order_seller
+        .groupby('seller_id')
+        .agg(
+            total_orders=('order_id', 'nunique'),
+            total_items=('items_in_order', 'sum'),
+            total_revenue=('revenue_in_order', 'sum'),
+            total_freight=('freight_in_order', 'sum'),
+            avg_review_score=('review_score', 'mean'),
+            review_count=('review_score', 'count'),
+            five_star_count=('review_score', lambda x: (x == 5).sum()),
+            one_star_count=('review_score', lambda x: (x == 1).sum()),
+            avg_delivery_days=('total_delivery_time', 'mean'),
+            delay_count=('is_delayed', 'sum'),
+            first_order_date=('order_purchase_timestamp', 'min'),
+            last_order_date=('order_purchase_timestamp', 'max')
+        )
+        .reset_index()
+    )
+    master_sellers['total_gmv'] = master_sellers['total_revenue'] + master_sellers['total_freight']
+    master_sellers['five_star_rate'] = (master_sellers['five_star_count'] / master_sellers['review_count'] * 100).round(2)
+    master_sellers['one_star_rate'] = (master_sellers['one_star_count'] / master_sellers['review_count'] * 100).round(2)
+    master_sellers['delay_rate'] = (master_sellers['delay_count'] / master_sellers['total_orders'] * 100).round(2)
+    return master_sellers.merge(sellers[['seller_id', 'seller_city', 'seller_state']], on='seller_id', how='left')
+
+
+def notebook_rolling(order_items: pd.DataFrame,
+                     clean_orders: pd.DataFrame,
+                     clean_reviews: pd.DataFrame,
+                     sellers: pd.DataFrame,
+                     windows: List[int]) -> Dict:
+    """월말마다 window 구간 주문을 잘라서 노트북 방식 집계를 반복"""
+    months = pd.PeriodIndex(clean_orders['order_purchase_timestamp'].dt.to_period('M')).unique().sort_values()
+    result = {}
+    for month in months:
+        end = month.to_timestamp(how='end').normalize() + pd.Timedelta(days=1)
+        for w in windows:
+            window_orders = clean_orders[
+                (clean_orders['order_purchase_timestamp'] >= end - pd.Timedelta(days=w))
+                & (clean_orders['order_purchase_timestamp'] < end)
+            ]
+            # Step 2.5와 같이 기간 필터 후에는 window 안 주문의 상품만 남김
+            window_items = order_items[order_items['order_id'].isin(window_orders['order_id'])]
+            result[(str(month), w)] = notebook_master_sellers(window_items, window_orders, clean_reviews, sellers)
+    return result
+
+
+def kernel_master_sellers(order_items, clean_orders, clean_reviews, sellers) -> pd.DataFrame:
+    encoded = encode_seller_orders(order_items, clean_orders, clean_reviews)
+    return aggregate_seller_metrics(encoded, sellers)
+
+
+def kernel_rolling(order_items, clean_orders, clean_reviews, sellers, windows) -> pd.DataFrame:
+    encoded = encode_seller_orders(order_items, clean_orders, clean_reviews)
+    return rolling_seller_metrics(encoded, windows)
+
+
+# 이동 지표에서 비교하는 컬럼
+ROLLING_CHECK_COLUMNS = ['total_orders', 'total_items', 'total_revenue', 'avg_review_score',
+                         'avg_delivery_days', 'delay_rate', 'five_star_rate']
+
+
+def assert_rolling_equal(kernel: pd.DataFrame, notebook: Dict) -> None:
+    """월/window마다 커널 이동 지표와 노트북 방식 재집계 비교 (window에 주문이 있는 판매자)"""
+    kernel = kernel.set_index(['month', 'seller_id'])
+    for (month, w), expected in notebook.items():
+        actual = kernel.loc[month] if month in kernel.index.get_level_values(0) else kernel.iloc[:0]
+        actual = actual[actual[f'total_orders_{w}d'] > 0].sort_index()
+        expected = expected.set_index('seller_id').sort_index()
+        for col in ROLLING_CHECK_COLUMNS:
+            pd.testing.assert_series_equal(actual[f'{col}_{w}d'], expected[col], check_names=False,
+                                           check_dtype=False, check_index_type=False)
+
+
+def peak_memory(func, *args) -> float:
+    """실행 중 최대 할당 메모리 (MB, tracemalloc)"""
+    tracemalloc.start()
+    try:
+        func(*args)
+        return tracemalloc.get_traced_memory()[1] / 2**20
+    finally:
+        tracemalloc.stop()
+
+
+def time_call(func, *args, repeat: int = 3) -> float:
+    """repeat회 실행 중 최소 시간(초)"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--data-path', type=Path, default=DATA_PATH)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    tables = load_all_tables(args.data_path, verbose=False)
+    missing = sorted(name for name in ('orders', 'order_items', 'order_reviews', 'sellers')
+                     if tables.get(name) is None)
+    if missing:
+        print(f"❌ 테이블 없음: {', '.join(missing)} ({args.data_path})")
+        sys.exit(1)
+
+    steps = run_steps(tables, ['clean_orders', 'clean_reviews'])
+    inputs = (tables['order_items'], steps['clean_orders'], steps['clean_reviews'], tables['sellers'])
+
+    # 결과 일치 확인
+    expected = notebook_master_sellers(*inputs).set_index('seller_id').sort_index()
+    actual = kernel_master_sellers(*inputs).set_index('seller_id').sort_index()
+    pd.testing.assert_frame_equal(actual, expected[actual.columns], check_dtype=False,
+                                  check_categorical=False, check_index_type=False)
+    print("✅ master_sellers 결과 일치\n")
+
+    print(f"{'task':>24s} | {'notebook':>9s} | {'kernel':>8s} | {'speedup':>7s}")
+    print("-" * 58)
+
+    notebook = time_call(notebook_master_sellers, *inputs, repeat=args.repeat)
+    kernel = time_call(kernel_master_sellers, *inputs, repeat=args.repeat)
+    print(f"{'master_sellers':>24s} | {notebook:>8.3f}s | {kernel:>7.3f}s | {notebook / kernel:>6.1f}x")
+
+    label = 'rolling ' + '/'.join(f'{w}d' for w in ROLLING_WINDOWS)
+    notebook = time_call(notebook_rolling, *inputs, ROLLING_WINDOWS, repeat=1)
+    kernel = time_call(kernel_rolling, *inputs, ROLLING_WINDOWS, repeat=args.repeat)
+    print(f"{label:>24s} | {notebook:>8.3f}s | {kernel:>7.3f}s | {notebook / kernel:>6.1f}x")
+
+    assert_rolling_equal(kernel_rolling(*inputs, ROLLING_WINDOWS), notebook_rolling(*inputs, ROLLING_WINDOWS))
+    print(f"\n✅ {label} 결과 일치 (커널 최대 메모리 {peak_memory(kernel_rolling, *inputs, ROLLING_WINDOWS):.1f}MB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+"""
+SQL 엔진 벤치마크
+src.sql_engine 저장된 쿼리와 같은 결과를 pandas(load_all_tables + src.master 단계 함수 + groupby)로 만들어 비교
+
+실행: python benchmarks/bench_sql_engine.py [--scale 1] [--start 2018-01-01]
+      (합성 데이터는 benchmarks/synthetic.py로 생성/재사용)
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from benchmarks.synthetic import ensure_olist
+from src.data_loader import load_all_tables
+from src.master import _filter_by_time, _seller_month, combine_seller_partials, run_steps
+from src.sql_engine import SAVED_QUERIES, SQLEngine, saved_query_sql
+
+
+# ==============================================
+# pandas 구현 (노트북/src.master 방식)
+# ==============================================
+
+def _master_orders(tables, start, end):
+    master_orders = run_steps(tables, ['master_orders'])['master_orders']
+    return _filter_by_time(master_orders, 'order_purchase_timestamp', start, end)
+
+
+def _rate(series: pd.Series) -> float:
+    return round(series.mean() * 100, 2)
+
+
+def pandas_master_orders(tables, start=None, end=None):
+    return _master_orders(tables, start, end)
+
+
+def pandas_master_sellers(tables, start=None, end=None):
+    order_seller = run_steps(tables, ['order_seller'])['order_seller']
+    order_seller = _filter_by_time(order_seller, 'order_purchase_timestamp', start, end)
+    return combine_seller_partials(_seller_month(order_seller), tables['sellers'])
+
+
+def pandas_delivery_by_state(tables, start=None, end=None):
+    return (
+        _master_orders(tables, start, end)
+        .groupby('customer_state', observed=True)
+        .agg(orders=('order_id', 'size'),
+             avg_delivery_days=('total_delivery_time', 'mean'),
+             avg_delivery_accuracy=('delivery_accuracy', 'mean'),
+             delay_rate=('is_delayed', _rate),
+             avg_review_score=('review_score', 'mean'))
+        .reset_index()
+    )
+
+
+def pandas_delivery_by_month(tables, start=None, end=None):
+    master_orders = _master_orders(tables, start, end)
+    master_orders['order_month'] = master_orders['order_purchase_timestamp'].dt.strftime('%Y-%m')
+    return (
+        master_orders
+        .groupby('order_month')
+        .agg(orders=('order_id', 'size'),
+             revenue=('total_price', 'sum'),
+             avg_delivery_days=('total_delivery_time', 'mean'),
+             delay_rate=('is_delayed', _rate),
+             avg_review_score=('review_score', 'mean'))
+        .reset_index()
+    )
+
+
+def pandas_review_by_delay(tables, start=None, end=None):
+    master_orders = _master_orders(tables, start, end)
+    return (
+        master_orders
+        .groupby('is_delayed')
+        .agg(orders=('order_id', 'size'),
+             avg_review_score=('review_score', 'mean'),
+             review_count=('review_score', 'count'),
+             one_star_rate=('review_score', lambda s: round((s == 1).sum() / s.count() * 100, 2)))
+        .reset_index()
+    )
+
+
+PANDAS_EQUIVALENTS = {
+    'master_orders': (pandas_master_orders, 'order_id'),
+    'master_sellers': (pandas_master_sellers, 'seller_id'),
+    'delivery_by_state': (pandas_delivery_by_state, 'customer_state'),
+    'delivery_by_month': (pandas_delivery_by_month, 'order_month'),
+    'review_by_delay': (pandas_review_by_delay, 'is_delayed'),
+}
+
+
+def mismatched_columns(expected: pd.DataFrame, actual: pd.DataFrame, key: str) -> dict:
+    """key로 정렬 후 컬럼별 불일치 행 수 (수치는 1e-9 상대오차, 비율(%)은 반올림 차이 0.01 허용)"""
+    if list(expected.columns) != list(actual.columns):
+        return {'columns': f"{list(expected.columns)} != {list(actual.columns)}"}
+    if len(expected) != len(actual):
+        return {'rows': f"{len(expected)} != {len(actual)}"}
+
+    expected = expected.sort_values(key, ignore_index=True)
+    actual = actual.sort_values(key, ignore_index=True)
+    result = {}
+    for col in expected.columns:
+        left, right = expected[col], actual[col]
+        if pd.api.types.is_datetime64_any_dtype(left):
+            diff = (left.astype('datetime64[us]') != right.astype('datetime64[us]')) & left.notna()
+        elif pd.api.types.is_numeric_dtype(left) or pd.api.types.is_bool_dtype(left):
+            a = pd.to_numeric(left, errors='coerce').astype('float64').to_numpy()
+            b = pd.to_numeric(right, errors='coerce').astype('float64').to_numpy()
+            atol = 0.01 if col.endswith('_rate') else 0.0
+            diff = ~np.isclose(a, b, rtol=1e-9, atol=atol, equal_nan=True)
+        else:
+            missing = '\x00'
+            diff = left.astype(object).fillna(missing).to_numpy() != right.astype(object).fillna(missing).to_numpy()
+        n = int(np.sum(diff))
+        if n:
+            result[col] = n
+    return result
+
+
+def time_call(func, *args, repeat: int = 3, **kwargs) -> float:
+    """repeat회 실행 중 최소 시간(초)"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args, **kwargs)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--data-path', type=Path, default=None, help="지정하지 않으면 합성 데이터 사용")
+    parser.add_argument('--scale', type=float, default=1.0)
+    parser.add_argument('--start', default=None, help="구매일 시작 (예: 2018-01-01)")
+    parser.add_argument('--end', default=None)
+    parser.add_argument('--csv', action='store_true', help="Parquet 캐시 대신 원본 CSV를 스캔")
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    data_path = args.data_path or ensure_olist(
+        Path(tempfile.gettempdir()) / "olist_synthetic" / f"sf{args.scale:g}", scale=args.scale)
+
+    tables = load_all_tables(data_path, verbose=False)   # Parquet 캐시 준비
+    engine = SQLEngine(data_path, use_cache=not args.csv)
+    print(f"📂 {data_path} (뷰: {', '.join(sorted(set(engine.sources.values())))})")
+
+    # 1) 결과 일치 확인
+    failed = False
+    for name, (pandas_func, key) in PANDAS_EQUIVALENTS.items():
+        expected = pandas_func(tables, args.start, args.end)
+        actual = engine.run_saved(name, args.start, args.end)
+        mismatches = mismatched_columns(expected, actual, key)
+        if mismatches:
+            failed = True
+            print(f"❌ {name}: {mismatches}")
+        else:
+            print(f"✅ {name}: {len(actual):,d} rows 일치")
+    if failed:
+        sys.exit(1)
+
+    # 2) 구매일 조건/컬럼이 스캔 단계로 내려가는지 확인
+    plan = engine.explain(saved_query_sql('delivery_by_month', start='2018-01-01'), {'start': '2018-01-01'})
+    print(f"\n🔎 pushdown: 스캔 필터 {'있음' if 'Filters' in plan else '없음'}, "
+          f"review_comment_message 스캔 {'함' if 'review_comment_message' in plan else '안 함'}\n")
+
+    # 3) 시간 비교 (pandas = Parquet 캐시 로드 + 계산, SQL = 같은 파일 스캔 + 계산)
+    def pandas_total(func):
+        return func(load_all_tables(data_path, verbose=False), args.start, args.end)
+
+    print(f"{'query':>18s} | {'pandas':>8s} | {'(compute)':>9s} | {'sql':>8s} | {'speedup':>7s}")
+    print("-" * 64)
+    for name, (pandas_func, _) in PANDAS_EQUIVALENTS.items():
+        legacy = time_call(pandas_total, pandas_func, repeat=args.repeat)
+        compute = time_call(pandas_func, tables, args.start, args.end, repeat=args.repeat)
+        sql = time_call(engine.run_saved, name, args.start, args.end, repeat=args.repeat)
+        print(f"{name:>18s} | {legacy:>7.3f}s | {compute:>8.3f}s | {sql:>7.3f}s | {legacy / sql:>6.1f}x")
+
+    assert set(PANDAS_EQUIVALENTS) == set(SAVED_QUERIES)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+공유 테이블 저장소 벤치마크
+여러 프로세스(노트북 커널 흉내)가 동시에 전체 테이블을 들고 있을 때 메모리 합계 비교
+- pandas : 프로세스마다 load_all_tables() (Parquet 캐시 → 프로세스별 사본)
+- shared : load_all_tables(shared=True) (Arrow IPC memory-map → OS 페이지 캐시 한 벌 공유)
+
+메모리는 /proc/self/smaps_rollup의 PSS(공유 페이지를 나눠서 계산)와 private 메모리로 측정 (Linux 전용)
+
+실행: python benchmarks/bench_table_store.py [--scale 1] [--processes 4]
+"""
+
+import argparse
+import ctypes
+import gc
+import json
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+
+def memory_mb() -> dict:
+    """현재 프로세스의 RSS / PSS / private 메모리 (MB)"""
+    values = {}
+    with open('/proc/self/smaps_rollup') as f:
+        for line in f:
+            key, _, rest = line.partition(':')
+            if key in ('Rss', 'Pss', 'Private_Clean', 'Private_Dirty'):
+                values[key] = int(rest.split()[0]) / 1024
+    return {'rss': values['Rss'], 'pss': values['Pss'],
+            'private': values['Private_Clean'] + values['Private_Dirty']}
+
+
+def worker(mode: str, data_path: Path) -> None:
+    """테이블을 로드하고 전체 값을 한 번 읽은 뒤, 부모 신호를 기다렸다가 메모리 보고"""
+    import pandas as pd
+    import pyarrow as pa
+    from src.data_loader import load_all_tables
+
+    base = memory_mb()
+    start = time.perf_counter()
+    tables = load_all_tables(data_path, verbose=False, shared=(mode == 'shared'))
+    load_seconds = time.perf_counter() - start
+
+    # 노트북에서 실제로 값을 쓰는 것처럼 모든 컬럼을 한 번씩 읽음 (memory-map 페이지 로드)
+    for df in tables.values():
+        for col in df.columns:
+            series = df[col]
+            if pd.api.types.is_numeric_dtype(series) or pd.api.types.is_datetime64_any_dtype(series):
+                series.max()
+            else:
+                series.nunique()
+
+    # 읽는 중에 만든 임시 배열은 해제하고 측정 (glibc/Arrow 메모리 풀이 잡고 있는 빈 영역 반환)
+    gc.collect()
+    pa.default_memory_pool().release_unused()
+    try:
+        ctypes.CDLL('libc.so.6').malloc_trim(0)
+    except OSError:
+        pass
+
+    print("ready", flush=True)
+    sys.stdin.readline()
+    used = memory_mb()
+    print(json.dumps({'load_seconds': load_seconds,
+                      **{key: used[key] - base[key] for key in used}}), flush=True)
+
+
+def run_group(mode: str, data_path: Path, processes: int) -> list:
+    """processes개를 동시에 띄워서 모두 로드된 시점의 메모리 수집"""
+    cmd = [sys.executable, str(Path(__file__).resolve()), '--worker', mode, '--data-path', str(data_path)]
+    procs = [subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+             for _ in range(processes)]
+    for proc in procs:
+        if proc.stdout.readline().strip() != "ready":
+            raise RuntimeError(f"{mode} worker 실패")
+    # 모두 테이블을 들고 있는 상태에서 측정
+    for proc in procs:
+        proc.stdin.write("go\n")
+        proc.stdin.flush()
+    results = [json.loads(proc.stdout.readline()) for proc in procs]
+    for proc in procs:
+        proc.wait()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--data-path', type=Path, default=None, help="지정하지 않으면 합성 데이터 사용")
+    parser.add_argument('--scale', type=float, default=1.0)
+    parser.add_argument('--processes', type=int, default=4)
+    parser.add_argument('--worker', default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        worker(args.worker, args.data_path)
+        return
+
+    from benchmarks.synthetic import ensure_olist
+    from src.data_loader import load_all_tables
+
+    data_path = args.data_path or ensure_olist(
+        Path(tempfile.gettempdir()) / "olist_synthetic" / f"sf{args.scale:g}", scale=args.scale)
+
+    # 캐시/저장소 준비 (측정에서 제외)
+    load_all_tables(data_path, verbose=False)
+    load_all_tables(data_path, verbose=False, shared=True)
+
+    print(f"📂 {data_path}, 동시 프로세스 {args.processes}개\n")
+    print(f"{'mode':>8s} | {'load/proc':>9s} | {'private/proc':>12s} | {'PSS total':>10s}")
+    print("-" * 50)
+    totals = {}
+    for mode in ('pandas', 'shared'):
+        results = run_group(mode, data_path, args.processes)
+        load = sum(r['load_seconds'] for r in results) / len(results)
+        private = sum(r['private'] for r in results) / len(results)
+        totals[mode] = sum(r['pss'] for r in results)
+        print(f"{mode:>8s} | {load:>8.3f}s | {private:>10.1f}MB | {totals[mode]:>8.1f}MB")
+
+    print(f"\n💾 메모리 합계 {totals['pandas'] / totals['shared']:.1f}x 절감 "
+          f"({totals['pandas']:.0f}MB → {totals['shared']:.0f}MB)")
+
+
+if __name__ == "__main__":
+    main()
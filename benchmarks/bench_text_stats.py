@@ -0,0 +1,125 @@
+"""
+리뷰 단어 빈도 벤치마크
+one_star_review.ipynb의 apply(preprocess_text) + Counter와 src.text_stats 스트리밍 집계 비교
+
+실행: python benchmarks/bench_text_stats.py [--input data/review_ko/one_star_reviews_translated.csv] [--scale 10]
+"""
+
+import argparse
+import re
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.complaints import COMPLAINT_KEYWORDS, OTHER_LABEL
+from src.text_stats import STOPWORDS, term_frequencies
+
+
+def preprocess_text(text):
+    """노트북 Step 2 구현"""
+    if pd.isna(text):
+        return ""
+    text = re.sub(r'[^가-힣a-zA-Z0-9\s]', ' ', str(text))
+    text = re.sub(r'\s+', ' ', text)
+    return text.strip().lower()
+
+
+def notebook_word_counts(texts: pd.Series) -> Counter:
+    """apply + split + Counter (단어 빈도만)"""
+    counter = Counter()
+    for text in texts.apply(preprocess_text):
+        counter.update(word for word in text.split() if len(word) >= 2 and word not in STOPWORDS)
+    return counter
+
+
+def notebook_full(texts: pd.Series) -> dict:
+    """같은 결과를 노트북 방식으로: 단어 + bigram + 불만 유형별 단어 빈도 (유형마다 다시 순회)"""
+    words = texts.apply(preprocess_text).str.split().apply(
+        lambda ws: [w for w in ws if len(w) >= 2 and w not in STOPWORDS])
+    unigrams = Counter(w for ws in words for w in ws)
+    bigrams = Counter(f"{a} {b}" for ws in words for a, b in zip(ws, ws[1:]))
+
+    lowered = texts.fillna('').astype(str).str.lower()
+    by_type = {}
+    matched = pd.Series(False, index=texts.index)
+    for category, keywords in COMPLAINT_KEYWORDS.items():
+        mask = lowered.apply(lambda t: any(kw in t for kw in keywords)) & texts.notna()
+        matched |= mask
+        by_type[category] = Counter(w for ws in words[mask] for w in ws)
+    by_type[OTHER_LABEL] = Counter(w for ws in words[~matched & texts.notna()] for w in ws)
+    return {'unigrams': unigrams, 'bigrams': bigrams, 'by_type': by_type}
+
+
+def iter_chunks(texts: pd.Series, chunksize: int):
+    frame = texts.to_frame()
+    for start in range(0, len(frame), chunksize):
+        yield frame.iloc[start:start + chunksize]
+
+
+def time_call(func, *args, repeat: int = 3, **kwargs) -> float:
+    """repeat회 실행 중 최소 시간(초)"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args, **kwargs)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--input', type=Path,
+                        default=Path(__file__).parent.parent / "data" / "review_ko" / "one_star_reviews_translated.csv")
+    parser.add_argument('--column', default='message_ko')
+    parser.add_argument('--scale', type=int, default=10, help="텍스트를 이 배수만큼 복제 (전체 점수 리뷰 규모 흉내)")
+    parser.add_argument('--chunksize', type=int, default=20_000)
+    parser.add_argument('--n-jobs', type=int, default=2)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    texts = pd.read_csv(args.input, encoding='utf-8-sig')[args.column]
+    scaled = pd.concat([texts] * args.scale, ignore_index=True)
+
+    def engine(data, n_jobs=1, **kwargs):
+        return term_frequencies(iter_chunks(data, args.chunksize), args.column,
+                                n_jobs=n_jobs, verbose=False, **kwargs)
+
+    # 결과 일치 확인
+    expected = notebook_full(texts)
+    actual = engine(texts, by_complaint=True)
+    terms = actual['terms']
+    checks = {
+        'unigram': dict(terms[terms['ngram'] == 1].set_index('term')['count']) == dict(expected['unigrams']),
+        'bigram': dict(terms[terms['ngram'] == 2].set_index('term')['count']) == dict(expected['bigrams']),
+        'complaint': all(
+            dict(group.set_index('term')['count']) == dict(expected['by_type'][complaint_type])
+            for complaint_type, group in actual['by_complaint'].groupby('complaint_type')
+        ),
+    }
+    failed = [name for name, ok in checks.items() if not ok]
+    if failed:
+        print(f"❌ 빈도 불일치: {', '.join(failed)}")
+        sys.exit(1)
+    print("✅ 노트북 단어/bigram/유형별 빈도와 일치\n")
+
+    print(f"{'dataset':>16s} | {'task':>9s} | {'notebook':>8s} | {'engine':>8s} | "
+          f"{f'n_jobs={args.n_jobs}':>8s} | {'speedup':>7s}")
+    print("-" * 76)
+
+    for label, data in ((f'{len(texts):,d}', texts), (f'{len(scaled):,d} ({args.scale}x)', scaled)):
+        for task, legacy_func, kwargs in (('words', notebook_word_counts, {'ngram': 1}),
+                                          ('full', notebook_full, {'ngram': 2, 'by_complaint': True})):
+            legacy = time_call(legacy_func, data, repeat=args.repeat)
+            single = time_call(engine, data, repeat=args.repeat, **kwargs)
+            parallel = time_call(engine, data, repeat=args.repeat, n_jobs=args.n_jobs, **kwargs)
+            print(f"{label:>16s} | {task:>9s} | {legacy:>7.3f}s | {single:>7.3f}s | {parallel:>7.3f}s | "
+                  f"{legacy / min(single, parallel):>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,457 @@
+"""
+벤치마크 스위트
+합성 Olist 데이터(scale factor별)로 src/data_loader.py, src/utils.py의 공개 함수와
+보고서 생성(scripts/generate_report.py)의 실행 시간/메모리를 측정하고 JSON으로 저장,
+이전 결과와 비교해서 느려진 항목을 찾는다
+
+실행 예:
+    python benchmarks/run_suite.py --scales 1 10 --output benchmarks/results/latest.json
+    python benchmarks/run_suite.py --scales 1 --cases read_table utils. --compare benchmarks/results/baseline.json
+"""
+
+import argparse
+import contextlib
+import fnmatch
+import importlib
+import io
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+ROOT = Path(__file__).parent.parent
+sys.path.append(str(ROOT))
+
+RESULTS_VERSION = 1
+DEFAULT_DATA_ROOT = Path(tempfile.gettempdir()) / "olist_synthetic"
+DEFAULT_OUTPUT = ROOT / "benchmarks" / "results" / "latest.json"
+
+# 비교 시 이 시간(초)보다 짧은 차이는 잡음으로 봄
+MIN_REGRESSION_SECONDS = 0.005
+
+
+# ==============================================
+# 측정 대상 (case 이름 → setup 함수)
+# ==============================================
+# setup(ctx)는 측정하지 않는 준비 작업(테이블 로드 등)을 하고, 측정할 인자 없는 함수를 반환한다.
+
+def _quiet(func: Callable) -> Callable:
+    """출력(print)이 많은 함수는 stdout을 버리고 측정"""
+    def call():
+        with contextlib.redirect_stdout(io.StringIO()):
+            return func()
+    return call
+
+
+def _tables(ctx: Dict, *names: str) -> Dict:
+    from src.data_loader import load_all_tables
+    if 'tables' not in ctx:
+        ctx['tables'] = load_all_tables(ctx['data_path'], verbose=False)
+    return ctx['tables'] if not names else {name: ctx['tables'][name] for name in names}
+
+
+def _orders_str(ctx: Dict):
+    from src.data_loader import read_table
+    return read_table('orders', ctx['data_path'], typed=False)
+
+
+def _setup_data_loader() -> Dict[str, Callable]:
+    from src import data_loader as dl
+
+    def table_content_hash(ctx):
+        return lambda: dl.table_content_hash('orders', ctx['data_path'])
+
+    def read_table_csv(ctx):
+        return lambda: dl.read_table('orders', ctx['data_path'], use_cache=False)
+
+    def read_table_cached(ctx):
+        dl.read_table('orders', ctx['data_path'])
+        return lambda: dl.read_table('orders', ctx['data_path'])
+
+    def load_all_tables_csv(ctx):
+        return _quiet(lambda: dl.load_all_tables(ctx['data_path'], use_cache=False))
+
+    def load_all_tables_cached(ctx):
+        dl.load_all_tables(ctx['data_path'], verbose=False)
+        return _quiet(lambda: dl.load_all_tables(ctx['data_path']))
+
+    def load_all_tables_parallel(ctx):
+        dl.load_all_tables(ctx['data_path'], verbose=False)
+        return _quiet(lambda: dl.load_all_tables(ctx['data_path'], parallel=True))
+
+    def load_single(name):
+        def setup(ctx):
+            func = getattr(dl, f'load_{name}')
+            func(data_path=ctx['data_path'])
+            return lambda: func(data_path=ctx['data_path'])
+        return setup
+
+    def iter_table_chunks(ctx):
+        return lambda: sum(len(chunk) for chunk in dl.iter_table_chunks('order_items', ctx['data_path']))
+
+    def load_geolocation_by_zip(ctx):
+        return lambda: dl.load_geolocation_by_zip(ctx['data_path'], use_cache=False)
+
+    def get_table_info(ctx):
+        orders = _tables(ctx, 'orders')['orders']
+        return _quiet(lambda: dl.get_table_info(orders, 'orders'))
+
+    def validate_relationships(ctx):
+        tables = _tables(ctx)
+        return lambda: dl.validate_relationships(tables)
+
+    def check_relationships(ctx):
+        tables = _tables(ctx)
+        return _quiet(lambda: dl.check_relationships(tables))
+
+    cases = {
+        'data_loader.table_content_hash': table_content_hash,
+        'data_loader.read_table[csv]': read_table_csv,
+        'data_loader.read_table[cached]': read_table_cached,
+        'data_loader.load_all_tables[csv]': load_all_tables_csv,
+        'data_loader.load_all_tables[cached]': load_all_tables_cached,
+        'data_loader.load_all_tables[parallel]': load_all_tables_parallel,
+        'data_loader.iter_table_chunks': iter_table_chunks,
+        'data_loader.load_geolocation_by_zip': load_geolocation_by_zip,
+        'data_loader.get_table_info': get_table_info,
+        'data_loader.validate_relationships': validate_relationships,
+        'data_loader.check_relationships': check_relationships,
+    }
+    for name in ('orders', 'order_items', 'order_payments', 'order_reviews', 'customers',
+                 'sellers', 'products', 'geolocation', 'category_translation'):
+        cases[f'data_loader.load_{name}'] = load_single(name)
+    return cases
+
+
+def _setup_utils() -> Dict[str, Callable]:
+    from src import utils
+
+    date_cols = ['order_purchase_timestamp', 'order_approved_at', 'order_delivered_carrier_date',
+                 'order_delivered_customer_date', 'order_estimated_delivery_date']
+    numeric_cols = ['price', 'freight_value']
+
+    def items(ctx):
+        return _tables(ctx, 'order_items')['order_items']
+
+    def set_korean_font(ctx):
+        return _quiet(utils.set_korean_font)
+
+    def check_data_quality(ctx):
+        orders = _tables(ctx, 'orders')['orders']
+        return lambda: utils.check_data_quality(orders, 'orders')
+
+    def print_quality_report(ctx):
+        report = utils.check_data_quality(_tables(ctx, 'orders')['orders'], 'orders')
+        return _quiet(lambda: utils.print_quality_report(report))
+
+    def detect_outliers_iqr(ctx):
+        df = items(ctx)
+        return lambda: utils.detect_outliers_iqr(df, 'price')
+
+    def calculate_summary_stats(ctx):
+        df = items(ctx)
+        return lambda: utils.calculate_summary_stats(df, 'price')
+
+    def calculate_summary_stats_batch(ctx):
+        df = items(ctx)
+        return lambda: utils.calculate_summary_stats_batch(df, numeric_cols, groupby='seller_id')
+
+    def detect_outliers_iqr_batch(ctx):
+        df = items(ctx)
+        return lambda: utils.detect_outliers_iqr_batch(df, numeric_cols, groupby='seller_id')
+
+    def calculate_boxplot_stats(ctx):
+        df = items(ctx)
+        return lambda: utils.calculate_boxplot_stats(df, numeric_cols)
+
+    def parse_olist_datetime(ctx):
+        column = _orders_str(ctx)['order_purchase_timestamp']
+        return lambda: utils.parse_olist_datetime(column)
+
+    def convert_to_datetime(ctx):
+        orders = _orders_str(ctx)
+        return _quiet(lambda: utils.convert_to_datetime(orders, date_cols))
+
+    def convert_to_datetime_fast(ctx):
+        orders = _orders_str(ctx)
+        return _quiet(lambda: utils.convert_to_datetime(orders, date_cols, fast=True))
+
+    def calculate_time_diff(ctx):
+        orders = _tables(ctx, 'orders')['orders']
+        return lambda: utils.calculate_time_diff(orders, 'order_purchase_timestamp',
+                                                 'order_delivered_customer_date', 'days', 'total_delivery_time')
+
+    def calculate_time_diffs(ctx):
+        orders = _tables(ctx, 'orders')['orders']
+        return lambda: utils.calculate_time_diffs(orders)
+
+    def categorize_numeric(ctx):
+        price = items(ctx)['price']
+        return lambda: utils.categorize_numeric(price, [0, 50, 100, 200, 500, 10_000])
+
+    def get_top_n(ctx):
+        df = items(ctx)
+        return lambda: utils.get_top_n(df, 'price', 100)
+
+    def safe_divide(ctx):
+        df = items(ctx)
+        return lambda: utils.safe_divide(df['freight_value'], df['price'])
+
+    def percentage(ctx):
+        return lambda: [utils.percentage(i, 1000) for i in range(1000)]
+
+    return {f'utils.{name}': func for name, func in locals().items()
+            if callable(func) and name not in ('items',)}
+
+
+def _setup_report() -> Dict[str, Callable]:
+    def load_module():
+        # 워커 프로세스가 render_section을 이름으로 import할 수 있도록 scripts/를 경로에 추가
+        sys.path.insert(0, str(ROOT / "scripts"))
+        return importlib.import_module('generate_report')
+
+    def report(use_cache: bool):
+        def setup(ctx):
+            # reports/, images/는 임시 폴더에 생성
+            os.chdir(ctx['work_dir'])
+            module = load_module()
+            if use_cache:
+                _quiet(lambda: module.generate_quality_report(ctx['data_path'], max_workers=ctx['workers']))()
+            return _quiet(lambda: module.generate_quality_report(ctx['data_path'], use_cache=use_cache,
+                                                                 max_workers=ctx['workers']))
+        return setup
+
+    return {
+        'generate_report.generate_quality_report[full]': report(use_cache=False),
+        'generate_report.generate_quality_report[cached]': report(use_cache=True),
+    }
+
+
+def all_cases() -> Dict[str, Callable]:
+    cases = {}
+    cases.update(_setup_data_loader())
+    cases.update(_setup_utils())
+    cases.update(_setup_report())
+    return cases
+
+
+def select_cases(patterns: Optional[List[str]]) -> List[str]:
+    """패턴(부분 문자열 또는 glob)에 맞는 case 이름"""
+    names = list(all_cases())
+    if not patterns:
+        return names
+    return [name for name in names
+            if any(p in name or fnmatch.fnmatch(name, p) for p in patterns)]
+
+
+# ==============================================
+# 측정 (case마다 새 프로세스)
+# ==============================================
+
+def _max_rss_mb() -> float:
+    # Linux: KB, macOS: bytes / 워커 프로세스(보고서 생성)까지 포함
+    rss = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+              resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    return rss / (1024 * 1024) if sys.platform == 'darwin' else rss / 1024
+
+
+def run_case(name: str, data_path: Path, repeat: int, workers: int) -> Dict:
+    """현재 프로세스에서 case 하나 측정 (setup → repeat회 시간 측정 → tracemalloc 1회)"""
+    with tempfile.TemporaryDirectory() as work_dir:
+        ctx = {'data_path': Path(data_path), 'work_dir': work_dir, 'workers': workers}
+        cwd = os.getcwd()
+        try:
+            setup_start = time.perf_counter()
+            call = all_cases()[name](ctx)
+            setup_seconds = time.perf_counter() - setup_start
+            rss_before = _max_rss_mb()
+
+            times = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                call()
+                times.append(time.perf_counter() - start)
+
+            tracemalloc.start()
+            call()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        finally:
+            os.chdir(cwd)
+
+    times.sort()
+    return {
+        'case': name,
+        'seconds': times[0],
+        'median_seconds': times[len(times) // 2],
+        'repeat': repeat,
+        'setup_seconds': setup_seconds,
+        'peak_alloc_mb': peak / 1024 / 1024,
+        'max_rss_mb': _max_rss_mb(),
+        'rss_growth_mb': max(_max_rss_mb() - rss_before, 0.0),
+    }
+
+
+def _run_case_subprocess(name: str, data_path: Path, repeat: int, workers: int, timeout: float) -> Dict:
+    cmd = [sys.executable, str(Path(__file__).resolve()), '--run-case', name,
+           '--data-path', str(data_path), '--repeat', str(repeat), '--workers', str(workers)]
+    try:
+        proc = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout, cwd=str(ROOT))
+    except subprocess.TimeoutExpired:
+        return {'case': name, 'error': f'timeout ({timeout:.0f}s)'}
+    if proc.returncode != 0:
+        lines = (proc.stderr or proc.stdout).strip().splitlines()
+        return {'case': name, 'error': lines[-1] if lines else f'exit {proc.returncode}'}
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def _environment() -> Dict:
+    import numpy as np
+    import pandas as pd
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                                text=True, cwd=str(ROOT)).stdout.strip() or None
+    except OSError:
+        commit = None
+    return {
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'git_commit': commit,
+    }
+
+
+def run_suite(scales: List[float],
+              cases: List[str],
+              data_root: Path = DEFAULT_DATA_ROOT,
+              repeat: int = 3,
+              workers: int = 2,
+              seed: int = 0,
+              timeout: float = 1800) -> Dict:
+    """
+    scale factor별로 합성 데이터를 준비하고 모든 case 측정
+
+    Returns:
+    --------
+    Dict
+        {'version', 'created_at', 'environment', 'scales': {scale: 데이터 정보}, 'results': [...]}
+    """
+    from benchmarks.synthetic import ensure_olist
+
+    results = []
+    scale_info = {}
+    for scale in scales:
+        data_path = ensure_olist(Path(data_root) / f"sf{scale:g}", scale=scale, seed=seed)
+        scale_info[f"{scale:g}"] = json.loads((data_path / "synthetic.json").read_text(encoding='utf-8'))
+        print(f"\n📏 scale {scale:g} ({data_path})")
+
+        for name in cases:
+            result = _run_case_subprocess(name, data_path, repeat, workers, timeout)
+            result['scale'] = scale
+            results.append(result)
+            if 'error' in result:
+                print(f"  ❌ {name:55s} {result['error']}")
+            else:
+                print(f"  ⏱️  {name:55s} {result['seconds']:>9.4f}s  "
+                      f"peak {result['peak_alloc_mb']:>8.1f}MB  rss {result['max_rss_mb']:>8.1f}MB")
+
+    return {
+        'version': RESULTS_VERSION,
+        'created_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'environment': _environment(),
+        'scales': scale_info,
+        'results': results,
+    }
+
+
+def compare_results(current: Dict, baseline: Dict, threshold: float = 1.2) -> List[Dict]:
+    """
+    이전 결과 대비 느려진 case 목록
+
+    Parameters:
+    -----------
+    current, baseline : Dict
+        run_suite 결과
+    threshold : float
+        seconds 비율이 이 값을 넘고 차이가 MIN_REGRESSION_SECONDS 이상이면 회귀로 판단
+    """
+    base = {(r['case'], r['scale']): r for r in baseline.get('results', []) if 'error' not in r}
+    rows = []
+    for r in current['results']:
+        old = base.get((r['case'], r['scale']))
+        if old is None or 'error' in r:
+            continue
+        ratio = r['seconds'] / old['seconds'] if old['seconds'] > 0 else float('inf')
+        rows.append({
+            'case': r['case'],
+            'scale': r['scale'],
+            'baseline_seconds': old['seconds'],
+            'seconds': r['seconds'],
+            'ratio': ratio,
+            'peak_ratio': (r['peak_alloc_mb'] / old['peak_alloc_mb']) if old['peak_alloc_mb'] else None,
+            'regression': ratio > threshold and r['seconds'] - old['seconds'] > MIN_REGRESSION_SECONDS,
+        })
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scales', type=float, nargs='+', default=[1.0], help="scale factor (1 = 주문 약 10만 건)")
+    parser.add_argument('--cases', nargs='*', default=None, help="case 이름 패턴 (부분 문자열 또는 glob)")
+    parser.add_argument('--data-root', type=Path, default=DEFAULT_DATA_ROOT)
+    parser.add_argument('--output', type=Path, default=DEFAULT_OUTPUT)
+    parser.add_argument('--compare', type=Path, default=None, help="비교할 이전 결과 JSON")
+    parser.add_argument('--threshold', type=float, default=1.2)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--workers', type=int, default=2, help="보고서 생성 프로세스 수")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--timeout', type=float, default=1800, help="case당 제한 시간(초)")
+    parser.add_argument('--list', action='store_true', help="case 목록만 출력")
+    # 내부용: case 하나를 현재 프로세스에서 실행하고 JSON 한 줄 출력
+    parser.add_argument('--run-case', default=None, help=argparse.SUPPRESS)
+    parser.add_argument('--data-path', type=Path, default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_case:
+        print(json.dumps(run_case(args.run_case, args.data_path, args.repeat, args.workers)))
+        return
+
+    cases = select_cases(args.cases)
+    if args.list:
+        print('\n'.join(cases))
+        return
+    if not cases:
+        print(f"❌ 일치하는 case 없음: {args.cases}")
+        sys.exit(1)
+
+    suite = run_suite(args.scales, cases, args.data_root, args.repeat, args.workers, args.seed, args.timeout)
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(suite, indent=2, ensure_ascii=False), encoding='utf-8')
+    print(f"\n💾 저장: {args.output}")
+
+    if args.compare is not None:
+        baseline = json.loads(args.compare.read_text(encoding='utf-8'))
+        rows = compare_results(suite, baseline, args.threshold)
+        regressions = [r for r in rows if r['regression']]
+        print(f"\n📊 {args.compare} 대비 (기준 {args.threshold:g}x)")
+        for r in sorted(rows, key=lambda r: -r['ratio']):
+            mark = '🔴' if r['regression'] else '  '
+            print(f"  {mark} {r['case']:55s} sf{r['scale']:<5g} {r['baseline_seconds']:>8.4f}s → "
+                  f"{r['seconds']:>8.4f}s ({r['ratio']:.2f}x)")
+        if regressions:
+            print(f"\n❌ 느려진 case {len(regressions)}개")
+            sys.exit(1)
+        print("\n✅ 회귀 없음")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,363 @@
+"""
+Olist 형태 합성 데이터 생성
+실제 Olist 데이터의 행 수/결측 비율/치우침(인기 상품·판매자·지역)과 key 관계를 흉내 낸
+9개 CSV를 scale factor 배수로 생성 (주문 블록 단위로 써서 메모리는 블록 크기에 비례)
+
+실행: python benchmarks/synthetic.py --scale 1 --output /tmp/olist_sf1
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.data_loader import TABLE_FILES
+
+# 생성 로직이 바뀌면 올려서 기존 합성 데이터를 다시 만들게 함
+GENERATOR_VERSION = 1
+
+# scale 1 = 실제 Olist 규모
+BASE_ROWS = {
+    'orders': 99_441,
+    'products': 32_951,
+    'sellers': 3_095,
+    'zip_prefixes': 19_015,
+    'geolocation_per_order': 10.06,
+}
+
+# 주문 블록 크기 (이 단위로 생성해서 CSV에 이어 씀)
+BLOCK_ORDERS = 200_000
+
+PURCHASE_START = pd.Timestamp('2016-09-04')
+PURCHASE_END = pd.Timestamp('2018-10-17')
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+ORDER_STATUS = {
+    'delivered': 0.9702, 'shipped': 0.0111, 'canceled': 0.0063, 'unavailable': 0.0061,
+    'invoiced': 0.0032, 'processing': 0.0030, 'created': 0.0001,
+}
+ITEMS_PER_ORDER = {1: 0.9014, 2: 0.0761, 3: 0.0132, 4: 0.0051, 5: 0.0020, 6: 0.0022}
+# 상품 없는 주문 비율 (실제 데이터의 orders → order_items orphan)
+ORDERS_WITHOUT_ITEMS = 0.0078
+PAYMENT_TYPES = {'credit_card': 0.739, 'boleto': 0.190, 'voucher': 0.056, 'debit_card': 0.015}
+REVIEW_SCORES = {5: 0.578, 4: 0.193, 1: 0.115, 3: 0.082, 2: 0.032}
+STATES = {
+    'SP': 0.420, 'RJ': 0.129, 'MG': 0.117, 'RS': 0.055, 'PR': 0.051, 'SC': 0.037, 'BA': 0.034,
+    'DF': 0.022, 'ES': 0.020, 'GO': 0.020, 'PE': 0.017, 'CE': 0.013, 'PA': 0.010, 'MT': 0.009,
+    'MA': 0.008, 'MS': 0.007, 'PB': 0.005, 'PI': 0.005, 'RN': 0.005, 'AL': 0.004, 'SE': 0.004,
+    'TO': 0.003, 'RO': 0.003, 'AM': 0.002, 'AC': 0.001, 'AP': 0.001, 'RR': 0.001,
+}
+CITIES = ['sao paulo', 'rio de janeiro', 'belo horizonte', 'brasilia', 'curitiba', 'campinas',
+          'porto alegre', 'salvador', 'guarulhos', 'sao bernardo do campo', 'niteroi', 'santo andre']
+CATEGORIES = [
+    'cama_mesa_banho', 'beleza_saude', 'esporte_lazer', 'moveis_decoracao', 'informatica_acessorios',
+    'utilidades_domesticas', 'relogios_presentes', 'telefonia', 'ferramentas_jardim', 'automotivo',
+    'brinquedos', 'cool_stuff', 'perfumaria', 'bebes', 'eletronicos', 'papelaria', 'fashion_bolsas_e_acessorios',
+    'pet_shop', 'moveis_escritorio', 'consoles_games', 'malas_acessorios', 'construcao_ferramentas_construcao',
+    'eletrodomesticos', 'instrumentos_musicais', 'eletroportateis', 'casa_construcao', 'livros_interesse_geral',
+    'alimentos', 'moveis_sala', 'casa_conforto', 'bebidas', 'audio', 'market_place', 'climatizacao',
+]
+REVIEW_MESSAGES = {
+    1: ['Produto não chegou', 'Ainda não recebi o produto', 'Veio errado', 'Produto com defeito',
+        'Recebi apenas 1 item do pedido', 'Péssimo atendimento, não respondem', 'Quero meu dinheiro de volta'],
+    2: ['Produto diferente do anunciado', 'Demorou muito para chegar', 'Qualidade ruim'],
+    3: ['Produto ok', 'Chegou no prazo mas a embalagem estava danificada', 'Razoável'],
+    4: ['Bom produto', 'Chegou antes do prazo', 'Recomendo'],
+    5: ['Muito bom', 'Excelente produto, recomendo', 'Chegou rápido, tudo certo', 'Perfeito'],
+}
+# 결측 비율 (실제 데이터 기준)
+NULL_RATES = {
+    'order_approved_at': 0.0016,
+    'order_delivered_carrier_date': 0.0179,
+    'review_comment_title': 0.8834,
+    'review_comment_message': 0.5870,
+    'product_category_name': 0.0185,
+    'product_weight_g': 0.0001,
+}
+
+
+def _choice(rng: np.random.Generator, weights: Dict, size: int) -> np.ndarray:
+    keys = list(weights)
+    p = np.array(list(weights.values()), dtype='float64')
+    return np.asarray(keys)[rng.choice(len(keys), size=size, p=p / p.sum())]
+
+
+def _zipf_weights(n: int, exponent: float) -> np.ndarray:
+    weights = 1.0 / np.arange(1, n + 1) ** exponent
+    return weights / weights.sum()
+
+
+def _hex_ids(rng: np.random.Generator, n: int) -> np.ndarray:
+    """32자리 hex id (Olist key 형식)"""
+    raw = rng.integers(0, 2 ** 63, size=(n, 2), dtype='int64', endpoint=False).view('uint64')
+    return np.char.add(np.char.mod('%016x', raw[:, 0]), np.char.mod('%016x', raw[:, 1])).astype(object)
+
+
+def _with_nulls(rng: np.random.Generator, values: pd.Series, rate: float) -> pd.Series:
+    return values.mask(rng.random(len(values)) < rate)
+
+
+def _format_ts(values: pd.Series) -> pd.Series:
+    return values.dt.strftime(TIMESTAMP_FORMAT)
+
+
+def _write(df: pd.DataFrame, path: Path, first: bool) -> None:
+    df.to_csv(path, mode='w' if first else 'a', header=first, index=False)
+
+
+def _dimension_tables(rng: np.random.Generator, scale: float, out: Path) -> Dict[str, np.ndarray]:
+    """상품/판매자/카테고리 번역 + 블록에서 공유할 key/가중치"""
+    n_products = max(int(BASE_ROWS['products'] * scale), 50)
+    n_sellers = max(int(BASE_ROWS['sellers'] * scale), 10)
+    n_zips = max(int(BASE_ROWS['zip_prefixes'] * min(scale, 5)), 100)
+
+    zips = np.sort(rng.choice(np.arange(1000, 100000), size=min(n_zips, 99000), replace=False))
+    zip_weights = rng.permutation(_zipf_weights(len(zips), 0.8))
+    zip_states = _choice(rng, STATES, len(zips))
+    zip_cities = rng.choice(CITIES, size=len(zips))
+
+    seller_ids = _hex_ids(rng, n_sellers)
+    seller_zip = rng.choice(len(zips), size=n_sellers, p=zip_weights)
+    pd.DataFrame({
+        'seller_id': seller_ids,
+        'seller_zip_code_prefix': zips[seller_zip],
+        'seller_city': zip_cities[seller_zip],
+        'seller_state': zip_states[seller_zip],
+    }).to_csv(out / TABLE_FILES['sellers'], index=False)
+
+    product_ids = _hex_ids(rng, n_products)
+    categories = pd.Series(rng.choice(CATEGORIES, size=n_products, p=_zipf_weights(len(CATEGORIES), 1.0)))
+    missing_meta = rng.random(n_products) < NULL_RATES['product_category_name']
+
+    def measure(low, high):
+        return pd.Series(rng.integers(low, high, n_products).astype('float64')).mask(missing_meta)
+
+    weight = pd.Series(rng.lognormal(6.7, 1.2, n_products).round().clip(0, 40_425))
+    pd.DataFrame({
+        'product_id': product_ids,
+        'product_category_name': categories.mask(missing_meta),
+        'product_name_lenght': measure(5, 77),
+        'product_description_lenght': measure(4, 3993),
+        'product_photos_qty': measure(1, 21),
+        'product_weight_g': _with_nulls(rng, weight, NULL_RATES['product_weight_g']),
+        'product_length_cm': rng.integers(7, 106, n_products).astype('float64'),
+        'product_height_cm': rng.integers(2, 106, n_products).astype('float64'),
+        'product_width_cm': rng.integers(6, 119, n_products).astype('float64'),
+    }).to_csv(out / TABLE_FILES['products'], index=False)
+
+    pd.DataFrame({
+        'product_category_name': CATEGORIES,
+        'product_category_name_english': [c.replace('_', ' ') for c in CATEGORIES],
+    }).to_csv(out / TABLE_FILES['category_translation'], index=False)
+
+    return {
+        'n_sellers': n_sellers,
+        'zips': zips, 'zip_weights': zip_weights, 'zip_states': zip_states, 'zip_cities': zip_cities,
+        'product_ids': product_ids,
+        'product_weights': rng.permutation(_zipf_weights(n_products, 0.9)),
+        # 상품마다 판매자 하나 (인기 판매자에게 상품이 몰림)
+        'product_sellers': seller_ids[rng.choice(n_sellers, size=n_products, p=_zipf_weights(n_sellers, 1.1))],
+    }
+
+
+def _order_block(rng: np.random.Generator, n: int, dims: Dict[str, np.ndarray],
+                 out: Path, first: bool) -> Dict[str, int]:
+    """주문 n건과 그에 딸린 고객/상품/결제/리뷰/지리 좌표 행 생성"""
+    order_ids = _hex_ids(rng, n)
+    customer_ids = _hex_ids(rng, n)
+
+    # 고객: 주문마다 customer_id 1개, 재구매 고객은 customer_unique_id 공유 (~3%)
+    unique_ids = _hex_ids(rng, n)
+    repeat = rng.random(n) < 0.03
+    unique_ids[repeat] = unique_ids[rng.integers(0, n, repeat.sum())]
+    customer_zip = rng.choice(len(dims['zips']), size=n, p=dims['zip_weights'])
+    _write(pd.DataFrame({
+        'customer_id': customer_ids,
+        'customer_unique_id': unique_ids,
+        'customer_zip_code_prefix': dims['zips'][customer_zip],
+        'customer_city': dims['zip_cities'][customer_zip],
+        'customer_state': dims['zip_states'][customer_zip],
+    }), out / TABLE_FILES['customers'], first)
+
+    # 주문: 기간 후반으로 갈수록 주문이 많아지는 분포
+    span = (PURCHASE_END - PURCHASE_START).total_seconds()
+    purchase = PURCHASE_START + pd.to_timedelta(rng.beta(2.0, 1.3, n) * span, unit='s')
+    status = _choice(rng, ORDER_STATUS, n)
+    delivered = status == 'delivered'
+    shipped = delivered | (status == 'shipped')
+
+    approved = pd.Series(purchase + pd.to_timedelta(rng.exponential(10 * 3600, n), unit='s'))
+    approved = approved.mask((rng.random(n) < NULL_RATES['order_approved_at']) | (status == 'created'))
+    carrier = pd.Series(purchase + pd.to_timedelta(rng.gamma(2.0, 1.5 * 86400, n) + 3600, unit='s'))
+    carrier = carrier.mask(~shipped | (rng.random(n) < NULL_RATES['order_delivered_carrier_date'] / 2))
+    delivered_at = pd.Series(carrier + pd.to_timedelta(rng.gamma(2.5, 3.5 * 86400, n), unit='s'))
+    delivered_at = delivered_at.mask(~delivered | (rng.random(n) < 0.0003))
+    estimated = pd.Series((purchase + pd.to_timedelta(rng.integers(10, 45, n), unit='D')).normalize())
+
+    _write(pd.DataFrame({
+        'order_id': order_ids,
+        'customer_id': customer_ids,
+        'order_status': status,
+        'order_purchase_timestamp': _format_ts(pd.Series(purchase)),
+        'order_approved_at': _format_ts(approved),
+        'order_delivered_carrier_date': _format_ts(carrier),
+        'order_delivered_customer_date': _format_ts(delivered_at),
+        'order_estimated_delivery_date': _format_ts(estimated),
+    }), out / TABLE_FILES['orders'], first)
+
+    # 주문 상품: 일부 주문은 상품 없음, 상품/판매자는 인기도에 치우침
+    n_items = _choice(rng, ITEMS_PER_ORDER, n).astype('int64')
+    n_items[rng.random(n) < ORDERS_WITHOUT_ITEMS] = 0
+    item_order = np.repeat(np.arange(n), n_items)
+    item_seq = np.arange(len(item_order)) - np.repeat(np.cumsum(n_items) - n_items, n_items) + 1
+    products = rng.choice(len(dims['product_ids']), size=len(item_order), p=dims['product_weights'])
+    price = rng.lognormal(4.4, 0.9, len(item_order)).round(2).clip(0.85, 6735)
+    freight = rng.lognormal(2.8, 0.5, len(item_order)).round(2).clip(0, 409)
+    _write(pd.DataFrame({
+        'order_id': order_ids[item_order],
+        'order_item_id': item_seq,
+        'product_id': dims['product_ids'][products],
+        'seller_id': dims['product_sellers'][products],
+        'shipping_limit_date': _format_ts(pd.Series(purchase[item_order] + pd.Timedelta(days=6))),
+        'price': price,
+        'freight_value': freight,
+    }), out / TABLE_FILES['order_items'], first)
+
+    # 결제: 주문 금액을 1~3개 결제로 나눔 (~3%는 바우처 분할)
+    order_value = np.bincount(item_order, weights=price + freight, minlength=n)
+    order_value[n_items == 0] = rng.lognormal(4.6, 0.8, (n_items == 0).sum())
+    n_payments = np.where(rng.random(n) < 0.03, rng.integers(2, 4, n), 1)
+    pay_order = np.repeat(np.arange(n), n_payments)
+    pay_seq = np.arange(len(pay_order)) - np.repeat(np.cumsum(n_payments) - n_payments, n_payments) + 1
+    pay_type = _choice(rng, PAYMENT_TYPES, len(pay_order))
+    pay_type[pay_seq > 1] = 'voucher'
+    installments = np.where(pay_type == 'credit_card', rng.geometric(0.35, len(pay_order)).clip(1, 24), 1)
+    _write(pd.DataFrame({
+        'order_id': order_ids[pay_order],
+        'payment_sequential': pay_seq,
+        'payment_type': pay_type,
+        'payment_installments': installments,
+        'payment_value': (order_value[pay_order] / n_payments[pay_order]).round(2),
+    }), out / TABLE_FILES['order_payments'], first)
+
+    # 리뷰: 리뷰 없는 주문 ~0.8%, 리뷰 2개인 주문 ~0.5%, 결측 텍스트
+    n_reviews = np.where(rng.random(n) < 0.008, 0, np.where(rng.random(n) < 0.005, 2, 1))
+    review_order = np.repeat(np.arange(n), n_reviews)
+    m = len(review_order)
+    scores = _choice(rng, REVIEW_SCORES, m).astype('int64')
+    messages = np.array([rng.choice(REVIEW_MESSAGES[s]) for s in scores], dtype=object) if m else np.array([], dtype=object)
+    reference = delivered_at.to_numpy()[review_order]
+    reference = np.where(pd.isna(reference), estimated.to_numpy()[review_order], reference)
+    created = pd.Series(pd.to_datetime(reference)).dt.normalize() + pd.Timedelta(days=1)
+    answered = created + pd.to_timedelta(rng.exponential(2.5 * 86400, m), unit='s')
+    _write(pd.DataFrame({
+        'review_id': _hex_ids(rng, m),
+        'order_id': order_ids[review_order],
+        'review_score': scores,
+        'review_comment_title': _with_nulls(rng, pd.Series(rng.choice(['Ruim', 'Bom', 'Ótimo', 'Recomendo'], m)),
+                                            NULL_RATES['review_comment_title']),
+        'review_comment_message': _with_nulls(rng, pd.Series(messages), NULL_RATES['review_comment_message']),
+        'review_creation_date': _format_ts(created),
+        'review_answer_timestamp': _format_ts(answered),
+    }), out / TABLE_FILES['order_reviews'], first)
+
+    # 지리 좌표: zip prefix마다 여러 좌표 (같은 인기도 분포)
+    g = int(n * BASE_ROWS['geolocation_per_order'])
+    geo_zip = rng.choice(len(dims['zips']), size=g, p=dims['zip_weights'])
+    _write(pd.DataFrame({
+        'geolocation_zip_code_prefix': dims['zips'][geo_zip],
+        'geolocation_lat': (-23.5 + (geo_zip % 97) * 0.1 + rng.normal(0, 0.05, g)).round(8),
+        'geolocation_lng': (-46.6 + (geo_zip % 89) * 0.1 + rng.normal(0, 0.05, g)).round(8),
+        'geolocation_city': dims['zip_cities'][geo_zip],
+        'geolocation_state': dims['zip_states'][geo_zip],
+    }), out / TABLE_FILES['geolocation'], first)
+
+    return {'orders': n, 'order_items': len(item_order), 'order_payments': len(pay_order),
+            'order_reviews': m, 'geolocation': g}
+
+
+def generate_olist(output: Path, scale: float = 1.0, seed: int = 0,
+                   block_orders: int = BLOCK_ORDERS, verbose: bool = True) -> Dict:
+    """
+    Olist 형태 합성 CSV 생성
+
+    Parameters:
+    -----------
+    output : Path
+        CSV를 쓸 폴더
+    scale : float
+        실제 Olist 대비 배수 (1 = 주문 약 10만 건)
+    seed : int
+        난수 seed (같은 scale/seed면 같은 데이터)
+    block_orders : int
+        한 번에 생성할 주문 수
+    verbose : bool
+        진행 출력 여부
+
+    Returns:
+    --------
+    Dict
+        생성 정보 (synthetic.json에도 저장)
+    """
+    start = time.perf_counter()
+    output = Path(output)
+    output.mkdir(parents=True, exist_ok=True)
+    rng = np.random.default_rng(seed)
+
+    dims = _dimension_tables(rng, scale, output)
+    total_orders = max(int(BASE_ROWS['orders'] * scale), 100)
+    rows = {'products': len(dims['product_ids']), 'sellers': dims['n_sellers']}
+
+    done = 0
+    while done < total_orders:
+        n = min(block_orders, total_orders - done)
+        for name, count in _order_block(rng, n, dims, output, first=(done == 0)).items():
+            rows[name] = rows.get(name, 0) + count
+        done += n
+        if verbose:
+            print(f"  🧪 주문 {done:,d}/{total_orders:,d}")
+    rows['customers'] = rows['orders']
+
+    info = {
+        'generator_version': GENERATOR_VERSION,
+        'scale': scale,
+        'seed': seed,
+        'rows': rows,
+        'seconds': round(time.perf_counter() - start, 2),
+    }
+    (output / "synthetic.json").write_text(json.dumps(info, indent=2), encoding='utf-8')
+    if verbose:
+        print(f"✅ 합성 데이터 생성 완료: {output} (scale {scale:g}, 주문 {total_orders:,d}건, {info['seconds']:.1f}초)")
+    return info
+
+
+def ensure_olist(output: Path, scale: float = 1.0, seed: int = 0, verbose: bool = True) -> Path:
+    """같은 scale/seed/생성기 버전의 합성 데이터가 있으면 재사용, 없으면 생성"""
+    output = Path(output)
+    try:
+        info = json.loads((output / "synthetic.json").read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        info = {}
+    if info.get('generator_version') != GENERATOR_VERSION or info.get('scale') != scale or info.get('seed') != seed:
+        generate_olist(output, scale, seed, verbose=verbose)
+    return output
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--scale', type=float, default=1.0)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', type=Path, required=True)
+    args = parser.parse_args()
+    generate_olist(args.output, args.scale, args.seed)
+
+
+if __name__ == "__main__":
+    main()
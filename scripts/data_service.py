@@ -0,0 +1,64 @@
+"""
+상주 데이터 서비스 실행 스크립트
+테이블과 파생 프레임(master_orders, master_sellers ...)을 메모리에 올려두고 로컬 HTTP로 제공
+
+실행 예:
+    python scripts/data_service.py                    # 시작 (127.0.0.1:8765)
+    python scripts/data_service.py --status           # 상태/보유 프레임 확인
+    python scripts/data_service.py --refresh          # 바뀐 CSV 다시 로드
+    python scripts/data_service.py --stop             # 종료
+
+사용 (스크립트/노트북):
+    from src.data_service import get_frame
+    master_orders = get_frame('master_orders')
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.getcwd())
+
+from src.data_loader import DATA_PATH
+from src.data_service import DEFAULT_HOST, DEFAULT_PORT, DataServiceClient, serve
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--data-path', type=Path, default=DATA_PATH)
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--no-preload', action='store_true', help="파생 프레임을 첫 요청 때 계산")
+    parser.add_argument('--quiet', action='store_true', help="요청 로그 출력 안 함")
+    action = parser.add_mutually_exclusive_group()
+    action.add_argument('--status', action='store_true')
+    action.add_argument('--refresh', action='store_true')
+    action.add_argument('--stop', action='store_true')
+    args = parser.parse_args()
+
+    if args.status or args.refresh or args.stop:
+        client = DataServiceClient(f"http://{args.host}:{args.port}")
+        if not client.is_available():
+            print(f"❌ 서비스 없음: {client.url}")
+            sys.exit(1)
+        if args.status:
+            info = client.health()
+            print(f"✅ {client.url} (pid {info['pid']}, {info['uptime_seconds']:.0f}초, {info['data_path']})")
+            for name, (rows, cols) in info['frames'].items():
+                print(f"   - {name}: {rows:,d} rows × {cols} cols")
+        elif args.refresh:
+            changed = client.refresh()['changed']
+            print(f"🔄 다시 로드: {', '.join(changed) if changed else '변경 없음'}")
+        else:
+            client.shutdown()
+            print(f"🛑 종료 요청: {client.url}")
+        return
+
+    serve(args.data_path, host=args.host, port=args.port,
+          preload=not args.no_preload, verbose=not args.quiet)
+
+
+if __name__ == "__main__":
+    main()
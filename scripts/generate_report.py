@@ -1,95 +1,207 @@
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
+import hashlib
+import json
 import os
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Dict, Optional
 
 # 프로젝트 루트 경로 추가
 sys.path.append(os.getcwd())
 
-from src.data_loader import load_all_tables
-from src.utils import set_korean_font
-
-def generate_quality_report():
-    # 1. 환경 설정 및 데이터 로드
-    set_korean_font()
-    tables = load_all_tables(verbose=False)
-    
-    report_dir = Path("reports")
-    img_dir = Path("images/eda")
-    report_dir.mkdir(parents=True, exist_ok=True)
-    img_dir.mkdir(parents=True, exist_ok=True)
-    
+from src.data_loader import DATA_PATH, TABLE_FILES, table_content_hash
+from src.data_service import get_frame
+from src.profiling import profile_table
+from src.schema import schema_signature
+
+# 섹션 렌더링 방식(마크다운 형식, 그림 스타일)이 바뀌면 올려서 캐시를 무효화
+RENDER_VERSION = 1
+
+REPORT_DIR = Path("reports")
+IMG_DIR = Path("images/eda")
+# 테이블별 섹션 캐시 (마크다운 조각 + 캐시 key)
+SECTION_CACHE_DIR = REPORT_DIR / ".cache"
+
+
+def _section_key(table_name: str, data_path: Path) -> str:
+    """섹션 캐시 key - 테이블 원본 내용 해시 + 스키마(dtype) + 렌더링 버전"""
+    payload = json.dumps({
+        'table': table_name,
+        'content': table_content_hash(table_name, data_path),
+        'schema': schema_signature(table_name),
+        'render': RENDER_VERSION,
+    }, sort_keys=True)
+    return hashlib.md5(payload.encode('utf-8')).hexdigest()
+
+
+def _load_cached_section(table_name: str, key: str) -> Optional[Dict]:
+    """key가 같고 그림 파일도 남아 있으면 캐시된 섹션 반환"""
+    cache_file = SECTION_CACHE_DIR / f"{table_name}.json"
+    try:
+        section = json.loads(cache_file.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return None
+    if section.get('key') != key:
+        return None
+    if section.get('figure') and not Path(section['figure']).exists():
+        return None
+    return section
+
+
+def _save_cached_section(table_name: str, section: Dict) -> None:
+    SECTION_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    cache_file = SECTION_CACHE_DIR / f"{table_name}.json"
+    tmp_file = cache_file.with_name(cache_file.name + '.tmp')
+    tmp_file.write_text(json.dumps(section, ensure_ascii=False, indent=2), encoding='utf-8')
+    os.replace(tmp_file, cache_file)
+
+
+def render_section(table_name: str, data_path: Path, key: str) -> Dict:
+    """
+    테이블 1개의 보고서 섹션(마크다운 + boxplot 그림) 생성
+
+    그림은 pyplot 없이 Figure로 직접 그려 파일로만 저장한다 (호출한 프로세스의 backend,
+    rc 설정, 경고 필터를 바꾸지 않으므로 노트북에서 호출해도 안전).
+
+    Returns:
+    --------
+    Dict
+        {'key', 'markdown', 'figure'} - figure는 그림 파일 경로 (없으면 None)
+    """
+    import matplotlib
+    from matplotlib.figure import Figure
+    from src.utils import calculate_boxplot_stats, korean_font_rc
+
+    # 같은 데이터의 상주 서비스(scripts/data_service.py)가 떠 있으면 로드된 테이블을 받아옴
+    df = get_frame(table_name, data_path)
+    content = f"## 📊 {table_name.upper()} 테이블\n\n"
+
+    # 테이블 프로파일 (결측치/기술통계를 한 번에 계산)
+    profile = profile_table(df, table_name, version=key)
+    stats = profile['column_stats']
+
+    # 1. 결측치 분석
+    missing = stats.loc[stats['nulls'] > 0, 'nulls']
+
+    content += "### 🔍 1. 결측치 현황\n"
+    if len(missing) == 0:
+        content += "- ✅ 결측치 없음\n\n"
+    else:
+        content += "| 컬럼명 | 결측치 수 | 비율 (%) |\n"
+        content += "| :--- | :---: | :---: |\n"
+        for col, count in missing.items():
+            pct = (count / profile['rows']) * 100
+            content += f"| {col} | {count:,} | {pct:.2f}% |\n"
+        content += "\n"
+
+    # 2. 기술통계량 분석
+    desc = stats[stats['is_numeric']]
+    if not desc.empty:
+        content += "### 🔢 2. 수치형 컬럼 기술통계\n\n"
+
+        # 마크다운 테이블 직접 생성
+        content += "| 컬럼 | count | mean | std | min | 25% | 50% | 75% | max |\n"
+        content += "| :--- | :---: | :---: | :---: | :---: | :---: | :---: | :---: | :---: |\n"
+        for col, row in desc.iterrows():
+            content += f"| {col} | {row['count']:.0f} | {row['mean']:.2f} | {row['std']:.2f} | {row['min']:.2f} | {row['25%']:.2f} | {row['50%']:.2f} | {row['75%']:.2f} | {row['max']:.2f} |\n"
+        content += "\n"
+
+    # 3. 이상치 분석 (Boxplot)
+    num_cols = desc.index.tolist()
+    # ID 성격의 컬럼 제외 (zip_code 등)
+    plot_cols = [c for c in num_cols if 'zip' not in c.lower() and c != 'payment_sequential']
+
+    figure = None
+    if plot_cols:
+        content += "### 📈 3. 이상치 분석 (Boxplot)\n"
+
+        # 전체 데이터 대신 분위수/수염 요약값으로 그림
+        boxes = calculate_boxplot_stats(df, plot_cols)
+        color = matplotlib.colormaps['Set2'](0)
+        img_path = IMG_DIR / f"{table_name}_boxplot.png"
+
+        with matplotlib.rc_context(korean_font_rc()):
+            fig = Figure(figsize=(max(4 * len(plot_cols), 10), 6))
+            axes = fig.subplots(1, len(plot_cols))
+            if len(plot_cols) == 1: axes = [axes]
+
+            for ax, box in zip(axes, boxes):
+                ax.bxp([box], showfliers=True, patch_artist=True,
+                       boxprops={'facecolor': color}, medianprops={'color': 'black'},
+                       flierprops={'marker': 'd', 'markersize': 4, 'markerfacecolor': 'gray'})
+                ax.set_title(f"{box['label']}")
+                ax.set_ylabel("Value")
+                ax.set_xticks([])
+
+            fig.tight_layout()
+            fig.savefig(img_path)
+        figure = str(img_path)
+
+        content += f"![{table_name} Boxplot](../images/eda/{table_name}_boxplot.png)\n\n"
+
+    content += "---\n\n"
+    return {'key': key, 'markdown': content, 'figure': figure}
+
+
+def generate_quality_report(data_path: Path = DATA_PATH,
+                            use_cache: bool = True,
+                            max_workers: Optional[int] = None) -> Path:
+    """
+    데이터 품질 보고서 생성
+
+    테이블별 섹션은 원본 내용 해시로 캐시하고, 바뀐 테이블만 프로세스 풀에서
+    다시 렌더링한다. 아무것도 바뀌지 않았으면 테이블을 로드하지 않는다.
+
+    Parameters:
+    -----------
+    data_path : Path
+        CSV 파일 경로
+    use_cache : bool
+        섹션 캐시 사용 여부 (False면 전체 재생성)
+    max_workers : int
+        프로세스 수 (None이면 CPU 수)
+    """
+    start = time.perf_counter()
+    REPORT_DIR.mkdir(parents=True, exist_ok=True)
+    IMG_DIR.mkdir(parents=True, exist_ok=True)
+
+    table_names = [name for name, file in TABLE_FILES.items() if (Path(data_path) / file).exists()]
+    keys = {name: _section_key(name, data_path) for name in table_names}
+
+    sections = {}
+    for name in table_names:
+        cached = _load_cached_section(name, keys[name]) if use_cache else None
+        if cached is not None:
+            sections[name] = cached
+
+    pending = [name for name in table_names if name not in sections]
+    if len(pending) == 1 or max_workers == 1:
+        for name in pending:
+            sections[name] = render_section(name, data_path, keys[name])
+            _save_cached_section(name, sections[name])
+    elif pending:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {name: executor.submit(render_section, name, data_path, keys[name]) for name in pending}
+            for name, future in futures.items():
+                sections[name] = future.result()
+                _save_cached_section(name, sections[name])
+
     report_content = "# Olist 데이터셋 품질 및 기술통계 분석 보고서\n\n"
     report_content += "본 보고서는 Olist 데이터셋의 결측치 현황, 주요 수치형 변수의 기술통계, 그리고 이상치 분석 결과를 포함합니다.\n\n"
-    
-    # 2. 테이블별 분석
-    for table_name, df in tables.items():
-        if df is None: continue
-        
-        report_content += f"## 📊 {table_name.upper()} 테이블\n\n"
-        
-        # 2.1 결측치 분석
-        missing = df.isnull().sum()
-        missing = missing[missing > 0]
-        
-        report_content += "### 🔍 1. 결측치 현황\n"
-        if len(missing) == 0:
-            report_content += "- ✅ 결측치 없음\n\n"
-        else:
-            report_content += "| 컬럼명 | 결측치 수 | 비율 (%) |\n"
-            report_content += "| :--- | :---: | :---: |\n"
-            for col, count in missing.items():
-                pct = (count / len(df)) * 100
-                report_content += f"| {col} | {count:,} | {pct:.2f}% |\n"
-            report_content += "\n"
-            
-        # 2.2 기술통계량 분석
-        num_df = df.select_dtypes(include=['number'])
-        if not num_df.empty:
-            report_content += "### 🔢 2. 수치형 컬럼 기술통계\n\n"
-            desc = num_df.describe().transpose()
-            
-            # 마크다운 테이블 직접 생성
-            report_content += "| 컬럼 | count | mean | std | min | 25% | 50% | 75% | max |\n"
-            report_content += "| :--- | :---: | :---: | :---: | :---: | :---: | :---: | :---: | :---: |\n"
-            for col, stats in desc.iterrows():
-                report_content += f"| {col} | {stats['count']:.0f} | {stats['mean']:.2f} | {stats['std']:.2f} | {stats['min']:.2f} | {stats['25%']:.2f} | {stats['50%']:.2f} | {stats['75%']:.2f} | {stats['max']:.2f} |\n"
-            report_content += "\n"
-        
-        # 2.3 이상치 분석 (Boxplot)
-        num_cols = num_df.columns.tolist()
-        # ID 성격의 컬럼 제외 (zip_code 등)
-        plot_cols = [c for c in num_cols if 'zip' not in c.lower() and c != 'payment_sequential']
-        
-        if plot_cols:
-            report_content += "### 📈 3. 이상치 분석 (Boxplot)\n"
-            
-            # 그래프 생성
-            fig, axes = plt.subplots(1, len(plot_cols), figsize=(max(4 * len(plot_cols), 10), 6))
-            if len(plot_cols) == 1: axes = [axes]
-            
-            for i, col in enumerate(plot_cols):
-                sns.boxplot(y=df[col].dropna(), ax=axes[i], palette='Set2')
-                axes[i].set_title(f"{col}")
-                axes[i].set_ylabel("Value")
-            
-            plt.tight_layout()
-            img_path = img_dir / f"{table_name}_boxplot.png"
-            plt.savefig(img_path)
-            plt.close()
-            
-            report_content += f"![{table_name} Boxplot](../images/eda/{table_name}_boxplot.png)\n\n"
-            
-        report_content += "---\n\n"
-        
-    # 3. 파일 저장
-    report_file = report_dir / "01_data_quality_report.md"
-    with open(report_file, "w", encoding='utf-8') as f:
-        f.write(report_content)
-    
-    print(f"✅ 보고서 생성 완료: {report_file}")
+    report_content += "".join(sections[name]['markdown'] for name in table_names)
+
+    # 파일 저장 (내용이 같으면 그대로 둠)
+    report_file = REPORT_DIR / "01_data_quality_report.md"
+    if not report_file.exists() or report_file.read_text(encoding='utf-8') != report_content:
+        with open(report_file, "w", encoding='utf-8') as f:
+            f.write(report_content)
+
+    elapsed = time.perf_counter() - start
+    print(f"✅ 보고서 생성 완료: {report_file} "
+          f"(재생성 {len(pending)}개 / 캐시 {len(table_names) - len(pending)}개 테이블, {elapsed:.2f}초)")
+    return report_file
+
 
 if __name__ == "__main__":
     generate_quality_report()
@@ -0,0 +1,79 @@
+"""
+리뷰 번역 스크립트 (포르투갈어 → 한국어)
+src.translation으로 리뷰 제목/본문을 번역해서 data/review_ko/에 저장
+
+실행 예:
+    python scripts/translate_reviews.py --backend stub --score 1
+    python scripts/translate_reviews.py --backend google --score 1 --seed-csv data/review_ko/one_star_reviews_translated.csv
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.getcwd())
+
+from src.data_loader import DATA_PATH, read_table
+from src.translation import (
+    TRANSLATION_CACHE_PATH, GoogleBackend, StubBackend, TransformersBackend,
+    TranslationCache, import_translations, translate_column
+)
+
+BACKENDS = {
+    'stub': StubBackend,
+    'google': GoogleBackend,
+    'transformers': TransformersBackend,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--backend', choices=sorted(BACKENDS), default='stub')
+    parser.add_argument('--data-path', type=Path, default=DATA_PATH)
+    parser.add_argument('--score', type=int, default=None, help="이 점수의 리뷰만 번역 (기본: 전체)")
+    parser.add_argument('--limit', type=int, default=None)
+    parser.add_argument('--batch-size', type=int, default=None)
+    parser.add_argument('--concurrency', type=int, default=4)
+    parser.add_argument('--cache', type=Path, default=TRANSLATION_CACHE_PATH)
+    parser.add_argument('--seed-csv', type=Path, default=None,
+                        help="기존 번역 CSV (review_comment_message/message_ko, review_comment_title/title_ko)를 캐시에 등록")
+    parser.add_argument('--output', type=Path,
+                        default=Path("data/review_ko/reviews_translated.csv"))
+    args = parser.parse_args()
+
+    backend = BACKENDS[args.backend]()
+    reviews = read_table('order_reviews', args.data_path,
+                         columns=['order_id', 'review_score', 'review_comment_title', 'review_comment_message'])
+
+    target = reviews[reviews['review_comment_message'].notna()]
+    if args.score is not None:
+        target = target[target['review_score'] == args.score]
+    if args.limit is not None:
+        target = target.head(args.limit)
+    target = target.copy()
+
+    with TranslationCache(args.cache) as cache:
+        if args.seed_csv is not None:
+            seed = pd.read_csv(args.seed_csv, encoding='utf-8-sig')
+            n_seeded = 0
+            for source_col, ko_col in (('review_comment_message', 'message_ko'),
+                                       ('review_comment_title', 'title_ko')):
+                if source_col in seed.columns and ko_col in seed.columns:
+                    n_seeded += import_translations(cache, backend, zip(seed[source_col], seed[ko_col]))
+            print(f"📥 기존 번역 {n_seeded:,d}건 캐시 등록 ({args.seed_csv})\n")
+
+        kwargs = {'batch_size': args.batch_size, 'max_concurrency': args.concurrency}
+        target['message_ko'] = translate_column(target, 'review_comment_message', backend, cache, **kwargs)
+        target['title_ko'] = translate_column(target, 'review_comment_title', backend, cache, **kwargs)
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    target.to_csv(args.output, index=False, encoding='utf-8-sig')
+    print(f"✅ 저장 완료: {args.output} ({len(target):,d}건)")
+
+
+if __name__ == "__main__":
+    main()
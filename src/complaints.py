@@ -0,0 +1,261 @@
+"""
+1점 리뷰 불만 유형 분류 모듈
+유형별 키워드를 정규식 하나로 컴파일해서 리뷰 컬럼 전체를 한 번에 분류하고,
+결과를 (리뷰 × 유형) boolean 행렬로 돌려주는 함수들
+"""
+
+import re
+from itertools import chain
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional, Tuple
+
+
+# 불만 유형별 키워드 (one_star_review.ipynb Step 3 분석 기반)
+COMPLAINT_KEYWORDS: Dict[str, List[str]] = {
+    '배송 미수령': [
+        '받지', '못했습니다', '못했어요', '못받', '안왔', '오지',
+        '도착하지', '배송되지', '배송되었습니다',
+        '아직', '아직도', '아직까지', '지금까지', '현재까지',
+        '기다리고', '기다리는'
+    ],
+    '수량 불일치': [
+        '1개만', '2개만', '3개만', '하나만', '2개', '3개',
+        '누락', '누락되었습니다', '빠진', '빠졌', '부족',
+        '2개를', '함께', '없이', '빠져'
+    ],
+    '제품 불일치': [
+        '다른', '다릅니다', '잘못된', '잘못', '틀린',
+        '일치하지', '맞지', '설명과', '사진과',
+        '광고와', '다르게', '이상한', '것과'
+    ],
+    '제품 품질': [
+        '품질', '품질이', '결함', '결함이', '불량',
+        '파손', '깨진', '망가진', '문제가', '문제를',
+        '작동하지', '끔찍한', '나쁜', '좋지'
+    ],
+    '고객 응대': [
+        '답변', '답변을', '응답', '응답을', '응답이',
+        '연락', '연락을', '이메일', '이메일을',
+        '아무도', '아무런', '전혀', '무시'
+    ],
+    '환불/반품': [
+        '환불', '환불을', '반품', '반품을', '반품하고',
+        '교환', '교환을', '취소', '돌려', '돌려받고',
+        '반송'
+    ],
+    '배송 지연': [
+        '늦게', '지연', '오래', '시간이', '시간에',
+        '기한', '기한이', '지났는데', '마감'
+    ]
+}
+
+# 어느 유형에도 해당하지 않는 리뷰
+OTHER_LABEL = '기타'
+
+# complaint_types_str 구분자 (기존 CSV 형식)
+TYPES_SEPARATOR = ', '
+
+
+def _keyword_trie_regex(keywords: List[str]) -> str:
+    """
+    키워드 목록 → 공통 접두어로 묶은 정규식 (가장 긴 키워드를 우선 매칭)
+
+    예: ['아직', '아직도', '아직까지'] → '아직(?:까지|도)?'
+    """
+    trie: Dict = {}
+    for keyword in keywords:
+        node = trie
+        for ch in keyword:
+            node = node.setdefault(ch, {})
+        node[''] = {}
+
+    def build(node: Dict) -> str:
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        return f'(?:{body})?' if '' in node else body
+
+    return build(trie)
+
+
+def _classify_chunk(pattern: re.Pattern, texts: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """텍스트 목록에서 키워드 매칭 → (행 번호, 매칭 키워드) 배열"""
+    found = [pattern.findall(text) for text in texts]
+    lengths = np.fromiter(map(len, found), dtype='int64', count=len(found))
+    rows = np.repeat(np.arange(len(found), dtype='int64'), lengths)
+    return rows, np.fromiter(chain.from_iterable(found), dtype=object, count=int(lengths.sum()))
+
+
+class ComplaintClassifier:
+    """
+    키워드 기반 불만 유형 분류기
+
+    모든 유형의 키워드를 공통 접두어 trie 형태의 정규식 하나로 컴파일한다.
+    모든 시작 위치에서 가장 긴 키워드가 잡히고, 같은 위치에서 시작하는 더 짧은
+    키워드(접두어)의 유형도 함께 켜지므로 결과는 유형마다
+    `any(keyword in text)` 한 것과 같다.
+
+    Parameters:
+    -----------
+    keywords : Dict[str, List[str]]
+        유형 → 키워드 목록 (None이면 COMPLAINT_KEYWORDS)
+    other_label : str
+        어느 유형에도 해당하지 않는 리뷰의 라벨 (None이면 컬럼을 만들지 않음)
+    """
+
+    def __init__(self,
+                 keywords: Optional[Dict[str, List[str]]] = None,
+                 other_label: Optional[str] = OTHER_LABEL):
+        keywords = COMPLAINT_KEYWORDS if keywords is None else keywords
+        self.categories = list(keywords)
+        self.other_label = other_label
+
+        all_tokens = sorted({kw.lower() for kws in keywords.values() for kw in kws},
+                            key=lambda kw: (-len(kw), kw))
+        # 첫 글자 charset으로 후보 위치만 빠르게 찾고, 그 위치에서 시작하는 가장 긴 키워드를
+        # lookbehind 안의 lookahead로 캡처 (한 글자씩만 소비하므로 겹치는 키워드도 모두 찾음)
+        first_chars = ''.join(sorted({token[0] for token in all_tokens}))
+        self.pattern = re.compile(
+            f'[{re.escape(first_chars)}](?<=(?=({_keyword_trie_regex(all_tokens)})).)'
+        )
+
+        # 키워드 → 유형 boolean 벡터 (자기 자신의 접두어인 키워드의 유형 포함)
+        self.tokens = all_tokens
+        self.token_index = {token: i for i, token in enumerate(all_tokens)}
+        self.token_categories = np.zeros((len(all_tokens), len(self.categories)), dtype=bool)
+        for j, category in enumerate(self.categories):
+            category_tokens = {kw.lower() for kw in keywords[category]}
+            for i, token in enumerate(all_tokens):
+                if any(token.startswith(kw) for kw in category_tokens):
+                    self.token_categories[i, j] = True
+
+    @property
+    def columns(self) -> List[str]:
+        return self.categories + ([self.other_label] if self.other_label is not None else [])
+
+    def classify(self, texts: pd.Series, n_jobs: int = 1, chunksize: int = 20_000) -> pd.DataFrame:
+        """
+        텍스트 컬럼 분류 → (리뷰 × 유형) boolean 행렬
+
+        같은 텍스트는 한 번만 매칭한다. n_jobs > 1이면 고유 텍스트를
+        chunksize씩 나눠 프로세스 풀에서 매칭한다.
+
+        Parameters:
+        -----------
+        texts : pd.Series
+            리뷰 텍스트 (결측은 모든 유형 False, 기타도 False)
+        n_jobs : int
+            매칭 프로세스 수
+        chunksize : int
+            병렬 모드에서 프로세스 하나가 맡을 텍스트 수
+
+        Returns:
+        --------
+        pd.DataFrame
+            texts와 같은 index, 컬럼 = 유형 (+ 기타)
+        """
+        codes, uniques = pd.factorize(texts)
+        lowered = pd.Series(uniques).astype(str).str.lower().tolist()
+
+        if n_jobs > 1 and len(lowered) > chunksize:
+            from concurrent.futures import ProcessPoolExecutor
+            starts = list(range(0, len(lowered), chunksize))
+            with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+                parts = list(executor.map(_classify_chunk,
+                                          [self.pattern] * len(starts),
+                                          [lowered[s:s + chunksize] for s in starts]))
+            rows = np.concatenate([part_rows + s for (part_rows, _), s in zip(parts, starts)])
+            tokens = np.concatenate([part_tokens for _, part_tokens in parts])
+        else:
+            rows, tokens = _classify_chunk(self.pattern, lowered)
+
+        # 고유 텍스트 × 유형 행렬
+        unique_matrix = np.zeros((len(uniques) + 1, len(self.categories)), dtype=bool)
+        if len(rows):
+            token_ids = np.array([self.token_index[t] for t in tokens], dtype='int64')
+            for j in range(len(self.categories)):
+                hit = self.token_categories[token_ids, j]
+                unique_matrix[rows[hit], j] = True
+
+        # 결측(code -1)은 마지막 행(전부 False)을 가리키게 해서 원래 순서로 펼침
+        matrix = unique_matrix[np.where(codes < 0, len(uniques), codes)]
+        result = pd.DataFrame(matrix, index=texts.index, columns=self.categories)
+
+        if self.other_label is not None:
+            result[self.other_label] = ~matrix.any(axis=1) & (codes >= 0)
+        return result
+
+
+_DEFAULT_CLASSIFIER: Optional[ComplaintClassifier] = None
+
+
+def classify_complaints(texts: pd.Series,
+                        keywords: Optional[Dict[str, List[str]]] = None,
+                        n_jobs: int = 1) -> pd.DataFrame:
+    """
+    불만 유형 분류 (기본 키워드는 컴파일한 분류기를 재사용)
+
+    Parameters:
+    -----------
+    texts : pd.Series
+        리뷰 텍스트 (예: df['message_ko'])
+    keywords : Dict[str, List[str]]
+        유형 → 키워드 목록 (None이면 COMPLAINT_KEYWORDS)
+    n_jobs : int
+        매칭 프로세스 수
+
+    Returns:
+    --------
+    pd.DataFrame
+        (리뷰 × 유형) boolean 행렬 - 유형별 필터는 df[matrix['배송 미수령']]
+    """
+    global _DEFAULT_CLASSIFIER
+    if keywords is not None:
+        return ComplaintClassifier(keywords).classify(texts, n_jobs=n_jobs)
+    if _DEFAULT_CLASSIFIER is None:
+        _DEFAULT_CLASSIFIER = ComplaintClassifier()
+    return _DEFAULT_CLASSIFIER.classify(texts, n_jobs=n_jobs)
+
+
+def complaint_types_to_str(matrix: pd.DataFrame) -> pd.Series:
+    """boolean 행렬 → 기존 complaint_types_str 형식 ('배송 미수령, 제품 품질')"""
+    labels = np.asarray(matrix.columns, dtype=object)
+    values = matrix.to_numpy(dtype=bool)
+    joined = [TYPES_SEPARATOR.join(labels[row]) if row.any() else np.nan for row in values]
+    return pd.Series(joined, index=matrix.index, name='complaint_types_str')
+
+
+def complaint_types_from_str(types_str: pd.Series,
+                             columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    저장된 complaint_types_str 컬럼 → boolean 행렬 (split/apply 없이 한 번에)
+
+    Parameters:
+    -----------
+    types_str : pd.Series
+        '유형1, 유형2' 형식 문자열 컬럼
+    columns : List[str]
+        결과 컬럼 순서 (None이면 COMPLAINT_KEYWORDS 유형 + 기타)
+    """
+    columns = list(COMPLAINT_KEYWORDS) + [OTHER_LABEL] if columns is None else columns
+    dummies = types_str.str.get_dummies(sep=TYPES_SEPARATOR).astype(bool)
+    return dummies.reindex(columns=columns, fill_value=False)
+
+
+def count_complaint_types(matrix: pd.DataFrame) -> pd.DataFrame:
+    """
+    유형별 건수/비율 (중복 가능, 건수 내림차순)
+
+    Returns:
+    --------
+    pd.DataFrame
+        index=유형, 컬럼: count, percentage
+    """
+    counts = matrix.sum().sort_values(ascending=False)
+    counts = counts[counts > 0]
+    return pd.DataFrame({
+        'count': counts.astype('int64'),
+        'percentage': (counts / len(matrix) * 100).round(2) if len(matrix) else 0.0,
+    })
@@ -3,11 +3,21 @@ Olist 데이터 로드 모듈
 8개 테이블을 읽고 기본 정보를 확인하는 함수들
 """
 
+import hashlib
+import importlib.util
+import json
+import os
+import threading
+import time
+import numpy as np
 import pandas as pd
+from collections.abc import MutableMapping
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Tuple
-import warnings
-warnings.filterwarnings('ignore')
+from typing import Dict, Iterator, List, Optional, Tuple
+from src.instrument import instrumented
+from src.profiling import profile_table
+from src.schema import apply_schema, read_csv_dtypes, schema_signature, untyped_memory_usage
 
 
 # 데이터 경로 설정 (수정됨!)
@@ -18,7 +28,251 @@ warnings.filterwarnings('ignore')
 DATA_PATH = Path(__file__).parent.parent / "data" / "processed_v2"
 
 
-def load_all_tables(data_path: Path = DATA_PATH, verbose: bool = True) -> Dict[str, pd.DataFrame]:
+TABLE_FILES = {
+    'customers': 'olist_customers_dataset.csv',
+    'geolocation': 'olist_geolocation_dataset.csv',
+    'order_items': 'olist_order_items_dataset.csv',
+    'order_payments': 'olist_order_payments_dataset.csv',
+    'order_reviews': 'olist_order_reviews_dataset.csv',
+    'orders': 'olist_orders_dataset.csv',
+    'products': 'olist_products_dataset.csv',
+    'sellers': 'olist_sellers_dataset.csv',
+    'category_translation': 'product_category_name_translation.csv'
+}
+
+# 컬럼형(Parquet) 캐시 설정
+# 캐시는 기본적으로 CSV 폴더 아래 .cache/ 에 테이블별로 저장된다
+CACHE_DIR_NAME = ".cache"
+CACHE_FORMAT_VERSION = 1
+
+
+def _parquet_available() -> bool:
+    """Parquet 엔진(pyarrow) 설치 여부 - import 없이 확인"""
+    return importlib.util.find_spec('pyarrow') is not None
+
+
+def _file_digest(file_path: Path, chunk_size: int = 1 << 20) -> str:
+    """파일 내용 해시(md5) 계산"""
+    digest = hashlib.md5()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(chunk_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _source_signature(file_path: Path) -> Dict:
+    """원본 CSV의 크기/수정시각"""
+    stat = file_path.stat()
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+
+def _cache_files(table_name: str, cache_dir: Path, typed: bool = True) -> Tuple[Path, Path]:
+    """테이블별 캐시 파일 (데이터, 메타) 경로 - 스키마 미적용 버전은 .raw 접미사"""
+    stem = table_name if typed else f"{table_name}.raw"
+    return cache_dir / f"{stem}.parquet", cache_dir / f"{stem}.meta.json"
+
+
+def _write_json_atomic(path: Path, payload: Dict) -> None:
+    tmp_path = path.with_name(path.name + '.tmp')
+    tmp_path.write_text(json.dumps(payload, indent=2), encoding='utf-8')
+    os.replace(tmp_path, path)
+
+
+def _is_cache_valid(file_path: Path, parquet_file: Path, meta_file: Path,
+                    schema: str, verify_hash: bool = False) -> bool:
+    """
+    캐시가 원본 CSV와 일치하는지 확인
+
+    크기가 다르면 무효, 크기/mtime이 같으면 유효로 본다.
+    mtime만 바뀐 경우(git checkout 등)는 내용 해시로 재확인하고,
+    해시가 같으면 메타만 갱신해서 캐시를 그대로 쓴다.
+    스키마 정의가 바뀐 경우에도 무효.
+    """
+    if not parquet_file.exists() or not meta_file.exists():
+        return False
+
+    try:
+        meta = json.loads(meta_file.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return False
+
+    if meta.get('version') != CACHE_FORMAT_VERSION or meta.get('schema') != schema:
+        return False
+
+    signature = _source_signature(file_path)
+    if meta.get('size') != signature['size']:
+        return False
+    if meta.get('mtime_ns') == signature['mtime_ns'] and not verify_hash:
+        return True
+
+    if meta.get('md5') != _file_digest(file_path):
+        return False
+
+    if meta.get('mtime_ns') != signature['mtime_ns']:
+        meta.update(signature)
+        _write_json_atomic(meta_file, meta)
+    return True
+
+
+def _write_cache(df: pd.DataFrame, file_path: Path, parquet_file: Path, meta_file: Path,
+                 schema: str) -> None:
+    """DataFrame을 Parquet 캐시로 저장 (임시 파일 → rename)"""
+    parquet_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = parquet_file.with_name(parquet_file.name + '.tmp')
+    df.to_parquet(tmp_file, index=False)
+    os.replace(tmp_file, parquet_file)
+
+    meta = {
+        'version': CACHE_FORMAT_VERSION,
+        'schema': schema,
+        'source': str(file_path),
+        'md5': _file_digest(file_path),
+        **_source_signature(file_path),
+    }
+    _write_json_atomic(meta_file, meta)
+
+
+@instrumented
+def table_content_hash(table_name: str, data_path: Path = DATA_PATH) -> str:
+    """
+    원본 CSV 내용 해시(md5)
+
+    Parquet 캐시 메타의 크기/mtime이 원본과 같으면 메타에 기록된 해시를 그대로
+    쓰고, 아니면 파일을 읽어 새로 계산한다.
+    """
+    file_path = Path(data_path) / TABLE_FILES[table_name]
+    signature = _source_signature(file_path)
+
+    cache_dir = Path(data_path) / CACHE_DIR_NAME
+    for typed in (True, False):
+        _, meta_file = _cache_files(table_name, cache_dir, typed=typed)
+        try:
+            meta = json.loads(meta_file.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            continue
+        if (meta.get('md5') and meta.get('size') == signature['size']
+                and meta.get('mtime_ns') == signature['mtime_ns']):
+            return meta['md5']
+
+    return _file_digest(file_path)
+
+
+def _read_csv(file_path: Path, table_name: str,
+              columns: Optional[List[str]] = None, typed: bool = True) -> pd.DataFrame:
+    """CSV 파싱 (typed=True면 TABLE_SCHEMAS 적용)"""
+    if not typed:
+        return pd.read_csv(file_path, encoding='utf-8', usecols=columns)
+
+    df = pd.read_csv(file_path, encoding='utf-8', usecols=columns,
+                     dtype=read_csv_dtypes(table_name, columns))
+    return apply_schema(df, table_name)
+
+
+def _read_table(table_name: str,
+                data_path: Path = DATA_PATH,
+                columns: Optional[List[str]] = None,
+                use_cache: bool = True,
+                cache_dir: Optional[Path] = None,
+                verify_hash: bool = False,
+                typed: bool = True) -> Tuple[pd.DataFrame, str]:
+    """read_table 본체 - (DataFrame, 'cache' | 'csv') 반환"""
+    file_path = Path(data_path) / TABLE_FILES[table_name]
+
+    if not use_cache or not _parquet_available():
+        return _read_csv(file_path, table_name, columns=columns, typed=typed), 'csv'
+
+    cache_dir = Path(data_path) / CACHE_DIR_NAME if cache_dir is None else Path(cache_dir)
+    parquet_file, meta_file = _cache_files(table_name, cache_dir, typed=typed)
+    schema = schema_signature(table_name) if typed else 'raw'
+
+    if _is_cache_valid(file_path, parquet_file, meta_file, schema, verify_hash=verify_hash):
+        return pd.read_parquet(parquet_file, columns=columns), 'cache'
+
+    # 캐시가 없거나 무효 → CSV 전체를 읽어 캐시 재생성
+    df = _read_csv(file_path, table_name, typed=typed)
+    try:
+        _write_cache(df, file_path, parquet_file, meta_file, schema)
+    except OSError:
+        # 읽기 전용 경로 등 캐시를 쓸 수 없는 경우 CSV 결과만 반환
+        pass
+
+    if columns is not None:
+        df = df[list(columns)]
+    return df, 'csv'
+
+
+@instrumented
+def read_table(table_name: str,
+               data_path: Path = DATA_PATH,
+               columns: Optional[List[str]] = None,
+               use_cache: bool = True,
+               cache_dir: Optional[Path] = None,
+               verify_hash: bool = False,
+               typed: bool = True) -> pd.DataFrame:
+    """
+    테이블 하나를 로드 (Parquet 캐시 사용)
+
+    첫 로드 시 CSV를 파싱해서 Parquet 캐시를 만들고, 이후에는 캐시를 읽는다.
+    원본 CSV의 크기/mtime/해시나 스키마 정의가 바뀌면 캐시를 다시 만든다.
+    pyarrow가 없으면 캐시 없이 CSV를 직접 읽는다.
+
+    Parameters:
+    -----------
+    table_name : str
+        TABLE_FILES의 테이블명 (예: 'orders')
+    data_path : Path
+        CSV 파일이 있는 경로
+    columns : List[str]
+        읽을 컬럼 목록 (None이면 전체). 캐시에서는 해당 컬럼만 읽는다
+    use_cache : bool
+        Parquet 캐시 사용 여부
+    cache_dir : Path
+        캐시 폴더 (None이면 data_path / '.cache')
+    verify_hash : bool
+        크기/mtime이 같아도 내용 해시까지 확인할지 여부
+    typed : bool
+        src.schema.TABLE_SCHEMAS의 compact dtype 적용 여부
+
+    Returns:
+    --------
+    pd.DataFrame
+        로드된 테이블
+    """
+    df, _ = _read_table(table_name, data_path, columns=columns, use_cache=use_cache,
+                        cache_dir=cache_dir, verify_hash=verify_hash, typed=typed)
+    return df
+
+
+def _timed_read(table_name: str,
+                data_path: Path,
+                columns: Optional[List[str]],
+                use_cache: bool,
+                typed: bool) -> Tuple[str, Optional[pd.DataFrame], Optional[str], float]:
+    """
+    테이블 하나를 읽고 소요 시간을 함께 반환 (스레드/프로세스 풀 작업 단위)
+
+    파일이 없으면 DataFrame과 source 자리에 None을 돌려준다.
+    """
+    start = time.perf_counter()
+    try:
+        df, source = _read_table(table_name, data_path, columns=columns,
+                                 use_cache=use_cache, typed=typed)
+    except FileNotFoundError:
+        df, source = None, None
+    return table_name, df, source, time.perf_counter() - start
+
+
+@instrumented
+def load_all_tables(data_path: Path = DATA_PATH,
+                    verbose: bool = True,
+                    use_cache: bool = True,
+                    columns: Optional[Dict[str, List[str]]] = None,
+                    typed: bool = True,
+                    parallel: bool = False,
+                    max_workers: Optional[int] = None,
+                    executor: str = 'thread',
+                    lazy: bool = False,
+                    shared: bool = False) -> Dict[str, pd.DataFrame]:
     """
     Olist의 모든 테이블을 한번에 로드
     
@@ -27,7 +281,24 @@ def load_all_tables(data_path: Path = DATA_PATH, verbose: bool = True) -> Dict[s
     data_path : Path
         CSV 파일이 있는 경로
     verbose : bool
-        로딩 정보 출력 여부
+        로딩 정보 출력 여부 (테이블별/전체 소요 시간 포함)
+    use_cache : bool
+        Parquet 캐시 사용 여부 (read_table 참고)
+    columns : Dict[str, List[str]]
+        테이블별로 읽을 컬럼 목록 (지정하지 않은 테이블은 전체 컬럼)
+    typed : bool
+        테이블 스키마(compact dtype) 적용 여부
+    parallel : bool
+        테이블들을 동시에 로드할지 여부
+    max_workers : int
+        동시 로드 worker 수 (None이면 min(테이블 수, CPU 수))
+    executor : str
+        'thread' (기본, CSV/Parquet 파서가 GIL을 놓음) 또는 'process'
+    lazy : bool
+        True면 아무것도 읽지 않고 LazyTables를 반환 (첫 접근 시 로드)
+    shared : bool
+        True면 공유 저장소(src.table_store)에 Arrow 파일로 한 번 쓰고 memory-map으로 열기
+        (여러 노트북/프로세스가 같은 메모리를 공유, 타입 적용된 테이블만 지원)
         
     Returns:
     --------
@@ -35,96 +306,376 @@ def load_all_tables(data_path: Path = DATA_PATH, verbose: bool = True) -> Dict[s
         테이블명을 key로 하는 딕셔너리
     """
     
-    tables = {}
+    if lazy:
+        return LazyTables(data_path, use_cache=use_cache, columns=columns,
+                          typed=typed, verbose=verbose)
     
-    # 테이블 파일명 정의
-    table_files = {
-        'customers': 'olist_customers_dataset.csv',
-        'geolocation': 'olist_geolocation_dataset.csv',
-        'order_items': 'olist_order_items_dataset.csv',
-        'order_payments': 'olist_order_payments_dataset.csv',
-        'order_reviews': 'olist_order_reviews_dataset.csv',
-        'orders': 'olist_orders_dataset.csv',
-        'products': 'olist_products_dataset.csv',
-        'sellers': 'olist_sellers_dataset.csv',
-        'category_translation': 'product_category_name_translation.csv'
-    }
+    if shared:
+        from src.table_store import load_shared_tables
+        return load_shared_tables(data_path, columns=columns, verbose=verbose)
+    
+    tables = {}
+    columns = columns or {}
     
     if verbose:
         print("🚀 Olist 데이터 로딩 중...\n")
     
-    for table_name, file_name in table_files.items():
-        file_path = data_path / file_name
+    wall_start = time.perf_counter()
+    jobs = [(table_name, Path(data_path), columns.get(table_name), use_cache, typed)
+            for table_name in TABLE_FILES]
+    
+    if parallel:
+        if executor == 'thread':
+            pool_cls = ThreadPoolExecutor
+        elif executor == 'process':
+            # multiprocessing은 프로세스 풀을 쓸 때만 import
+            from concurrent.futures import ProcessPoolExecutor
+            pool_cls = ProcessPoolExecutor
+        else:
+            raise ValueError(f"지원하지 않는 executor: {executor}")
         
-        try:
-            df = pd.read_csv(file_path, encoding='utf-8')
-            tables[table_name] = df
-            
-            if verbose:
-                print(f"✅ {table_name:20s}: {df.shape[0]:>7,d} rows × {df.shape[1]:>2d} columns")
-                
-        except FileNotFoundError:
-            if verbose:
-                print(f"❌ {table_name:20s}: 파일을 찾을 수 없습니다 ({file_name})")
-            tables[table_name] = None
+        if max_workers is None:
+            max_workers = min(len(jobs), os.cpu_count() or 1)
+        
+        with pool_cls(max_workers=max_workers) as pool:
+            results = list(pool.map(_timed_read, *zip(*jobs)))
+    else:
+        results = [_timed_read(*job) for job in jobs]
+    
+    wall_time = time.perf_counter() - wall_start
+    
+    for table_name, df, source, elapsed in results:
+        tables[table_name] = df
+        
+        if verbose:
+            if df is None:
+                print(f"❌ {table_name:20s}: 파일을 찾을 수 없습니다 ({TABLE_FILES[table_name]})")
+            else:
+                print(f"✅ {table_name:20s}: {df.shape[0]:>7,d} rows × {df.shape[1]:>2d} columns "
+                      f"({source}, {elapsed:.2f}s)")
     
     if verbose:
         print("\n" + "="*60)
         total_rows = sum(df.shape[0] for df in tables.values() if df is not None)
         print(f"📊 전체 데이터: {total_rows:,d} rows")
+        mode = f"{executor} × {max_workers}" if parallel else "sequential"
+        print(f"⏱️  로딩 시간: {wall_time:.2f}s ({mode}, 테이블별 합계 {sum(r[3] for r in results):.2f}s)")
         print("="*60 + "\n")
     
     return tables
 
 
-def load_orders() -> pd.DataFrame:
+class LazyTables(MutableMapping):
+    """
+    첫 접근 시점에 테이블을 로드하는 dict 호환 컨테이너
+
+    load_all_tables()의 반환값과 같은 인터페이스(tables['orders'], .items(), in, len ...)를
+    제공하되, 각 테이블은 처음 key로 접근할 때 read_table로 읽고 메모이즈한다.
+    파일이 없는 테이블은 load_all_tables와 동일하게 None이 된다.
+
+    Examples:
+    ---------
+    >>> tables = LazyTables()
+    >>> orders = tables['orders']        # 이때 orders만 로드
+    >>> tables.materialized              # ['orders']
+    >>> tables.release('orders')         # 메모리 해제 (다음 접근 시 다시 로드)
+    """
+
+    def __init__(self,
+                 data_path: Path = DATA_PATH,
+                 use_cache: bool = True,
+                 columns: Optional[Dict[str, List[str]]] = None,
+                 typed: bool = True,
+                 verbose: bool = False):
+        self.data_path = Path(data_path)
+        self.use_cache = use_cache
+        self.columns = columns or {}
+        self.typed = typed
+        self.verbose = verbose
+        self._names = list(TABLE_FILES)
+        self._loaded: Dict[str, Optional[pd.DataFrame]] = {}
+        self._lock = threading.RLock()
+
+    def __getitem__(self, table_name: str) -> Optional[pd.DataFrame]:
+        with self._lock:
+            if table_name in self._loaded:
+                return self._loaded[table_name]
+            if table_name not in self._names:
+                raise KeyError(table_name)
+
+            _, df, source, elapsed = _timed_read(table_name, self.data_path,
+                                                 self.columns.get(table_name),
+                                                 self.use_cache, self.typed)
+            self._loaded[table_name] = df
+
+            if self.verbose:
+                if df is None:
+                    print(f"❌ {table_name:20s}: 파일을 찾을 수 없습니다 ({TABLE_FILES[table_name]})")
+                else:
+                    print(f"✅ {table_name:20s}: {df.shape[0]:>7,d} rows × {df.shape[1]:>2d} columns "
+                          f"({source}, {elapsed:.2f}s)")
+            return df
+
+    def __setitem__(self, table_name: str, df: Optional[pd.DataFrame]) -> None:
+        with self._lock:
+            if table_name not in self._names:
+                self._names.append(table_name)
+            self._loaded[table_name] = df
+
+    def __delitem__(self, table_name: str) -> None:
+        with self._lock:
+            self._names.remove(table_name)
+            self._loaded.pop(table_name, None)
+
+    def __iter__(self):
+        return iter(list(self._names))
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, table_name) -> bool:
+        return table_name in self._names
+
+    def __repr__(self) -> str:
+        status = ', '.join(f"{name}{'*' if name in self._loaded else ''}" for name in self._names)
+        return f"LazyTables([{status}])  (* = 로드됨)"
+
+    @property
+    def materialized(self) -> List[str]:
+        """현재 메모리에 로드된 테이블 목록"""
+        return [name for name in self._names if name in self._loaded]
+
+    def is_loaded(self, table_name: str) -> bool:
+        """테이블 로드 여부"""
+        return table_name in self._loaded
+
+    def release(self, *table_names: str) -> None:
+        """
+        로드된 테이블을 메모리에서 해제 (key는 유지, 다음 접근 시 다시 로드)
+
+        인자를 주지 않으면 모든 테이블을 해제한다.
+        """
+        with self._lock:
+            for table_name in table_names or list(self._loaded):
+                self._loaded.pop(table_name, None)
+
+    def memory_usage(self) -> Dict[str, float]:
+        """로드된 테이블별 메모리 사용량 (MB)"""
+        return {
+            name: float(df.memory_usage(deep=True).sum() / 1024**2)
+            for name, df in list(self._loaded.items())
+            if df is not None
+        }
+
+    def to_dict(self) -> Dict[str, Optional[pd.DataFrame]]:
+        """모든 테이블을 로드해서 일반 dict로 반환"""
+        return {name: self[name] for name in self._names}
+
+
+@instrumented
+def load_orders(columns: Optional[List[str]] = None, typed: bool = True,
+                data_path: Path = DATA_PATH) -> pd.DataFrame:
     """주문 데이터 로드"""
-    return pd.read_csv(DATA_PATH / 'olist_orders_dataset.csv', encoding='utf-8')
+    return read_table('orders', data_path, columns=columns, typed=typed)
 
 
-def load_order_items() -> pd.DataFrame:
+@instrumented
+def load_order_items(columns: Optional[List[str]] = None, typed: bool = True,
+                     data_path: Path = DATA_PATH) -> pd.DataFrame:
     """주문 상품 데이터 로드"""
-    return pd.read_csv(DATA_PATH / 'olist_order_items_dataset.csv', encoding='utf-8')
+    return read_table('order_items', data_path, columns=columns, typed=typed)
 
 
-def load_order_payments() -> pd.DataFrame:
+@instrumented
+def load_order_payments(columns: Optional[List[str]] = None, typed: bool = True,
+                        data_path: Path = DATA_PATH) -> pd.DataFrame:
     """주문 결제 데이터 로드"""
-    return pd.read_csv(DATA_PATH / 'olist_order_payments_dataset.csv', encoding='utf-8')
+    return read_table('order_payments', data_path, columns=columns, typed=typed)
 
 
-def load_order_reviews() -> pd.DataFrame:
+@instrumented
+def load_order_reviews(columns: Optional[List[str]] = None, typed: bool = True,
+                       data_path: Path = DATA_PATH) -> pd.DataFrame:
     """주문 리뷰 데이터 로드"""
-    return pd.read_csv(DATA_PATH / 'olist_order_reviews_dataset.csv', encoding='utf-8')
+    return read_table('order_reviews', data_path, columns=columns, typed=typed)
 
 
-def load_customers() -> pd.DataFrame:
+@instrumented
+def load_customers(columns: Optional[List[str]] = None, typed: bool = True,
+                   data_path: Path = DATA_PATH) -> pd.DataFrame:
     """고객 데이터 로드"""
-    return pd.read_csv(DATA_PATH / 'olist_customers_dataset.csv', encoding='utf-8')
+    return read_table('customers', data_path, columns=columns, typed=typed)
 
 
-def load_sellers() -> pd.DataFrame:
+@instrumented
+def load_sellers(columns: Optional[List[str]] = None, typed: bool = True,
+                 data_path: Path = DATA_PATH) -> pd.DataFrame:
     """판매자 데이터 로드"""
-    return pd.read_csv(DATA_PATH / 'olist_sellers_dataset.csv', encoding='utf-8')
+    return read_table('sellers', data_path, columns=columns, typed=typed)
 
 
-def load_products() -> pd.DataFrame:
+@instrumented
+def load_products(columns: Optional[List[str]] = None, typed: bool = True,
+                  data_path: Path = DATA_PATH) -> pd.DataFrame:
     """상품 데이터 로드"""
-    return pd.read_csv(DATA_PATH / 'olist_products_dataset.csv', encoding='utf-8')
+    return read_table('products', data_path, columns=columns, typed=typed)
 
 
-def load_geolocation() -> pd.DataFrame:
+@instrumented
+def load_geolocation(columns: Optional[List[str]] = None, typed: bool = True,
+                     data_path: Path = DATA_PATH) -> pd.DataFrame:
     """지리 좌표 데이터 로드"""
-    return pd.read_csv(DATA_PATH / 'olist_geolocation_dataset.csv', encoding='utf-8')
+    return read_table('geolocation', data_path, columns=columns, typed=typed)
+
+
+@instrumented
+def iter_table_chunks(table_name: str,
+                      data_path: Path = DATA_PATH,
+                      chunksize: int = 200_000,
+                      columns: Optional[List[str]] = None,
+                      typed: bool = True) -> Iterator[pd.DataFrame]:
+    """
+    CSV를 chunk 단위로 스트리밍 로드 (전체 테이블을 메모리에 올리지 않음)
+
+    Parameters:
+    -----------
+    table_name : str
+        TABLE_FILES의 테이블명
+    data_path : Path
+        CSV 파일이 있는 경로
+    chunksize : int
+        chunk 당 행 수
+    columns : List[str]
+        읽을 컬럼 목록 (None이면 전체)
+    typed : bool
+        chunk마다 테이블 스키마 적용 여부
+
+    Yields:
+    -------
+    pd.DataFrame
+        chunksize 행 이하의 데이터프레임
+    """
+    file_path = Path(data_path) / TABLE_FILES[table_name]
+    dtypes = read_csv_dtypes(table_name, columns) if typed else None
+
+    for chunk in pd.read_csv(file_path, encoding='utf-8', usecols=columns,
+                             dtype=dtypes, chunksize=chunksize):
+        yield apply_schema(chunk, table_name) if typed else chunk
+
+
+GEO_ZIP_COLUMNS = [
+    'geolocation_zip_code_prefix', 'geolocation_lat', 'geolocation_lng',
+    'geolocation_city', 'geolocation_state'
+]
+GEO_ZIP_SIGNATURE = 'geolocation_zip-v1'
+
+
+def _aggregate_geolocation_by_zip(data_path: Path, chunksize: int) -> pd.DataFrame:
+    """
+    geolocation CSV를 chunk 단위로 읽으며 zip prefix별로 축약
+
+    chunk마다 (zip → 좌표 합/개수), ((zip, city, state) → 건수) 부분 집계를 만들고
+    누적 집계에 더한다. 누적 상태의 크기는 원본 행 수가 아니라 고유 zip prefix
+    (와 city/state 조합) 수에 비례한다.
+    """
+    zip_col = 'geolocation_zip_code_prefix'
+    label_cols = [zip_col, 'geolocation_city', 'geolocation_state']
+
+    coords = None
+    labels = None
+
+    for chunk in iter_table_chunks('geolocation', data_path, chunksize=chunksize,
+                                   columns=GEO_ZIP_COLUMNS, typed=False):
+        part = chunk.groupby(zip_col).agg(
+            lat_sum=('geolocation_lat', 'sum'),
+            lng_sum=('geolocation_lng', 'sum'),
+            coord_count=('geolocation_lat', 'count'),
+            point_count=('geolocation_lat', 'size'),
+        )
+        coords = part if coords is None else coords.add(part, fill_value=0)
+
+        part_labels = chunk.groupby(label_cols, dropna=False).size()
+        labels = part_labels if labels is None else labels.add(part_labels, fill_value=0)
+
+    if coords is None:
+        return pd.DataFrame(columns=GEO_ZIP_COLUMNS + ['point_count'])
 
+    # zip prefix별 최빈 city/state
+    top_labels = (
+        labels.rename('n')
+        .reset_index()
+        .sort_values([zip_col, 'n'], ascending=[True, False], kind='stable')
+        .drop_duplicates(zip_col)
+        .set_index(zip_col)[['geolocation_city', 'geolocation_state']]
+    )
 
-def load_category_translation() -> pd.DataFrame:
+    result = pd.DataFrame({
+        'geolocation_lat': coords['lat_sum'] / coords['coord_count'],
+        'geolocation_lng': coords['lng_sum'] / coords['coord_count'],
+        'point_count': coords['point_count'].astype('int64'),
+    }).join(top_labels)
+
+    result = result.rename_axis(zip_col).reset_index()
+    result = apply_schema(result[GEO_ZIP_COLUMNS + ['point_count']], 'geolocation')
+    result['point_count'] = pd.to_numeric(result['point_count'], downcast='integer')
+    return result
+
+
+@instrumented
+def load_geolocation_by_zip(data_path: Path = DATA_PATH,
+                            chunksize: int = 200_000,
+                            use_cache: bool = True) -> pd.DataFrame:
+    """
+    zip prefix 당 1행으로 축약한 지리 좌표 데이터 로드 (스트리밍 집계)
+
+    geolocation 원본은 같은 zip prefix에 중복 좌표가 많으므로, CSV를 chunk 단위로
+    읽으면서 zip prefix별 중심 좌표(평균 lat/lng), 좌표 개수, 최빈 city/state로 축약한다.
+    최대 메모리는 원본 행 수가 아니라 고유 zip prefix 수에 비례한다.
+    결과는 원본 CSV 기준으로 Parquet 캐시된다.
+
+    Parameters:
+    -----------
+    data_path : Path
+        CSV 파일이 있는 경로
+    chunksize : int
+        한 번에 읽을 행 수
+    use_cache : bool
+        Parquet 캐시 사용 여부
+
+    Returns:
+    --------
+    pd.DataFrame
+        geolocation_zip_code_prefix, geolocation_lat, geolocation_lng,
+        geolocation_city, geolocation_state, point_count
+    """
+    file_path = Path(data_path) / TABLE_FILES['geolocation']
+
+    if not use_cache or not _parquet_available():
+        return _aggregate_geolocation_by_zip(data_path, chunksize)
+
+    parquet_file, meta_file = _cache_files('geolocation_zip', Path(data_path) / CACHE_DIR_NAME)
+    if _is_cache_valid(file_path, parquet_file, meta_file, GEO_ZIP_SIGNATURE):
+        return pd.read_parquet(parquet_file)
+
+    result = _aggregate_geolocation_by_zip(data_path, chunksize)
+    try:
+        _write_cache(result, file_path, parquet_file, meta_file, GEO_ZIP_SIGNATURE)
+    except OSError:
+        pass
+    return result
+
+
+@instrumented
+def load_category_translation(columns: Optional[List[str]] = None, typed: bool = True,
+                              data_path: Path = DATA_PATH) -> pd.DataFrame:
     """카테고리 번역 데이터 로드"""
-    return pd.read_csv(DATA_PATH / 'product_category_name_translation.csv', encoding='utf-8')
+    return read_table('category_translation', data_path, columns=columns, typed=typed)
 
 
+@instrumented
 def get_table_info(df: pd.DataFrame, table_name: str = "DataFrame") -> None:
     """
-    데이터프레임의 기본 정보 출력
+    데이터프레임의 기본 정보 출력 (src.profiling.profile_table 결과를 출력)
     
     Parameters:
     -----------
@@ -144,20 +695,209 @@ def get_table_info(df: pd.DataFrame, table_name: str = "DataFrame") -> None:
     for i, col in enumerate(df.columns, 1):
         print(f"   {i:2d}. {col} ({df[col].dtype})")
     
+    profile = profile_table(df, table_name)
+    stats = profile['column_stats']
+    
     print(f"\n🔍 Missing Values:")
-    missing = df.isnull().sum()
-    if missing.sum() == 0:
+    missing = stats.loc[stats['nulls'] > 0, ['nulls', 'null_pct']]
+    if len(missing) == 0:
         print("   ✅ 결측치 없음!")
     else:
-        missing_pct = (missing / len(df) * 100).round(2)
-        for col in missing[missing > 0].index:
-            print(f"   {col:40s}: {missing[col]:>7,d} ({missing_pct[col]:>5.2f}%)")
+        for col, row in missing.iterrows():
+            print(f"   {col:40s}: {int(row['nulls']):>7,d} ({row['null_pct']:>5.2f}%)")
+    
+    memory = profile['memory_bytes']
+    print(f"\n📈 Memory Usage: {memory / 1024**2:.2f} MB")
     
-    print(f"\n📈 Memory Usage: {df.memory_usage(deep=True).sum() / 1024**2:.2f} MB")
+    # 스키마(compact dtype) 적용 효과: 타입 미적용 로드 대비 절감량
+    typed = any(
+        isinstance(dtype, pd.CategoricalDtype)
+        or pd.api.types.is_datetime64_any_dtype(dtype)
+        or (pd.api.types.is_numeric_dtype(dtype) and dtype.itemsize < 8)
+        for dtype in df.dtypes
+    )
+    untyped = untyped_memory_usage(df) if typed else 0
+    if untyped > memory:
+        saved = untyped - memory
+        print(f"   (untyped 로드 대비 {saved / 1024**2:.2f} MB 절감, "
+              f"{untyped / 1024**2:.2f} MB → {memory / 1024**2:.2f} MB, -{saved / untyped * 100:.1f}%)")
     print()
 
 
-def check_relationships(tables: Dict[str, pd.DataFrame]) -> None:
+# 테이블 간 Foreign Key 관계 정의
+# parent: key를 참조하는 테이블, child: key가 정의된 테이블
+RELATIONSHIP_CHECKS = [
+    {
+        'name': 'orders → customers',
+        'parent': 'orders',
+        'child': 'customers',
+        'key': 'customer_id'
+    },
+    {
+        'name': 'order_items → orders',
+        'parent': 'order_items',
+        'child': 'orders',
+        'key': 'order_id'
+    },
+    {
+        'name': 'order_items → products',
+        'parent': 'order_items',
+        'child': 'products',
+        'key': 'product_id'
+    },
+    {
+        'name': 'order_items → sellers',
+        'parent': 'order_items',
+        'child': 'sellers',
+        'key': 'seller_id'
+    },
+    {
+        'name': 'order_payments → orders',
+        'parent': 'order_payments',
+        'child': 'orders',
+        'key': 'order_id'
+    },
+    {
+        'name': 'order_reviews → orders',
+        'parent': 'order_reviews',
+        'child': 'orders',
+        'key': 'order_id'
+    },
+]
+
+
+def _encode_key_columns(tables: Dict[str, pd.DataFrame],
+                        checks: List[Dict]) -> Tuple[Dict[Tuple[str, str], np.ndarray],
+                                                     Dict[str, pd.Index]]:
+    """
+    key별로 관련 테이블의 key 컬럼을 한 번에 정수 코드로 인코딩
+
+    같은 key(예: order_id)를 쓰는 모든 컬럼을 이어 붙여 pd.factorize 한 번으로
+    공통 사전을 만든다. 테이블이 여러 검증에 등장해도 인코딩은 한 번뿐이다.
+
+    Returns:
+    --------
+    (codes, uniques)
+        codes[(table, key)] = 정수 코드 배열 (결측은 -1)
+        uniques[key] = 코드 → 원래 key 값
+    """
+    columns_by_key: Dict[str, List[str]] = {}
+    for check in checks:
+        for table_name in (check['parent'], check['child']):
+            names = columns_by_key.setdefault(check['key'], [])
+            if table_name not in names and tables.get(table_name) is not None:
+                names.append(table_name)
+
+    codes: Dict[Tuple[str, str], np.ndarray] = {}
+    uniques: Dict[str, pd.Index] = {}
+
+    for key, table_names in columns_by_key.items():
+        if not table_names:
+            continue
+        columns = [tables[name][key] for name in table_names]
+        all_codes, key_uniques = pd.factorize(pd.concat(columns, ignore_index=True))
+        offsets = np.cumsum([len(col) for col in columns])[:-1]
+        for name, table_codes in zip(table_names, np.split(all_codes, offsets)):
+            codes[(name, key)] = table_codes
+        uniques[key] = pd.Index(key_uniques)
+
+    return codes, uniques
+
+
+@instrumented
+def validate_relationships(tables: Dict[str, pd.DataFrame],
+                           checks: Optional[List[Dict]] = None) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    테이블 간 관계를 벡터 연산으로 검증 (양방향 orphan + 카디널리티)
+
+    각 key 컬럼을 한 번만 정수 인코딩한 뒤, 검증마다 np.bincount로 key별 등장 횟수를
+    구해 비교한다. Python set을 만들지 않는다.
+
+    Parameters:
+    -----------
+    tables : Dict[str, pd.DataFrame]
+        로드된 테이블 딕셔너리 (LazyTables도 가능)
+    checks : List[Dict]
+        검증 목록 (None이면 RELATIONSHIP_CHECKS)
+
+    Returns:
+    --------
+    Tuple[pd.DataFrame, pd.DataFrame]
+        summary : 검증별 key 수, 양방향 orphan 수/비율, 카디널리티
+            - orphans         : parent에는 있는데 child에 없는 key (참조 무결성 위반)
+            - reverse_orphans : child에는 있는데 parent가 참조하지 않는 key
+            - cardinality     : 'child:parent' 형식 (예: orders:order_items = '1:N')
+        orphans : orphan key 목록 (check, direction, key, value)
+    """
+    checks = RELATIONSHIP_CHECKS if checks is None else checks
+    available = [c for c in checks
+                 if tables.get(c['parent']) is not None and tables.get(c['child']) is not None]
+    codes, uniques = _encode_key_columns(tables, available)
+
+    counts: Dict[Tuple[str, str], np.ndarray] = {}
+
+    def key_counts(table_name: str, key: str) -> np.ndarray:
+        # (table, key) 별 key 등장 횟수 - 여러 검증에서 재사용
+        if (table_name, key) not in counts:
+            table_codes = codes[(table_name, key)]
+            counts[(table_name, key)] = np.bincount(table_codes[table_codes >= 0],
+                                                    minlength=len(uniques[key]))
+        return counts[(table_name, key)]
+
+    summary_rows = []
+    orphan_frames = []
+
+    for check in available:
+        key = check['key']
+        parent_counts = key_counts(check['parent'], key)
+        child_counts = key_counts(check['child'], key)
+        in_parent = parent_counts > 0
+        in_child = child_counts > 0
+
+        orphan_codes = np.flatnonzero(in_parent & ~in_child)
+        reverse_codes = np.flatnonzero(in_child & ~in_parent)
+        n_parent = int(in_parent.sum())
+        n_child = int(in_child.sum())
+
+        child_side = '1' if child_counts.max(initial=0) <= 1 else 'N'
+        parent_side = '1' if parent_counts.max(initial=0) <= 1 else 'N'
+
+        summary_rows.append({
+            'check': check['name'],
+            'key': key,
+            'parent_keys': n_parent,
+            'child_keys': n_child,
+            'orphans': len(orphan_codes),
+            'orphan_pct': len(orphan_codes) / n_parent * 100 if n_parent else 0.0,
+            'reverse_orphans': len(reverse_codes),
+            'reverse_orphan_pct': len(reverse_codes) / n_child * 100 if n_child else 0.0,
+            'cardinality': f"{child_side}:{parent_side}",
+        })
+
+        for direction, direction_codes in (('parent→child', orphan_codes),
+                                           ('child→parent', reverse_codes)):
+            if len(direction_codes):
+                orphan_frames.append(pd.DataFrame({
+                    'check': check['name'],
+                    'direction': direction,
+                    'key': key,
+                    'value': uniques[key].take(direction_codes).astype(object),
+                }))
+
+    summary = pd.DataFrame(summary_rows, columns=[
+        'check', 'key', 'parent_keys', 'child_keys', 'orphans', 'orphan_pct',
+        'reverse_orphans', 'reverse_orphan_pct', 'cardinality'
+    ])
+    if orphan_frames:
+        orphans = pd.concat(orphan_frames, ignore_index=True)
+    else:
+        orphans = pd.DataFrame(columns=['check', 'direction', 'key', 'value'])
+
+    return summary, orphans
+
+
+@instrumented
+def check_relationships(tables: Dict[str, pd.DataFrame], verbose: bool = True) -> pd.DataFrame:
     """
     테이블 간 관계 검증 (Foreign Key 체크)
     
@@ -165,70 +905,41 @@ def check_relationships(tables: Dict[str, pd.DataFrame]) -> None:
     -----------
     tables : Dict[str, pd.DataFrame]
         로드된 테이블 딕셔너리
+    verbose : bool
+        검증 결과 출력 여부
+        
+    Returns:
+    --------
+    pd.DataFrame
+        orphan key 목록 (check, direction, key, value) - validate_relationships 참고
     """
     
+    summary, orphans = validate_relationships(tables)
+    
+    if not verbose:
+        return orphans
+    
     print("\n" + "="*60)
     print("🔗 테이블 관계 검증")
     print("="*60 + "\n")
     
-    checks = [
-        {
-            'name': 'orders → customers',
-            'parent': 'orders',
-            'child': 'customers',
-            'key': 'customer_id'
-        },
-        {
-            'name': 'order_items → orders',
-            'parent': 'order_items',
-            'child': 'orders',
-            'key': 'order_id'
-        },
-        {
-            'name': 'order_items → products',
-            'parent': 'order_items',
-            'child': 'products',
-            'key': 'product_id'
-        },
-        {
-            'name': 'order_items → sellers',
-            'parent': 'order_items',
-            'child': 'sellers',
-            'key': 'seller_id'
-        },
-        {
-            'name': 'order_payments → orders',
-            'parent': 'order_payments',
-            'child': 'orders',
-            'key': 'order_id'
-        },
-        {
-            'name': 'order_reviews → orders',
-            'parent': 'order_reviews',
-            'child': 'orders',
-            'key': 'order_id'
-        },
-    ]
+    checked = set(summary['check'])
+    for check in RELATIONSHIP_CHECKS:
+        if check['name'] not in checked:
+            print(f"❌ {check['name']:30s}: 테이블 없음 (검증 생략)")
     
-    for check in checks:
-        parent_df = tables[check['parent']]
-        child_df = tables[check['child']]
-        key = check['key']
-        
-        # Foreign Key 검증
-        parent_keys = set(parent_df[key].dropna())
-        child_keys = set(child_df[key].dropna())
-        
-        # 부모에는 있는데 자식에는 없는 키
-        orphans = parent_keys - child_keys
-        
-        if len(orphans) == 0:
-            print(f"✅ {check['name']:30s}: 일치 ({len(parent_keys):,d} keys)")
+    for row in summary.itertuples(index=False):
+        if row.orphans == 0:
+            print(f"✅ {row.check:30s}: 일치 ({row.parent_keys:,d} keys, {row.cardinality})")
         else:
-            orphan_pct = len(orphans) / len(parent_keys) * 100
-            print(f"⚠️  {check['name']:30s}: {len(orphans):,d} orphans ({orphan_pct:.2f}%)")
+            print(f"⚠️  {row.check:30s}: {row.orphans:,d} orphans ({row.orphan_pct:.2f}%), {row.cardinality}")
+        
+        if row.reverse_orphans > 0:
+            print(f"   ↳ 역방향 미참조 key: {row.reverse_orphans:,d} ({row.reverse_orphan_pct:.2f}%)")
     
     print()
+    
+    return orphans
 
 
 if __name__ == "__main__":
@@ -0,0 +1,616 @@
+"""
+상주 데이터 서비스 모듈
+테이블을 한 번 로드(스키마 적용)하고 파생 프레임(배송 지표가 붙은 배송 완료 주문, 마스터 테이블)을
+메모리에 유지하는 로컬 HTTP 서비스와, 스크립트/노트북에서 쓰는 클라이언트 함수들
+
+서비스 시작: python scripts/data_service.py [--port 8765] [--data-path data/processed_v2]
+
+클라이언트:
+    from src.data_service import get_frame
+    master_orders = get_frame('master_orders')   # 서비스가 있으면 수 ms, 없으면 직접 계산
+
+프레임은 Arrow IPC로, 그 외 결과는 JSON으로 주고받는다 (서비스는 127.0.0.1에만 바인딩).
+행 필터는 (컬럼, 연산자, 값) 목록으로만 받고, /refresh와 /shutdown은 서비스 시작 때 만든 토큰이 있어야 한다.
+"""
+
+import hmac
+import io
+import json
+import operator
+import os
+import secrets
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.data_loader import DATA_PATH, TABLE_FILES, load_all_tables, read_table, table_content_hash
+from src.master import combine_seller_partials, run_steps
+from src.profiling import profile_table
+from src import utils
+
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+# 다른 주소의 서비스를 쓰려면 환경 변수로 지정 (예: http://127.0.0.1:9000)
+SERVICE_URL_ENV = "OLIST_SERVICE_URL"
+
+# /refresh, /shutdown 요청 토큰 - 서비스가 시작할 때 만들어 포트별 파일(소유자만 읽기)에 쓴다
+# (환경 변수로 고정값을 줄 수도 있음)
+SERVICE_TOKEN_ENV = "OLIST_SERVICE_TOKEN"
+TOKEN_HEADER = "X-Olist-Token"
+TOKEN_DIR = Path.home() / ".cache" / "olist"
+PROTECTED_PATHS = ['/refresh', '/shutdown']
+
+# get_frame이 서비스 사용 가능 여부를 다시 확인하기까지의 시간(초)
+SERVICE_STATUS_TTL = 30.0
+
+ARROW_CONTENT_TYPE = "application/vnd.apache.arrow.stream"
+JSON_CONTENT_TYPE = "application/json"
+
+# 서비스가 유지하는 파생 프레임 (src.master 단계 출력 + master_sellers)
+DERIVED_FRAMES = ['clean_orders', 'clean_reviews', 'master_orders', 'order_seller', 'seller_month',
+                  'master_sellers']
+
+# 원격 호출을 허용하는 함수 (입력 프레임을 바꾸지 않는 것만)
+REMOTE_FUNCTIONS = {
+    'check_data_quality': utils.check_data_quality,
+    'calculate_summary_stats': utils.calculate_summary_stats,
+    'calculate_summary_stats_batch': utils.calculate_summary_stats_batch,
+    'detect_outliers_iqr_batch': utils.detect_outliers_iqr_batch,
+    'calculate_boxplot_stats': utils.calculate_boxplot_stats,
+    'calculate_time_diffs': utils.calculate_time_diffs,
+    'get_top_n': utils.get_top_n,
+    'profile_table': profile_table,
+}
+
+# select 필터 연산자 (문자열 쿼리 대신 (컬럼, 연산자, 값)으로만 받음)
+FILTER_OPS = {
+    '==': operator.eq,
+    '!=': operator.ne,
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge,
+    'in': lambda series, values: series.isin(values),
+    'not in': lambda series, values: ~series.isin(values),
+    'isna': lambda series, _: series.isna(),
+    'notna': lambda series, _: series.notna(),
+}
+
+
+# ==============================================
+# 프레임 계산 (서비스/로컬 공용)
+# ==============================================
+
+def build_derived_frames(tables: Dict[str, pd.DataFrame], names: List[str]) -> Dict[str, pd.DataFrame]:
+    """
+    파생 프레임 계산 (src.master 단계 그래프 재사용)
+
+    Returns:
+    --------
+    Dict[str, pd.DataFrame]
+        요청한 프레임과 그 과정에서 만든 중간 프레임
+    """
+    steps = [name for name in names if name != 'master_sellers']
+    if 'master_sellers' in names:
+        steps.append('seller_month')
+    frames = run_steps(tables, steps)
+    frames = {name: df for name, df in frames.items() if name in DERIVED_FRAMES}
+    if 'master_sellers' in names:
+        frames['master_sellers'] = combine_seller_partials(frames['seller_month'], tables.get('sellers'))
+    return frames
+
+
+def apply_filters(df: pd.DataFrame, filters: Sequence[Sequence]) -> pd.DataFrame:
+    """
+    (컬럼, 연산자, 값) 필터를 모두 만족하는 행만 남김
+
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        필터할 프레임
+    filters : Sequence[Sequence]
+        [('review_score', '==', 1), ('order_purchase_timestamp', '>=', '2018-01-01'), ('review_comment_message', 'notna')]
+        연산자는 FILTER_OPS 중 하나 (isna/notna는 값 생략). 날짜 컬럼의 문자열 값은 Timestamp로 변환
+
+    Returns:
+    --------
+    pd.DataFrame
+        조건을 만족하는 행
+    """
+    mask = pd.Series(True, index=df.index)
+    for condition in filters:
+        if not isinstance(condition, (list, tuple)) or len(condition) not in (2, 3):
+            raise ValueError(f"필터는 (컬럼, 연산자, 값) 형식이어야 합니다: {condition!r}")
+        column, op = condition[0], condition[1]
+        value = condition[2] if len(condition) == 3 else None
+        if op not in FILTER_OPS:
+            raise ValueError(f"지원하지 않는 연산자: {op} (가능: {', '.join(FILTER_OPS)})")
+        if column not in df.columns:
+            raise ValueError(f"없는 컬럼: {column}")
+        series = df[column]
+        if pd.api.types.is_datetime64_any_dtype(series.dtype):
+            value = [pd.Timestamp(v) for v in value] if op in ('in', 'not in') else (
+                pd.Timestamp(value) if value is not None else None)
+        mask &= FILTER_OPS[op](series, value).fillna(False).astype(bool)
+    return df[mask.to_numpy()]
+
+
+def _token_file(port: int) -> Path:
+    return TOKEN_DIR / f"data_service_{port}.token"
+
+
+def _write_token(port: int, token: str) -> Path:
+    """토큰 파일 쓰기 (소유자만 읽기/쓰기)"""
+    TOKEN_DIR.mkdir(parents=True, exist_ok=True)
+    path = _token_file(port)
+    tmp_path = path.with_suffix(f".tmp{os.getpid()}")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        f.write(token)
+    os.replace(tmp_path, path)
+    return path
+
+
+def _read_token(port: int) -> Optional[str]:
+    try:
+        return _token_file(port).read_text(encoding='utf-8').strip() or None
+    except OSError:
+        return None
+
+
+# ==============================================
+# 직렬화
+# ==============================================
+
+def _frame_to_arrow(df: pd.DataFrame) -> bytes:
+    import pyarrow as pa
+    table = pa.Table.from_pandas(df)
+    sink = io.BytesIO()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue()
+
+
+def _arrow_to_frame(payload: bytes) -> pd.DataFrame:
+    import pyarrow as pa
+    return pa.ipc.open_stream(payload).read_all().to_pandas()
+
+
+def _to_jsonable(value: Any) -> Any:
+    """결과를 JSON으로 (DataFrame/Series는 split 형식으로 감싸서 클라이언트에서 복원)"""
+    if isinstance(value, pd.DataFrame):
+        return {'__dataframe__': json.loads(value.to_json(orient='split', date_format='iso'))}
+    if isinstance(value, pd.Series):
+        return {'__series__': json.loads(value.to_json(orient='split', date_format='iso'))}
+    if isinstance(value, dict):
+        return {str(k): _to_jsonable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_jsonable(v) for v in value]
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, float) and np.isnan(value):
+        return None
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if value is pd.NA or value is pd.NaT:
+        return None
+    # dtype, Timestamp 등은 문자열로
+    return str(value)
+
+
+def _from_jsonable(value: Any) -> Any:
+    if isinstance(value, dict):
+        if '__dataframe__' in value:
+            split = value['__dataframe__']
+            return pd.DataFrame(split['data'], index=split['index'], columns=split['columns'])
+        if '__series__' in value:
+            split = value['__series__']
+            return pd.Series(split['data'], index=split['index'], name=split.get('name'))
+        return {k: _from_jsonable(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_from_jsonable(v) for v in value]
+    return value
+
+
+# ==============================================
+# 서비스
+# ==============================================
+
+class DataService:
+    """
+    테이블/파생 프레임을 메모리에 유지하는 서비스 본체 (HTTP 처리와 분리)
+
+    프레임은 만든 뒤 바꾸지 않고(응답은 직렬화본), 파생 프레임은 처음 요청될 때
+    한 번만 계산한다 (프레임별 lock이라 다른 프레임 계산/refresh를 기다리지 않음).
+    refresh()는 원본 CSV가 바뀐 테이블만 다시 읽고 파생 프레임을 비운다.
+    """
+
+    def __init__(self, data_path: Path = DATA_PATH, preload: bool = True, verbose: bool = True):
+        self.data_path = Path(data_path)
+        self.verbose = verbose
+        self.started_at = time.time()
+        # _lock: 프레임 dict 교체/갱신 (짧게만 잡음), _build_locks: 파생 프레임별 계산 lock,
+        # _refresh_lock: refresh끼리 직렬화. _generation은 refresh마다 올려서 그 전 테이블로
+        # 계산을 시작한 결과가 새 파생 프레임 자리에 들어가지 않게 한다
+        self._lock = threading.Lock()
+        self._build_locks: Dict[str, threading.Lock] = {}
+        self._refresh_lock = threading.Lock()
+        self._generation = 0
+        self._tables: Dict[str, pd.DataFrame] = {}
+        self._hashes: Dict[str, str] = {}
+        self._derived: Dict[str, pd.DataFrame] = {}
+        self._load_tables(list(TABLE_FILES))
+        if preload:
+            self.frame('master_orders')
+            self.frame('master_sellers')
+
+    def _load_tables(self, names: List[str]) -> None:
+        if set(names) == set(TABLE_FILES):
+            tables = load_all_tables(self.data_path, verbose=self.verbose)
+        else:
+            tables = {name: read_table(name, self.data_path) for name in names}
+        with self._lock:
+            for name in names:
+                if tables.get(name) is None:
+                    continue
+                self._tables[name] = tables[name]
+                self._hashes[name] = table_content_hash(name, self.data_path)
+
+    def frame_names(self) -> List[str]:
+        return list(self._tables) + DERIVED_FRAMES
+
+    def frame(self, name: str) -> pd.DataFrame:
+        """테이블 또는 파생 프레임 (없으면 계산해서 유지)"""
+        df = self._tables.get(name, self._derived.get(name))
+        if df is not None:
+            return df
+        if name not in DERIVED_FRAMES:
+            raise KeyError(f"없는 프레임: {name} (가능: {', '.join(self.frame_names())})")
+
+        # 같은 프레임을 동시에 요청해도 한 번만 계산 (다른 프레임 요청은 기다리지 않음)
+        with self._lock:
+            build_lock = self._build_locks.setdefault(name, threading.Lock())
+        with build_lock:
+            with self._lock:
+                if name in self._derived:
+                    return self._derived[name]
+                tables = dict(self._tables)
+                generation = self._generation
+            start = time.perf_counter()
+            frames = build_derived_frames(tables, [name])
+            with self._lock:
+                # 계산 중에 refresh됐으면 결과는 이번 요청에만 쓰고 보관하지 않음
+                if generation == self._generation:
+                    for frame_name, df in frames.items():
+                        self._derived.setdefault(frame_name, df)
+            if self.verbose:
+                print(f"🔧 {name} 계산 ({time.perf_counter() - start:.2f}s)")
+            return frames[name]
+
+    def info(self) -> Dict:
+        with self._lock:
+            frames = {name: list(df.shape) for name, df in {**self._tables, **self._derived}.items()}
+        return {
+            'status': 'ok',
+            'pid': os.getpid(),
+            'data_path': str(self.data_path.resolve()),
+            'uptime_seconds': time.time() - self.started_at,
+            'frames': frames,
+            'available': self.frame_names(),
+        }
+
+    def refresh(self) -> Dict:
+        """원본 CSV가 바뀐 테이블만 다시 로드 (바뀐 게 있으면 파생 프레임 폐기)"""
+        with self._refresh_lock:
+            return self._refresh()
+
+    def _refresh(self) -> Dict:
+        changed = [name for name in TABLE_FILES
+                   if (self.data_path / TABLE_FILES[name]).exists()
+                   and table_content_hash(name, self.data_path) != self._hashes.get(name)]
+        if changed:
+            self._load_tables(changed)
+            with self._lock:
+                self._derived.clear()
+                self._generation += 1
+        return {'changed': changed}
+
+    def select(self, name: str, columns: Optional[List[str]] = None,
+               filters: Optional[Sequence[Sequence]] = None, head: Optional[int] = None) -> pd.DataFrame:
+        """프레임 일부 (apply_filters 필터 → 컬럼 선택 → 앞 head행)"""
+        df = self.frame(name)
+        if filters:
+            df = apply_filters(df, filters)
+        if columns:
+            df = df[columns]
+        if head is not None:
+            df = df.head(head)
+        return df
+
+    def call(self, func: str, frame: str, kwargs: Optional[Dict] = None) -> Any:
+        """허용된 함수(REMOTE_FUNCTIONS)를 유지 중인 프레임에 실행"""
+        if func not in REMOTE_FUNCTIONS:
+            raise KeyError(f"호출할 수 없는 함수: {func} (가능: {', '.join(REMOTE_FUNCTIONS)})")
+        return REMOTE_FUNCTIONS[func](self.frame(frame), **(kwargs or {}))
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = "OlistDataService/1"
+    protocol_version = "HTTP/1.1"
+
+    @property
+    def service(self) -> DataService:
+        return self.server.service
+
+    def log_message(self, format, *args):
+        if self.service.verbose:
+            super().log_message(format, *args)
+
+    def _send(self, status: int, body: bytes, content_type: str) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, payload: Any, status: int = 200) -> None:
+        self._send(status, json.dumps(_to_jsonable(payload), ensure_ascii=False).encode('utf-8'), JSON_CONTENT_TYPE)
+
+    def _send_result(self, result: Any) -> None:
+        if isinstance(result, pd.Series):
+            result = result.to_frame()
+        if isinstance(result, pd.DataFrame):
+            self._send(200, _frame_to_arrow(result), ARROW_CONTENT_TYPE)
+        else:
+            self._send_json({'result': result})
+
+    def _handle(self, method: str) -> None:
+        url = urllib.parse.urlparse(self.path)
+        params = {k: v[-1] for k, v in urllib.parse.parse_qs(url.query).items()}
+        if url.path in PROTECTED_PATHS and not hmac.compare_digest(
+                self.headers.get(TOKEN_HEADER, ''), self.server.token):
+            self._send_json({'error': f"토큰이 맞지 않습니다: {url.path}"}, status=403)
+            return
+        try:
+            if method == 'GET' and url.path == '/health':
+                self._send_json(self.service.info())
+            elif method == 'GET' and url.path.startswith('/frame/'):
+                name = urllib.parse.unquote(url.path[len('/frame/'):])
+                columns = params['columns'].split(',') if params.get('columns') else None
+                filters = json.loads(params['filters']) if params.get('filters') else None
+                head = int(params['head']) if params.get('head') else None
+                self._send_result(self.service.select(name, columns, filters, head))
+            elif method == 'POST' and url.path == '/call':
+                length = int(self.headers.get('Content-Length', 0))
+                request = json.loads(self.rfile.read(length) or b'{}')
+                self._send_result(self.service.call(request['func'], request['frame'], request.get('kwargs')))
+            elif method == 'POST' and url.path == '/refresh':
+                self._send_json(self.service.refresh())
+            elif method == 'POST' and url.path == '/shutdown':
+                self._send_json({'status': 'stopping'})
+                threading.Thread(target=self.server.shutdown, daemon=True).start()
+            else:
+                self._send_json({'error': f"없는 경로: {method} {url.path}"}, status=404)
+        except KeyError as exc:
+            self._send_json({'error': str(exc.args[0] if exc.args else exc)}, status=404)
+        except (ValueError, TypeError, SyntaxError) as exc:
+            self._send_json({'error': f"{type(exc).__name__}: {exc}"}, status=400)
+        except Exception as exc:
+            self._send_json({'error': f"{type(exc).__name__}: {exc}"}, status=500)
+
+    def do_GET(self):
+        self._handle('GET')
+
+    def do_POST(self):
+        self._handle('POST')
+
+
+def serve(data_path: Path = DATA_PATH,
+          host: str = DEFAULT_HOST,
+          port: int = DEFAULT_PORT,
+          preload: bool = True,
+          verbose: bool = True) -> None:
+    """
+    데이터 서비스 실행 (Ctrl+C 또는 POST /shutdown으로 종료)
+
+    요청은 스레드별로 처리하고, 프레임 계산/갱신은 서비스 lock으로 직렬화한다.
+    /refresh, /shutdown용 토큰은 OLIST_SERVICE_TOKEN 또는 새로 만든 값을
+    ~/.cache/olist/data_service_<port>.token에 써두고 종료할 때 지운다.
+
+    Parameters:
+    -----------
+    data_path : Path
+        CSV 파일이 있는 경로
+    host, port : str, int
+        바인딩 주소 (기본 127.0.0.1:8765 - 로컬 전용)
+    preload : bool
+        시작할 때 master_orders / master_sellers까지 미리 계산
+    verbose : bool
+        로딩/요청 로그 출력
+    """
+    start = time.perf_counter()
+    service = DataService(data_path, preload=preload, verbose=verbose)
+    server = ThreadingHTTPServer((host, port), _Handler)
+    server.daemon_threads = True
+    server.service = service
+    server.token = os.environ.get(SERVICE_TOKEN_ENV) or secrets.token_urlsafe(32)
+    token_file = _write_token(server.server_address[1], server.token)
+    print(f"✅ 데이터 서비스 시작: http://{host}:{server.server_address[1]} "
+          f"(pid {os.getpid()}, 준비 {time.perf_counter() - start:.2f}초)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        token_file.unlink(missing_ok=True)
+        print("🛑 데이터 서비스 종료")
+
+
+# ==============================================
+# 클라이언트
+# ==============================================
+
+class ServiceError(RuntimeError):
+    """서비스가 오류 응답을 돌려준 경우"""
+
+
+class DataServiceClient:
+    """
+    데이터 서비스 클라이언트
+
+    Parameters:
+    -----------
+    url : str
+        서비스 주소 (None이면 환경 변수 OLIST_SERVICE_URL, 없으면 http://127.0.0.1:8765)
+    timeout : float
+        요청 제한 시간(초)
+    token : str
+        /refresh, /shutdown 토큰 (None이면 환경 변수 OLIST_SERVICE_TOKEN, 없으면 포트별 토큰 파일)
+    """
+
+    def __init__(self, url: Optional[str] = None, timeout: float = 60.0, token: Optional[str] = None):
+        self.url = (url or os.environ.get(SERVICE_URL_ENV) or f"http://{DEFAULT_HOST}:{DEFAULT_PORT}").rstrip('/')
+        self.timeout = timeout
+        self.token = token or os.environ.get(SERVICE_TOKEN_ENV)
+
+    def _token(self) -> str:
+        if self.token is None:
+            port = urllib.parse.urlparse(self.url).port or DEFAULT_PORT
+            self.token = _read_token(port)
+        if self.token is None:
+            raise ServiceError(f"서비스 토큰이 없습니다: {SERVICE_TOKEN_ENV} 또는 {_token_file(DEFAULT_PORT).parent} 확인")
+        return self.token
+
+    def _request(self, method: str, path: str, payload: Optional[Dict] = None,
+                 timeout: Optional[float] = None) -> Any:
+        data = json.dumps(payload).encode('utf-8') if payload is not None else None
+        headers = {'Content-Type': JSON_CONTENT_TYPE} if data else {}
+        if path in PROTECTED_PATHS:
+            headers[TOKEN_HEADER] = self._token()
+        request = urllib.request.Request(self.url + path, data=data, method=method, headers=headers)
+        try:
+            with urllib.request.urlopen(request, timeout=timeout or self.timeout) as response:
+                body = response.read()
+                content_type = response.headers.get('Content-Type', '')
+        except urllib.error.HTTPError as exc:
+            try:
+                message = json.loads(exc.read()).get('error', str(exc))
+            except ValueError:
+                message = str(exc)
+            raise ServiceError(message) from None
+
+        if content_type.startswith(ARROW_CONTENT_TYPE):
+            return _arrow_to_frame(body)
+        return _from_jsonable(json.loads(body))
+
+    def health(self, timeout: Optional[float] = None) -> Dict:
+        return self._request('GET', '/health', timeout=timeout)
+
+    def is_available(self, data_path: Optional[Path] = None) -> bool:
+        """서비스 응답 여부 (data_path를 주면 같은 데이터를 들고 있는지까지 확인)"""
+        try:
+            info = self.health(timeout=0.5)
+        except (OSError, ServiceError, ValueError):
+            return False
+        return data_path is None or info.get('data_path') == str(Path(data_path).resolve())
+
+    def frame(self, name: str, columns: Optional[List[str]] = None,
+              filters: Optional[Sequence[Tuple]] = None, head: Optional[int] = None) -> pd.DataFrame:
+        """
+        서비스가 유지 중인 프레임 가져오기
+
+        Parameters:
+        -----------
+        name : str
+            테이블명(orders ...) 또는 파생 프레임명(master_orders, master_sellers ...)
+        columns : List[str]
+            가져올 컬럼 (None이면 전체)
+        filters : Sequence[Tuple]
+            서버에서 먼저 적용할 (컬럼, 연산자, 값) 조건 (예: [('review_score', '==', 1)], apply_filters 참고)
+        head : int
+            앞에서부터 가져올 행 수
+        """
+        params = {}
+        if columns:
+            params['columns'] = ','.join(columns)
+        if filters:
+            params['filters'] = json.dumps([list(f) for f in filters], default=str)
+        if head is not None:
+            params['head'] = str(head)
+        suffix = f"?{urllib.parse.urlencode(params)}" if params else ""
+        return self._request('GET', f"/frame/{urllib.parse.quote(name)}{suffix}")
+
+    def call(self, func: str, frame: str, **kwargs) -> Any:
+        """서버의 프레임에 REMOTE_FUNCTIONS 함수 실행 (예: call('check_data_quality', 'orders'))"""
+        result = self._request('POST', '/call', {'func': func, 'frame': frame, 'kwargs': kwargs})
+        return result['result'] if isinstance(result, dict) and 'result' in result else result
+
+    def refresh(self) -> Dict:
+        return self._request('POST', '/refresh', {})
+
+    def shutdown(self) -> Dict:
+        return self._request('POST', '/shutdown', {})
+
+
+# 프로세스별 서비스 사용 가능 여부와 확인 시각 (SERVICE_STATUS_TTL 동안은 다시 확인하지 않음)
+_SERVICE_STATUS: Dict[str, Tuple[bool, float]] = {}
+
+
+def get_frame(name: str,
+              data_path: Path = DATA_PATH,
+              columns: Optional[List[str]] = None,
+              url: Optional[str] = None,
+              use_service: bool = True) -> pd.DataFrame:
+    """
+    프레임 가져오기 - 같은 data_path의 서비스가 떠 있으면 서비스에서, 아니면 직접 로드/계산
+
+    Parameters:
+    -----------
+    name : str
+        테이블명 또는 DERIVED_FRAMES 이름
+    data_path : Path
+        CSV 파일이 있는 경로
+    columns : List[str]
+        가져올 컬럼
+    url : str
+        서비스 주소 (DataServiceClient 참고)
+    use_service : bool
+        False면 서비스를 확인하지 않고 직접 계산
+
+    Returns:
+    --------
+    pd.DataFrame
+        요청한 프레임
+    """
+    if use_service:
+        client = DataServiceClient(url)
+        status_key = f"{client.url}|{Path(data_path).resolve()}"
+        available, checked_at = _SERVICE_STATUS.get(status_key, (False, None))
+        # 나중에 띄운 서비스도 쓰도록 TTL이 지나면 다시 확인
+        if checked_at is None or time.monotonic() - checked_at > SERVICE_STATUS_TTL:
+            available = client.is_available(data_path)
+            _SERVICE_STATUS[status_key] = (available, time.monotonic())
+        if available:
+            try:
+                return client.frame(name, columns=columns)
+            except OSError:
+                # 서비스가 내려간 경우 TTL 동안은 직접 계산
+                _SERVICE_STATUS[status_key] = (False, time.monotonic())
+
+    if name in TABLE_FILES:
+        return read_table(name, data_path, columns=columns)
+    if name not in DERIVED_FRAMES:
+        raise KeyError(f"없는 프레임: {name}")
+    tables = load_all_tables(data_path, verbose=False, lazy=True)
+    df = build_derived_frames(tables, [name])[name]
+    return df[columns] if columns else df
@@ -0,0 +1,118 @@
+"""
+공용 파생 프레임 모듈
+노트북마다 반복해서 만드는 파생 프레임을 src.memo로 메모이제이션한 함수들
+(입력 내용이 같으면 데이터 버전당 한 번만 계산)
+"""
+
+import pandas as pd
+
+from src.complaints import TYPES_SEPARATOR
+from src.master import _clean_orders
+from src.memo import memoize
+from src.utils import calculate_time_diffs
+
+
+# 결측치를 0으로 채우는 상품 컬럼 (설명 정보가 없는 상품)
+PRODUCT_ZERO_FILL_COLUMNS = ['product_name_lenght', 'product_description_lenght', 'product_photos_qty']
+# 결측치를 중앙값으로 채우는 상품 크기/무게 컬럼
+PRODUCT_MEDIAN_FILL_COLUMNS = ['product_weight_g', 'product_length_cm', 'product_height_cm', 'product_width_cm']
+UNKNOWN_CATEGORY = 'unknown'
+
+
+# 계산은 src.master에 맡기므로 그쪽 소스가 바뀌어도 key가 바뀌도록
+@memoize(deps=[_clean_orders, calculate_time_diffs])
+def delivered_orders(orders: pd.DataFrame) -> pd.DataFrame:
+    """
+    배송 완료 주문 + 배송 파생변수 (master_orders의 clean_orders 단계와 동일)
+
+    Parameters:
+    -----------
+    orders : pd.DataFrame
+        orders 테이블 (날짜 컬럼이 문자열이면 변환)
+
+    Returns:
+    --------
+    pd.DataFrame
+        delivered 주문 (결측/논리적 오류 제거, 배송 시간/지연/구매 시점 컬럼 추가)
+    """
+    return _clean_orders(orders)
+
+
+@memoize
+def clean_products(products: pd.DataFrame) -> pd.DataFrame:
+    """
+    상품 결측치 처리 (data_quality_analysis 노트북 기준)
+
+    카테고리는 'unknown', 이름/설명 길이와 사진 수는 0, 무게/크기는 중앙값으로 채운다.
+
+    Parameters:
+    -----------
+    products : pd.DataFrame
+        products 테이블
+
+    Returns:
+    --------
+    pd.DataFrame
+        결측치를 채운 새 데이터프레임
+    """
+    clean = products.copy()
+    category = clean['product_category_name']
+    if isinstance(category.dtype, pd.CategoricalDtype) and UNKNOWN_CATEGORY not in category.cat.categories:
+        category = category.cat.add_categories([UNKNOWN_CATEGORY])
+    clean['product_category_name'] = category.fillna(UNKNOWN_CATEGORY)
+
+    for col in PRODUCT_ZERO_FILL_COLUMNS:
+        clean[col] = clean[col].fillna(0)
+    for col in PRODUCT_MEDIAN_FILL_COLUMNS:
+        clean[col] = clean[col].fillna(clean[col].median())
+    return clean
+
+
+@memoize
+def review_with_text(master_orders: pd.DataFrame, order_reviews: pd.DataFrame) -> pd.DataFrame:
+    """
+    master_orders 리뷰 점수 + 원본 리뷰 제목/본문 (review_woo 노트북 기준)
+
+    Returns:
+    --------
+    pd.DataFrame
+        order_id, review_score, review_comment_title, review_comment_message
+    """
+    return master_orders[['order_id', 'review_score']].merge(
+        order_reviews[['order_id', 'review_comment_title', 'review_comment_message']],
+        on='order_id',
+        how='left'
+    )
+
+
+@memoize
+def explode_complaint_types(df: pd.DataFrame,
+                            column: str = 'complaint_types_str',
+                            type_column: str = 'complaint_type',
+                            keep_empty: bool = False) -> pd.DataFrame:
+    """
+    불만 유형 문자열('유형1, 유형2')을 유형당 한 행으로 펼침
+
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        complaint_types_str 컬럼이 있는 데이터프레임 (분류 결과/타임라인)
+    column : str
+        유형 문자열 컬럼
+    type_column : str
+        펼친 유형 컬럼명
+    keep_empty : bool
+        유형이 없는 행도 남길지 여부 (type_column이 NaN)
+
+    Returns:
+    --------
+    pd.DataFrame
+        원래 컬럼 + type_column (index는 원본 index 반복)
+    """
+    # 위치 기준으로 펼쳐서 index가 중복된 입력도 행이 섞이지 않도록
+    types = df[column].reset_index(drop=True).str.split(TYPES_SEPARATOR).explode()
+    if not keep_empty:
+        types = types.dropna()
+    result = df.drop(columns=[column]).iloc[types.index.to_numpy()]
+    result[type_column] = types.to_numpy()
+    return result
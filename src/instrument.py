@@ -0,0 +1,481 @@
+"""
+실행 계측 모듈
+함수별 실행 시간(wall/CPU), 메모리 peak 증가량, 입력/출력 행 수를 구조화된 이벤트로 기록하는 함수들
+
+사용 예:
+    from src.instrument import instrument, print_summary
+
+    with instrument() as events:
+        tables = load_all_tables()
+        ...
+    print_summary(events)
+
+계측이 꺼져 있을 때(기본) 데코레이터는 sink 목록 확인 한 번 후 원래 함수를 그대로 호출한다.
+환경 변수 OLIST_INSTRUMENT에 파일 경로를 주면 import 시점부터 JSON lines로 기록한다
+(OLIST_INSTRUMENT_MEMORY=1이면 메모리도 측정).
+"""
+
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+
+ENV_VAR = "OLIST_INSTRUMENT"
+ENV_MEMORY_VAR = "OLIST_INSTRUMENT_MEMORY"
+
+# 활성 sink 목록 (비어 있으면 계측 꺼짐)
+_SINKS: List = []
+_TRACK_MEMORY = False
+_STARTED_TRACEMALLOC = False
+
+# 스레드별 호출 스택 (중첩 호출의 parent/depth, 자식 시간 집계용)
+_LOCAL = threading.local()
+
+
+# ==============================================
+# Sink
+# ==============================================
+
+class MemorySink:
+    """이벤트를 리스트에 모으는 sink (list처럼 순회/len 가능)"""
+
+    def __init__(self):
+        self.events: List[Dict] = []
+        self._lock = threading.Lock()
+
+    def emit(self, event: Dict) -> None:
+        with self._lock:
+            self.events.append(event)
+
+    def close(self) -> None:
+        pass
+
+    def __iter__(self):
+        return iter(list(self.events))
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def summary(self, top: Optional[int] = None) -> pd.DataFrame:
+        return summarize(self.events, top=top)
+
+
+class JsonLinesSink:
+    """이벤트를 한 줄에 하나씩 JSON으로 파일에 추가하는 sink"""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, 'a', encoding='utf-8')
+        self._lock = threading.Lock()
+
+    def emit(self, event: Dict) -> None:
+        line = json.dumps(event, ensure_ascii=False, default=str)
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+
+class CallbackSink:
+    """함수 하나로 이벤트를 받는 sink"""
+
+    def __init__(self, callback: Callable[[Dict], None]):
+        self.callback = callback
+
+    def emit(self, event: Dict) -> None:
+        self.callback(event)
+
+    def close(self) -> None:
+        pass
+
+
+def read_events(path: Union[str, Path]) -> List[Dict]:
+    """JsonLinesSink가 쓴 파일을 이벤트 리스트로 읽기"""
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+# ==============================================
+# 켜기 / 끄기
+# ==============================================
+
+def _as_sink(sink):
+    if hasattr(sink, 'emit'):
+        return sink
+    if callable(sink):
+        return CallbackSink(sink)
+    if isinstance(sink, (str, Path)):
+        return JsonLinesSink(sink)
+    raise TypeError(f"sink로 쓸 수 없는 객체: {type(sink).__name__}")
+
+
+def enable(*sinks, track_memory: bool = True) -> List:
+    """
+    계측 켜기
+
+    Parameters:
+    -----------
+    *sinks
+        emit(event)를 가진 객체, 이벤트를 받는 함수, 또는 JSON lines 파일 경로
+        (없으면 MemorySink 하나를 만든다)
+    track_memory : bool
+        tracemalloc으로 호출별 메모리 peak 증가량 측정 (느려지므로 시간만 볼 때는 False)
+
+    Returns:
+    --------
+    List
+        추가된 sink 목록
+    """
+    global _TRACK_MEMORY, _STARTED_TRACEMALLOC
+    added = [_as_sink(sink) for sink in sinks] or [MemorySink()]
+    if track_memory and not _TRACK_MEMORY:
+        _TRACK_MEMORY = True
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _STARTED_TRACEMALLOC = True
+    _SINKS.extend(added)
+    return added
+
+
+def disable(*sinks) -> None:
+    """계측 끄기 (sink를 지정하면 그 sink만 제거) - 제거된 sink는 close"""
+    global _TRACK_MEMORY, _STARTED_TRACEMALLOC
+    removed = list(sinks) if sinks else list(_SINKS)
+    for sink in removed:
+        if sink in _SINKS:
+            _SINKS.remove(sink)
+        sink.close()
+    if not _SINKS and _TRACK_MEMORY:
+        _TRACK_MEMORY = False
+        if _STARTED_TRACEMALLOC:
+            tracemalloc.stop()
+            _STARTED_TRACEMALLOC = False
+
+
+def is_enabled() -> bool:
+    return bool(_SINKS)
+
+
+@contextmanager
+def instrument(*sinks, track_memory: bool = True):
+    """
+    with 블록 안에서만 계측 (첫 번째 sink를 반환, 지정하지 않으면 MemorySink)
+    """
+    added = enable(*sinks, track_memory=track_memory)
+    try:
+        yield added[0]
+    finally:
+        disable(*added)
+
+
+# ==============================================
+# 이벤트 기록
+# ==============================================
+
+def _count_rows(obj) -> Optional[int]:
+    """DataFrame/Series/ndarray 행 수 (dict/list/tuple이면 안의 테이블 행 수 합계)"""
+    if isinstance(obj, (pd.DataFrame, pd.Series, pd.Index, np.ndarray)):
+        return len(obj)
+    # LazyTables 같은 Mapping은 세는 순간 로드되므로 일반 dict/list/tuple만 본다
+    if type(obj) is dict:
+        values = obj.values()
+    elif type(obj) in (list, tuple):
+        values = obj
+    else:
+        return None
+    counts = [_count_rows(value) for value in values
+              if isinstance(value, (pd.DataFrame, pd.Series, np.ndarray))]
+    return sum(counts) if counts else None
+
+
+def _input_rows(args, kwargs) -> Optional[int]:
+    counts = [n for n in map(_count_rows, list(args) + list(kwargs.values())) if n is not None]
+    return sum(counts) if counts else None
+
+
+def _stack() -> List[Dict]:
+    stack = getattr(_LOCAL, 'stack', None)
+    if stack is None:
+        stack = _LOCAL.stack = []
+    return stack
+
+
+def _begin(name: str) -> Dict:
+    """호출 시작: 스택에 frame을 올리고 시작 시각/메모리 기록"""
+    stack = _stack()
+    frame = {
+        'name': name,
+        'parent': stack[-1] if stack else None,
+        'child_wall': 0.0,
+        'child_peak': 0,
+        'mem_start': None,
+        'depth': len(stack),
+    }
+    if _TRACK_MEMORY and tracemalloc.is_tracing():
+        frame['mem_start'] = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+    stack.append(frame)
+    frame['ts'] = time.time()
+    frame['cpu_start'] = time.process_time()
+    frame['wall_start'] = time.perf_counter()
+    return frame
+
+
+def _finish(frame: Dict) -> Dict:
+    """frame을 스택에서 내리고 시간/메모리 측정값 반환 (부모 frame에 자식 시간/peak 반영)"""
+    wall = time.perf_counter() - frame['wall_start']
+    cpu = time.process_time() - frame['cpu_start']
+    _stack().pop()
+    parent = frame['parent']
+
+    mem_delta = None
+    if frame['mem_start'] is not None and tracemalloc.is_tracing():
+        # 자식 호출이 reset_peak을 했으므로 자식 peak과 그 이후 peak 중 큰 값
+        peak = max(tracemalloc.get_traced_memory()[1], frame['child_peak'])
+        mem_delta = max(peak - frame['mem_start'], 0)
+        if parent is not None:
+            parent['child_peak'] = max(parent['child_peak'], peak)
+    if parent is not None:
+        parent['child_wall'] += wall
+    return {'wall_s': wall, 'cpu_s': cpu, 'mem_peak_delta_bytes': mem_delta}
+
+
+def _event(frame: Dict, wall: float, cpu: float, child_wall: float, mem_delta: Optional[int],
+           rows_in: Optional[int], rows_out: Optional[int], error: Optional[str]) -> Dict:
+    parent = frame['parent']
+    return {
+        'name': frame['name'],
+        'ts': frame['ts'],
+        'wall_s': wall,
+        'cpu_s': cpu,
+        'self_wall_s': wall - child_wall,
+        'mem_peak_delta_bytes': mem_delta,
+        'rows_in': rows_in,
+        'rows_out': rows_out,
+        'depth': frame['depth'],
+        'parent': parent['name'] if parent else None,
+        'pid': os.getpid(),
+        'thread': threading.current_thread().name,
+        'error': error,
+    }
+
+
+def _emit(event: Dict) -> None:
+    for sink in list(_SINKS):
+        sink.emit(event)
+
+
+def _end(frame: Dict, error: Optional[str], rows_in: Optional[int], rows_out: Optional[int],
+         extra: Optional[Dict] = None) -> None:
+    """호출 종료: 이벤트를 만들어 sink로 보냄"""
+    step = _finish(frame)
+    event = _event(frame, step['wall_s'], step['cpu_s'], frame['child_wall'],
+                   step['mem_peak_delta_bytes'], rows_in, rows_out, error)
+    if extra:
+        event.update(extra)
+    _emit(event)
+
+
+def _record(name: str, func: Callable, args, kwargs):
+    frame = _begin(name)
+    result = None
+    error = None
+    try:
+        result = func(*args, **kwargs)
+        return result
+    except BaseException as exc:
+        error = type(exc).__name__
+        raise
+    finally:
+        _end(frame, error, _input_rows(args, kwargs), _count_rows(result))
+
+
+def _record_generator(name: str, func: Callable, args, kwargs):
+    """
+    generator 함수 계측: 값을 만드는 동안(next 호출 안)의 시간만 합산하고
+    다 소비되거나 close될 때 이벤트 하나를 보냄 (rows_out = 생성한 청크 행 수 합계)
+    """
+    gen = func(*args, **kwargs)
+    first = None
+    totals = {'wall': 0.0, 'cpu': 0.0, 'child_wall': 0.0, 'mem': None, 'rows': None}
+    error = None
+    try:
+        while True:
+            frame = _begin(name)
+            first = first or frame
+            try:
+                item = next(gen)
+            except StopIteration:
+                item = None
+                return
+            except BaseException as exc:
+                error = type(exc).__name__
+                raise
+            finally:
+                # 단계별 frame은 부모에 반영만 하고 이벤트는 보내지 않음
+                step = _finish(frame)
+                totals['wall'] += step['wall_s']
+                totals['cpu'] += step['cpu_s']
+                totals['child_wall'] += frame['child_wall']
+                if step['mem_peak_delta_bytes'] is not None:
+                    totals['mem'] = max(totals['mem'] or 0, step['mem_peak_delta_bytes'])
+            rows = _count_rows(item)
+            if rows is not None:
+                totals['rows'] = (totals['rows'] or 0) + rows
+            yield item
+    finally:
+        gen.close()
+        if first is not None:
+            event = _event(first, totals['wall'], totals['cpu'], totals['child_wall'], totals['mem'],
+                           _input_rows(args, kwargs), totals['rows'], error)
+            _emit(event)
+
+
+def _qualified_name(func: Callable) -> str:
+    module = func.__module__ or ''
+    if module.startswith('src.'):
+        module = module[len('src.'):]
+    return f"{module}.{func.__qualname__}" if module else func.__qualname__
+
+
+def instrumented(func: Optional[Callable] = None, *, name: Optional[str] = None):
+    """
+    함수 계측 데코레이터 (@instrumented 또는 @instrumented(name='...'))
+
+    계측이 꺼져 있으면 원래 함수를 바로 호출한다. 원래 함수는 __wrapped__로 접근 가능.
+    generator 함수는 값을 만드는 데 쓴 시간을 합산해서 다 소비된 뒤 이벤트 하나로 기록한다.
+    """
+    def decorate(f: Callable) -> Callable:
+        event_name = name or _qualified_name(f)
+
+        if inspect.isgeneratorfunction(f):
+            @functools.wraps(f)
+            def gen_wrapper(*args, **kwargs):
+                if not _SINKS:
+                    return f(*args, **kwargs)
+                return _record_generator(event_name, f, args, kwargs)
+
+            return gen_wrapper
+
+        @functools.wraps(f)
+        def wrapper(*args, **kwargs):
+            if not _SINKS:
+                return f(*args, **kwargs)
+            return _record(event_name, f, args, kwargs)
+
+        return wrapper
+
+    return decorate(func) if func is not None else decorate
+
+
+@contextmanager
+def span(name: str, **fields) -> Iterator[None]:
+    """
+    코드 블록 계측 (노트북/스크립트 단계 구분용, fields는 이벤트에 그대로 추가)
+
+    예: with span('step1.load'): tables = load_all_tables()
+    """
+    if not _SINKS:
+        yield
+        return
+    frame = _begin(name)
+    error = None
+    try:
+        yield
+    except BaseException as exc:
+        error = type(exc).__name__
+        raise
+    finally:
+        _end(frame, error, None, None, extra=fields)
+
+
+# ==============================================
+# 요약
+# ==============================================
+
+def summarize(events, top: Optional[int] = None) -> pd.DataFrame:
+    """
+    이벤트를 함수별로 집계한 hot spot 표
+
+    Parameters:
+    -----------
+    events : Iterable[Dict]
+        MemorySink, read_events() 결과 등
+    top : int
+        self 시간 기준 상위 N개만 (None이면 전체)
+
+    Returns:
+    --------
+    pd.DataFrame
+        name별 calls, wall_s(합계), self_wall_s(자식 호출 제외), cpu_s, mean_wall_s,
+        mem_peak_mb(최대), rows_in/rows_out(합계), errors, self_pct(최상위 호출 시간 대비 %)
+        - self_wall_s 내림차순
+    """
+    columns = ['name', 'calls', 'wall_s', 'self_wall_s', 'cpu_s', 'mean_wall_s',
+               'mem_peak_mb', 'rows_in', 'rows_out', 'errors', 'self_pct']
+    df = pd.DataFrame(list(events))
+    if len(df) == 0:
+        return pd.DataFrame(columns=columns)
+
+    df['mem_peak_mb'] = pd.to_numeric(df['mem_peak_delta_bytes'], errors='coerce') / 1024 ** 2
+    df['has_error'] = df['error'].notna()
+    summary = df.groupby('name', sort=False).agg(
+        calls=('wall_s', 'size'),
+        wall_s=('wall_s', 'sum'),
+        self_wall_s=('self_wall_s', 'sum'),
+        cpu_s=('cpu_s', 'sum'),
+        mean_wall_s=('wall_s', 'mean'),
+        mem_peak_mb=('mem_peak_mb', 'max'),
+        rows_in=('rows_in', lambda s: pd.to_numeric(s, errors='coerce').sum(min_count=1)),
+        rows_out=('rows_out', lambda s: pd.to_numeric(s, errors='coerce').sum(min_count=1)),
+        errors=('has_error', 'sum'),
+    ).reset_index()
+
+    root_wall = df.loc[df['depth'] == 0, 'wall_s'].sum()
+    summary['self_pct'] = summary['self_wall_s'] / root_wall * 100 if root_wall > 0 else np.nan
+    summary = summary.sort_values('self_wall_s', ascending=False, ignore_index=True)[columns]
+    return summary.head(top) if top is not None else summary
+
+
+def print_summary(events, top: int = 15) -> pd.DataFrame:
+    """hot spot 표 출력 (self 시간 상위 top개)"""
+    summary = summarize(events)
+    print(f"\n{'='*100}")
+    print(f"🔥 Hot spots (self 시간 순, 상위 {min(top, len(summary))}/{len(summary)}개)")
+    print(f"{'='*100}")
+    if len(summary) == 0:
+        print("   기록된 이벤트가 없습니다")
+        return summary
+
+    print(f"   {'name':45s} {'calls':>6s} {'total':>9s} {'self':>9s} {'self%':>6s} "
+          f"{'cpu':>9s} {'peak MB':>8s} {'rows out':>11s}")
+    for row in summary.head(top).itertuples():
+        peak = f"{row.mem_peak_mb:8.1f}" if pd.notna(row.mem_peak_mb) else f"{'-':>8s}"
+        rows_out = f"{int(row.rows_out):11,d}" if pd.notna(row.rows_out) else f"{'-':>11s}"
+        pct = f"{row.self_pct:5.1f}%" if pd.notna(row.self_pct) else f"{'-':>6s}"
+        print(f"   {row.name[:45]:45s} {row.calls:6d} {row.wall_s:8.3f}s {row.self_wall_s:8.3f}s {pct} "
+              f"{row.cpu_s:8.3f}s {peak} {rows_out}")
+        if row.errors:
+            print(f"      ❌ 예외 {row.errors}회")
+    print(f"{'='*100}\n")
+    return summary
+
+
+# 환경 변수로 켜기 (스크립트/노트북을 고치지 않고 기록)
+if os.environ.get(ENV_VAR):
+    enable(os.environ[ENV_VAR], track_memory=os.environ.get(ENV_MEMORY_VAR) == '1')
@@ -0,0 +1,369 @@
+"""
+정수 key 조인 모듈
+order_id/customer_id/seller_id/product_id를 전역 사전으로 한 번만 정수 코드로 바꾸고,
+테이블마다 key 인덱스(코드 → 행 위치)를 유지해서 문자열 해싱 없이 조인하는 함수들
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+from src.utils import calculate_time_diffs, parse_olist_datetime
+
+
+# 정수 코드로 관리할 key 컬럼
+KEY_NAMES = ['order_id', 'customer_id', 'seller_id', 'product_id']
+
+# 1점 리뷰 타임라인 (one_star_review.ipynb Step 7)에 붙이는 컬럼
+TIMELINE_REVIEW_COLUMNS = ['review_creation_date', 'review_answer_timestamp']
+TIMELINE_ORDER_COLUMNS = [
+    'order_purchase_timestamp', 'order_delivered_customer_date', 'order_estimated_delivery_date',
+    'is_delayed', 'total_delivery_time'
+]
+
+
+# ==============================================
+# 전역 key 사전
+# ==============================================
+
+class KeyDictionary:
+    """
+    key 값 → 정수 코드 사전 (추가만 가능, 한 번 받은 코드는 바뀌지 않음)
+
+    테이블마다 따로 factorize하면 같은 order_id라도 코드가 달라지므로,
+    모든 테이블이 하나의 사전을 공유해야 코드끼리 바로 비교/조인할 수 있다.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.values = pd.Index([], dtype=object)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __repr__(self) -> str:
+        return f"KeyDictionary({self.name!r}, size={len(self):,d})"
+
+    def encode(self, values: pd.Series) -> np.ndarray:
+        """
+        key 값 → 코드 (처음 보는 값은 사전 끝에 추가, 결측은 -1)
+
+        Returns:
+        --------
+        np.ndarray
+            int64 코드 배열
+        """
+        values = pd.Series(values)
+        if len(self.values) == 0:
+            codes, uniques = pd.factorize(values)
+            self.values = pd.Index(uniques)
+            return codes.astype('int64')
+
+        codes = self.values.get_indexer(values)
+        unseen = (codes < 0) & values.notna().to_numpy()
+        if unseen.any():
+            new_values = pd.Index(values[unseen].unique())
+            self.values = self.values.append(new_values)
+            codes[unseen] = new_values.get_indexer(values[unseen]) + len(self.values) - len(new_values)
+        return codes.astype('int64')
+
+    def decode(self, codes: np.ndarray) -> pd.Index:
+        """코드 → key 값 (-1은 결측)"""
+        codes = np.asarray(codes)
+        decoded = self.values.take(np.where(codes < 0, 0, codes)) if len(self.values) else pd.Index(
+            [None] * len(codes), dtype=object)
+        return decoded.where(codes >= 0) if (codes < 0).any() else decoded
+
+
+class KeyIndex:
+    """
+    테이블 하나의 key 인덱스 (CSR 형식: 코드 → 해당 코드를 가진 행 위치들)
+
+    rows[offsets[c]:offsets[c + 1]]가 코드 c인 행 위치 (원래 행 순서 유지).
+    key가 유일하면 counts가 모두 0/1이라 조회가 배열 인덱싱 한 번이다.
+    """
+
+    def __init__(self, codes: np.ndarray, size: int):
+        valid = codes >= 0
+        self.counts = np.bincount(codes[valid], minlength=size)
+        self.offsets = np.zeros(size + 1, dtype='int64')
+        np.cumsum(self.counts, out=self.offsets[1:])
+        self.rows = np.flatnonzero(valid)[np.argsort(codes[valid], kind='stable')]
+        self.unique = bool(self.counts.max(initial=0) <= 1)
+
+    def __len__(self) -> int:
+        return len(self.counts)
+
+    def lookup(self, codes: np.ndarray, keep_missing: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        코드 배열 → (입력 위치, 매칭 행 위치) 쌍
+
+        Parameters:
+        -----------
+        codes : np.ndarray
+            찾을 코드 (인덱스를 만든 뒤 사전에 추가된 코드/결측은 매칭 없음)
+        keep_missing : bool
+            매칭이 없는 입력도 행 위치 -1로 남길지 여부 (left join)
+        """
+        in_range = (codes >= 0) & (codes < len(self.counts))
+        safe = np.where(in_range, codes, 0)
+        counts = np.where(in_range, self.counts[safe], 0)
+
+        if keep_missing:
+            n_out = np.maximum(counts, 1)
+        else:
+            n_out = counts
+        left = np.repeat(np.arange(len(codes), dtype='int64'), n_out)
+        within = np.arange(len(left), dtype='int64') - np.repeat(np.cumsum(n_out) - n_out, n_out)
+
+        matched = np.repeat(counts > 0, n_out)
+        right = np.full(len(left), -1, dtype='int64')
+        right[matched] = self.rows[np.repeat(self.offsets[safe], n_out)[matched] + within[matched]]
+        return left, right
+
+
+# ==============================================
+# key 인덱스를 가진 테이블 모음
+# ==============================================
+
+class KeyedTables:
+    """
+    전역 key 사전 + 테이블별 key 코드/인덱스
+
+    register()할 때 key 컬럼을 한 번만 인코딩하고, join()은 코드와 인덱스로 행 위치 쌍만
+    계산한 뒤 필요한 컬럼을 take한다. 인덱스는 처음 조인에 쓰일 때 만들고 재사용한다.
+
+    Parameters:
+    -----------
+    key_names : List[str]
+        정수 코드로 관리할 key 컬럼 (None이면 KEY_NAMES)
+
+    Example:
+    --------
+    >>> keyed = KeyedTables()
+    >>> keyed.register('translated', df_translated)
+    >>> keyed.register('reviews', reviews)
+    >>> df = keyed.join('translated', 'reviews', on='order_id', columns=['review_answer_timestamp'])
+    """
+
+    def __init__(self, key_names: Optional[List[str]] = None):
+        self.key_names = list(KEY_NAMES if key_names is None else key_names)
+        self.dictionaries: Dict[str, KeyDictionary] = {key: KeyDictionary(key) for key in self.key_names}
+        self.tables: Dict[str, pd.DataFrame] = {}
+        self.codes: Dict[str, Dict[str, np.ndarray]] = {}
+        self._indexes: Dict[Tuple[str, str], KeyIndex] = {}
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.tables
+
+    def __getitem__(self, name: str) -> pd.DataFrame:
+        return self.tables[name]
+
+    def __repr__(self) -> str:
+        sizes = ', '.join(f"{key}={len(d):,d}" for key, d in self.dictionaries.items())
+        return f"KeyedTables(tables={list(self.tables)}, keys: {sizes})"
+
+    def register(self, name: str, df: pd.DataFrame,
+                 codes: Optional[Dict[str, np.ndarray]] = None) -> 'KeyedTables':
+        """
+        테이블 등록 (key 컬럼 인코딩, 같은 이름이 있으면 교체)
+
+        Parameters:
+        -----------
+        name : str
+            테이블 이름
+        df : pd.DataFrame
+            테이블 (key 컬럼 중 있는 것만 인코딩, 행 위치 기준이라 index는 상관없음)
+        codes : Dict[str, np.ndarray]
+            이미 계산된 key 코드 (조인 결과 등록 시 다시 해싱하지 않도록)
+        """
+        codes = {} if codes is None else dict(codes)
+        for key in self.key_names:
+            if key in df.columns and key not in codes:
+                codes[key] = self.dictionaries[key].encode(df[key])
+        self.tables[name] = df
+        self.codes[name] = codes
+        for index_key in [k for k in self._indexes if k[0] == name]:
+            del self._indexes[index_key]
+        return self
+
+    def register_all(self, tables: Mapping[str, Optional[pd.DataFrame]]) -> 'KeyedTables':
+        """
+        여러 테이블 등록 (None은 건너뜀)
+
+        key마다 모든 테이블의 컬럼을 이어 붙여 한 번에 인코딩한다 (해싱 1회).
+        """
+        tables = {name: df for name, df in tables.items() if df is not None}
+        codes: Dict[str, Dict[str, np.ndarray]] = {name: {} for name in tables}
+        for key in self.key_names:
+            names = [name for name, df in tables.items() if key in df.columns]
+            if not names:
+                continue
+            all_codes = self.dictionaries[key].encode(
+                pd.concat([tables[name][key] for name in names], ignore_index=True))
+            offsets = np.cumsum([len(tables[name]) for name in names])[:-1]
+            for name, table_codes in zip(names, np.split(all_codes, offsets)):
+                codes[name][key] = table_codes
+        for name, df in tables.items():
+            self.register(name, df, codes=codes[name])
+        return self
+
+    def index(self, name: str, key: str) -> KeyIndex:
+        """(테이블, key) 인덱스 - 없으면 만들고 캐시"""
+        if (name, key) not in self._indexes:
+            self._indexes[(name, key)] = KeyIndex(self.codes[name][key], len(self.dictionaries[key]))
+        # 이후 다른 테이블 등록으로 사전이 커져도 이 테이블의 코드는 그대로라 인덱스는 유효
+        return self._indexes[(name, key)]
+
+    def is_unique(self, name: str, key: str) -> bool:
+        """테이블에서 key가 유일한지 여부"""
+        return self.index(name, key).unique
+
+    def join_positions(self, left: str, right: str, on: str,
+                       how: str = 'inner') -> Tuple[np.ndarray, np.ndarray]:
+        """
+        조인 결과의 (왼쪽 행 위치, 오른쪽 행 위치) 쌍
+
+        how='left'면 매칭이 없는 왼쪽 행은 오른쪽 위치 -1.
+        """
+        if how not in ('inner', 'left'):
+            raise ValueError(f"how는 'inner' 또는 'left'만 지원합니다: {how!r}")
+        return self.index(right, on).lookup(self.codes[left][on], keep_missing=(how == 'left'))
+
+    def join(self,
+             left: str,
+             right: str,
+             on: str,
+             how: str = 'inner',
+             columns: Optional[Sequence[str]] = None,
+             suffixes: Tuple[str, str] = ('_x', '_y'),
+             name: Optional[str] = None) -> pd.DataFrame:
+        """
+        등록된 두 테이블을 key 코드로 조인 (pd.merge와 같은 행 순서/결과)
+
+        Parameters:
+        -----------
+        left, right : str
+            등록된 테이블 이름
+        on : str
+            조인 key (key_names 중 하나)
+        how : str
+            'inner' 또는 'left'
+        columns : Sequence[str]
+            오른쪽 테이블에서 가져올 컬럼 (None이면 key를 뺀 전체)
+        suffixes : Tuple[str, str]
+            겹치는 컬럼 이름 접미사
+        name : str
+            결과를 이 이름으로 다시 등록 (연속 조인용)
+
+        Returns:
+        --------
+        pd.DataFrame
+            조인 결과
+        """
+        left_df, right_df = self.tables[left], self.tables[right]
+        columns = [c for c in right_df.columns if c != on] if columns is None else [c for c in columns if c != on]
+        left_rows, right_rows = self.join_positions(left, right, on, how)
+
+        overlap = set(columns) & (set(left_df.columns) - {on})
+        left_part = left_df.take(left_rows).reset_index(drop=True)
+        left_part.columns = [f"{c}{suffixes[0]}" if c in overlap else c for c in left_df.columns]
+        if how == 'left' and (right_rows < 0).any():
+            # 위치 -1은 RangeIndex에 없으므로 결측 행이 된다 (pd.merge와 같은 dtype 승격)
+            right_part = right_df[columns].reset_index(drop=True).reindex(right_rows).reset_index(drop=True)
+        else:
+            right_part = right_df[columns].take(right_rows).reset_index(drop=True)
+        right_part.columns = [f"{c}{suffixes[1]}" if c in overlap else c for c in columns]
+
+        result = pd.concat([left_part, right_part], axis=1)
+        if name is not None:
+            # 왼쪽 코드를 그대로 재사용 (다시 해싱하지 않음)
+            self.register(name, result, codes={key: codes[left_rows] for key, codes in self.codes[left].items()})
+        return result
+
+    def filter_by_keys(self, name: str, key: str, other: str) -> pd.DataFrame:
+        """name 테이블에서 other 테이블에도 key가 있는 행만 (semi join)"""
+        other_counts = self.index(other, key).counts
+        codes = self.codes[name][key]
+        in_range = (codes >= 0) & (codes < len(other_counts))
+        mask = np.zeros(len(codes), dtype=bool)
+        mask[in_range] = other_counts[codes[in_range]] > 0
+        return self.tables[name][mask]
+
+
+# ==============================================
+# 1점 리뷰 타임라인
+# ==============================================
+
+def build_one_star_timeline(translated: pd.DataFrame,
+                            reviews: pd.DataFrame,
+                            master_orders: pd.DataFrame,
+                            keyed: Optional[KeyedTables] = None) -> pd.DataFrame:
+    """
+    one_star_timeline_final.csv 생성 (one_star_review.ipynb Step 7)
+
+    번역된 1점 리뷰 ⋈ order_reviews(날짜) ⋈ master_orders(배송 정보)를 inner join한 뒤
+    주문/배송/설문 → 리뷰 답변까지 걸린 일수를 계산한다.
+
+    Parameters:
+    -----------
+    translated : pd.DataFrame
+        번역된 1점 리뷰 (one_star_reviews_translated.csv)
+    reviews : pd.DataFrame
+        order_reviews 원본
+    master_orders : pd.DataFrame
+        master_orders (2017년 이후)
+    keyed : KeyedTables
+        이미 테이블이 등록된 KeyedTables (None이면 새로 만듦 - 여러 분석에서 재사용 권장)
+
+    Returns:
+    --------
+    pd.DataFrame
+        타임라인 데이터프레임 (노트북 CSV와 같은 컬럼, keyed에 'timeline'으로 등록됨)
+    """
+    keyed = KeyedTables() if keyed is None else keyed
+    inputs = {'translated': translated, 'reviews': reviews, 'master_orders': master_orders}
+    keyed.register_all({name: df for name, df in inputs.items() if keyed.tables.get(name) is not df})
+
+    keyed.join('translated', 'reviews', on='order_id', columns=TIMELINE_REVIEW_COLUMNS,
+               name='timeline_reviews')
+    df = keyed.join('timeline_reviews', 'master_orders', on='order_id', columns=TIMELINE_ORDER_COLUMNS,
+                    name='timeline')
+
+    # 이미 datetime이면 그대로, 문자열(CSV)이면 고정 포맷 파싱
+    for new_col, col in (('order_purchase', 'order_purchase_timestamp'),
+                         ('order_delivered', 'order_delivered_customer_date'),
+                         ('order_estimated', 'order_estimated_delivery_date'),
+                         ('survey_sent', 'review_creation_date'),
+                         ('review_answered', 'review_answer_timestamp')):
+        df[new_col], _ = parse_olist_datetime(df[col])
+
+    diffs = calculate_time_diffs(df, [
+        ('order_purchase', 'review_answered', 'days', 'days_order_to_answer'),
+        ('order_delivered', 'review_answered', 'days', 'days_delivery_to_answer'),
+        ('survey_sent', 'review_answered', 'days', 'days_survey_to_answer'),
+    ])
+    df = df.join(diffs)
+
+    # 행 구성은 그대로이므로 조인 때 만든 key 코드를 유지한 채 결과로 교체
+    keyed.register('timeline', df, codes=keyed.codes['timeline'])
+    return df
+
+
+def attach_complaint_types(keyed: KeyedTables,
+                           timeline: str,
+                           classified: str,
+                           columns: Sequence[str] = ('complaint_types_str',)) -> pd.DataFrame:
+    """
+    타임라인에 불만 유형 붙이기 (one_star_review.ipynb Step 8~10의 left join)
+
+    Parameters:
+    -----------
+    keyed : KeyedTables
+        timeline/classified가 등록된 KeyedTables
+    timeline, classified : str
+        등록된 테이블 이름
+    columns : Sequence[str]
+        classified에서 가져올 컬럼
+    """
+    return keyed.join(timeline, classified, on='order_id', how='left', columns=list(columns))
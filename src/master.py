@@ -0,0 +1,658 @@
+"""
+마스터 테이블 생성 모듈
+기본 테이블에서 master_orders / master_sellers를 단계(step) 그래프로 만들고,
+구매월 단위 파티션으로 저장해서 바뀐 월만 다시 계산하는 함수들
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from typing import Callable, Dict, List, Mapping, Optional, Tuple
+
+from src.data_loader import DATA_PATH, LazyTables
+from src.utils import calculate_time_diffs
+
+
+# 파티션 저장 경로
+# data/master/partitions/<출력명>/<YYYY-MM>.parquet + manifest.json
+MASTER_PATH = Path(__file__).parent.parent / "data" / "master"
+PARTITION_DIR_NAME = "partitions"
+# 2: seller_month에 delivered(정제 주문 여부) 그룹 추가
+MANIFEST_VERSION = 2
+
+# 2017년 이후 분석용 필터 시작일 (master_begin2017)
+BEGIN2017 = '2017-01-01'
+
+BASE_TABLES = ['orders', 'order_items', 'order_payments', 'order_reviews', 'customers']
+# master_sellers에 그대로 붙는 판매자 정보 (월과 무관하므로 manifest에 테이블 단위 fingerprint로 저장)
+SELLER_INFO_COLUMNS = ['seller_id', 'seller_city', 'seller_state']
+
+# 월 파티션으로 저장되는 단계 출력
+PARTITIONED_OUTPUTS = ['master_orders', 'order_seller', 'seller_month']
+
+MASTER_SELLERS_COLUMNS = [
+    'seller_id', 'total_orders', 'total_items', 'total_revenue', 'total_freight',
+    'avg_review_score', 'review_count', 'five_star_count', 'one_star_count',
+    'avg_delivery_days', 'delay_count', 'first_order_date', 'last_order_date',
+    'total_gmv', 'five_star_rate', 'one_star_rate', 'delay_rate',
+    'seller_city', 'seller_state'
+]
+
+
+# ==============================================
+# 단계(step) 함수
+# ==============================================
+
+def _clean_orders(orders: pd.DataFrame) -> pd.DataFrame:
+    """배송 완료 주문 + 배송 파생변수 (논리적 오류 제거)"""
+    clean = orders[orders['order_status'] == 'delivered'].dropna()
+
+    metrics = calculate_time_diffs(clean)
+    clean = clean.join(metrics)
+    clean = clean[~clean.pop('is_logical_error')]
+
+    purchase = clean['order_purchase_timestamp']
+    clean['purchase_hour'] = purchase.dt.hour
+    clean['purchase_dayofweek'] = purchase.dt.day_name()
+    clean['purchase_month'] = purchase.dt.month
+    clean['is_weekend'] = purchase.dt.weekday >= 5
+    # 구간 경계 (0, 6, 15, 30, 최대값) - 파티션 단위 계산이므로 최대값 대신 inf 사용
+    clean['delivery_speed_type'] = pd.cut(clean['total_delivery_time'],
+                                          bins=[-1, 6, 15, 30, np.inf],
+                                          labels=['Very Fast', 'Normal', 'Slow', 'Very Slow'])
+    return clean.reset_index(drop=True)
+
+
+def _clean_reviews(order_reviews: pd.DataFrame) -> pd.DataFrame:
+    """주문당 가장 최신 리뷰 1건만 유지"""
+    return (
+        order_reviews
+        .sort_values(by='review_creation_date', ascending=False, kind='stable')
+        .drop_duplicates(subset='order_id', keep='first')
+    )
+
+
+def _order_items_agg(order_items: pd.DataFrame) -> pd.DataFrame:
+    """order_items 주문 단위 집계"""
+    return (
+        order_items
+        .groupby('order_id')
+        .agg(
+            item_count=('order_item_id', 'count'),
+            seller_count=('seller_id', 'nunique'),
+            total_price=('price', 'sum'),
+            total_freight=('freight_value', 'sum')
+        )
+        .reset_index()
+    )
+
+
+def _payments_agg(order_payments: pd.DataFrame) -> pd.DataFrame:
+    """order_payments 주문 단위 집계 (주 결제수단 = 가장 큰 금액)"""
+    payments_main = (
+        order_payments
+        .sort_values(['order_id', 'payment_value'], ascending=[True, False], kind='stable')
+        .drop_duplicates(subset='order_id', keep='first')
+        [['order_id', 'payment_type']]
+        .rename(columns={'payment_type': 'main_payment_type'})
+    )
+    return (
+        order_payments
+        .groupby('order_id')
+        .agg(
+            payment_count=('payment_sequential', 'count'),
+            payment_total=('payment_value', 'sum'),
+            max_installments=('payment_installments', 'max')
+        )
+        .reset_index()
+        .merge(payments_main, on='order_id', how='left')
+    )
+
+
+def _master_orders(clean_orders: pd.DataFrame,
+                   order_items_agg: pd.DataFrame,
+                   payments_agg: pd.DataFrame,
+                   clean_reviews: pd.DataFrame,
+                   customers: pd.DataFrame) -> pd.DataFrame:
+    """주문 단위 마스터 테이블 (1행 = 1주문)"""
+    return (
+        clean_orders
+        .merge(order_items_agg, on='order_id', how='left')
+        .merge(payments_agg, on='order_id', how='left')
+        .merge(clean_reviews[['order_id', 'review_score', 'review_comment_message']],
+               on='order_id', how='left')
+        .merge(customers[['customer_id', 'customer_unique_id', 'customer_city', 'customer_state']],
+               on='customer_id', how='left')
+    )
+
+
+def _order_seller(order_items: pd.DataFrame,
+                  orders: pd.DataFrame,
+                  clean_orders: pd.DataFrame,
+                  clean_reviews: pd.DataFrame) -> pd.DataFrame:
+    """
+    (주문, 판매자) 단위 중간 집계 + 주문/리뷰 정보
+
+    노트북과 같이 clean_orders에 left join - 배송 완료가 아닌 주문의 상품도 남기고
+    (구매일/배송 컬럼은 NaN) 주문/상품/매출 합계에 포함한다. order_month(파티션 키)는
+    원본 orders의 구매월이라 이런 행도 해당 월 파티션에 들어간다.
+    """
+    order_seller = (
+        order_items
+        .groupby(['order_id', 'seller_id'])
+        .agg(
+            items_in_order=('order_item_id', 'count'),
+            revenue_in_order=('price', 'sum'),
+            freight_in_order=('freight_value', 'sum')
+        )
+        .reset_index()
+        .merge(clean_orders[['order_id', 'order_purchase_timestamp',
+                             'total_delivery_time', 'is_delayed']],
+               on='order_id', how='left')
+        .merge(clean_reviews[['order_id', 'review_score']], on='order_id', how='left')
+    )
+    order_seller['order_month'] = order_seller['order_id'].map(_order_months(orders)).to_numpy()
+    return order_seller
+
+
+def _seller_month(order_seller: pd.DataFrame) -> pd.DataFrame:
+    """
+    판매자 × 구매월 × delivered 부분 집계 (합/개수/최소/최대만 - 월끼리 그대로 합산 가능)
+
+    delivered=False는 clean_orders에 없는 주문 (구매일/배송 값이 NaN). 전체 master_sellers는
+    모두 합산하고, 기간 조회는 노트북의 2017년 필터처럼 delivered=True만 합산한다.
+    """
+    score = order_seller['review_score']
+    delivery = order_seller['total_delivery_time']
+    partial = order_seller.assign(
+        delivered=order_seller['order_purchase_timestamp'].notna(),
+        review_sum=score,
+        five_star=(score == 5).astype('int64'),
+        one_star=(score == 1).astype('int64'),
+        delivery_days_sum=delivery,
+        delivery_days_count=delivery.notna().astype('int64'),
+    )
+    return (
+        partial
+        .groupby(['seller_id', 'order_month', 'delivered'])
+        .agg(
+            total_orders=('order_id', 'nunique'),
+            total_items=('items_in_order', 'sum'),
+            total_revenue=('revenue_in_order', 'sum'),
+            total_freight=('freight_in_order', 'sum'),
+            review_sum=('review_sum', 'sum'),
+            review_count=('review_score', 'count'),
+            five_star_count=('five_star', 'sum'),
+            one_star_count=('one_star', 'sum'),
+            delivery_days_sum=('delivery_days_sum', 'sum'),
+            delivery_days_count=('delivery_days_count', 'sum'),
+            delay_count=('is_delayed', 'sum'),
+            first_order_date=('order_purchase_timestamp', 'min'),
+            last_order_date=('order_purchase_timestamp', 'max')
+        )
+        .reset_index()
+    )
+
+
+# 단계 그래프: 출력명 → (입력 목록, 함수)
+MASTER_STEPS: Dict[str, Tuple[List[str], Callable]] = {
+    'clean_orders': (['orders'], _clean_orders),
+    'clean_reviews': (['order_reviews'], _clean_reviews),
+    'order_items_agg': (['order_items'], _order_items_agg),
+    'payments_agg': (['order_payments'], _payments_agg),
+    'master_orders': (['clean_orders', 'order_items_agg', 'payments_agg',
+                       'clean_reviews', 'customers'], _master_orders),
+    'order_seller': (['order_items', 'orders', 'clean_orders', 'clean_reviews'], _order_seller),
+    'seller_month': (['order_seller'], _seller_month),
+}
+
+
+def run_steps(inputs: Mapping[str, pd.DataFrame],
+              targets: List[str],
+              steps: Optional[Dict[str, Tuple[List[str], Callable]]] = None) -> Dict[str, pd.DataFrame]:
+    """
+    단계 그래프를 의존성 순서대로 실행
+
+    Parameters:
+    -----------
+    inputs : Mapping[str, pd.DataFrame]
+        기본 테이블 (orders, order_items ...)
+    targets : List[str]
+        만들 단계 출력명
+    steps : Dict
+        단계 그래프 (None이면 MASTER_STEPS)
+
+    Returns:
+    --------
+    Dict[str, pd.DataFrame]
+        targets와 그 과정에서 만든 중간 출력
+    """
+    steps = MASTER_STEPS if steps is None else steps
+    results: Dict[str, pd.DataFrame] = {}
+
+    def resolve(name: str) -> pd.DataFrame:
+        if name in results:
+            return results[name]
+        if name not in steps:
+            results[name] = inputs[name]
+            return results[name]
+        deps, func = steps[name]
+        results[name] = func(*[resolve(dep) for dep in deps])
+        return results[name]
+
+    for target in targets:
+        resolve(target)
+    return results
+
+
+# ==============================================
+# 월 파티션 변경 감지
+# ==============================================
+
+def _order_months(orders: pd.DataFrame) -> pd.Series:
+    """order_id → 구매월(YYYY-MM)"""
+    purchase = orders['order_purchase_timestamp']
+    if not pd.api.types.is_datetime64_any_dtype(purchase):
+        purchase = pd.to_datetime(purchase, errors='coerce')
+    return pd.Series(purchase.dt.strftime('%Y-%m').to_numpy(), index=orders['order_id'].to_numpy())
+
+
+def _row_months(tables: Mapping[str, pd.DataFrame], order_months: pd.Series) -> Dict[str, np.ndarray]:
+    """기본 테이블 각 행이 속한 구매월"""
+    months = {}
+    for name in ['orders', 'order_items', 'order_payments', 'order_reviews']:
+        months[name] = tables[name]['order_id'].map(order_months).to_numpy()
+
+    customer_months = pd.Series(months['orders'], index=tables['orders']['customer_id'].to_numpy())
+    customer_months = customer_months[~customer_months.index.duplicated()]
+    months['customers'] = tables['customers']['customer_id'].map(customer_months).to_numpy()
+    return months
+
+
+def month_fingerprints(tables: Mapping[str, pd.DataFrame]) -> Dict[str, str]:
+    """
+    구매월별 입력 데이터 fingerprint
+
+    각 기본 테이블의 행 해시를 그 행이 속한 구매월(주문 기준) 단위로 합산한다.
+    어떤 월의 주문/상품/결제/리뷰/고객 행이 추가·수정·삭제되면 그 월의 값만 바뀐다.
+
+    Returns:
+    --------
+    Dict[str, str]
+        YYYY-MM → fingerprint
+    """
+    row_months = _row_months(tables, _order_months(tables['orders']))
+    parts = []
+
+    for name in BASE_TABLES:
+        hashes = pd.util.hash_pandas_object(tables[name], index=False).to_numpy().view('int64')
+        per_month = (
+            pd.DataFrame({'month': row_months[name], 'h': hashes})
+            .dropna(subset=['month'])
+            .groupby('month')['h']
+            .agg(['sum', 'count'])
+        )
+        parts.append(per_month.add_prefix(f"{name}_"))
+
+    combined = pd.concat(parts, axis=1).fillna(0).astype('int64')
+    return {
+        month: hashlib.md5(row.to_numpy().tobytes()).hexdigest()
+        for month, row in combined.iterrows()
+    }
+
+
+def sellers_fingerprint(sellers: Optional[pd.DataFrame]) -> Optional[str]:
+    """master_sellers에 붙는 판매자 정보(SELLER_INFO_COLUMNS) fingerprint (sellers가 없으면 None)"""
+    if sellers is None:
+        return None
+    hashes = pd.util.hash_pandas_object(sellers[SELLER_INFO_COLUMNS], index=False).to_numpy()
+    return hashlib.md5(hashes.tobytes()).hexdigest()
+
+
+def _subset_by_months(tables: Mapping[str, pd.DataFrame], months: List[str]) -> Dict[str, pd.DataFrame]:
+    """지정한 구매월에 속한 행만 남긴 기본 테이블"""
+    row_months = _row_months(tables, _order_months(tables['orders']))
+    month_set = pd.Index(months)
+    return {
+        name: tables[name][month_set.get_indexer(row_months[name]) >= 0]
+        for name in BASE_TABLES
+    }
+
+
+# ==============================================
+# 파티션 저장소
+# ==============================================
+
+def _partition_root(store_path: Path) -> Path:
+    return Path(store_path) / PARTITION_DIR_NAME
+
+
+def _partition_file(store_path: Path, output: str, month: str) -> Path:
+    return _partition_root(store_path) / output / f"{month}.parquet"
+
+
+def _read_manifest(store_path: Path) -> Dict:
+    manifest_file = _partition_root(store_path) / "manifest.json"
+    try:
+        manifest = json.loads(manifest_file.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {'version': MANIFEST_VERSION, 'months': {}}
+    if manifest.get('version') != MANIFEST_VERSION:
+        return {'version': MANIFEST_VERSION, 'months': {}}
+    return manifest
+
+
+def _write_manifest(store_path: Path, manifest: Dict) -> None:
+    manifest_file = _partition_root(store_path) / "manifest.json"
+    manifest_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = manifest_file.with_name(manifest_file.name + '.tmp')
+    tmp_file.write_text(json.dumps(manifest, indent=2), encoding='utf-8')
+    os.replace(tmp_file, manifest_file)
+
+
+def _write_partition(df: pd.DataFrame, path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = path.with_name(path.name + '.tmp')
+    df.to_parquet(tmp_file, index=False)
+    os.replace(tmp_file, path)
+
+
+def _read_partitions(store_path: Path, output: str,
+                     months: Optional[List[str]] = None) -> pd.DataFrame:
+    """출력명의 월 파티션들을 읽어 합침 (months=None이면 전체)"""
+    folder = _partition_root(store_path) / output
+    files = sorted(folder.glob('*.parquet')) if folder.exists() else []
+    if months is not None:
+        wanted = set(months)
+        files = [f for f in files if f.stem in wanted]
+    frames = [pd.read_parquet(f) for f in files]
+    frames = [f for f in frames if len(f)]
+    if not frames:
+        return pd.DataFrame()
+    return pd.concat(frames, ignore_index=True)
+
+
+def combine_seller_partials(partials: pd.DataFrame, sellers: Optional[pd.DataFrame]) -> pd.DataFrame:
+    """
+    판매자 × 월 부분 집계(seller_month 단계 출력)를 합쳐서 master_sellers 형식으로 변환
+
+    월 파티션/데이터 서비스처럼 seller_month를 따로 들고 있는 곳에서 master_sellers를 만들 때 사용
+
+    Parameters:
+    -----------
+    partials : pd.DataFrame
+        seller_month 부분 집계 (여러 월/그룹을 이어 붙여도 됨)
+    sellers : pd.DataFrame
+        sellers 테이블 (None이면 seller_city/seller_state는 결측)
+
+    Returns:
+    --------
+    pd.DataFrame
+        MASTER_SELLERS_COLUMNS 순서의 판매자 단위 집계
+    """
+    if partials.empty:
+        return pd.DataFrame(columns=MASTER_SELLERS_COLUMNS)
+
+    master_sellers = (
+        partials
+        .groupby('seller_id')
+        .agg(
+            total_orders=('total_orders', 'sum'),
+            total_items=('total_items', 'sum'),
+            total_revenue=('total_revenue', 'sum'),
+            total_freight=('total_freight', 'sum'),
+            review_sum=('review_sum', 'sum'),
+            review_count=('review_count', 'sum'),
+            five_star_count=('five_star_count', 'sum'),
+            one_star_count=('one_star_count', 'sum'),
+            delivery_days_sum=('delivery_days_sum', 'sum'),
+            delivery_days_count=('delivery_days_count', 'sum'),
+            delay_count=('delay_count', 'sum'),
+            first_order_date=('first_order_date', 'min'),
+            last_order_date=('last_order_date', 'max')
+        )
+        .reset_index()
+    )
+
+    master_sellers['avg_review_score'] = (
+        master_sellers['review_sum'] / master_sellers['review_count'].replace(0, np.nan)
+    )
+    master_sellers['avg_delivery_days'] = (
+        master_sellers['delivery_days_sum'] / master_sellers['delivery_days_count'].replace(0, np.nan)
+    )
+
+    # 파생 변수
+    master_sellers['total_gmv'] = master_sellers['total_revenue'] + master_sellers['total_freight']
+    master_sellers['five_star_rate'] = (master_sellers['five_star_count'] / master_sellers['review_count'] * 100).round(2)
+    master_sellers['one_star_rate'] = (master_sellers['one_star_count'] / master_sellers['review_count'] * 100).round(2)
+    master_sellers['delay_rate'] = (master_sellers['delay_count'] / master_sellers['total_orders'] * 100).round(2)
+
+    return _attach_seller_info(master_sellers, sellers)
+
+
+def _attach_seller_info(master_sellers: pd.DataFrame, sellers: Optional[pd.DataFrame]) -> pd.DataFrame:
+    """seller_city/seller_state를 (다시) 붙이고 MASTER_SELLERS_COLUMNS 순서로 정리"""
+    master_sellers = master_sellers.drop(columns=['seller_city', 'seller_state'], errors='ignore')
+    if sellers is not None:
+        master_sellers = master_sellers.merge(sellers[SELLER_INFO_COLUMNS], on='seller_id', how='left')
+    else:
+        master_sellers['seller_city'] = np.nan
+        master_sellers['seller_state'] = np.nan
+
+    return master_sellers[MASTER_SELLERS_COLUMNS]
+
+
+# ==============================================
+# 빌드 / 조회
+# ==============================================
+
+def build_master_tables(tables: Optional[Mapping[str, pd.DataFrame]] = None,
+                        store_path: Path = MASTER_PATH,
+                        data_path: Path = DATA_PATH,
+                        full_rebuild: bool = False,
+                        verbose: bool = True) -> Dict:
+    """
+    master_orders / master_sellers를 증분 생성
+
+    1. 기본 테이블 행을 구매월 단위로 묶어 fingerprint를 계산하고, 저장된 manifest와
+       비교해서 새로 생기거나 바뀐 월/사라진 월을 찾는다.
+    2. 바뀐 월의 행만 골라 MASTER_STEPS를 실행하고, 월 파티션
+       (master_orders, order_seller, seller_month)만 다시 쓴다.
+    3. master_sellers는 바뀐 월에 등장한(이전/현재) 판매자만 모든 월의
+       seller_month 부분 집계로 다시 합산하고, 나머지 판매자 행은 유지한다.
+    4. sellers 테이블(도시/주)만 바뀌었으면 월 재계산 없이 master_sellers에 판매자 정보만 다시 붙인다.
+
+    Parameters:
+    -----------
+    tables : Mapping[str, pd.DataFrame]
+        로드된 테이블 (None이면 LazyTables(data_path))
+    store_path : Path
+        파티션 저장 경로 (파티션은 store_path / 'partitions' 아래)
+    data_path : Path
+        tables가 None일 때 CSV 경로
+    full_rebuild : bool
+        True면 manifest를 무시하고 전체 월을 다시 계산
+    verbose : bool
+        진행 상황 출력 여부
+
+    Returns:
+    --------
+    Dict
+        {'rebuilt': 다시 계산한 월 목록, 'removed': 삭제한 월 목록, 'sellers': 다시 집계한 판매자 수,
+         'seller_info': 판매자 정보를 다시 붙였는지 여부}
+    """
+    if tables is None:
+        tables = LazyTables(data_path)
+    store_path = Path(store_path)
+
+    fingerprints = month_fingerprints(tables)
+    # manifest가 없거나 형식 버전이 다르면 재사용할 파티션이 없으므로 전체 재계산
+    full_rebuild = full_rebuild or not _read_manifest(store_path)['months']
+    if full_rebuild:
+        for output in PARTITIONED_OUTPUTS:
+            shutil.rmtree(_partition_root(store_path) / output, ignore_errors=True)
+    manifest = {'version': MANIFEST_VERSION, 'months': {}} if full_rebuild else _read_manifest(store_path)
+    previous = manifest['months']
+
+    changed = sorted(m for m, fp in fingerprints.items() if previous.get(m) != fp)
+    removed = sorted(m for m in previous if m not in fingerprints)
+
+    if verbose:
+        print("🏗️  마스터 테이블 빌드")
+        print(f"   전체 {len(fingerprints)}개월 / 재계산 {len(changed)}개월 / 삭제 {len(removed)}개월")
+
+    # 바뀐 월에 있던 판매자 (재계산 전 상태)
+    touched_sellers = set()
+    old_order_seller = _read_partitions(store_path, 'order_seller', months=changed + removed)
+    if not old_order_seller.empty:
+        touched_sellers.update(old_order_seller['seller_id'])
+
+    if changed:
+        results = run_steps(_subset_by_months(tables, changed), PARTITIONED_OUTPUTS)
+        order_months = {
+            'master_orders': results['master_orders']['order_purchase_timestamp'].dt.strftime('%Y-%m'),
+            'order_seller': results['order_seller']['order_month'],
+            'seller_month': results['seller_month']['order_month'],
+        }
+        touched_sellers.update(results['order_seller']['seller_id'])
+
+        for output in PARTITIONED_OUTPUTS:
+            groups = dict(tuple(results[output].groupby(order_months[output].to_numpy())))
+            for month in changed:
+                path = _partition_file(store_path, output, month)
+                if month in groups:
+                    _write_partition(groups[month].reset_index(drop=True), path)
+                elif path.exists():
+                    path.unlink()
+
+    for month in removed:
+        for output in PARTITIONED_OUTPUTS:
+            path = _partition_file(store_path, output, month)
+            if path.exists():
+                path.unlink()
+
+    # master_sellers: 영향 받은 판매자만 다시 합산
+    sellers = tables.get('sellers')
+    seller_fingerprint = sellers_fingerprint(sellers)
+    seller_info_changed = manifest.get('sellers') != seller_fingerprint
+    master_sellers_file = _partition_root(store_path) / "master_sellers.parquet"
+    if master_sellers_file.exists() and not full_rebuild:
+        master_sellers = pd.read_parquet(master_sellers_file)
+        master_sellers = master_sellers[~master_sellers['seller_id'].isin(touched_sellers)]
+    else:
+        master_sellers = pd.DataFrame(columns=MASTER_SELLERS_COLUMNS)
+        touched_sellers = None  # 전체 판매자 집계
+
+    if touched_sellers is None or touched_sellers:
+        partials = _read_partitions(store_path, 'seller_month')
+        if touched_sellers is not None and not partials.empty:
+            partials = partials[partials['seller_id'].isin(touched_sellers)]
+        updated = combine_seller_partials(partials, sellers)
+        master_sellers = pd.concat([df for df in (master_sellers, updated) if len(df)],
+                                   ignore_index=True) if len(updated) else master_sellers
+        master_sellers = master_sellers.sort_values('seller_id', kind='stable').reset_index(drop=True)
+    # 다시 합산하지 않은 판매자 행에도 바뀐 도시/주 반영 (전체 합산이면 이미 최신)
+    if seller_info_changed and touched_sellers is not None:
+        master_sellers = _attach_seller_info(master_sellers, sellers)
+    if touched_sellers is None or touched_sellers or seller_info_changed:
+        _write_partition(master_sellers, master_sellers_file)
+
+    manifest['months'] = fingerprints
+    manifest['sellers'] = seller_fingerprint
+    _write_manifest(store_path, manifest)
+
+    n_sellers = len(touched_sellers) if touched_sellers is not None else len(master_sellers)
+    if verbose:
+        print(f"   판매자 재집계: {n_sellers:,d}명 / master_sellers: {len(master_sellers):,d}명"
+              + (" / 판매자 정보 갱신" if seller_info_changed else ""))
+        print("✅ 마스터 테이블 빌드 완료\n")
+
+    return {'rebuilt': changed, 'removed': removed, 'sellers': n_sellers, 'seller_info': seller_info_changed}
+
+
+def _months_in_range(store_path: Path, start: Optional[str], end: Optional[str]) -> List[str]:
+    """구매일 [start, end) 범위에 걸치는 월 파티션 (end가 월 첫날 0시면 그 월은 제외)"""
+    months = sorted(_read_manifest(store_path)['months'])
+    if start is not None:
+        months = [m for m in months if m >= pd.Timestamp(start).strftime('%Y-%m')]
+    if end is not None:
+        last_month = (pd.Timestamp(end) - pd.Timedelta(1, unit='ns')).strftime('%Y-%m')
+        months = [m for m in months if m <= last_month]
+    return months
+
+
+def _filter_by_time(df: pd.DataFrame, col: str, start: Optional[str], end: Optional[str]) -> pd.DataFrame:
+    if df.empty:
+        return df
+    mask = pd.Series(True, index=df.index)
+    if start is not None:
+        mask &= df[col] >= pd.Timestamp(start)
+    if end is not None:
+        mask &= df[col] < pd.Timestamp(end)
+    return df[mask].reset_index(drop=True)
+
+
+def load_master_orders(start: Optional[str] = None,
+                       end: Optional[str] = None,
+                       store_path: Path = MASTER_PATH) -> pd.DataFrame:
+    """
+    master_orders 조회 (구매일 기준 [start, end) 필터 뷰)
+
+    해당 범위의 월 파티션만 읽는다. 예: load_master_orders(start=BEGIN2017)
+    """
+    months = _months_in_range(store_path, start, end)
+    master_orders = _read_partitions(store_path, 'master_orders', months=months)
+    return _filter_by_time(master_orders, 'order_purchase_timestamp', start, end)
+
+
+def load_master_sellers(start: Optional[str] = None,
+                        end: Optional[str] = None,
+                        store_path: Path = MASTER_PATH,
+                        sellers: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+    """
+    master_sellers 조회
+
+    기간을 주지 않으면 저장된 master_sellers를 그대로 읽는다. 노트북과 같이 clean_orders에
+    없는 주문의 상품도 주문/상품/매출 합계에 들어간다 (해당 주문의 날짜/배송 값은 NaN).
+    start/end를 주면 (예: start=BEGIN2017) 해당 월들의 seller_month 부분 집계만 합산해서
+    만든다. 경계가 월 중간이면 그 월만 order_seller 행에서 부분 집계를 다시 계산한다.
+
+    Parameters:
+    -----------
+    start, end : str
+        구매일 기준 [start, end) 범위
+    store_path : Path
+        파티션 저장 경로
+    sellers : pd.DataFrame
+        seller_city/seller_state를 붙일 sellers 테이블 (None이면 저장된 master_sellers에서 가져옴)
+    """
+    master_sellers_file = _partition_root(store_path) / "master_sellers.parquet"
+    if start is None and end is None:
+        return pd.read_parquet(master_sellers_file)
+
+    months = _months_in_range(store_path, start, end)
+    boundary = set()
+    if start is not None and pd.Timestamp(start) != pd.Timestamp(start).to_period('M').to_timestamp():
+        boundary.add(pd.Timestamp(start).strftime('%Y-%m'))
+    if end is not None and pd.Timestamp(end) != pd.Timestamp(end).to_period('M').to_timestamp():
+        boundary.add(pd.Timestamp(end).strftime('%Y-%m'))
+    boundary &= set(months)
+
+    # 구매일이 없는 행(clean_orders에 없는 주문)은 기간 조건에서 제외 (노트북 Step 2.5와 동일)
+    partials = _read_partitions(store_path, 'seller_month', months=[m for m in months if m not in boundary])
+    if not partials.empty:
+        partials = partials[partials['delivered']]
+    if boundary:
+        order_seller = _read_partitions(store_path, 'order_seller', months=sorted(boundary))
+        order_seller = _filter_by_time(order_seller, 'order_purchase_timestamp', start, end)
+        if not order_seller.empty:
+            partials = pd.concat([p for p in (partials, _seller_month(order_seller)) if len(p)],
+                                 ignore_index=True)
+
+    if sellers is None and master_sellers_file.exists():
+        sellers = pd.read_parquet(master_sellers_file, columns=SELLER_INFO_COLUMNS)
+    return combine_seller_partials(partials, sellers)
@@ -0,0 +1,510 @@
+"""
+파생 프레임 메모이제이션 모듈
+함수 + 인자 + 입력 프레임 내용 digest를 key로 결과를 재사용하는 데코레이터와 캐시 함수들
+
+사용 예:
+    from src.memo import memoize, print_cache_info
+
+    @memoize
+    def clean_products(products: pd.DataFrame) -> pd.DataFrame:
+        ...
+
+    clean_products(products)   # 계산
+    clean_products(products)   # 메모리 캐시 (내용이 같은 다른 프레임이어도 적중)
+    print_cache_info()
+
+- 메모리 계층: 최근 사용 순(LRU), 전체 크기를 바이트로 제한 (기본 512MB, OLIST_MEMO_MAX_MB)
+- 디스크 계층: 메모리에서 밀려난 결과를 data/.cache/memo/에 pickle로 저장 (기본 4GB, OLIST_MEMO_DISK_MAX_MB)
+- key에는 함수 소스 코드 해시가 들어가므로 함수를 고치면 이전 결과는 쓰지 않는다
+  (다른 모듈 함수에 계산을 맡기는 경우 @memoize(deps=[...])로 그 함수 소스도 key에 넣는다)
+- OLIST_MEMO=0이면 캐시 없이 원래 함수를 그대로 호출
+"""
+
+import copy
+import functools
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import sys
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+MEMO_PATH = Path(__file__).parent.parent / "data" / ".cache" / "memo"
+MEMO_VERSION = 1
+
+ENV_VAR = "OLIST_MEMO"
+ENV_MAX_MB_VAR = "OLIST_MEMO_MAX_MB"
+ENV_DISK_MAX_MB_VAR = "OLIST_MEMO_DISK_MAX_MB"
+
+DEFAULT_MAX_MB = 512
+DEFAULT_DISK_MAX_MB = 4096
+
+
+class Uncacheable(TypeError):
+    """인자를 key로 만들 수 없는 경우 (캐시 없이 계산)"""
+
+
+# ==============================================
+# key 생성
+# ==============================================
+
+def _update_array(digest, values: np.ndarray) -> None:
+    digest.update(str(values.dtype).encode('utf-8'))
+    digest.update(np.ascontiguousarray(values).view(np.uint8))
+
+
+def _update_column(digest, values) -> None:
+    """
+    컬럼 값을 digest에 반영 (값 단위 해시 대신 메모리 버퍼를 그대로 해시)
+
+    Arrow 문자열 컬럼도 버퍼 + offset/길이로 처리하므로 profiling.frame_fingerprint보다
+    훨씬 빠르다. 같은 값이 다른 버퍼 구성이면 key가 달라질 수 있지만 (미적중일 뿐)
+    다른 값이 같은 key가 되지는 않는다.
+    """
+    array = values.array if isinstance(values, (pd.Series, pd.Index)) else values
+    digest.update(str(getattr(array, 'dtype', '')).encode('utf-8'))
+    if isinstance(array, pd.Categorical):
+        _update_array(digest, array.codes)
+        _update_column(digest, array.categories)
+    elif hasattr(array, '__arrow_array__'):
+        chunked = array.__arrow_array__()
+        for chunk in getattr(chunked, 'chunks', [chunked]):
+            digest.update(f"{chunk.type}:{chunk.offset}:{len(chunk)}".encode('utf-8'))
+            for buffer in chunk.buffers():
+                if buffer is not None:
+                    digest.update(buffer)
+    elif hasattr(array, '_data') and hasattr(array, '_mask'):
+        # nullable 정수/불리언 (값 + 결측 마스크)
+        _update_array(digest, array._data)
+        _update_array(digest, array._mask)
+    else:
+        numpy_values = np.asarray(array)
+        if numpy_values.dtype == object:
+            numpy_values = pd.util.hash_pandas_object(pd.Series(numpy_values), index=False).to_numpy()
+        _update_array(digest, numpy_values)
+
+
+def _frame_digest(df: pd.DataFrame) -> str:
+    """DataFrame 내용 digest (컬럼명/dtype/값/index)"""
+    digest = hashlib.sha1()
+    digest.update(repr(df.shape).encode('utf-8'))
+    for name in df.columns:
+        digest.update(repr(name).encode('utf-8'))
+        _update_column(digest, df[name])
+    _update_index(digest, df.index)
+    return digest.hexdigest()
+
+
+def _update_index(digest, index: pd.Index) -> None:
+    if isinstance(index, pd.RangeIndex):
+        digest.update(f"range:{index.start}:{index.stop}:{index.step}".encode('utf-8'))
+    elif isinstance(index, pd.MultiIndex):
+        for level in range(index.nlevels):
+            _update_column(digest, index.get_level_values(level))
+    else:
+        _update_column(digest, index)
+
+
+def _arg_token(value: Any) -> Any:
+    """인자 하나를 JSON으로 직렬화 가능한 key 조각으로 변환"""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, pd.DataFrame):
+        return ['frame', _frame_digest(value)]
+    if isinstance(value, pd.Series):
+        return ['series', repr(value.name), _frame_digest(value.to_frame(name=0))]
+    if isinstance(value, np.ndarray):
+        digest = hashlib.sha1()
+        _update_column(digest, value.ravel())
+        return ['array', list(value.shape), digest.hexdigest()]
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, Path):
+        return ['path', str(value)]
+    if isinstance(value, bytes):
+        return ['bytes', hashlib.sha1(value).hexdigest()]
+    if isinstance(value, (list, tuple)):
+        return [type(value).__name__, [_arg_token(v) for v in value]]
+    if isinstance(value, (set, frozenset)):
+        return ['set', sorted(json.dumps(_arg_token(v), sort_keys=True) for v in value)]
+    if isinstance(value, Mapping):
+        # 테이블 dict도 값별 digest로 (LazyTables는 전부 로드되므로 필요한 테이블만 넘길 것)
+        return ['mapping', sorted([str(k), _arg_token(v)] for k, v in value.items())]
+    raise Uncacheable(f"key로 만들 수 없는 인자 타입: {type(value).__name__}")
+
+
+def _function_token(func: Callable) -> str:
+    """함수 식별자 (모듈 + 이름 + 소스 코드 해시)"""
+    try:
+        code = inspect.getsource(func).encode('utf-8')
+    except (OSError, TypeError):
+        code = func.__code__.co_code
+    return f"{func.__module__}.{func.__qualname__}:{hashlib.sha1(code).hexdigest()[:16]}"
+
+
+def make_key(func: Callable, args: tuple, kwargs: dict,
+             signature: Optional[inspect.Signature] = None,
+             func_token: Optional[str] = None) -> str:
+    """
+    호출 key 생성 (기본값을 채운 뒤 인자 이름 기준이므로 위치/키워드 호출이 같은 key)
+
+    Returns:
+    --------
+    str
+        sha1 hex key
+
+    Raises:
+    -------
+    Uncacheable
+        key로 만들 수 없는 인자가 있는 경우
+    """
+    signature = signature or inspect.signature(func)
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+    payload = json.dumps({
+        'version': MEMO_VERSION,
+        'func': func_token or _function_token(func),
+        'args': {name: _arg_token(value) for name, value in bound.arguments.items()},
+    }, sort_keys=True)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+# ==============================================
+# 캐시 계층
+# ==============================================
+
+def _nbytes(value: Any) -> int:
+    """결과 크기 추정 (바이트)"""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True, index=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(deep=True, index=True))
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    if isinstance(value, Mapping):
+        return sys.getsizeof(value) + sum(_nbytes(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(_nbytes(v) for v in value)
+    return sys.getsizeof(value)
+
+
+# 복사 없이 그대로 넘겨도 되는 불변 타입
+_IMMUTABLE_TYPES = (str, bytes, int, float, bool, complex, type(None), np.generic, pd.Timestamp, pd.Timedelta)
+
+
+def _detach(value: Any) -> Any:
+    """
+    캐시 보관본과 호출자에게 주는 객체를 분리
+
+    DataFrame/Series는 얕은 복사 (Copy-on-Write라 값 복사 없이 호출자 수정이 캐시에 번지지 않음),
+    dict/list/tuple은 원소까지 재귀로 복사, ndarray와 그 밖의 객체는 깊은 복사
+    """
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return value.copy(deep=False)
+    if isinstance(value, _IMMUTABLE_TYPES):
+        return value
+    if isinstance(value, dict):
+        return type(value)((k, _detach(v)) for k, v in value.items())
+    if isinstance(value, list):
+        return [_detach(v) for v in value]
+    if isinstance(value, tuple) and not hasattr(value, '_fields'):
+        return tuple(_detach(v) for v in value)
+    if isinstance(value, np.ndarray):
+        return value.copy()
+    return copy.deepcopy(value)
+
+
+def _env_mb(name: str, default: int) -> int:
+    try:
+        return int(float(os.environ.get(name, default)) * 1024 ** 2)
+    except ValueError:
+        return default * 1024 ** 2
+
+
+class MemoCache:
+    """
+    바이트 제한 LRU 메모리 캐시 + 디스크 spill 계층
+
+    Parameters:
+    -----------
+    max_bytes : int
+        메모리 계층 최대 크기 (None이면 OLIST_MEMO_MAX_MB, 기본 512MB)
+    disk_path : Path
+        디스크 계층 폴더 (None이면 data/.cache/memo, False면 디스크 계층 사용 안 함)
+    max_disk_bytes : int
+        디스크 계층 최대 크기 (None이면 OLIST_MEMO_DISK_MAX_MB, 기본 4GB)
+    """
+
+    def __init__(self,
+                 max_bytes: Optional[int] = None,
+                 disk_path: Optional[Path] = None,
+                 max_disk_bytes: Optional[int] = None):
+        self.max_bytes = _env_mb(ENV_MAX_MB_VAR, DEFAULT_MAX_MB) if max_bytes is None else max_bytes
+        self.max_disk_bytes = (_env_mb(ENV_DISK_MAX_MB_VAR, DEFAULT_DISK_MAX_MB)
+                               if max_disk_bytes is None else max_disk_bytes)
+        self.disk_path = None if disk_path is False else Path(disk_path or MEMO_PATH)
+        self._entries: "OrderedDict[str, Tuple[Any, int, str]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.RLock()
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        self.stats = {'hits': 0, 'disk_hits': 0, 'misses': 0, 'evictions': 0, 'spills': 0,
+                      'uncacheable': 0}
+        self.func_stats: Dict[str, Dict[str, int]] = {}
+
+    def _count(self, func_name: str, event: str) -> None:
+        self.stats[event] += 1
+        counts = self.func_stats.setdefault(func_name, {'hits': 0, 'disk_hits': 0, 'misses': 0})
+        if event in counts:
+            counts[event] += 1
+
+    # ---------- 디스크 계층 ----------
+
+    def _disk_file(self, key: str) -> Optional[Path]:
+        return self.disk_path / f"{key}.pkl" if self.disk_path is not None else None
+
+    def _read_disk(self, key: str) -> Tuple[bool, Any]:
+        disk_file = self._disk_file(key)
+        if disk_file is None or not disk_file.exists():
+            return False, None
+        try:
+            with open(disk_file, 'rb') as f:
+                value = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+            return False, None
+        # 최근 사용 시각 갱신 (디스크 정리 순서)
+        try:
+            os.utime(disk_file)
+        except OSError:
+            pass
+        return True, value
+
+    def _write_disk(self, key: str, value: Any) -> bool:
+        disk_file = self._disk_file(key)
+        if disk_file is None:
+            return False
+        if disk_file.exists():
+            return True
+        try:
+            disk_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = disk_file.with_name(f"{disk_file.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp_file, 'wb') as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, disk_file)
+        except (OSError, pickle.PicklingError, TypeError, AttributeError):
+            return False
+        self._trim_disk()
+        return True
+
+    def _trim_disk(self) -> None:
+        """디스크 계층이 max_disk_bytes를 넘으면 오래 안 쓴 파일부터 삭제"""
+        files = []
+        for path in self.disk_path.glob("*.pkl"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files, key=lambda item: item[0]):
+            if total <= self.max_disk_bytes:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+
+    def disk_usage(self) -> Tuple[int, int]:
+        """(디스크 계층 파일 수, 바이트)"""
+        if self.disk_path is None or not self.disk_path.exists():
+            return 0, 0
+        sizes = [path.stat().st_size for path in self.disk_path.glob("*.pkl")]
+        return len(sizes), sum(sizes)
+
+    # ---------- 메모리 계층 ----------
+
+    def get(self, key: str, func_name: str = "") -> Tuple[bool, Any]:
+        """(적중 여부, 값) - 메모리 → 디스크 순서로 찾고, 디스크에서 찾으면 메모리로 올림"""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self._count(func_name, 'hits')
+                return True, _detach(self._entries[key][0])
+
+        found, value = self._read_disk(key)
+        if found:
+            with self._lock:
+                self._count(func_name, 'disk_hits')
+            self._put_memory(key, value, func_name, spilled=True)
+            return True, _detach(value)
+
+        with self._lock:
+            self._count(func_name, 'misses')
+        return False, None
+
+    def put(self, key: str, value: Any, func_name: str = "") -> None:
+        self._put_memory(key, _detach(value), func_name)
+
+    def _put_memory(self, key: str, value: Any, func_name: str, spilled: bool = False) -> None:
+        size = _nbytes(value)
+        if size > self.max_bytes:
+            # 메모리 한도보다 큰 결과는 바로 디스크로
+            if not spilled and self._write_disk(key, value):
+                with self._lock:
+                    self.stats['spills'] += 1
+            return
+
+        evicted = []
+        with self._lock:
+            if key in self._entries:
+                self._bytes -= self._entries.pop(key)[1]
+            self._entries[key] = (value, size, func_name)
+            self._bytes += size
+            while self._bytes > self.max_bytes and len(self._entries) > 1:
+                old_key, (old_value, old_size, old_func) = self._entries.popitem(last=False)
+                self._bytes -= old_size
+                self.stats['evictions'] += 1
+                evicted.append((old_key, old_value))
+
+        # 디스크 쓰기는 lock 밖에서 (다른 스레드의 메모리 적중을 막지 않도록)
+        for old_key, old_value in evicted:
+            if self._write_disk(old_key, old_value):
+                with self._lock:
+                    self.stats['spills'] += 1
+
+    def clear(self, disk: bool = False) -> None:
+        """메모리 계층 비우기 (disk=True면 디스크 계층 파일도 삭제)"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+        if disk and self.disk_path is not None and self.disk_path.exists():
+            for path in self.disk_path.glob("*.pkl"):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+    def info(self) -> Dict:
+        with self._lock:
+            lookups = self.stats['hits'] + self.stats['disk_hits'] + self.stats['misses']
+            disk_files, disk_bytes = self.disk_usage()
+            return {
+                **self.stats,
+                'hit_rate': (self.stats['hits'] + self.stats['disk_hits']) / lookups if lookups else 0.0,
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes,
+                'disk_entries': disk_files,
+                'disk_bytes': disk_bytes,
+                'functions': {name: dict(counts) for name, counts in self.func_stats.items()},
+            }
+
+
+_DEFAULT_CACHE: Optional[MemoCache] = None
+
+
+def get_cache() -> MemoCache:
+    """모듈 기본 캐시 (처음 사용할 때 생성)"""
+    global _DEFAULT_CACHE
+    if _DEFAULT_CACHE is None:
+        _DEFAULT_CACHE = MemoCache()
+    return _DEFAULT_CACHE
+
+
+def _enabled() -> bool:
+    return os.environ.get(ENV_VAR, "1").lower() not in ("0", "false", "off")
+
+
+# ==============================================
+# 데코레이터
+# ==============================================
+
+def memoize(func: Optional[Callable] = None, *, cache: Optional[MemoCache] = None,
+            deps: Optional[List[Callable]] = None):
+    """
+    결과 메모이제이션 데코레이터
+
+    key = 함수(모듈/이름/소스 해시) + 인자 값 (DataFrame/Series/ndarray는 내용 digest).
+    내용이 같으면 다른 객체여도 적중하고, 입력을 제자리에서 고쳐도 digest가 바뀌므로
+    이전 결과를 잘못 돌려주지 않는다. key로 만들 수 없는 인자가 있으면 캐시 없이 계산한다.
+
+    원래 함수는 wrapper.__wrapped__, 캐시 key는 wrapper.cache_key(*args, **kwargs)
+
+    Parameters:
+    -----------
+    func : Callable
+        메모이제이션할 함수 (@memoize / @memoize(cache=...) 모두 가능)
+    cache : MemoCache
+        사용할 캐시 (None이면 모듈 기본 캐시)
+    deps : List[Callable]
+        결과에 영향을 주는 다른 함수 (소스 해시를 key에 포함 - 호출하는 함수를 고치면 캐시 무효화)
+    """
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+        func_name = f"{func.__module__}.{func.__qualname__}"
+        func_token = '|'.join(_function_token(f) for f in [func, *(deps or [])])
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled():
+                return func(*args, **kwargs)
+            memo = cache or get_cache()
+            try:
+                key = make_key(func, args, kwargs, signature, func_token)
+            except Uncacheable:
+                with memo._lock:
+                    memo.stats['uncacheable'] += 1
+                return func(*args, **kwargs)
+
+            found, value = memo.get(key, func_name)
+            if found:
+                return value
+            value = func(*args, **kwargs)
+            memo.put(key, value, func_name)
+            return value
+
+        wrapper.cache_key = lambda *args, **kwargs: make_key(func, args, kwargs, signature, func_token)
+        return wrapper
+
+    if func is not None:
+        return decorator(func)
+    return decorator
+
+
+def cache_info() -> Dict:
+    """
+    기본 캐시 통계
+
+    Returns:
+    --------
+    Dict
+        hits / disk_hits / misses / evictions / spills / uncacheable / hit_rate,
+        entries / bytes / max_bytes (메모리), disk_entries / disk_bytes, functions (함수별 적중)
+    """
+    return get_cache().info()
+
+
+def print_cache_info() -> None:
+    """기본 캐시 통계 출력"""
+    info = cache_info()
+    print(f"🧠 메모리: {info['entries']}개, {info['bytes'] / 1024**2:.1f} / {info['max_bytes'] / 1024**2:.0f} MB")
+    print(f"💾 디스크: {info['disk_entries']}개, {info['disk_bytes'] / 1024**2:.1f} MB")
+    print(f"🎯 적중 {info['hits']} (디스크 {info['disk_hits']}) / 미적중 {info['misses']} "
+          f"(적중률 {info['hit_rate'] * 100:.1f}%), 축출 {info['evictions']} / spill {info['spills']}")
+    for name, counts in info['functions'].items():
+        print(f"   - {name}: 적중 {counts['hits'] + counts['disk_hits']} / 미적중 {counts['misses']}")
+
+
+def clear_cache(disk: bool = False) -> None:
+    """기본 캐시 비우기 (disk=True면 디스크 계층도 삭제)"""
+    get_cache().clear(disk=disk)
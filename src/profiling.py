@@ -0,0 +1,175 @@
+"""
+테이블 프로파일링 모듈
+get_table_info, check_data_quality, 품질 보고서가 공통으로 쓰는 통계를 한 번에 계산
+"""
+
+import numpy as np
+import pandas as pd
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+
+# 테이블 버전별 프로파일 캐시 (최근 사용 순, 최대 PROFILE_CACHE_SIZE개)
+PROFILE_CACHE_SIZE = 32
+_PROFILE_CACHE: "OrderedDict[Tuple[str, str], Dict]" = OrderedDict()
+
+# 행 해시 결합용 상수 (64bit 곱셈 해시)
+_HASH_MULTIPLIER = np.uint64(0x9E3779B97F4A7C15)
+
+QUANTILES = [0.25, 0.5, 0.75]
+
+
+def _copy_profile(profile: Dict) -> Dict:
+    """캐시 보관본과 분리된 프로파일 (호출자가 column_stats를 고쳐도 캐시는 그대로)"""
+    return {key: value.copy() if isinstance(value, pd.DataFrame) else value
+            for key, value in profile.items()}
+
+
+def _column_hashes(df: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """컬럼별 값 해시 (uint64) - 고유값 수/중복 행/fingerprint 계산에 공용"""
+    return {
+        col: pd.util.hash_pandas_object(df[col], index=False).to_numpy()
+        for col in df.columns
+    }
+
+
+def _combine_row_hashes(column_hashes: Dict[str, np.ndarray], n_rows: int) -> np.ndarray:
+    """컬럼 해시를 순서대로 결합해서 행 해시 생성"""
+    row_hash = np.zeros(n_rows, dtype=np.uint64)
+    with np.errstate(over='ignore'):
+        for hashes in column_hashes.values():
+            row_hash = (row_hash * _HASH_MULTIPLIER) ^ hashes
+    return row_hash
+
+
+def _fingerprint_from_hashes(df: pd.DataFrame, row_hash: np.ndarray) -> str:
+    """행 해시 + 컬럼/dtype 구성으로 테이블 버전 문자열 생성"""
+    with np.errstate(over='ignore'):
+        # 행 순서까지 반영되도록 위치 가중치를 곱해서 합산
+        weights = np.arange(1, len(row_hash) + 1, dtype=np.uint64) * _HASH_MULTIPLIER
+        content = int(np.bitwise_xor.reduce(row_hash * weights)) if len(row_hash) else 0
+    layout = pd.util.hash_pandas_object(
+        pd.Series([f"{col}:{dtype}" for col, dtype in df.dtypes.items()], dtype=object),
+        index=False
+    ).sum()
+    return f"{len(df)}x{df.shape[1]}-{int(layout):016x}-{content:016x}"
+
+
+def frame_fingerprint(df: pd.DataFrame) -> str:
+    """
+    DataFrame 내용 기반 fingerprint (값/순서/컬럼/dtype이 같으면 같은 문자열)
+
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        데이터프레임
+
+    Returns:
+    --------
+    str
+        fingerprint 문자열
+    """
+    row_hash = _combine_row_hashes(_column_hashes(df), len(df))
+    return _fingerprint_from_hashes(df, row_hash)
+
+
+def profile_table(df: pd.DataFrame,
+                  table_name: str = "DataFrame",
+                  version: Optional[str] = None,
+                  use_cache: bool = True) -> Dict:
+    """
+    테이블 프로파일을 한 번에 계산
+
+    결측치, 중복 행(행 해시 기반), 고유값 수, 메모리, 수치형 컬럼의
+    count/mean/std/min/25%/50%/75%/max를 계산한다. 컬럼별 값 해시는 한 번만
+    만들어 고유값 수, 중복 행, fingerprint에 함께 사용하고, 수치형 분위수는
+    컬럼마다 한 번의 quantile 호출로 구한다.
+
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        프로파일링할 데이터프레임
+    table_name : str
+        테이블 이름
+    version : str
+        테이블 버전 키 (예: 원본 CSV 해시). 주면 해시 계산 없이 캐시를 조회하고,
+        None이면 내용 fingerprint를 버전으로 사용
+    use_cache : bool
+        (table_name, version) 기준 결과 캐시 사용 여부
+
+    Returns:
+    --------
+    Dict
+        name, version, rows, columns, duplicates, memory_bytes,
+        column_stats (컬럼별 통계 DataFrame)
+    """
+    if use_cache and version is not None and (table_name, version) in _PROFILE_CACHE:
+        _PROFILE_CACHE.move_to_end((table_name, version))
+        return _copy_profile(_PROFILE_CACHE[(table_name, version)])
+
+    n_rows = len(df)
+    column_hashes = _column_hashes(df)
+    row_hash = _combine_row_hashes(column_hashes, n_rows)
+
+    if version is None:
+        version = _fingerprint_from_hashes(df, row_hash)
+        if use_cache and (table_name, version) in _PROFILE_CACHE:
+            _PROFILE_CACHE.move_to_end((table_name, version))
+            return _copy_profile(_PROFILE_CACHE[(table_name, version)])
+
+    nulls = df.isna().sum()
+    memory = df.memory_usage(deep=True, index=False)
+
+    distinct = {}
+    for col, hashes in column_hashes.items():
+        valid = hashes if nulls[col] == 0 else hashes[df[col].notna().to_numpy()]
+        distinct[col] = len(pd.unique(valid))
+
+    column_stats = pd.DataFrame({
+        'dtype': df.dtypes.astype(str),
+        'nulls': nulls.astype('int64'),
+        'null_pct': (nulls / n_rows * 100).round(2) if n_rows else 0.0,
+        'distinct': pd.Series(distinct, dtype='int64'),
+        'memory_bytes': memory.astype('int64'),
+        'is_numeric': [
+            pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)
+            for dtype in df.dtypes
+        ],
+    }, index=df.columns)
+
+    num_cols = column_stats.index[column_stats['is_numeric']].tolist()
+    stat_cols = ['count', 'mean', 'std', 'min', '25%', '50%', '75%', 'max']
+    numeric = pd.DataFrame(index=df.columns, columns=stat_cols, dtype='float64')
+
+    if num_cols:
+        num_df = df[num_cols]
+        numeric.loc[num_cols, 'count'] = n_rows - nulls[num_cols]
+        numeric.loc[num_cols, 'mean'] = num_df.mean()
+        numeric.loc[num_cols, 'std'] = num_df.std()
+        numeric.loc[num_cols, 'min'] = num_df.min()
+        numeric.loc[num_cols, 'max'] = num_df.max()
+        quantiles = num_df.quantile(QUANTILES)
+        for q, label in zip(QUANTILES, ['25%', '50%', '75%']):
+            numeric.loc[num_cols, label] = quantiles.loc[q]
+
+    profile = {
+        'name': table_name,
+        'version': version,
+        'rows': n_rows,
+        'columns': df.shape[1],
+        'duplicates': int(pd.Series(row_hash).duplicated().sum()),
+        'memory_bytes': int(memory.sum()),
+        'column_stats': column_stats.join(numeric),
+    }
+
+    if use_cache:
+        _PROFILE_CACHE[(table_name, version)] = _copy_profile(profile)
+        while len(_PROFILE_CACHE) > PROFILE_CACHE_SIZE:
+            _PROFILE_CACHE.popitem(last=False)
+
+    return profile
+
+
+def clear_profile_cache() -> None:
+    """프로파일 캐시 비우기"""
+    _PROFILE_CACHE.clear()
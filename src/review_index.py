@@ -0,0 +1,497 @@
+"""
+리뷰 역색인 모듈
+리뷰 텍스트(review_comment_message, message_ko)의 단어 → 리뷰 행 번호 역색인을 디스크에 저장하고,
+AND/OR/NOT, 구문("..."), 접두어(단어*) 검색과 새 리뷰 추가(세그먼트 단위 증분 색인) 함수들
+"""
+
+import json
+import os
+import re
+from itertools import chain
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from src.text_stats import TOKEN_PATTERN
+
+
+# 색인 저장 경로
+# data/review_index/manifest.json + segments/<세그먼트>.npz
+INDEX_PATH = Path(__file__).parent.parent / "data" / "review_index"
+INDEX_VERSION = 1
+
+# 색인할 텍스트 컬럼
+INDEX_FIELDS = ['review_comment_message', 'message_ko']
+
+# 검색 결과를 원래 테이블에 다시 붙일 key 컬럼
+KEY_COLUMNS = ['order_id']
+
+# 번역된 1점 리뷰 (기본 색인 대상)
+TRANSLATED_REVIEWS_PATH = Path(__file__).parent.parent / "data" / "review_ko" / "one_star_reviews_translated.csv"
+
+# 쿼리 연산자
+QUERY_OPERATORS = {'AND', 'OR', 'NOT'}
+_QUERY_TOKEN = re.compile(r'"[^"]*"|\(|\)|[^\s()"]+')
+
+
+# ==============================================
+# 토큰화
+# ==============================================
+
+def analyze(text: str) -> List[str]:
+    """
+    검색어/리뷰 공통 토큰화 (src.text_stats와 같은 단어 경계, 소문자)
+
+    색인은 구문 검색을 위해 불용어/한 글자 단어도 위치와 함께 모두 저장한다.
+    """
+    return [token.lower() for token in TOKEN_PATTERN.findall(text)]
+
+
+def _tokenize_column(texts: pd.Series) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    텍스트 컬럼 → (문서 번호, 단어 위치, 단어 코드, 어휘)
+
+    어휘(vocab)는 정렬되어 있어 접두어 검색을 searchsorted 범위로 처리할 수 있다.
+    """
+    values = texts.fillna('').astype(str).tolist()
+    found = [TOKEN_PATTERN.findall(text) for text in values]
+    lengths = np.fromiter(map(len, found), dtype='int64', count=len(found))
+    total = int(lengths.sum())
+
+    docs = np.repeat(np.arange(len(found), dtype='int64'), lengths)
+    starts = np.repeat(np.cumsum(lengths) - lengths, lengths)
+    positions = np.arange(total, dtype='int64') - starts
+    flat = np.fromiter(chain.from_iterable(found), dtype=object, count=total)
+
+    raw_codes, raw_vocab = pd.factorize(flat)
+    lowered = pd.Index(raw_vocab, dtype=object).str.lower().to_numpy(dtype=object)
+    vocab, lower_codes = np.unique(lowered.astype(str), return_inverse=True) if len(lowered) else (
+        np.array([], dtype=str), np.array([], dtype='int64'))
+    codes = lower_codes[raw_codes] if total else raw_codes.astype('int64')
+    return docs, positions, codes, vocab
+
+
+def _field_postings(texts: pd.Series, row_start: int) -> Dict[str, np.ndarray]:
+    """
+    텍스트 컬럼 하나의 posting 배열
+
+    Returns:
+    --------
+    Dict[str, np.ndarray]
+        vocab: 정렬된 단어, offsets: 단어별 posting 시작 위치 (len(vocab) + 1),
+        docs/positions: (단어, 행 번호, 위치) 순으로 정렬된 posting
+    """
+    docs, positions, codes, vocab = _tokenize_column(texts)
+    order = np.lexsort((positions, docs, codes))
+    offsets = np.zeros(len(vocab) + 1, dtype='int64')
+    np.cumsum(np.bincount(codes, minlength=len(vocab)), out=offsets[1:])
+    return {
+        'vocab': vocab,
+        'offsets': offsets,
+        'docs': docs[order] + row_start,
+        'positions': positions[order].astype('int32'),
+    }
+
+
+def _row_hashes(df: pd.DataFrame, columns: List[str]) -> np.ndarray:
+    """리뷰 행 fingerprint (key 컬럼 + 텍스트) - 이미 색인된 행을 건너뛰는 데 사용"""
+    return pd.util.hash_pandas_object(df[columns].astype(object), index=False).to_numpy(dtype='uint64')
+
+
+# ==============================================
+# 쿼리 파서
+# ==============================================
+
+def parse_query(query: str) -> Tuple:
+    """
+    검색어 → 쿼리 트리
+
+    문법 (연산자는 대문자, 공백은 AND):
+        배송 AND (환불 OR 반품) NOT 취소
+        "받지 못했습니다"        구문 (연속된 단어)
+        배송*                   접두어 (배송이, 배송을, 배송되지 ...)
+
+    Returns:
+    --------
+    Tuple
+        ('term', 단어) / ('prefix', 접두어) / ('phrase', [단어...]) /
+        ('and', 왼쪽, 오른쪽) / ('or', 왼쪽, 오른쪽) / ('not', 하위 쿼리)
+    """
+    tokens = _QUERY_TOKEN.findall(query)
+    pos = 0
+
+    def peek() -> Optional[str]:
+        return tokens[pos] if pos < len(tokens) else None
+
+    def take() -> str:
+        nonlocal pos
+        pos += 1
+        return tokens[pos - 1]
+
+    def parse_or() -> Tuple:
+        node = parse_and()
+        while peek() == 'OR':
+            take()
+            node = ('or', node, parse_and())
+        return node
+
+    def parse_and() -> Tuple:
+        node = parse_not()
+        while peek() is not None and peek() not in (')', 'OR'):
+            if peek() == 'AND':
+                take()
+            node = ('and', node, parse_not())
+        return node
+
+    def parse_not() -> Tuple:
+        if peek() == 'NOT':
+            take()
+            return ('not', parse_not())
+        return parse_atom()
+
+    def parse_atom() -> Tuple:
+        token = peek()
+        if token is None or token == ')' or token in QUERY_OPERATORS:
+            raise ValueError(f"쿼리 문법 오류 (위치 {pos}): {query!r}")
+        take()
+        if token == '(':
+            node = parse_or()
+            if peek() != ')':
+                raise ValueError(f"괄호가 닫히지 않았습니다: {query!r}")
+            take()
+            return node
+        if token.startswith('"'):
+            return ('phrase', analyze(token.strip('"')))
+        if token.endswith('*') and len(token) > 1:
+            words = analyze(token[:-1])
+            if len(words) == 1:
+                return ('prefix', words[0])
+        words = analyze(token)
+        return ('term', words[0]) if len(words) == 1 else ('phrase', words)
+
+    if not tokens:
+        raise ValueError("빈 쿼리입니다")
+    tree = parse_or()
+    if peek() is not None:
+        raise ValueError(f"쿼리 문법 오류 (위치 {pos}): {query!r}")
+    return tree
+
+
+# ==============================================
+# 역색인
+# ==============================================
+
+class ReviewIndex:
+    """
+    리뷰 텍스트 역색인 (디스크 저장, 세그먼트 단위 증분)
+
+    update()로 추가되는 리뷰 묶음마다 세그먼트 파일(.npz) 하나를 쓰고 manifest에 등록한다.
+    행 번호(row_id)는 색인된 순서대로 0부터 매겨지고, docs 테이블에서 key 컬럼(order_id)으로
+    원래 데이터에 다시 붙일 수 있다.
+
+    Parameters:
+    -----------
+    path : Path
+        색인 디렉토리 (None이면 메모리에만 유지)
+    fields : List[str]
+        색인할 텍스트 컬럼
+    key_columns : List[str]
+        docs 테이블에 저장할 key 컬럼
+
+    Example:
+    --------
+    >>> index = ReviewIndex()
+    >>> index.update(pd.read_csv(TRANSLATED_REVIEWS_PATH, encoding='utf-8-sig'))
+    >>> hits = index.search('"받지 못했습니다" AND 환불*', field='message_ko')
+    >>> df.merge(hits, on='order_id')
+    """
+
+    def __init__(self,
+                 path: Optional[Path] = INDEX_PATH,
+                 fields: Optional[List[str]] = None,
+                 key_columns: Optional[List[str]] = None):
+        self.path = Path(path) if path is not None else None
+        manifest = self._read_manifest()
+
+        if manifest is not None:
+            self.fields = manifest['fields']
+            self.key_columns = manifest['key_columns']
+            self.segment_names = manifest['segments']
+        else:
+            self.fields = list(INDEX_FIELDS if fields is None else fields)
+            self.key_columns = list(KEY_COLUMNS if key_columns is None else key_columns)
+            self.segment_names = []
+
+        if fields is not None and list(fields) != self.fields:
+            raise ValueError(f"저장된 색인의 필드 {self.fields}와 다릅니다: {list(fields)}")
+
+        self.segments: List[Dict[str, np.ndarray]] = [self._load_segment(name) for name in self.segment_names]
+        self._docs: Optional[pd.DataFrame] = None
+
+    # ---------- 저장소 ----------
+
+    def _manifest_file(self) -> Path:
+        return self.path / "manifest.json"
+
+    def _segment_file(self, name: str) -> Path:
+        return self.path / "segments" / f"{name}.npz"
+
+    def _read_manifest(self) -> Optional[Dict]:
+        if self.path is None:
+            return None
+        try:
+            manifest = json.loads(self._manifest_file().read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+        return manifest if manifest.get('version') == INDEX_VERSION else None
+
+    def _write_manifest(self) -> None:
+        manifest = {
+            'version': INDEX_VERSION,
+            'fields': self.fields,
+            'key_columns': self.key_columns,
+            'segments': self.segment_names,
+            'n_docs': len(self),
+        }
+        manifest_file = self._manifest_file()
+        manifest_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = manifest_file.with_name(manifest_file.name + '.tmp')
+        tmp_file.write_text(json.dumps(manifest, indent=2), encoding='utf-8')
+        os.replace(tmp_file, manifest_file)
+
+    def _load_segment(self, name: str) -> Dict[str, np.ndarray]:
+        with np.load(self._segment_file(name)) as data:
+            return {key: data[key] for key in data.files}
+
+    def _write_segment(self, name: str, segment: Dict[str, np.ndarray]) -> None:
+        segment_file = self._segment_file(name)
+        segment_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = segment_file.with_name(segment_file.name + '.tmp.npz')
+        np.savez(tmp_file, **segment)
+        os.replace(tmp_file, segment_file)
+
+    # ---------- 색인 ----------
+
+    def __len__(self) -> int:
+        return sum(len(segment['row_hash']) for segment in self.segments)
+
+    def __repr__(self) -> str:
+        return (f"ReviewIndex(docs={len(self):,d}, segments={len(self.segments)}, "
+                f"fields={self.fields}, path={self.path})")
+
+    def _build_segment(self, df: pd.DataFrame, row_start: int, row_hash: np.ndarray) -> Dict[str, np.ndarray]:
+        segment = {'row_hash': row_hash}
+        for col in self.key_columns:
+            segment[f'key.{col}'] = df[col].astype(str).to_numpy(dtype=str)
+        for field in self.fields:
+            texts = df[field] if field in df.columns else pd.Series([None] * len(df), dtype=object)
+            for key, values in _field_postings(texts, row_start).items():
+                segment[f'{field}.{key}'] = values
+        return segment
+
+    def update(self, df: pd.DataFrame, verbose: bool = True) -> int:
+        """
+        새 리뷰 색인 (이미 색인된 행은 건너뜀)
+
+        (key 컬럼 + 텍스트) fingerprint가 이미 있는 행은 무시하므로, 번역 CSV에 리뷰가
+        추가된 뒤 전체 파일을 다시 넘겨도 새 행만 새 세그먼트로 색인된다.
+
+        Parameters:
+        -----------
+        df : pd.DataFrame
+            key 컬럼과 색인 필드(일부 없어도 됨)를 포함한 리뷰 데이터프레임
+        verbose : bool
+            결과 출력 여부
+
+        Returns:
+        --------
+        int
+            새로 색인된 리뷰 수
+        """
+        missing = [col for col in self.key_columns if col not in df.columns]
+        if missing:
+            raise KeyError(f"key 컬럼이 없습니다: {missing}")
+
+        hash_columns = self.key_columns + [f for f in self.fields if f in df.columns]
+        hashes = _row_hashes(df, hash_columns)
+        known = np.concatenate([s['row_hash'] for s in self.segments]) if self.segments else np.array([], dtype='uint64')
+        new_mask = ~np.isin(hashes, known) & ~pd.Series(hashes).duplicated().to_numpy()
+        new_rows = df[new_mask]
+
+        if len(new_rows) == 0:
+            if verbose:
+                print(f"✅ 새 리뷰 없음 (색인 {len(self):,d}건)")
+            return 0
+
+        segment = self._build_segment(new_rows, len(self), hashes[new_mask])
+        name = f"seg-{len(self.segment_names):05d}"
+        if self.path is not None:
+            self._write_segment(name, segment)
+        self.segments.append(segment)
+        self.segment_names.append(name)
+        self._docs = None
+        if self.path is not None:
+            self._write_manifest()
+
+        if verbose:
+            print(f"📇 리뷰 {len(new_rows):,d}건 색인 → {name} (전체 {len(self):,d}건, 세그먼트 {len(self.segments)}개)")
+        return len(new_rows)
+
+    def compact(self) -> None:
+        """세그먼트를 하나로 합침 (행 번호는 그대로 유지)"""
+        if len(self.segments) <= 1:
+            return
+
+        merged = {'row_hash': np.concatenate([s['row_hash'] for s in self.segments])}
+        for col in self.key_columns:
+            merged[f'key.{col}'] = np.concatenate([s[f'key.{col}'] for s in self.segments])
+        for field in self.fields:
+            vocab = np.unique(np.concatenate([s[f'{field}.vocab'] for s in self.segments]))
+            docs, positions, codes = [], [], []
+            for s in self.segments:
+                counts = np.diff(s[f'{field}.offsets'])
+                codes.append(np.repeat(np.searchsorted(vocab, s[f'{field}.vocab']), counts))
+                docs.append(s[f'{field}.docs'])
+                positions.append(s[f'{field}.positions'])
+            docs, positions, codes = np.concatenate(docs), np.concatenate(positions), np.concatenate(codes)
+            order = np.lexsort((positions, docs, codes))
+            offsets = np.zeros(len(vocab) + 1, dtype='int64')
+            np.cumsum(np.bincount(codes, minlength=len(vocab)), out=offsets[1:])
+            merged.update({f'{field}.vocab': vocab, f'{field}.offsets': offsets,
+                           f'{field}.docs': docs[order], f'{field}.positions': positions[order]})
+
+        old_names = self.segment_names
+        name = f"seg-{int(old_names[-1].split('-')[1]) + 1:05d}"
+        if self.path is not None:
+            self._write_segment(name, merged)
+        self.segments, self.segment_names = [merged], [name]
+        if self.path is not None:
+            self._write_manifest()
+            for old in old_names:
+                self._segment_file(old).unlink(missing_ok=True)
+
+    @property
+    def docs(self) -> pd.DataFrame:
+        """행 번호(row_id) → key 컬럼 테이블"""
+        if self._docs is None:
+            data = {'row_id': np.arange(len(self), dtype='int64')}
+            for col in self.key_columns:
+                values = [s[f'key.{col}'] for s in self.segments]
+                data[col] = np.concatenate(values).astype(object) if values else np.array([], dtype=object)
+            self._docs = pd.DataFrame(data)
+        return self._docs
+
+    # ---------- 검색 ----------
+
+    def _term_ranges(self, field: str, lo: str, hi: Optional[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """어휘에서 [lo, hi) 범위 단어들의 posting (hi=None이면 lo 한 단어)"""
+        docs, positions = [], []
+        for s in self.segments:
+            vocab = s[f'{field}.vocab']
+            start = np.searchsorted(vocab, lo, side='left')
+            end = np.searchsorted(vocab, hi, side='left') if hi is not None else (
+                start + 1 if start < len(vocab) and vocab[start] == lo else start)
+            if end <= start:
+                continue
+            offsets = s[f'{field}.offsets']
+            docs.append(s[f'{field}.docs'][offsets[start]:offsets[end]])
+            positions.append(s[f'{field}.positions'][offsets[start]:offsets[end]])
+        if not docs:
+            return np.array([], dtype='int64'), np.array([], dtype='int32')
+        return np.concatenate(docs), np.concatenate(positions)
+
+    def postings(self, term: str, field: str) -> Tuple[np.ndarray, np.ndarray]:
+        """단어 하나의 (행 번호, 위치) posting"""
+        return self._term_ranges(field, term, None)
+
+    def _match_field(self, node: Tuple, field: str) -> np.ndarray:
+        kind = node[0]
+        if kind == 'term':
+            return np.unique(self.postings(node[1], field)[0])
+        if kind == 'prefix':
+            return np.unique(self._term_ranges(field, node[1], node[1] + '\U0010ffff')[0])
+
+        # 구문: 단어 i의 (행, 위치 - i)가 모든 단어에서 겹치는 행
+        words = node[1]
+        if not words:
+            return np.array([], dtype='int64')
+        keys = None
+        for i, word in enumerate(words):
+            docs, positions = self.postings(word, field)
+            valid = positions >= i
+            word_keys = (docs[valid] << 32) | (positions[valid].astype('int64') - i)
+            keys = word_keys if keys is None else np.intersect1d(keys, word_keys, assume_unique=(i > 1))
+            if len(keys) == 0:
+                break
+        return np.unique(keys >> 32)
+
+    def _evaluate(self, node: Tuple, fields: List[str]) -> np.ndarray:
+        kind = node[0]
+        if kind == 'and':
+            return np.intersect1d(self._evaluate(node[1], fields), self._evaluate(node[2], fields),
+                                  assume_unique=True)
+        if kind == 'or':
+            return np.union1d(self._evaluate(node[1], fields), self._evaluate(node[2], fields))
+        if kind == 'not':
+            return np.setdiff1d(np.arange(len(self), dtype='int64'), self._evaluate(node[1], fields),
+                                assume_unique=True)
+        matches = [self._match_field(node, field) for field in fields]
+        return matches[0] if len(matches) == 1 else np.unique(np.concatenate(matches))
+
+    def query(self, query: str, field: Optional[str] = None) -> np.ndarray:
+        """
+        검색 → 일치하는 행 번호 (정렬된 int64 배열)
+
+        Parameters:
+        -----------
+        query : str
+            검색어 (parse_query 문법)
+        field : str
+            검색할 필드 (None이면 모든 필드 중 하나라도 일치)
+        """
+        fields = self.fields if field is None else [field]
+        unknown = [f for f in fields if f not in self.fields]
+        if unknown:
+            raise KeyError(f"색인되지 않은 필드입니다: {unknown}")
+        return self._evaluate(parse_query(query), fields)
+
+    def search(self, query: str, field: Optional[str] = None) -> pd.DataFrame:
+        """
+        검색 → (row_id + key 컬럼) 데이터프레임
+
+        order_id로 원래 데이터(번역 CSV, master_orders 등)에 merge해서 사용한다.
+        """
+        return self.docs.iloc[self.query(query, field)].reset_index(drop=True)
+
+    def count(self, queries: Sequence[str], field: Optional[str] = None) -> pd.Series:
+        """여러 검색어의 일치 리뷰 수 (건수 내림차순)"""
+        counts = {q: len(self.query(q, field)) for q in queries}
+        return pd.Series(counts, name='count').sort_values(ascending=False)
+
+
+def build_review_index(df: Optional[pd.DataFrame] = None,
+                       path: Optional[Path] = INDEX_PATH,
+                       verbose: bool = True) -> ReviewIndex:
+    """
+    리뷰 역색인 열기 + 새 리뷰 증분 색인
+
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        색인할 리뷰 (None이면 번역된 1점 리뷰 CSV)
+    path : Path
+        색인 디렉토리
+    verbose : bool
+        진행 출력 여부
+
+    Returns:
+    --------
+    ReviewIndex
+        최신 상태의 색인
+    """
+    if df is None:
+        df = pd.read_csv(TRANSLATED_REVIEWS_PATH, encoding='utf-8-sig')
+    index = ReviewIndex(path)
+    index.update(df, verbose=verbose)
+    return index
@@ -0,0 +1,206 @@
+"""
+Olist 테이블 스키마 정의 모듈
+테이블별 컬럼 타입을 정의하고 로드 시점에 compact dtype을 적용하는 함수들
+"""
+
+import hashlib
+import importlib.util
+import json
+import pandas as pd
+from typing import Dict, List, Optional
+
+
+# 컬럼 타입 종류
+# - 'id'       : 32자리 hex 키 → 문자열 전용 dtype (pyarrow 있으면 string[pyarrow])
+# - 'category' : 상태/주/결제수단 등 저카디널리티 문자열 → category
+# - 'datetime' : 타임스탬프 문자열 → datetime64 (파싱 실패는 NaT)
+# - 'int'      : 정수 → 가장 작은 정수형 (결측이 있으면 float32)
+# - 'float32'  : 정수값을 담은 실수(상품 치수 등) → float32
+# - 'float64'  : 금액/좌표 → float64 유지
+TABLE_SCHEMAS: Dict[str, Dict[str, str]] = {
+    'customers': {
+        'customer_id': 'id',
+        'customer_unique_id': 'id',
+        'customer_zip_code_prefix': 'int',
+        'customer_city': 'category',
+        'customer_state': 'category',
+    },
+    'geolocation': {
+        'geolocation_zip_code_prefix': 'int',
+        'geolocation_lat': 'float64',
+        'geolocation_lng': 'float64',
+        'geolocation_city': 'category',
+        'geolocation_state': 'category',
+    },
+    'order_items': {
+        'order_id': 'id',
+        'order_item_id': 'int',
+        'product_id': 'id',
+        'seller_id': 'id',
+        'shipping_limit_date': 'datetime',
+        'price': 'float64',
+        'freight_value': 'float64',
+    },
+    'order_payments': {
+        'order_id': 'id',
+        'payment_sequential': 'int',
+        'payment_type': 'category',
+        'payment_installments': 'int',
+        'payment_value': 'float64',
+    },
+    'order_reviews': {
+        'review_id': 'id',
+        'order_id': 'id',
+        'review_score': 'int',
+        'review_creation_date': 'datetime',
+        'review_answer_timestamp': 'datetime',
+    },
+    'orders': {
+        'order_id': 'id',
+        'customer_id': 'id',
+        'order_status': 'category',
+        'order_purchase_timestamp': 'datetime',
+        'order_approved_at': 'datetime',
+        'order_delivered_carrier_date': 'datetime',
+        'order_delivered_customer_date': 'datetime',
+        'order_estimated_delivery_date': 'datetime',
+    },
+    'products': {
+        'product_id': 'id',
+        'product_category_name': 'category',
+        'product_name_lenght': 'float32',
+        'product_description_lenght': 'float32',
+        'product_photos_qty': 'float32',
+        'product_weight_g': 'float32',
+        'product_length_cm': 'float32',
+        'product_height_cm': 'float32',
+        'product_width_cm': 'float32',
+    },
+    'sellers': {
+        'seller_id': 'id',
+        'seller_zip_code_prefix': 'int',
+        'seller_city': 'category',
+        'seller_state': 'category',
+    },
+    'category_translation': {
+        'product_category_name': 'category',
+        'product_category_name_english': 'category',
+    },
+}
+
+
+def id_dtype() -> str:
+    """ID 컬럼에 쓸 문자열 dtype (pyarrow 없으면 object)"""
+    return 'string[pyarrow]' if importlib.util.find_spec('pyarrow') is not None else 'object'
+
+
+def schema_signature(table_name: str) -> str:
+    """
+    스키마 정의 해시 - 캐시 무효화 키로 사용
+
+    스키마가 없는 테이블은 'raw'를 반환
+    """
+    schema = TABLE_SCHEMAS.get(table_name)
+    if schema is None:
+        return 'raw'
+    payload = json.dumps({'columns': schema, 'id_dtype': id_dtype()}, sort_keys=True)
+    return hashlib.md5(payload.encode('utf-8')).hexdigest()
+
+
+def read_csv_dtypes(table_name: str, columns: Optional[List[str]] = None) -> Dict[str, str]:
+    """
+    read_csv의 dtype 인자로 바로 넘길 수 있는 매핑 ('id', 'category'만 해당)
+
+    Parameters:
+    -----------
+    table_name : str
+        테이블명
+    columns : List[str]
+        실제로 읽을 컬럼 (None이면 전체)
+
+    Returns:
+    --------
+    Dict[str, str]
+        컬럼명 → dtype
+    """
+    schema = TABLE_SCHEMAS.get(table_name, {})
+    dtypes = {}
+    for col, kind in schema.items():
+        if columns is not None and col not in columns:
+            continue
+        if kind == 'id':
+            dtypes[col] = id_dtype()
+        elif kind == 'category':
+            dtypes[col] = 'category'
+    return dtypes
+
+
+def apply_schema(df: pd.DataFrame, table_name: str) -> pd.DataFrame:
+    """
+    테이블 스키마를 DataFrame에 적용 (컬럼 단위로 교체, 프레임 복사 없음)
+
+    스키마에 없는 컬럼은 그대로 두고, 스키마 컬럼 중 df에 없는 것은 건너뛴다.
+
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        CSV에서 읽은 데이터프레임
+    table_name : str
+        테이블명
+
+    Returns:
+    --------
+    pd.DataFrame
+        dtype이 적용된 데이터프레임 (입력과 같은 객체)
+    """
+    schema = TABLE_SCHEMAS.get(table_name, {})
+
+    for col, kind in schema.items():
+        if col not in df.columns:
+            continue
+        series = df[col]
+
+        if kind == 'id':
+            if series.dtype != id_dtype():
+                df[col] = series.astype(id_dtype())
+        elif kind == 'category':
+            if not isinstance(series.dtype, pd.CategoricalDtype):
+                df[col] = series.astype('category')
+        elif kind == 'datetime':
+            if not pd.api.types.is_datetime64_any_dtype(series):
+                df[col] = pd.to_datetime(series, format='ISO8601', errors='coerce')
+        elif kind == 'int':
+            if series.isna().any():
+                df[col] = pd.to_numeric(series, errors='coerce', downcast='float')
+            else:
+                df[col] = pd.to_numeric(series, errors='coerce', downcast='integer')
+        elif kind == 'float32':
+            df[col] = pd.to_numeric(series, errors='coerce').astype('float32')
+        elif kind == 'float64':
+            df[col] = pd.to_numeric(series, errors='coerce').astype('float64')
+        else:
+            raise ValueError(f"지원하지 않는 스키마 타입: {kind} ({table_name}.{col})")
+
+    return df
+
+
+def untyped_memory_usage(df: pd.DataFrame) -> int:
+    """
+    스키마 없이 로드했을 때의 메모리 사용량(bytes) 추정
+
+    category/문자열 컬럼은 Python object 문자열로, datetime 컬럼은
+    'YYYY-mm-dd HH:MM:SS' 문자열로, 수치 컬럼은 64bit로 환산한다.
+    """
+    total = 0
+    for col in df.columns:
+        series = df[col]
+        if pd.api.types.is_datetime64_any_dtype(series):
+            as_text = series.dt.strftime('%Y-%m-%d %H:%M:%S').astype(object)
+            total += as_text.memory_usage(deep=True, index=False)
+        elif isinstance(series.dtype, pd.CategoricalDtype) or pd.api.types.is_string_dtype(series):
+            total += series.astype(object).memory_usage(deep=True, index=False)
+        elif pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+            total += 8 * len(series)
+        else:
+            total += series.memory_usage(deep=True, index=False)
+    return int(total)
@@ -0,0 +1,319 @@
+"""
+판매자 지표 집계 모듈
+order_items + orders + reviews를 정수 key로 한 번 인코딩한 뒤
+판매자 지표(master_sellers)와 최근 30/90일 이동 지표를 bincount로 계산하는 함수들
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Mapping, Optional, Tuple
+
+from src.master import MASTER_SELLERS_COLUMNS, run_steps
+
+
+NS_PER_DAY = 86_400 * 10**9
+
+# 이동 지표 window (일)
+ROLLING_WINDOWS = [30, 90]
+
+
+def encode_seller_orders(order_items: pd.DataFrame,
+                         orders: pd.DataFrame,
+                         reviews: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """
+    판매자 집계용 정수 인코딩
+
+    세 테이블의 order_id를 한 번에 정수 코드로 바꾸고 주문 단위 값(구매일/배송/리뷰)을
+    코드 순서 배열로 만든 뒤, (주문, 판매자) 쌍을 한 번만 만든다. 노트북의 left join과
+    같이 정제된 주문에 없는 상품 행도 남긴다 (구매일/배송 값은 결측, 리뷰는 그대로 연결).
+
+    Parameters:
+    -----------
+    order_items : pd.DataFrame
+        order_items 테이블
+    orders : pd.DataFrame
+        정제된 주문 (order_purchase_timestamp, total_delivery_time, is_delayed 필요)
+    reviews : pd.DataFrame
+        주문당 1건으로 정리된 리뷰 (order_id, review_score)
+
+    Returns:
+    --------
+    Dict[str, np.ndarray]
+        sellers (판매자 id Index), purchase_dtype (구매일 dtype),
+        item_seller/price/freight/item_day/item_dated (상품 행),
+        pair_seller/pair_day/pair_dated/review_score/delivery_days/is_delayed/purchase_ns
+        ((주문, 판매자) 행). *_dated가 False인 행은 구매일이 없어 *_day 값이 의미 없음
+    """
+    n_orders, n_items = len(orders), len(order_items)
+    order_codes, order_uniques = pd.factorize(pd.concat(
+        [orders['order_id'], order_items['order_id'], reviews['order_id']], ignore_index=True
+    ))
+    n_codes = len(order_uniques)
+    orders_code = order_codes[:n_orders]
+    item_order = order_codes[n_orders:n_orders + n_items].astype('int64')
+    review_code = order_codes[n_orders + n_items:]
+
+    # 주문 단위 값 (order_id 코드 순서, 정제된 주문에 없으면 결측)
+    purchase_ns = np.full(n_codes, np.iinfo('int64').min, dtype='int64')
+    purchase_ns[orders_code] = orders['order_purchase_timestamp'].to_numpy(dtype='datetime64[ns]').view('int64')
+    dated = np.zeros(n_codes, dtype=bool)
+    dated[orders_code] = orders['order_purchase_timestamp'].notna().to_numpy()
+    delivery_days = np.full(n_codes, np.nan)
+    delivery_days[orders_code] = orders['total_delivery_time'].to_numpy(dtype='float64', na_value=np.nan)
+    is_delayed = np.zeros(n_codes)
+    is_delayed[orders_code] = orders['is_delayed'].to_numpy(dtype='float64', na_value=0.0)
+    review_score = np.full(n_codes, np.nan)
+    # 주문당 리뷰가 여러 건이면 첫 번째 값 사용 (역순으로 써서 앞쪽 값이 남게)
+    review_score[review_code[::-1]] = reviews['review_score'].to_numpy(dtype='float64', na_value=np.nan)[::-1]
+
+    seller_codes, sellers = pd.factorize(order_items['seller_id'])
+    n_sellers = max(len(sellers), 1)
+
+    # (주문, 판매자) 쌍
+    pair_index = pd.unique(item_order * n_sellers + seller_codes)
+    pair_order = pair_index // n_sellers
+    pair_seller = pair_index % n_sellers
+
+    return {
+        'sellers': sellers,
+        'purchase_dtype': orders['order_purchase_timestamp'].dtype,
+        'item_seller': seller_codes,
+        'item_day': purchase_ns[item_order] // NS_PER_DAY,
+        'item_dated': dated[item_order],
+        'price': order_items['price'].to_numpy(dtype='float64'),
+        'freight': order_items['freight_value'].to_numpy(dtype='float64'),
+        'pair_seller': pair_seller,
+        'purchase_ns': purchase_ns[pair_order],
+        'pair_day': purchase_ns[pair_order] // NS_PER_DAY,
+        'pair_dated': dated[pair_order],
+        'review_score': review_score[pair_order],
+        'delivery_days': delivery_days[pair_order],
+        'is_delayed': is_delayed[pair_order],
+    }
+
+
+def _metric_inputs(encoded: Dict[str, np.ndarray]) -> Dict[str, Tuple[str, Optional[np.ndarray]]]:
+    """
+    합산 지표별 (단위, 가중치)
+
+    단위 'pair'는 (주문, 판매자) 행, 'item'은 상품 행. 가중치 None은 개수
+    """
+    score = encoded['review_score']
+    has_score = ~np.isnan(score)
+    delivery = encoded['delivery_days']
+    has_delivery = ~np.isnan(delivery)
+    return {
+        'orders': ('pair', None),
+        'items': ('item', None),
+        'revenue': ('item', encoded['price']),
+        'freight': ('item', encoded['freight']),
+        'review_sum': ('pair', np.where(has_score, score, 0.0)),
+        'review_count': ('pair', has_score.astype('float64')),
+        'five_star': ('pair', (score == 5).astype('float64')),
+        'one_star': ('pair', (score == 1).astype('float64')),
+        'delivery_sum': ('pair', np.where(has_delivery, delivery, 0.0)),
+        'delivery_count': ('pair', has_delivery.astype('float64')),
+        'delay': ('pair', encoded['is_delayed']),
+    }
+
+
+def _derive_rates(sums: Dict[str, np.ndarray], suffix: str = '') -> Dict[str, np.ndarray]:
+    """합산 지표 → master_sellers 형식 지표"""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        review_count = np.where(sums['review_count'] > 0, sums['review_count'], np.nan)
+        delivery_count = np.where(sums['delivery_count'] > 0, sums['delivery_count'], np.nan)
+        orders = np.where(sums['orders'] > 0, sums['orders'], np.nan)
+        return {
+            f'total_orders{suffix}': sums['orders'].astype('int64'),
+            f'total_items{suffix}': sums['items'].astype('int64'),
+            f'total_revenue{suffix}': sums['revenue'],
+            f'total_freight{suffix}': sums['freight'],
+            f'avg_review_score{suffix}': sums['review_sum'] / review_count,
+            f'review_count{suffix}': sums['review_count'].astype('int64'),
+            f'five_star_count{suffix}': sums['five_star'].astype('int64'),
+            f'one_star_count{suffix}': sums['one_star'].astype('int64'),
+            f'avg_delivery_days{suffix}': sums['delivery_sum'] / delivery_count,
+            f'delay_count{suffix}': sums['delay'],
+            f'total_gmv{suffix}': sums['revenue'] + sums['freight'],
+            f'five_star_rate{suffix}': np.round(sums['five_star'] / review_count * 100, 2),
+            f'one_star_rate{suffix}': np.round(sums['one_star'] / review_count * 100, 2),
+            f'delay_rate{suffix}': np.round(sums['delay'] / orders * 100, 2),
+        }
+
+
+def aggregate_seller_metrics(encoded: Dict[str, np.ndarray],
+                             sellers: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+    """
+    판매자 지표를 한 번의 그룹 집계로 계산 (master_sellers와 같은 컬럼)
+
+    모든 지표가 같은 판매자 정수 코드를 쓰므로 groupby/merge 없이 지표마다
+    np.bincount 한 번으로 끝난다.
+
+    Parameters:
+    -----------
+    encoded : Dict[str, np.ndarray]
+        encode_seller_orders 결과
+    sellers : pd.DataFrame
+        seller_city/seller_state를 붙일 sellers 테이블 (None이면 결측)
+
+    Returns:
+    --------
+    pd.DataFrame
+        판매자별 지표 (MASTER_SELLERS_COLUMNS 순서)
+    """
+    n_sellers = len(encoded['sellers'])
+    keys = {'pair': encoded['pair_seller'], 'item': encoded['item_seller']}
+
+    sums = {
+        name: np.bincount(keys[unit], weights=weights, minlength=n_sellers).astype('float64')
+        for name, (unit, weights) in _metric_inputs(encoded).items()
+    }
+
+    # 첫/마지막 주문일은 구매일이 있는 쌍만 (없으면 NaT)
+    dated = encoded['pair_dated']
+    first = np.full(n_sellers, np.iinfo('int64').max, dtype='int64')
+    last = np.full(n_sellers, np.iinfo('int64').min, dtype='int64')
+    np.minimum.at(first, encoded['pair_seller'][dated], encoded['purchase_ns'][dated])
+    np.maximum.at(last, encoded['pair_seller'][dated], encoded['purchase_ns'][dated])
+    has_date = np.bincount(encoded['pair_seller'][dated], minlength=n_sellers) > 0
+
+    result = pd.DataFrame({'seller_id': encoded['sellers'], **_derive_rates(sums)})
+    # 구매일 컬럼과 같은 단위로 (NaT가 섞이면 단위가 다를 때 값 비교가 어긋남)
+    unit = np.datetime_data(encoded['purchase_dtype'])[0] if encoded['purchase_dtype'].kind == 'M' else 'ns'
+    for col, values in [('first_order_date', first), ('last_order_date', last)]:
+        result[col] = pd.to_datetime(np.where(has_date, values, np.iinfo('int64').min), unit='ns').as_unit(unit)
+
+    if sellers is not None:
+        result = result.merge(sellers[['seller_id', 'seller_city', 'seller_state']],
+                              on='seller_id', how='left')
+    else:
+        result['seller_city'] = np.nan
+        result['seller_state'] = np.nan
+
+    return result[MASTER_SELLERS_COLUMNS]
+
+
+def _dated_rows(encoded: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """구매일이 있는 상품/쌍 행만 남긴 인코딩"""
+    item_keys = ['item_seller', 'item_day', 'item_dated', 'price', 'freight']
+    result = dict(encoded)
+    for key, value in encoded.items():
+        if key in ('sellers', 'purchase_dtype'):
+            continue
+        result[key] = value[encoded['item_dated']] if key in item_keys else value[encoded['pair_dated']]
+    return result
+
+
+def rolling_seller_metrics(encoded: Dict[str, np.ndarray],
+                           windows: Optional[List[int]] = None) -> pd.DataFrame:
+    """
+    판매자 × 월별 최근 N일 이동 지표
+
+    각 월의 마지막 날을 기준으로 (월말 - N일, 월말] 구간의 지표를 계산한다.
+    행을 (판매자, 일) key로 한 번 정렬해 두고 합산 지표마다 누적합을 구하면,
+    (판매자, 월, window) 값은 월말 / 월말 - N일 key의 searchsorted 위치에서 누적합의 차로 나온다.
+    판매자 × 일 격자를 만들지 않으므로 메모리는 행 수 + 주문이 있는 (판매자, 월) 수에 비례한다.
+
+    Parameters:
+    -----------
+    encoded : Dict[str, np.ndarray]
+        encode_seller_orders 결과
+    windows : List[int]
+        window 길이(일) 목록 (None이면 ROLLING_WINDOWS)
+
+    Returns:
+    --------
+    pd.DataFrame
+        seller_id, month (YYYY-MM) + window별 지표 (컬럼 접미사 _30d, _90d ...).
+        가장 긴 window에 주문이 없는 (판매자, 월)은 제외
+    """
+    windows = ROLLING_WINDOWS if windows is None else windows
+    n_sellers = len(encoded['sellers'])
+    # 구매일이 없는 행(정제된 주문에 없는 주문)은 어느 window에도 속하지 않음
+    encoded = _dated_rows(encoded)
+    if n_sellers == 0 or len(encoded['pair_day']) == 0:
+        return pd.DataFrame(columns=['seller_id', 'month'])
+
+    first_day = int(encoded['pair_day'].min())
+    n_days = int(encoded['pair_day'].max()) - first_day + 1
+
+    # 월말 일 인덱스
+    months = pd.period_range(pd.Timestamp(first_day * NS_PER_DAY),
+                             pd.Timestamp((first_day + n_days - 1) * NS_PER_DAY), freq='M')
+    month_end = (
+        months.to_timestamp(how='end').normalize().to_numpy(dtype='datetime64[ns]').view('int64')
+        // NS_PER_DAY - first_day
+    )
+
+    # (판매자, 일) key로 정렬 - 같은 판매자의 행이 일 순서로 연속
+    keys = {
+        'pair': encoded['pair_seller'].astype('int64') * n_days + (encoded['pair_day'] - first_day),
+        'item': encoded['item_seller'].astype('int64') * n_days + (encoded['item_day'] - first_day),
+    }
+    order = {unit: np.argsort(key, kind='stable') for unit, key in keys.items()}
+    sorted_keys = {unit: keys[unit][order[unit]] for unit in keys}
+
+    def positions(unit: str, day: np.ndarray, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """(판매자, 월) 행마다 key <= 판매자 * n_days + day 인 정렬 행 수 (day는 그 판매자 범위로 자름)"""
+        day = np.clip(day, -1, n_days - 1)
+        query = (np.arange(n_sellers, dtype='int64')[:, None] * n_days + day[None, :]).ravel()
+        if rows is not None:
+            query = query[rows]
+        return np.searchsorted(sorted_keys[unit], query, side='right')
+
+    # 가장 긴 window에 주문이 있는 (판매자, 월)만 계산
+    longest = max(windows)
+    rows = np.flatnonzero(positions('pair', month_end) > positions('pair', month_end - longest))
+    at_end = {unit: positions(unit, month_end, rows) for unit in keys}
+    at_before = {w: {unit: positions(unit, month_end - w, rows) for unit in keys} for w in windows}
+
+    window_sums: Dict[int, Dict[str, np.ndarray]] = {w: {} for w in windows}
+    for name, (unit, weights) in _metric_inputs(encoded).items():
+        sorted_weights = np.ones(len(order[unit])) if weights is None else weights[order[unit]]
+        cumsum = np.concatenate([[0.0], np.cumsum(sorted_weights)])
+        for w in windows:
+            window_sums[w][name] = cumsum[at_end[unit]] - cumsum[at_before[w][unit]]
+
+    result = pd.DataFrame({
+        'seller_id': encoded['sellers'].take(rows // len(months)),
+        'month': months.strftime('%Y-%m').take(rows % len(months)),
+    })
+    for w in windows:
+        derived = _derive_rates(window_sums[w], suffix=f'_{w}d')
+        result = result.assign(**derived)
+    return result
+
+
+def compute_seller_metrics(tables: Mapping[str, pd.DataFrame],
+                           start: Optional[str] = None,
+                           windows: Optional[List[int]] = None) -> Dict[str, pd.DataFrame]:
+    """
+    기본 테이블에서 판매자 지표와 이동 지표를 한 번에 계산
+
+    Parameters:
+    -----------
+    tables : Mapping[str, pd.DataFrame]
+        로드된 테이블 (orders, order_items, order_reviews, sellers)
+    start : str
+        이 날짜 이후 구매 주문만 사용 (예: master.BEGIN2017)
+    windows : List[int]
+        이동 지표 window 길이(일)
+
+    Returns:
+    --------
+    Dict[str, pd.DataFrame]
+        {'sellers': master_sellers 형식, 'rolling': 판매자 × 월 이동 지표}
+    """
+    steps = run_steps(tables, ['clean_orders', 'clean_reviews'])
+    orders = steps['clean_orders']
+    order_items = tables['order_items']
+    if start is not None:
+        # 노트북 Step 2.5와 같이 기간 필터는 구매일이 있는 주문만 남김
+        orders = orders[orders['order_purchase_timestamp'] >= pd.Timestamp(start)]
+        order_items = order_items[order_items['order_id'].isin(orders['order_id'])]
+
+    encoded = encode_seller_orders(order_items, orders, steps['clean_reviews'])
+    return {
+        'sellers': aggregate_seller_metrics(encoded, tables.get('sellers')),
+        'rolling': rolling_seller_metrics(encoded, windows),
+    }
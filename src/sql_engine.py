@@ -0,0 +1,464 @@
+"""
+SQL 분석 엔진 모듈
+DuckDB(선택 설치)로 Olist 원본 CSV 또는 Parquet 캐시 위에 뷰를 만들고 SQL 결과를 DataFrame으로 반환하는 함수들
+
+- 테이블을 메모리에 올리지 않고 파일을 직접 스캔 (필요한 컬럼만 읽고, WHERE 조건은 스캔 단계에서 적용)
+- memory_limit을 넘는 집계/조인은 temp_directory로 내려 쓰면서 처리 (out-of-core)
+- master_orders / master_sellers / 배송·리뷰 집계를 SAVED_QUERIES로 제공
+
+사용 예:
+    from src.sql_engine import query, run_saved_query
+
+    query("SELECT customer_state, count(*) AS n FROM customers GROUP BY 1 ORDER BY n DESC")
+    run_saved_query('delivery_by_state', start='2017-01-01')
+"""
+
+import importlib.util
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from src.data_loader import (CACHE_DIR_NAME, DATA_PATH, TABLE_FILES,
+                             _cache_files, _is_cache_valid)
+from src.schema import TABLE_SCHEMAS, schema_signature
+
+
+# 스키마 타입 → DuckDB 타입 (CSV 직접 스캔 시)
+DUCKDB_TYPES = {
+    'id': 'VARCHAR',
+    'category': 'VARCHAR',
+    'datetime': 'VARCHAR',      # 뷰에서 TRY_CAST (파싱 실패는 NULL = pandas의 NaT)
+    'int': 'BIGINT',
+    'float32': 'FLOAT',
+    'float64': 'DOUBLE',
+}
+
+MICROS_PER_DAY = 86_400 * 10**6
+
+# 파일 내 행 순서(_row)가 필요한 테이블 - <테이블명>_rows 뷰를 추가로 만든다
+# (pandas의 stable 정렬 후 drop_duplicates처럼 동점이면 파일에서 먼저 나온 행을 고르기 위함)
+ROW_ORDER_TABLES = ['order_reviews', 'order_payments']
+
+
+def _duckdb_available() -> bool:
+    """duckdb 설치 여부 - import 없이 확인"""
+    return importlib.util.find_spec('duckdb') is not None
+
+
+def _import_duckdb():
+    if not _duckdb_available():
+        raise ImportError("SQL 엔진에는 duckdb가 필요합니다: pip install duckdb")
+    import duckdb
+    return duckdb
+
+
+def _sql_literal(value: str) -> str:
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+# ==============================================
+# 저장된 쿼리
+# ==============================================
+# {purchase_filter}는 start/end를 줬을 때만 구매일 조건으로 채워진다
+# (조건을 SQL에 직접 넣어야 스캔 단계로 내려간다)
+# {matched_filter}도 그때만 채워져 정제된 주문과 짝이 없는 행을 뺀다
+# (master_sellers는 노트북처럼 left join이지만, 기간을 주면 구매일 없는 행은 제외)
+
+def _days(start: str, end: str) -> str:
+    """(end - start) 일수 - calculate_time_diffs의 'days'와 같이 내림"""
+    return f"CAST(floor((epoch_us({end}) - epoch_us({start})) / {MICROS_PER_DAY}) AS BIGINT)"
+
+
+_ORDER_COLUMNS = list(TABLE_SCHEMAS['orders'])
+
+# master.py _clean_orders / _clean_reviews / _order_items_agg / _payments_agg 와 같은 로직
+_BASE_CTES = f"""
+delivered_raw AS (
+    SELECT
+        o.*,
+        {_days('order_purchase_timestamp', 'order_delivered_customer_date')} AS total_delivery_time,
+        {_days('order_approved_at', 'order_delivered_carrier_date')} AS seller_prep_time,
+        {_days('order_delivered_carrier_date', 'order_delivered_customer_date')} AS pure_shipping_time,
+        {_days('order_delivered_customer_date', 'order_estimated_delivery_date')} AS delivery_accuracy,
+        {_days('order_purchase_timestamp', 'order_estimated_delivery_date')} AS estimated_wait_time,
+        CAST(order_delivered_customer_date > order_estimated_delivery_date AS BIGINT) AS is_delayed
+    FROM orders o
+    WHERE order_status = 'delivered'
+      AND {' AND '.join(f'{col} IS NOT NULL' for col in _ORDER_COLUMNS)}
+      {{purchase_filter}}
+),
+clean_orders AS (
+    SELECT
+        *,
+        hour(order_purchase_timestamp) AS purchase_hour,
+        dayname(order_purchase_timestamp) AS purchase_dayofweek,
+        month(order_purchase_timestamp) AS purchase_month,
+        isodow(order_purchase_timestamp) >= 6 AS is_weekend,
+        CASE
+            WHEN total_delivery_time <= 6 THEN 'Very Fast'
+            WHEN total_delivery_time <= 15 THEN 'Normal'
+            WHEN total_delivery_time <= 30 THEN 'Slow'
+            ELSE 'Very Slow'
+        END AS delivery_speed_type
+    FROM delivered_raw
+    WHERE total_delivery_time >= 0 AND seller_prep_time >= 0 AND pure_shipping_time >= 0
+),
+clean_reviews AS (
+    SELECT order_id, review_score, review_comment_message
+    FROM order_reviews_rows
+    QUALIFY row_number() OVER (
+        PARTITION BY order_id ORDER BY review_creation_date DESC NULLS LAST, _row
+    ) = 1
+),
+order_items_agg AS (
+    SELECT
+        order_id,
+        count(order_item_id) AS item_count,
+        count(DISTINCT seller_id) AS seller_count,
+        sum(price) AS total_price,
+        sum(freight_value) AS total_freight
+    FROM order_items
+    GROUP BY order_id
+),
+payments_agg AS (
+    SELECT
+        order_id,
+        count(payment_sequential) AS payment_count,
+        sum(payment_value) AS payment_total,
+        max(payment_installments) AS max_installments,
+        first(payment_type ORDER BY payment_value DESC NULLS LAST, _row) AS main_payment_type
+    FROM order_payments_rows
+    GROUP BY order_id
+),
+master_orders AS (
+    SELECT
+        c.*,
+        i.item_count, i.seller_count, i.total_price, i.total_freight,
+        p.payment_count, p.payment_total, p.max_installments, p.main_payment_type,
+        r.review_score, r.review_comment_message,
+        cu.customer_unique_id, cu.customer_city, cu.customer_state
+    FROM clean_orders c
+    LEFT JOIN order_items_agg i USING (order_id)
+    LEFT JOIN payments_agg p USING (order_id)
+    LEFT JOIN clean_reviews r USING (order_id)
+    LEFT JOIN customers cu USING (customer_id)
+)"""
+
+SAVED_QUERIES: Dict[str, Dict[str, str]] = {
+    'master_orders': {
+        'description': "주문 단위 마스터 테이블 (src.master.load_master_orders와 같은 컬럼)",
+        'sql': f"""
+WITH {_BASE_CTES}
+SELECT * FROM master_orders
+ORDER BY order_purchase_timestamp, order_id""",
+    },
+    'master_sellers': {
+        'description': "판매자 단위 집계 (src.master.load_master_sellers와 같은 컬럼)",
+        'sql': f"""
+WITH {_BASE_CTES},
+order_seller AS (
+    SELECT
+        i.order_id, i.seller_id,
+        count(i.order_item_id) AS items_in_order,
+        sum(i.price) AS revenue_in_order,
+        sum(i.freight_value) AS freight_in_order,
+        any_value(c.order_purchase_timestamp) AS order_purchase_timestamp,
+        any_value(c.total_delivery_time) AS total_delivery_time,
+        any_value(c.is_delayed) AS is_delayed
+    FROM order_items i
+    LEFT JOIN clean_orders c USING (order_id)
+    {{matched_filter}}
+    GROUP BY i.order_id, i.seller_id
+),
+seller_agg AS (
+    SELECT
+        os.seller_id,
+        count(*) AS total_orders,
+        sum(os.items_in_order) AS total_items,
+        sum(os.revenue_in_order) AS total_revenue,
+        sum(os.freight_in_order) AS total_freight,
+        avg(r.review_score) AS avg_review_score,
+        count(r.review_score) AS review_count,
+        count(*) FILTER (WHERE r.review_score = 5) AS five_star_count,
+        count(*) FILTER (WHERE r.review_score = 1) AS one_star_count,
+        avg(os.total_delivery_time) AS avg_delivery_days,
+        coalesce(sum(os.is_delayed), 0) AS delay_count,
+        min(os.order_purchase_timestamp) AS first_order_date,
+        max(os.order_purchase_timestamp) AS last_order_date
+    FROM order_seller os
+    LEFT JOIN clean_reviews r USING (order_id)
+    GROUP BY os.seller_id
+)
+SELECT
+    a.*,
+    a.total_revenue + a.total_freight AS total_gmv,
+    round(a.five_star_count / a.review_count * 100, 2) AS five_star_rate,
+    round(a.one_star_count / a.review_count * 100, 2) AS one_star_rate,
+    round(a.delay_count / a.total_orders * 100, 2) AS delay_rate,
+    s.seller_city, s.seller_state
+FROM seller_agg a
+LEFT JOIN sellers s USING (seller_id)
+ORDER BY a.seller_id""",
+    },
+    'delivery_by_state': {
+        'description': "고객 주(state)별 주문 수, 평균 배송일, 지연율(%), 평균 리뷰 점수",
+        'sql': f"""
+WITH {_BASE_CTES}
+SELECT
+    customer_state,
+    count(*) AS orders,
+    avg(total_delivery_time) AS avg_delivery_days,
+    avg(delivery_accuracy) AS avg_delivery_accuracy,
+    round(avg(is_delayed) * 100, 2) AS delay_rate,
+    avg(review_score) AS avg_review_score
+FROM master_orders
+GROUP BY customer_state
+ORDER BY orders DESC, customer_state""",
+    },
+    'delivery_by_month': {
+        'description': "구매월별 주문 수, 매출, 평균 배송일, 지연율(%), 평균 리뷰 점수",
+        'sql': f"""
+WITH {_BASE_CTES}
+SELECT
+    strftime(order_purchase_timestamp, '%Y-%m') AS order_month,
+    count(*) AS orders,
+    sum(total_price) AS revenue,
+    avg(total_delivery_time) AS avg_delivery_days,
+    round(avg(is_delayed) * 100, 2) AS delay_rate,
+    avg(review_score) AS avg_review_score
+FROM master_orders
+GROUP BY order_month
+ORDER BY order_month""",
+    },
+    'review_by_delay': {
+        'description': "지연 여부별 평균 리뷰 점수와 1점 비율(%)",
+        'sql': f"""
+WITH {_BASE_CTES}
+SELECT
+    is_delayed,
+    count(*) AS orders,
+    avg(review_score) AS avg_review_score,
+    count(review_score) AS review_count,
+    round(count(*) FILTER (WHERE review_score = 1) / count(review_score) * 100, 2) AS one_star_rate
+FROM master_orders
+GROUP BY is_delayed
+ORDER BY is_delayed""",
+    },
+}
+
+
+def saved_query_sql(name: str, start: Optional[str] = None, end: Optional[str] = None) -> str:
+    """
+    저장된 쿼리의 SQL 텍스트 (구매일 [start, end) 조건 포함)
+
+    값은 $start / $end 파라미터로 넘긴다 (run_saved_query 참고)
+    """
+    if name not in SAVED_QUERIES:
+        raise KeyError(f"저장된 쿼리가 없습니다: {name} (가능: {', '.join(SAVED_QUERIES)})")
+    conditions = []
+    if start is not None:
+        conditions.append("AND order_purchase_timestamp >= CAST($start AS TIMESTAMP)")
+    if end is not None:
+        conditions.append("AND order_purchase_timestamp < CAST($end AS TIMESTAMP)")
+    matched_filter = "WHERE c.order_id IS NOT NULL" if conditions else ""
+    return (
+        SAVED_QUERIES[name]['sql']
+        .replace('{purchase_filter}', '\n      '.join(conditions))
+        .replace('{matched_filter}', matched_filter)
+    )
+
+
+# ==============================================
+# 엔진
+# ==============================================
+
+class SQLEngine:
+    """
+    Olist 테이블을 뷰로 등록한 DuckDB 연결
+
+    테이블마다 유효한 Parquet 캐시(data_loader.read_table이 만든 것)가 있으면 그 파일을,
+    없으면 원본 CSV를 스캔하는 뷰를 만든다. 어느 쪽이든 쿼리에 필요한 컬럼만 읽고,
+    Parquet은 WHERE 조건으로 row group을 건너뛴다.
+
+    Parameters:
+    -----------
+    data_path : Path
+        CSV 파일이 있는 경로
+    use_cache : bool
+        Parquet 캐시가 있으면 사용 (False면 항상 CSV)
+    database : str
+        DuckDB 데이터베이스 파일 (기본 ':memory:' - 뷰만 만들므로 데이터는 복사하지 않음)
+    memory_limit : str
+        DuckDB 메모리 한도 (예: '2GB') - 넘으면 temp_directory로 내려 쓰며 처리
+    temp_directory : Path
+        spill 경로 (None이면 DuckDB 기본값)
+    threads : int
+        DuckDB 스레드 수 (None이면 CPU 수)
+    """
+
+    def __init__(self,
+                 data_path: Path = DATA_PATH,
+                 use_cache: bool = True,
+                 database: str = ':memory:',
+                 memory_limit: Optional[str] = None,
+                 temp_directory: Optional[Path] = None,
+                 threads: Optional[int] = None):
+        duckdb = _import_duckdb()
+        self.data_path = Path(data_path)
+        self.use_cache = use_cache
+        self.con = duckdb.connect(database)
+        if memory_limit is not None:
+            self.con.execute(f"SET memory_limit = {_sql_literal(memory_limit)}")
+        if temp_directory is not None:
+            self.con.execute(f"SET temp_directory = {_sql_literal(Path(temp_directory))}")
+        if threads is not None:
+            self.con.execute(f"SET threads = {int(threads)}")
+        self.sources: Dict[str, str] = {}
+        self.refresh()
+
+    def _table_scan(self, table_name: str, row_numbers: bool = False) -> Optional[str]:
+        """
+        테이블 스캔 SQL (row_numbers=True면 파일 내 행 순서 _row 컬럼 추가)
+        """
+        file_path = self.data_path / TABLE_FILES[table_name]
+        if not file_path.exists():
+            return None
+
+        if self.use_cache:
+            cache_dir = self.data_path / CACHE_DIR_NAME
+            parquet_file, meta_file = _cache_files(table_name, cache_dir)
+            if _is_cache_valid(file_path, parquet_file, meta_file, schema_signature(table_name)):
+                self.sources[table_name] = 'parquet'
+                if row_numbers:
+                    return (f"(SELECT * EXCLUDE (file_row_number), file_row_number AS _row "
+                            f"FROM read_parquet({_sql_literal(parquet_file)}, file_row_number = true))")
+                return f"read_parquet({_sql_literal(parquet_file)})"
+
+        self.sources[table_name] = 'csv'
+        schema = TABLE_SCHEMAS.get(table_name, {})
+        types = ', '.join(f"{_sql_literal(col)}: {_sql_literal(DUCKDB_TYPES[kind])}"
+                          for col, kind in schema.items())
+        # 행 순서가 필요하면 단일 스레드로 읽어서 파일 순서대로 번호를 매김
+        options = "header = true, parallel = false" if row_numbers else "header = true"
+        scan = f"read_csv({_sql_literal(file_path)}, {options}, types = {{{types}}})"
+        datetime_cols = [col for col, kind in schema.items() if kind == 'datetime']
+        if datetime_cols:
+            casts = ', '.join(f"TRY_CAST({col} AS TIMESTAMP) AS {col}" for col in datetime_cols)
+            scan = f"(SELECT * REPLACE ({casts}) FROM {scan})"
+        if row_numbers:
+            scan = f"(SELECT *, row_number() OVER () - 1 AS _row FROM {scan})"
+        return scan
+
+    def refresh(self) -> Dict[str, str]:
+        """
+        테이블 뷰 다시 만들기 (캐시가 새로 생겼거나 CSV가 바뀐 경우)
+
+        Returns:
+        --------
+        Dict[str, str]
+            테이블명 → 'parquet' | 'csv'
+        """
+        self.sources = {}
+        for table_name in TABLE_FILES:
+            scan = self._table_scan(table_name)
+            if scan is None:
+                continue
+            self.con.execute(f"CREATE OR REPLACE VIEW {table_name} AS SELECT * FROM {scan}")
+            if table_name in ROW_ORDER_TABLES:
+                scan = self._table_scan(table_name, row_numbers=True)
+                self.con.execute(f"CREATE OR REPLACE VIEW {table_name}_rows AS SELECT * FROM {scan}")
+        return dict(self.sources)
+
+    def query(self, sql: str, params: Optional[Dict] = None) -> pd.DataFrame:
+        """
+        SQL 실행 결과를 DataFrame으로 반환
+
+        Parameters:
+        -----------
+        sql : str
+            SQL 문 (테이블명: orders, order_items, customers ...)
+        params : Dict
+            $name 파라미터 값
+
+        Returns:
+        --------
+        pd.DataFrame
+            쿼리 결과
+        """
+        return self.con.execute(sql, params or {}).df()
+
+    def explain(self, sql: str, params: Optional[Dict] = None) -> str:
+        """실행 계획 (스캔에 내려간 컬럼/필터 확인용)"""
+        rows = self.con.execute(f"EXPLAIN {sql}", params or {}).fetchall()
+        return '\n'.join(row[-1] for row in rows)
+
+    def run_saved(self, name: str, start: Optional[str] = None, end: Optional[str] = None) -> pd.DataFrame:
+        """저장된 쿼리 실행 (구매일 기준 [start, end) 필터)"""
+        params = {}
+        if start is not None:
+            params['start'] = str(pd.Timestamp(start))
+        if end is not None:
+            params['end'] = str(pd.Timestamp(end))
+        return self.query(saved_query_sql(name, start, end), params)
+
+    def close(self) -> None:
+        self.con.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# 경로별 기본 엔진 (query/run_saved_query가 재사용)
+_ENGINES: Dict[Path, SQLEngine] = {}
+
+
+def get_engine(data_path: Path = DATA_PATH, refresh: bool = False) -> SQLEngine:
+    """data_path별 공유 SQLEngine (refresh=True면 뷰를 다시 만듦)"""
+    key = Path(data_path).resolve()
+    engine = _ENGINES.get(key)
+    if engine is None:
+        engine = _ENGINES[key] = SQLEngine(data_path)
+    elif refresh:
+        engine.refresh()
+    return engine
+
+
+def query(sql: str, params: Optional[Dict] = None, data_path: Path = DATA_PATH) -> pd.DataFrame:
+    """
+    Olist 테이블에 SQL 실행 (get_engine(data_path).query)
+
+    예: query("SELECT order_status, count(*) FROM orders GROUP BY 1")
+    """
+    return get_engine(data_path).query(sql, params)
+
+
+def run_saved_query(name: str,
+                    start: Optional[str] = None,
+                    end: Optional[str] = None,
+                    data_path: Path = DATA_PATH) -> pd.DataFrame:
+    """
+    저장된 쿼리 실행
+
+    Parameters:
+    -----------
+    name : str
+        SAVED_QUERIES의 이름 (master_orders, master_sellers, delivery_by_state ...)
+    start, end : str
+        구매일 기준 [start, end) 범위 (예: start='2017-01-01')
+    data_path : Path
+        CSV 파일이 있는 경로
+
+    Returns:
+    --------
+    pd.DataFrame
+        쿼리 결과
+    """
+    return get_engine(data_path).run_saved(name, start=start, end=end)
+
+
+def list_saved_queries() -> List[str]:
+    return list(SAVED_QUERIES)
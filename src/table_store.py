@@ -0,0 +1,376 @@
+"""
+공유 테이블 저장소 모듈
+로드한 테이블을 Arrow IPC 파일로 한 번 써 두고, 여러 프로세스(노트북 커널, 보고서 작업)가
+같은 파일을 읽기 전용 memory-map으로 열어 복사/재파싱 없이 DataFrame으로 쓰게 하는 함수들
+
+저장 구조 (기본: <data_path>/.cache/store):
+    <table>/<version_key>.arrow   압축하지 않은 Arrow IPC 파일 (버전마다 새 파일, 덮어쓰지 않음)
+    <table>/manifest.json         {"current": 버전 번호, "versions": {번호: 정보}}
+    <table>/manifest.lock         manifest 갱신 중 표시 (버전 번호 할당 + manifest 쓰기를 프로세스 간 직렬화)
+
+테이블이 갱신되면 새 파일을 쓰고 manifest의 current만 바꾼다. 이전 버전을 열어 둔 프로세스는
+자기 파일을 계속 읽으므로 영향이 없다 (prune으로 오래된 버전 정리).
+"""
+
+import hashlib
+import importlib.util
+import json
+import os
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+import pandas as pd
+
+from src.data_loader import (CACHE_DIR_NAME, DATA_PATH, TABLE_FILES,
+                             _write_json_atomic, read_table, table_content_hash)
+from src.profiling import frame_fingerprint
+from src.schema import schema_signature
+
+
+STORE_DIR_NAME = "store"
+STORE_FORMAT_VERSION = 1
+MANIFEST_NAME = "manifest.json"
+LOCK_NAME = "manifest.lock"
+# lock 대기 제한(초)과, 이보다 오래된 lock 파일은 비정상 종료로 남은 것으로 보고 지움
+LOCK_TIMEOUT = 30.0
+LOCK_STALE_SECONDS = 60.0
+
+
+def _pyarrow_available() -> bool:
+    """pyarrow 설치 여부 - import 없이 확인"""
+    return importlib.util.find_spec('pyarrow') is not None
+
+
+def _import_pyarrow():
+    if not _pyarrow_available():
+        raise ImportError("공유 테이블 저장소에는 pyarrow가 필요합니다: pip install pyarrow")
+    import pyarrow as pa
+    import pyarrow.ipc  # noqa: F401
+    return pa
+
+
+@contextmanager
+def _manifest_lock(table_dir: Path) -> Iterator[None]:
+    """
+    테이블 manifest lock (O_EXCL로 lock 파일을 만든 프로세스만 진입)
+
+    fcntl이 없는 Windows에서도 동작하도록 lock 파일 생성 자체를 lock으로 쓴다.
+    """
+    table_dir.mkdir(parents=True, exist_ok=True)
+    lock_file = table_dir / LOCK_NAME
+    deadline = time.monotonic() + LOCK_TIMEOUT
+    while True:
+        try:
+            fd = os.open(lock_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL)
+            break
+        except FileExistsError:
+            try:
+                if time.time() - lock_file.stat().st_mtime > LOCK_STALE_SECONDS:
+                    lock_file.unlink(missing_ok=True)
+                    continue
+            except OSError:
+                continue
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"manifest lock 대기 시간 초과: {lock_file}")
+            time.sleep(0.01)
+    try:
+        os.write(fd, str(os.getpid()).encode('ascii'))
+        os.close(fd)
+        yield
+    finally:
+        lock_file.unlink(missing_ok=True)
+
+
+def default_store_path(data_path: Path = DATA_PATH) -> Path:
+    """data_path별 기본 저장소 경로 (<data_path>/.cache/store)"""
+    return Path(data_path) / CACHE_DIR_NAME / STORE_DIR_NAME
+
+
+class TableStore:
+    """
+    버전 관리되는 Arrow IPC 테이블 저장소
+
+    원본 테이블(TABLE_FILES)은 CSV 내용 해시 + 스키마 정의로, 직접 넘긴 DataFrame은
+    내용 fingerprint로 버전을 구분한다. 같은 내용이면 다시 쓰지 않는다.
+
+    Parameters:
+    -----------
+    path : Path
+        저장소 경로 (None이면 default_store_path(data_path))
+    data_path : Path
+        원본 CSV 경로 (원본 테이블 publish 시 사용)
+
+    Examples:
+    ---------
+    >>> store = TableStore()
+    >>> store.publish('orders')              # 처음 한 번 (또는 CSV가 바뀌었을 때) 파일 생성
+    >>> orders = store.open('orders')        # 다른 프로세스: memory-map으로 열기
+    """
+
+    def __init__(self, path: Optional[Path] = None, data_path: Path = DATA_PATH):
+        self.data_path = Path(data_path)
+        self.path = default_store_path(data_path) if path is None else Path(path)
+
+    # ------------------------------------------
+    # manifest
+    # ------------------------------------------
+
+    def _table_dir(self, name: str) -> Path:
+        return self.path / name
+
+    def manifest(self, name: str) -> Dict:
+        """테이블 manifest ({'current': 번호 또는 None, 'versions': {번호: 정보}})"""
+        try:
+            manifest = json.loads((self._table_dir(name) / MANIFEST_NAME).read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return {'format': STORE_FORMAT_VERSION, 'current': None, 'versions': {}}
+        if manifest.get('format') != STORE_FORMAT_VERSION:
+            return {'format': STORE_FORMAT_VERSION, 'current': None, 'versions': {}}
+        return manifest
+
+    def current(self, name: str) -> Optional[Dict]:
+        """현재 버전 정보 (없으면 None)"""
+        manifest = self.manifest(name)
+        if manifest['current'] is None:
+            return None
+        return manifest['versions'].get(str(manifest['current']))
+
+    def versions(self, name: str) -> pd.DataFrame:
+        """테이블의 모든 버전 (오래된 순)"""
+        manifest = self.manifest(name)
+        rows = [dict(info, current=(int(version) == manifest['current']))
+                for version, info in manifest['versions'].items()]
+        columns = ['version', 'file', 'key', 'rows', 'columns', 'bytes', 'created_at', 'current']
+        return pd.DataFrame(rows, columns=columns).sort_values('version', ignore_index=True)
+
+    def tables(self) -> List[str]:
+        """저장된 테이블 목록"""
+        if not self.path.exists():
+            return []
+        return sorted(p.parent.name for p in self.path.glob(f"*/{MANIFEST_NAME}"))
+
+    # ------------------------------------------
+    # 쓰기
+    # ------------------------------------------
+
+    def _source_key(self, name: str) -> str:
+        return f"csv:{table_content_hash(name, self.data_path)}:{schema_signature(name)}"
+
+    def publish(self, name: str, df: Optional[pd.DataFrame] = None, force: bool = False) -> Dict:
+        """
+        테이블을 저장소에 쓰고 현재 버전으로 지정
+
+        Parameters:
+        -----------
+        name : str
+            테이블명 (df가 없으면 TABLE_FILES의 원본 테이블을 read_table로 읽는다)
+        df : pd.DataFrame
+            저장할 DataFrame (master_orders 같은 파생 테이블)
+        force : bool
+            내용이 같아도 새 버전으로 다시 쓰기
+
+        Returns:
+        --------
+        Dict
+            현재 버전 정보 (version, file, key, rows, columns, bytes, created_at)
+        """
+        pa = _import_pyarrow()
+        if df is None:
+            if name not in TABLE_FILES:
+                raise KeyError(f"원본 테이블이 아닙니다: {name} (DataFrame을 같이 넘기세요)")
+            key = self._source_key(name)
+        else:
+            key = f"frame:{frame_fingerprint(df)}"
+
+        current = self.current(name)
+        if current is not None and current['key'] == key and not force \
+                and (self._table_dir(name) / current['file']).exists():
+            return current
+
+        if df is None:
+            df = read_table(name, self.data_path)
+
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        key_hash = hashlib.md5(key.encode('utf-8')).hexdigest()[:12]
+
+        table_dir = self._table_dir(name)
+        table_dir.mkdir(parents=True, exist_ok=True)
+        tmp_file = table_dir / f".{key_hash}.{os.getpid()}.tmp"
+        # memory-map으로 그대로 읽을 수 있도록 압축하지 않는다
+        # (큰 파일 쓰기는 lock 밖에서 하고, 버전 번호는 lock 안에서 할당)
+        with pa.OSFile(str(tmp_file), 'wb') as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+
+        # 다른 프로세스가 그사이 publish했을 수 있으므로 lock을 잡고 manifest를 다시 읽어서 번호 할당
+        with _manifest_lock(table_dir):
+            manifest = self.manifest(name)
+            version = max((int(v) for v in manifest['versions']), default=0) + 1
+            file_name = f"v{version:05d}-{key_hash}.arrow"
+            os.replace(tmp_file, table_dir / file_name)
+
+            info = {
+                'version': version,
+                'file': file_name,
+                'key': key,
+                'rows': table.num_rows,
+                'columns': table.num_columns,
+                'bytes': (table_dir / file_name).stat().st_size,
+                'created_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            }
+            manifest['versions'][str(version)] = info
+            manifest['current'] = version
+            _write_json_atomic(table_dir / MANIFEST_NAME, manifest)
+        return info
+
+    def prune(self, name: Optional[str] = None, keep: int = 2) -> int:
+        """
+        오래된 버전 파일 삭제 (현재 버전 포함 최근 keep개 유지)
+
+        POSIX에서는 이미 memory-map으로 열린 파일을 지워도 그 프로세스는 계속 읽을 수 있다.
+        Windows처럼 열린 파일을 지울 수 없으면 건너뛰고 다음 prune에서 다시 시도한다.
+
+        Returns:
+        --------
+        int
+            삭제한 파일 수
+        """
+        removed = 0
+        for table_name in ([name] if name else self.tables()):
+            table_dir = self._table_dir(table_name)
+            with _manifest_lock(table_dir):
+                manifest = self.manifest(table_name)
+                ordered = sorted(manifest['versions'], key=int)
+                keep_versions = set(ordered[-keep:]) | {str(manifest['current'])}
+                table_removed = 0
+                for version in ordered:
+                    if version in keep_versions:
+                        continue
+                    try:
+                        (table_dir / manifest['versions'][version]['file']).unlink(missing_ok=True)
+                    except OSError:
+                        continue
+                    del manifest['versions'][version]
+                    table_removed += 1
+                # 지운 버전이 있는 테이블만 manifest를 다시 씀
+                if table_removed:
+                    _write_json_atomic(table_dir / MANIFEST_NAME, manifest)
+            removed += table_removed
+        return removed
+
+    # ------------------------------------------
+    # 읽기
+    # ------------------------------------------
+
+    def _version_file(self, name: str, version: Optional[int]) -> Path:
+        manifest = self.manifest(name)
+        version = manifest['current'] if version is None else version
+        info = manifest['versions'].get(str(version)) if version is not None else None
+        if info is None:
+            raise KeyError(f"저장소에 없는 테이블/버전: {name} (version={version})")
+        return self._table_dir(name) / info['file']
+
+    def open_arrow(self, name: str, version: Optional[int] = None, columns: Optional[List[str]] = None):
+        """
+        테이블을 memory-map으로 열어 pyarrow.Table 반환 (데이터는 파일 페이지를 그대로 참조)
+        """
+        pa = _import_pyarrow()
+        source = pa.memory_map(str(self._version_file(name, version)), 'r')
+        table = pa.ipc.open_file(source).read_all()
+        return table.select(columns) if columns is not None else table
+
+    def open(self, name: str, version: Optional[int] = None, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        테이블을 memory-map으로 열어 DataFrame 반환
+
+        수치/날짜/문자열 컬럼은 파일 페이지를 그대로 참조하므로(결측 없는 수치 컬럼은 numpy view,
+        문자열은 Arrow 기반 str dtype) 여러 프로세스가 열어도 OS 페이지 캐시 한 벌만 쓴다.
+        category 컬럼은 코드 배열만 프로세스별로 만든다.
+
+        Parameters:
+        -----------
+        name : str
+            테이블명
+        version : int
+            버전 번호 (None이면 현재 버전)
+        columns : List[str]
+            읽을 컬럼 (None이면 전체)
+
+        Returns:
+        --------
+        pd.DataFrame
+            읽기 전용 데이터를 참조하는 DataFrame
+        """
+        return self.open_arrow(name, version, columns).to_pandas(split_blocks=True)
+
+    def load_all(self,
+                 columns: Optional[Dict[str, List[str]]] = None,
+                 publish: bool = True,
+                 verbose: bool = True) -> Dict[str, Optional[pd.DataFrame]]:
+        """
+        모든 원본 테이블을 저장소에서 열기 (load_all_tables(shared=True)의 본체)
+
+        publish=True면 저장소에 없거나 원본 CSV가 바뀐 테이블을 먼저 publish한다.
+        원본 CSV가 없는 테이블은 None.
+        """
+        columns = columns or {}
+        tables = {}
+        if verbose:
+            print(f"🚀 Olist 데이터 로딩 중... (공유 저장소: {self.path})\n")
+
+        wall_start = time.perf_counter()
+        for table_name in TABLE_FILES:
+            start = time.perf_counter()
+            if publish:
+                if not (self.data_path / TABLE_FILES[table_name]).exists():
+                    tables[table_name] = None
+                    if verbose:
+                        print(f"❌ {table_name:20s}: 파일을 찾을 수 없습니다 ({TABLE_FILES[table_name]})")
+                    continue
+                info = self.publish(table_name)
+            else:
+                info = self.current(table_name)
+                if info is None:
+                    tables[table_name] = None
+                    continue
+            df = self.open(table_name, info['version'], columns.get(table_name))
+            tables[table_name] = df
+            if verbose:
+                print(f"✅ {table_name:20s}: {df.shape[0]:>7,d} rows × {df.shape[1]:>2d} columns "
+                      f"(v{info['version']}, {time.perf_counter() - start:.2f}s)")
+
+        if verbose:
+            print("\n" + "="*60)
+            total_rows = sum(df.shape[0] for df in tables.values() if df is not None)
+            print(f"📊 전체 데이터: {total_rows:,d} rows")
+            print(f"⏱️  로딩 시간: {time.perf_counter() - wall_start:.2f}s (memory-map)")
+            print("="*60 + "\n")
+        return tables
+
+
+def load_shared_tables(data_path: Path = DATA_PATH,
+                       store_path: Optional[Path] = None,
+                       columns: Optional[Dict[str, List[str]]] = None,
+                       verbose: bool = True) -> Dict[str, Optional[pd.DataFrame]]:
+    """
+    공유 저장소를 거쳐 모든 테이블 로드
+
+    Parameters:
+    -----------
+    data_path : Path
+        CSV 파일이 있는 경로
+    store_path : Path
+        저장소 경로 (None이면 <data_path>/.cache/store)
+    columns : Dict[str, List[str]]
+        테이블별로 읽을 컬럼 목록
+    verbose : bool
+        로딩 정보 출력 여부
+
+    Returns:
+    --------
+    Dict[str, pd.DataFrame]
+        테이블명을 key로 하는 딕셔너리 (값은 memory-map된 파일을 참조)
+    """
+    return TableStore(store_path, data_path).load_all(columns=columns, verbose=verbose)
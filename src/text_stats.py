@@ -0,0 +1,343 @@
+"""
+리뷰 텍스트 통계 모듈
+리뷰 텍스트를 chunk 단위로 스트리밍하면서 정제/불용어 제거/단어·n-gram 빈도와
+점수별·불만 유형별 단어 빈도를 한 번에 계산하는 함수들
+"""
+
+import re
+from itertools import chain
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from src.complaints import classify_complaints
+from src.data_loader import DATA_PATH, iter_table_chunks
+
+
+# 불용어 (one_star_review.ipynb Step 2 기준)
+STOPWORDS: Set[str] = {
+    '것', '수', '및', '등', '안', '더', '때', '또', '그', '저', '이', '가', '을', '를',
+    '나', '너', '저희', '우리', '그것', '이것', '저것', '에', '의', '이', '는',
+    '있습니다', '합니다', '입니다', '했습니다', '있어', '없어', '있는', '없는',
+    '매우', '정말', '너무', '아주', '완전', '좀', '잘', '못', '안'
+}
+
+# clean_text 후 공백 분리한 단어와 같은 구간 (한글/영문/숫자 연속)
+TOKEN_PATTERN = re.compile(r'[가-힣a-zA-Z0-9]+')
+
+# 최소 단어 길이 (2글자 이상)
+MIN_TOKEN_LENGTH = 2
+
+# partial 결과를 몇 개 모을 때마다 중간 병합할지 (메모리 상한)
+MERGE_EVERY = 16
+
+
+def clean_text(texts: pd.Series) -> pd.Series:
+    """
+    텍스트 정제 (벡터화) - 노트북 preprocess_text와 동일
+
+    한글/영문/숫자/공백 외 문자를 공백으로 바꾸고, 연속 공백을 하나로 줄인 뒤
+    앞뒤 공백 제거 + 소문자 변환. 결측은 빈 문자열.
+    """
+    return (
+        texts.fillna('').astype(str)
+        .str.replace(r'[^가-힣a-zA-Z0-9\s]', ' ', regex=True)
+        .str.replace(r'\s+', ' ', regex=True)
+        .str.strip()
+        .str.lower()
+    )
+
+
+def _encode_tokens(texts: pd.Series,
+                   stopwords: Optional[Set[str]] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    텍스트 → (문서 번호, 단어 코드, 어휘) 배열
+
+    clean_text 후 공백으로 나눈 단어는 [가-힣a-zA-Z0-9]+ 구간과 같으므로 findall 한 번으로
+    자르고, 소문자 변환/불용어/길이 필터는 고유 단어(어휘)에만 적용한다.
+    """
+    stopwords = STOPWORDS if stopwords is None else stopwords
+    values = texts.fillna('').astype(str).tolist()
+    found = [TOKEN_PATTERN.findall(text) for text in values]
+    lengths = np.fromiter(map(len, found), dtype='int64', count=len(found))
+    docs = np.repeat(np.arange(len(found), dtype='int64'), lengths)
+    flat = np.fromiter(chain.from_iterable(found), dtype=object, count=int(lengths.sum()))
+
+    raw_codes, raw_vocab = pd.factorize(flat)
+    lower_codes, vocab = pd.factorize(pd.Index(raw_vocab, dtype=object).str.lower())
+    codes = lower_codes[raw_codes] if len(raw_codes) else raw_codes
+
+    vocab = pd.Index(vocab, dtype=object)
+    keep_vocab = np.asarray((vocab.str.len() >= MIN_TOKEN_LENGTH) & ~vocab.isin(stopwords), dtype=bool)
+    keep = keep_vocab[codes]
+    return docs[keep], codes[keep].astype('int64'), vocab.to_numpy(dtype=object)
+
+
+def tokenize(texts: pd.Series, stopwords: Optional[Set[str]] = None) -> pd.Series:
+    """
+    정제 + 단어 분리 + 불용어/짧은 단어 제거
+
+    Returns:
+    --------
+    pd.Series
+        단어 1개 = 1행, index = 원래 문서의 위치(0..n-1)
+    """
+    docs, codes, vocab = _encode_tokens(texts, stopwords)
+    return pd.Series(vocab[codes], index=docs, dtype=object)
+
+
+def _code_counts(codes: np.ndarray, vocab: np.ndarray) -> pd.Series:
+    """단어 코드 → 빈도 Series (index=단어, 0건 제외)"""
+    counts = np.bincount(codes, minlength=len(vocab))
+    present = np.flatnonzero(counts)
+    return pd.Series(counts[present], index=pd.Index(vocab[present], dtype=object, name='term'))
+
+
+def _ngram_counts(docs: np.ndarray, codes: np.ndarray, vocab: np.ndarray, n: int) -> pd.Series:
+    """같은 문서 안에서 연속된 n개 단어 빈도 (n-gram도 정수 코드로 만든 뒤 셈)"""
+    m = len(codes) - n + 1
+    if m <= 0:
+        return pd.Series(dtype='int64')
+
+    size = len(vocab)
+    gram_codes, gram_vocab = codes[:m], vocab
+    for k in range(1, n):
+        key = gram_codes.astype('int64') * size + codes[k:k + m]
+        gram_codes, uniques = pd.factorize(key)
+        gram_vocab = gram_vocab[uniques // size] + ' ' + vocab[uniques % size]
+
+    same_doc = docs[:m] == docs[n - 1:]
+    return _code_counts(gram_codes[same_doc], gram_vocab)
+
+
+def _keyed_counts(group_codes: np.ndarray, codes: np.ndarray,
+                  groups: np.ndarray, vocab: np.ndarray, names: List[str]) -> pd.Series:
+    """(그룹 코드, 단어 코드) 쌍 빈도 → MultiIndex Series"""
+    key = group_codes.astype('int64') * len(vocab) + codes
+    uniques, counts = np.unique(key, return_counts=True)
+    index = pd.MultiIndex.from_arrays([groups[uniques // len(vocab)], vocab[uniques % len(vocab)]],
+                                      names=names)
+    return pd.Series(counts, index=index)
+
+
+def chunk_term_counts(chunk: pd.DataFrame,
+                      text_col: str,
+                      group_col: Optional[str] = None,
+                      by_complaint: bool = False,
+                      ngram: int = 2,
+                      stopwords: Optional[Set[str]] = None) -> Dict:
+    """
+    chunk 하나의 단어/n-gram/그룹별 빈도 (partial 결과)
+
+    Parameters:
+    -----------
+    chunk : pd.DataFrame
+        텍스트 컬럼(과 그룹 컬럼)을 포함한 데이터프레임
+    text_col : str
+        텍스트 컬럼명
+    group_col : str
+        그룹별 단어 빈도 기준 컬럼 (예: 'review_score')
+    by_complaint : bool
+        src.complaints 불만 유형별 단어 빈도도 계산할지 여부 (한국어 텍스트)
+    ngram : int
+        최대 n-gram 길이 (1이면 단어만)
+    stopwords : Set[str]
+        불용어 (None이면 STOPWORDS)
+
+    Returns:
+    --------
+    Dict
+        docs, terms (n → 빈도 Series), group_docs/by_group, complaint_docs/by_complaint
+    """
+    texts = chunk[text_col]
+    has_text = texts.notna().to_numpy()
+    docs, codes, vocab = _encode_tokens(texts, stopwords)
+
+    partial = {
+        'docs': int(has_text.sum()),
+        'terms': {1: _code_counts(codes, vocab)},
+    }
+    for n in range(2, ngram + 1):
+        partial['terms'][n] = _ngram_counts(docs, codes, vocab, n)
+
+    if group_col is not None:
+        group_codes, groups = pd.factorize(chunk[group_col])
+        groups = np.asarray(groups, dtype=object)
+        partial['group_docs'] = pd.Series(np.bincount(group_codes[has_text & (group_codes >= 0)],
+                                                      minlength=len(groups)), index=groups)
+        valid = group_codes[docs] >= 0
+        partial['by_group'] = _keyed_counts(group_codes[docs][valid], codes[valid], groups, vocab,
+                                            ['group', 'term'])
+
+    if by_complaint:
+        matrix = classify_complaints(texts.reset_index(drop=True))
+        partial['complaint_docs'] = matrix.sum()
+        hits = matrix.to_numpy(dtype=bool)[docs]
+        type_rows, token_rows = np.nonzero(hits.T)
+        partial['by_complaint'] = _keyed_counts(type_rows, codes[token_rows],
+                                                np.asarray(matrix.columns, dtype=object), vocab,
+                                                ['complaint_type', 'term'])
+
+    return partial
+
+
+def _merge_series(parts: List[pd.Series]) -> pd.Series:
+    parts = [p for p in parts if p is not None and len(p)]
+    if not parts:
+        return pd.Series(dtype='int64')
+    merged = pd.concat(parts)
+    return merged.groupby(level=list(range(merged.index.nlevels)), sort=False).sum()
+
+
+def merge_term_counts(partials: List[Dict]) -> Dict:
+    """partial 결과(chunk_term_counts) 여러 개를 하나로 합침"""
+    merged = {'docs': sum(p['docs'] for p in partials), 'terms': {}}
+    levels = sorted({n for p in partials for n in p['terms']})
+    for n in levels:
+        merged['terms'][n] = _merge_series([p['terms'].get(n) for p in partials])
+    for key in ('group_docs', 'by_group', 'complaint_docs', 'by_complaint'):
+        if any(key in p for p in partials):
+            merged[key] = _merge_series([p.get(key) for p in partials])
+    return merged
+
+
+def term_frequencies(chunks: Iterable[pd.DataFrame],
+                     text_col: str,
+                     group_col: Optional[str] = None,
+                     by_complaint: bool = False,
+                     ngram: int = 2,
+                     n_jobs: int = 1,
+                     stopwords: Optional[Set[str]] = None,
+                     verbose: bool = True) -> Dict[str, pd.DataFrame]:
+    """
+    리뷰 텍스트 스트리밍 단어 빈도
+
+    chunk마다 chunk_term_counts를 (n_jobs > 1이면 프로세스 풀에서) 실행하고
+    partial 결과를 합친다. 동시에 처리 중인 chunk는 n_jobs * 2개로 제한한다.
+
+    Parameters:
+    -----------
+    chunks : Iterable[pd.DataFrame]
+        텍스트 chunk (예: iter_review_chunks(), pd.read_csv(..., chunksize=...))
+    text_col : str
+        텍스트 컬럼명
+    group_col : str
+        그룹별 단어 빈도 기준 컬럼 (예: 'review_score')
+    by_complaint : bool
+        불만 유형별 단어 빈도 계산 여부
+    ngram : int
+        최대 n-gram 길이
+    n_jobs : int
+        프로세스 수
+    stopwords : Set[str]
+        불용어
+    verbose : bool
+        결과 요약 출력 여부
+
+    Returns:
+    --------
+    Dict[str, pd.DataFrame]
+        terms: ngram, term, count, per_100_docs (빈도 내림차순)
+        by_group: group, term, count, per_100_docs (group_col을 준 경우)
+        by_complaint: complaint_type, term, count, per_100_docs (by_complaint=True인 경우)
+        per_100_docs는 문서 100건당 등장 횟수 (출현 횟수 ÷ 문서 수 × 100, 노트북의 비율(%)과 같은 계산).
+        한 리뷰에 여러 번 나온 단어는 모두 세므로 100을 넘을 수 있다 (문서 비율이 아님)
+    """
+    kwargs = dict(text_col=text_col, group_col=group_col, by_complaint=by_complaint,
+                  ngram=ngram, stopwords=stopwords)
+    partials: List[Dict] = []
+    n_chunks = 0
+
+    def collect(partial: Dict) -> None:
+        partials.append(partial)
+        if len(partials) >= MERGE_EVERY:
+            partials[:] = [merge_term_counts(partials)]
+
+    if n_jobs > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            in_flight = []
+            for chunk in chunks:
+                in_flight.append(executor.submit(chunk_term_counts, chunk, **kwargs))
+                n_chunks += 1
+                if len(in_flight) >= n_jobs * 2:
+                    collect(in_flight.pop(0).result())
+            for future in in_flight:
+                collect(future.result())
+    else:
+        for chunk in chunks:
+            collect(chunk_term_counts(chunk, **kwargs))
+            n_chunks += 1
+
+    merged = merge_term_counts(partials) if partials else {'docs': 0, 'terms': {}}
+    total_docs = merged['docs']
+
+    term_frames = []
+    for n, counts in merged['terms'].items():
+        frame = counts.rename('count').rename_axis('term').reset_index()
+        frame.insert(0, 'ngram', n)
+        term_frames.append(frame)
+    terms = (pd.concat(term_frames, ignore_index=True) if term_frames
+             else pd.DataFrame(columns=['ngram', 'term', 'count']))
+    terms['per_100_docs'] = (terms['count'] / total_docs * 100).round(2) if total_docs else 0.0
+    result = {'terms': terms.sort_values(['ngram', 'count'], ascending=[True, False], kind='stable')
+                            .reset_index(drop=True)}
+
+    for key, docs_key, level in (('by_group', 'group_docs', 'group'),
+                                 ('by_complaint', 'complaint_docs', 'complaint_type')):
+        if key not in merged:
+            continue
+        frame = merged[key].rename('count').reset_index()
+        frame.columns = [level, 'term', 'count']
+        docs = merged[docs_key]
+        frame['per_100_docs'] = (frame['count'] / frame[level].map(docs).astype('float64') * 100).round(2)
+        result[key] = (frame.sort_values([level, 'count'], ascending=[True, False], kind='stable')
+                       .reset_index(drop=True))
+
+    if verbose:
+        unigrams = result['terms'][result['terms']['ngram'] == 1]
+        print(f"📝 텍스트 통계: 문서 {total_docs:,d}건 / chunk {n_chunks:,d}개 / 고유 단어 {len(unigrams):,d}개")
+
+    return result
+
+
+def word_frequency_table(terms: pd.DataFrame) -> pd.DataFrame:
+    """
+    단어 빈도 → one_star_word_frequency.csv 형식 (단어, 빈도, 비율(%))
+
+    비율(%)은 노트북과 같이 per_100_docs (출현 횟수 ÷ 문서 수 × 100) 그대로
+    """
+    unigrams = terms[terms['ngram'] == 1]
+    return pd.DataFrame({
+        '단어': unigrams['term'].to_numpy(),
+        '빈도': unigrams['count'].to_numpy(),
+        '비율(%)': unigrams['per_100_docs'].to_numpy(),
+    })
+
+
+def iter_review_chunks(data_path: Path = DATA_PATH,
+                       chunksize: int = 20_000,
+                       text_col: str = 'review_comment_message',
+                       scores: Optional[List[int]] = None) -> Iterator[pd.DataFrame]:
+    """
+    order_reviews에서 (review_score, 텍스트) chunk 스트리밍
+
+    Parameters:
+    -----------
+    data_path : Path
+        CSV 경로
+    chunksize : int
+        chunk 당 행 수
+    text_col : str
+        텍스트 컬럼 ('review_comment_message' 또는 'review_comment_title')
+    scores : List[int]
+        이 점수들만 사용 (None이면 전체 점수)
+    """
+    for chunk in iter_table_chunks('order_reviews', data_path, chunksize=chunksize,
+                                   columns=['review_score', text_col]):
+        chunk = chunk[chunk[text_col].notna()]
+        if scores is not None:
+            chunk = chunk[chunk['review_score'].isin(scores)]
+        if len(chunk):
+            yield chunk
@@ -0,0 +1,350 @@
+"""
+리뷰 번역 모듈
+번역 백엔드(Google/transformers/로컬 stub)를 공통 인터페이스로 감싸고,
+중복 제거 + 배치 + 동시 요청 제한 + 영구 캐시(SQLite)로 번역하는 함수들
+"""
+
+import hashlib
+import random
+import re
+import sqlite3
+import time
+import unicodedata
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+# 번역 캐시 기본 경로 (data/review_ko/translation_cache.sqlite)
+TRANSLATION_CACHE_PATH = Path(__file__).parent.parent / "data" / "review_ko" / "translation_cache.sqlite"
+
+
+# ==============================================
+# 번역 백엔드
+# ==============================================
+
+class TranslationBackend:
+    """
+    번역 백엔드 공통 인터페이스
+
+    translate_batch(texts)만 구현하면 된다. name은 캐시 key에 들어가므로
+    백엔드(모델)가 달라지면 다른 이름을 써야 한다.
+    """
+
+    name = "base"
+    max_batch_size = 32
+
+    def __init__(self, source: str = 'pt', target: str = 'ko'):
+        self.source = source
+        self.target = target
+
+    def translate_batch(self, texts: List[str]) -> List[str]:
+        raise NotImplementedError
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.source}→{self.target})"
+
+
+class StubBackend(TranslationBackend):
+    """
+    오프라인 테스트용 로컬 백엔드 - '[ko] 원문' 형태로 돌려준다
+
+    delay를 주면 배치마다 그만큼 대기해서 네트워크 지연을 흉내낸다.
+    """
+
+    name = "stub"
+
+    def __init__(self, source: str = 'pt', target: str = 'ko',
+                 delay: float = 0.0, max_batch_size: int = 32):
+        super().__init__(source, target)
+        self.delay = delay
+        self.max_batch_size = max_batch_size
+        self.calls = 0
+        self.texts_translated = 0
+
+    def translate_batch(self, texts: List[str]) -> List[str]:
+        self.calls += 1
+        self.texts_translated += len(texts)
+        if self.delay:
+            time.sleep(self.delay)
+        return [f"[{self.target}] {text}" for text in texts]
+
+
+class GoogleBackend(TranslationBackend):
+    """
+    deep_translator.GoogleTranslator 백엔드 (pip install deep-translator)
+
+    요청이 실패하면 (시도 횟수 × retry_wait)초 + 약간의 랜덤 대기 후 다시 시도한다.
+    """
+
+    name = "google"
+    max_batch_size = 16
+
+    def __init__(self, source: str = 'pt', target: str = 'ko',
+                 max_retries: int = 5, retry_wait: float = 20.0):
+        super().__init__(source, target)
+        from deep_translator import GoogleTranslator
+        self.translator = GoogleTranslator(source=source, target=target)
+        self.max_retries = max_retries
+        self.retry_wait = retry_wait
+
+    def translate_batch(self, texts: List[str]) -> List[str]:
+        for attempt in range(self.max_retries):
+            try:
+                return self.translator.translate_batch(list(texts))
+            except Exception as e:
+                if attempt == self.max_retries - 1:
+                    raise
+                wait_time = (attempt + 1) * self.retry_wait + random.uniform(0, 1)
+                print(f"⚠️  번역 요청 실패 ({e}) - {attempt + 1}/{self.max_retries}, {wait_time:.0f}초 후 재시도")
+                time.sleep(wait_time)
+
+
+class TransformersBackend(TranslationBackend):
+    """
+    transformers 번역 pipeline 백엔드 (기본: mBART-50 다국어 모델)
+
+    pipeline에 리스트를 넘겨 모델 배치로 번역한다.
+    """
+
+    max_batch_size = 16
+    LANG_CODES = {'pt': 'pt_XX', 'ko': 'ko_KR', 'en': 'en_XX'}
+
+    def __init__(self, source: str = 'pt', target: str = 'ko',
+                 model: str = "facebook/mbart-large-50-many-to-many-mmt", device: int = -1):
+        super().__init__(source, target)
+        from transformers import pipeline
+        self.name = f"transformers:{model}"
+        self.pipe = pipeline("translation", model=model, device=device)
+
+    def translate_batch(self, texts: List[str]) -> List[str]:
+        results = self.pipe(list(texts), src_lang=self.LANG_CODES[self.source],
+                            tgt_lang=self.LANG_CODES[self.target], batch_size=len(texts))
+        return [r['translation_text'] for r in results]
+
+
+# ==============================================
+# 영구 캐시
+# ==============================================
+
+class TranslationCache:
+    """
+    번역 결과 key-value 캐시 (SQLite 파일)
+
+    key는 translation_key()의 해시. 배치 결과는 put_many 한 번에
+    하나의 트랜잭션으로 저장되므로, 중간에 중단돼도 커밋된 배치까지는 남고
+    절반만 쓰인 배치는 없다.
+    """
+
+    def __init__(self, path: Path = TRANSLATION_CACHE_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.path))
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS translations ("
+            "key TEXT PRIMARY KEY, backend TEXT, source_text TEXT, translated TEXT, created_at REAL)"
+        )
+        self.conn.commit()
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, str]:
+        """있는 key만 {key: 번역} 으로 반환"""
+        found = {}
+        keys = list(keys)
+        for i in range(0, len(keys), 900):  # SQLite 변수 개수 제한
+            chunk = keys[i:i + 900]
+            rows = self.conn.execute(
+                f"SELECT key, translated FROM translations WHERE key IN ({','.join('?' * len(chunk))})",
+                chunk
+            )
+            found.update(rows.fetchall())
+        return found
+
+    def put_many(self, rows: Iterable[Tuple[str, str, str, str]]) -> None:
+        """(key, backend, 원문, 번역) 여러 건을 한 트랜잭션으로 저장"""
+        now = time.time()
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO translations VALUES (?, ?, ?, ?, ?)",
+                [(key, backend, text, translated, now) for key, backend, text, translated in rows]
+            )
+
+    def __len__(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def normalize_text(text: str) -> str:
+    """중복 판정용 정규화 (유니코드 NFC, 앞뒤 공백 제거, 연속 공백 1개로)"""
+    return re.sub(r"\s+", " ", unicodedata.normalize('NFC', str(text))).strip()
+
+
+def translation_key(text: str, backend: TranslationBackend) -> str:
+    """정규화된 원문 + 백엔드/언어쌍 해시"""
+    payload = f"{backend.name}|{backend.source}|{backend.target}|{normalize_text(text)}"
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+def import_translations(cache: TranslationCache,
+                        backend: TranslationBackend,
+                        pairs: Iterable[Tuple[str, str]]) -> int:
+    """
+    기존 번역 결과(원문, 번역)를 캐시에 등록 (예: data/review_ko/*.csv)
+
+    Returns:
+    --------
+    int
+        등록한 건수
+    """
+    rows = [
+        (translation_key(text, backend), backend.name, normalize_text(text), translated)
+        for text, translated in pairs
+        if pd.notna(text) and pd.notna(translated) and normalize_text(text)
+    ]
+    cache.put_many(rows)
+    return len(rows)
+
+
+# ==============================================
+# 번역 실행
+# ==============================================
+
+def translate_texts(texts: Sequence[Optional[str]],
+                    backend: TranslationBackend,
+                    cache: Optional[TranslationCache] = None,
+                    batch_size: Optional[int] = None,
+                    max_concurrency: int = 4,
+                    verbose: bool = True) -> Tuple[List[Optional[str]], Dict]:
+    """
+    텍스트 목록 번역 (중복 제거 + 캐시 + 배치 + 동시 요청 제한)
+
+    1. 정규화한 원문 해시로 중복을 제거하고, 캐시에 있는 것은 건너뛴다.
+    2. 남은 고유 텍스트를 batch_size씩 묶어 최대 max_concurrency개 배치를
+       동시에 요청한다.
+    3. 배치가 끝날 때마다 결과를 캐시에 커밋(checkpoint)하므로, 중단 후 다시
+       실행하면 커밋된 텍스트는 다시 번역하지 않는다.
+
+    Parameters:
+    -----------
+    texts : Sequence[str]
+        원문 목록 (결측/빈 문자열은 None으로 반환)
+    backend : TranslationBackend
+        번역 백엔드
+    cache : TranslationCache
+        영구 캐시 (None이면 이번 실행 안에서만 중복 제거)
+    batch_size : int
+        배치 크기 (None이면 backend.max_batch_size)
+    max_concurrency : int
+        동시에 보낼 배치 수
+    verbose : bool
+        진행 상황/처리량 출력 여부
+
+    Returns:
+    --------
+    Tuple[List[str], Dict]
+        (입력 순서대로의 번역 결과, 통계: total, unique, cached, translated,
+         batches, elapsed, texts_per_sec)
+    """
+    start = time.perf_counter()
+    batch_size = batch_size or backend.max_batch_size
+
+    # 1. 정규화 + 중복 제거
+    keys: List[Optional[str]] = []
+    unique_texts: Dict[str, str] = {}
+    for text in texts:
+        if text is None or pd.isna(text) or not normalize_text(text):
+            keys.append(None)
+            continue
+        key = translation_key(text, backend)
+        keys.append(key)
+        unique_texts.setdefault(key, normalize_text(text))
+
+    results = cache.get_many(list(unique_texts)) if cache is not None else {}
+    n_cached = len(results)
+    pending = [key for key in unique_texts if key not in results]
+    batches = [pending[i:i + batch_size] for i in range(0, len(pending), batch_size)]
+
+    if verbose:
+        print(f"🌐 번역 ({backend!r})")
+        print(f"   전체 {len(texts):,d}건 / 고유 {len(unique_texts):,d}건 / "
+              f"캐시 {n_cached:,d}건 / 번역 대상 {len(pending):,d}건 ({len(batches):,d}배치)")
+
+    # 2. 배치 동시 요청 (캐시 쓰기는 메인 스레드에서만)
+    translate_start = time.perf_counter()
+    done = 0
+    errors: List[Exception] = []
+    if batches:
+        with ThreadPoolExecutor(max_workers=max(1, max_concurrency)) as executor:
+            futures = {
+                executor.submit(backend.translate_batch, [unique_texts[k] for k in batch]): batch
+                for batch in batches
+            }
+            for future in as_completed(futures):
+                batch = futures[future]
+                try:
+                    translated = future.result()
+                    if len(translated) != len(batch):
+                        raise ValueError(f"백엔드 결과 개수 불일치: {len(translated)} != {len(batch)}")
+                except Exception as e:
+                    # 실패한 배치만 건너뛰고 나머지 배치는 계속 저장 → 재실행 시 실패분만 번역
+                    errors.append(e)
+                    continue
+
+                results.update(zip(batch, translated))
+                if cache is not None:
+                    cache.put_many(
+                        (key, backend.name, unique_texts[key], value)
+                        for key, value in zip(batch, translated)
+                    )
+                # 진행률 10% 단위 출력
+                step = max(len(pending) // 10, 1)
+                if verbose and len(batches) > 1 and (done + len(batch)) // step > done // step:
+                    print(f"   ... {done + len(batch):,d}/{len(pending):,d}")
+                done += len(batch)
+
+    if errors:
+        print(f"❌ 실패한 배치 {len(errors):,d}개 (완료된 {done:,d}건은 캐시에 저장됨)")
+        raise errors[0]
+
+    translate_elapsed = time.perf_counter() - translate_start
+    elapsed = time.perf_counter() - start
+
+    stats = {
+        'total': len(texts),
+        'unique': len(unique_texts),
+        'cached': n_cached,
+        'translated': len(pending),
+        'batches': len(batches),
+        'elapsed': elapsed,
+        'texts_per_sec': len(pending) / translate_elapsed if translate_elapsed > 0 and pending else 0.0,
+    }
+
+    if verbose:
+        print(f"✅ 번역 완료: {elapsed:.2f}초 "
+              f"(백엔드 처리량 {stats['texts_per_sec']:,.1f}건/초, "
+              f"입력 기준 {len(texts) / elapsed if elapsed > 0 else 0:,.1f}건/초)\n")
+
+    return [results.get(key) if key is not None else None for key in keys], stats
+
+
+def translate_column(df: pd.DataFrame,
+                     column: str,
+                     backend: TranslationBackend,
+                     cache: Optional[TranslationCache] = None,
+                     **kwargs) -> pd.Series:
+    """
+    DataFrame 컬럼 번역 (df와 같은 index의 Series 반환)
+
+    kwargs는 translate_texts로 전달된다.
+    """
+    translated, _ = translate_texts(df[column].tolist(), backend, cache=cache, **kwargs)
+    return pd.Series(translated, index=df.index, name=f"{column}_ko")
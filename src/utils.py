@@ -5,35 +5,52 @@
 
 import pandas as pd
 import numpy as np
-from typing import List, Dict, Tuple
-import matplotlib.pyplot as plt
-import platform
-import warnings
-warnings.filterwarnings('ignore')
+from typing import List, Dict, Optional, Tuple, Union
+from src.instrument import instrumented
+from src.profiling import profile_table
 
 
-
-def set_korean_font():
+def korean_font_rc() -> Dict:
     """
-    시각화 한글 깨짐 방지를 위한 폰트 설정
+    한글 폰트 matplotlib rc 설정값 (전역 상태는 바꾸지 않음)
     Windows: Malgun Gothic, Mac: AppleGothic
+
+    보고서처럼 전역 설정을 건드리면 안 되는 곳에서는 matplotlib.rc_context(korean_font_rc())로 사용
     """
+    import platform
+
+    rc = {'axes.unicode_minus': False}   # 마이너스 기호 깨짐 방지
     system_os = platform.system()
-    
     if system_os == 'Windows':
-        plt.rc('font', family='Malgun Gothic')
+        rc['font.family'] = 'Malgun Gothic'
     elif system_os == 'Darwin': # Mac
-        plt.rc('font', family='AppleGothic')
-    
-    # 마이너스 기호 깨짐 방지
-    plt.rc('axes', unicode_minus=False)
-    
-    print(f"✅ 한글 폰트 설정 완료 ({system_os})")
+        rc['font.family'] = 'AppleGothic'
+    return rc
+
+
+@instrumented
+def set_korean_font():
+    """
+    시각화 한글 깨짐 방지를 위한 폰트 설정 (노트북용, matplotlib 전역 설정 변경)
+    Windows: Malgun Gothic, Mac: AppleGothic
+
+    matplotlib은 여기서 처음 import (src.utils import만으로는 불러오지 않음)
+    노트북 출력용으로 경고도 여기서 끈다 (모듈 import 시 전역으로 끄지 않음)
+    """
+    import platform
+    import warnings
+    import matplotlib.pyplot as plt
+
+    warnings.filterwarnings('ignore')
+    plt.rcParams.update(korean_font_rc())
+
+    print(f"✅ 한글 폰트 설정 완료 ({platform.system()})")
 
 
+@instrumented
 def check_data_quality(df: pd.DataFrame, name: str = "DataFrame") -> Dict:
     """
-    데이터 품질 체크
+    데이터 품질 체크 (src.profiling.profile_table 결과를 dict로 정리)
     
     Parameters:
     -----------
@@ -48,28 +65,29 @@ def check_data_quality(df: pd.DataFrame, name: str = "DataFrame") -> Dict:
         품질 체크 결과
     """
     
+    profile = profile_table(df, name)
+    stats = profile['column_stats']
+    
     quality_report = {
         'name': name,
-        'total_rows': len(df),
-        'total_columns': len(df.columns),
-        'duplicates': df.duplicated().sum(),
+        'total_rows': profile['rows'],
+        'total_columns': profile['columns'],
+        'duplicates': profile['duplicates'],
         'missing_values': {},
         'data_types': df.dtypes.to_dict()
     }
     
     # 결측치 확인
-    for col in df.columns:
-        missing_count = df[col].isnull().sum()
-        if missing_count > 0:
-            missing_pct = (missing_count / len(df)) * 100
-            quality_report['missing_values'][col] = {
-                'count': missing_count,
-                'percentage': round(missing_pct, 2)
-            }
+    for col, row in stats[stats['nulls'] > 0].iterrows():
+        quality_report['missing_values'][col] = {
+            'count': int(row['nulls']),
+            'percentage': float(row['null_pct'])
+        }
     
     return quality_report
 
 
+@instrumented
 def print_quality_report(quality_report: Dict) -> None:
     """
     데이터 품질 리포트 출력
@@ -98,6 +116,7 @@ def print_quality_report(quality_report: Dict) -> None:
     print()
 
 
+@instrumented
 def detect_outliers_iqr(df: pd.DataFrame, column: str, factor: float = 1.5) -> pd.Series:
     """
     IQR 방법으로 이상치 탐지
@@ -129,6 +148,7 @@ def detect_outliers_iqr(df: pd.DataFrame, column: str, factor: float = 1.5) -> p
     return outliers
 
 
+@instrumented
 def calculate_summary_stats(df: pd.DataFrame, column: str) -> Dict:
     """
     기술 통계량 계산
@@ -160,7 +180,254 @@ def calculate_summary_stats(df: pd.DataFrame, column: str) -> Dict:
     return stats
 
 
-def convert_to_datetime(df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+SUMMARY_QUANTILES = {0.25: '25%', 0.5: 'median', 0.75: '75%'}
+
+
+@instrumented
+def calculate_summary_stats_batch(df: pd.DataFrame,
+                                  columns: List[str],
+                                  groupby: Optional[Union[str, List[str]]] = None,
+                                  factor: float = 1.5) -> pd.DataFrame:
+    """
+    여러 컬럼(및 그룹)의 기술 통계량을 한 번에 계산
+    
+    calculate_summary_stats를 컬럼/그룹마다 반복 호출하는 대신,
+    분위수 3개(25%, median, 75%)를 컬럼(그룹)당 한 번의 quantile 호출로 구한다.
+    groupby를 주면 그룹 단위 통계를 하나의 groupby 연산으로 계산한다.
+    
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        데이터프레임
+    columns : List[str]
+        통계를 낼 수치형 컬럼 리스트
+    groupby : str or List[str]
+        그룹 기준 컬럼 (예: 'product_category_name', 'seller_state'). None이면 전체
+    factor : float
+        IQR 경계 계산용 배수 (기본 1.5)
+        
+    Returns:
+    --------
+    pd.DataFrame
+        tidy 통계 프레임 - 행: (그룹 컬럼..., column)
+        컬럼: count, mean, std, min, 25%, median, 75%, max, iqr, lower_bound, upper_bound
+    """
+    
+    columns = list(columns)
+    stat_funcs = ['count', 'mean', 'std', 'min', 'max']
+    
+    if groupby is None:
+        data = df[columns]
+        quantiles = data.quantile(list(SUMMARY_QUANTILES)).rename(index=SUMMARY_QUANTILES)
+        stats = pd.concat([data.agg(stat_funcs), quantiles]).T
+        stats = stats.rename_axis('column').reset_index()
+    else:
+        grouped = df.groupby(groupby, observed=True, sort=True)[columns]
+        agg = grouped.agg(stat_funcs)
+        quantiles = grouped.quantile(list(SUMMARY_QUANTILES)).unstack(-1)
+        
+        frames = []
+        for col in columns:
+            part = agg[col].copy()
+            for q, label in SUMMARY_QUANTILES.items():
+                part[label] = quantiles[(col, q)]
+            part.insert(0, 'column', col)
+            frames.append(part)
+        stats = pd.concat(frames).reset_index()
+    
+    stats = stats[[c for c in stats.columns if c not in stat_funcs + list(SUMMARY_QUANTILES.values())]
+                  + ['count', 'mean', 'std', 'min', '25%', 'median', '75%', 'max']]
+    stats['count'] = stats['count'].astype('int64')
+    stats['iqr'] = stats['75%'] - stats['25%']
+    stats['lower_bound'] = stats['25%'] - factor * stats['iqr']
+    stats['upper_bound'] = stats['75%'] + factor * stats['iqr']
+    
+    return stats
+
+
+@instrumented
+def detect_outliers_iqr_batch(df: pd.DataFrame,
+                              columns: List[str],
+                              groupby: Optional[Union[str, List[str]]] = None,
+                              factor: float = 1.5) -> pd.DataFrame:
+    """
+    여러 컬럼의 IQR 이상치를 한 번에 탐지 (그룹별 경계 지원)
+    
+    calculate_summary_stats_batch로 (그룹, 컬럼)별 경계를 한 번에 구한 뒤,
+    각 행의 그룹 번호로 경계 배열을 인덱싱해서 비교한다 (그룹별 Python 루프 없음).
+    그룹 키가 결측인 행은 이상치가 아닌 것(False)으로 처리한다.
+    
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        데이터프레임
+    columns : List[str]
+        체크할 컬럼 리스트
+    groupby : str or List[str]
+        그룹 기준 컬럼 (None이면 전체 기준 경계)
+    factor : float
+        IQR 배수 (기본 1.5)
+        
+    Returns:
+    --------
+    pd.DataFrame
+        df와 같은 index, columns별 이상치 여부 (True/False)
+    """
+    
+    columns = list(columns)
+    stats = calculate_summary_stats_batch(df, columns, groupby=groupby, factor=factor)
+    mask = pd.DataFrame(index=df.index)
+    
+    if groupby is None:
+        bounds = stats.set_index('column')
+        for col in columns:
+            values = df[col]
+            mask[col] = (values < bounds.at[col, 'lower_bound']) | (values > bounds.at[col, 'upper_bound'])
+        return mask
+    
+    # 행별 그룹 번호 (결측 그룹은 -1 → 맨 끝의 NaN 경계를 가리키게 함)
+    group_codes = df.groupby(groupby, observed=True, sort=True).ngroup().fillna(-1).to_numpy(dtype='int64')
+    
+    for col in columns:
+        col_stats = stats[stats['column'] == col]
+        lower = np.append(col_stats['lower_bound'].to_numpy(dtype='float64'), np.nan)[group_codes]
+        upper = np.append(col_stats['upper_bound'].to_numpy(dtype='float64'), np.nan)[group_codes]
+        values = df[col].to_numpy(dtype='float64', na_value=np.nan)
+        mask[col] = (values < lower) | (values > upper)
+    
+    return mask
+
+
+@instrumented
+def calculate_boxplot_stats(df: pd.DataFrame,
+                            columns: List[str],
+                            factor: float = 1.5,
+                            max_fliers: int = 200) -> List[Dict]:
+    """
+    Boxplot용 요약 통계 (matplotlib Axes.bxp 입력 형식)
+    
+    분위수/IQR 경계는 calculate_summary_stats_batch로 한 번에 구하고,
+    수염(whisker)은 경계 안쪽의 최소/최대값으로 정한다. 이상치 점은 고유값 기준
+    최대 max_fliers개만 (양 끝 포함, 균등 간격으로) 남겨서 그림 크기를 제한한다.
+    
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        데이터프레임
+    columns : List[str]
+        수치형 컬럼 리스트
+    factor : float
+        IQR 배수 (기본 1.5, seaborn/matplotlib 기본값과 동일)
+    max_fliers : int
+        컬럼당 표시할 이상치 점 최대 개수
+    
+    Returns:
+    --------
+    List[Dict]
+        컬럼별 {label, med, q1, q3, whislo, whishi, fliers, count}
+    """
+    
+    stats = calculate_summary_stats_batch(df, columns, factor=factor).set_index('column')
+    boxes = []
+    
+    for col in columns:
+        values = df[col].to_numpy(dtype='float64', na_value=np.nan)
+        values = values[~np.isnan(values)]
+        row = stats.loc[col]
+    
+        inside = (values >= row['lower_bound']) & (values <= row['upper_bound'])
+        fliers = np.unique(values[~inside])
+        if len(fliers) > max_fliers:
+            fliers = fliers[np.linspace(0, len(fliers) - 1, max_fliers).round().astype(int)]
+    
+        boxes.append({
+            'label': col,
+            'med': row['median'],
+            'q1': row['25%'],
+            'q3': row['75%'],
+            'whislo': values[inside].min() if inside.any() else row['25%'],
+            'whishi': values[inside].max() if inside.any() else row['75%'],
+            'fliers': fliers,
+            'count': int(row['count']),
+        })
+    
+    return boxes
+
+
+# Olist CSV 타임스탬프 포맷 (앞에서부터 순서대로 시도)
+OLIST_DATETIME_FORMATS = ['%Y-%m-%d %H:%M:%S', '%Y-%m-%d']
+
+# 고유값 1회 파싱 여부를 판단할 표본 크기 / 고유값 비율 기준
+DEDUP_SAMPLE_SIZE = 2000
+DEDUP_MAX_UNIQUE_RATIO = 0.5
+
+
+def _parse_with_formats(values: pd.Series, formats: List[str]) -> pd.Series:
+    """formats를 순서대로 적용해서 파싱 (앞 포맷에서 실패한 값만 다음 포맷으로 재시도)"""
+    parsed = pd.to_datetime(values, format=formats[0], errors='coerce', cache=False)
+    for fmt in formats[1:]:
+        failed = (parsed.isna() & values.notna()).to_numpy()
+        if not failed.any():
+            break
+        parsed[failed] = pd.to_datetime(values[failed], format=fmt, errors='coerce',
+                                        cache=False).to_numpy()
+    return parsed
+
+
+@instrumented
+def parse_olist_datetime(series: pd.Series,
+                         formats: Optional[List[str]] = None) -> Tuple[pd.Series, int]:
+    """
+    Olist 타임스탬프 문자열을 고정 포맷으로 빠르게 파싱
+    
+    포맷 추론 없이 formats를 순서대로 적용하고, 어느 포맷으로도 읽히지 않는 값은
+    NaT가 된다. 예정 배송일/리뷰 생성일처럼 같은 문자열이 많이 반복되는 컬럼은
+    (앞부분 표본의 고유값 비율로 판단) 고유 문자열만 한 번씩 파싱한 뒤
+    정수 코드로 원래 위치에 펼친다.
+    
+    Parameters:
+    -----------
+    series : pd.Series
+        타임스탬프 문자열 시리즈
+    formats : List[str]
+        시도할 strftime 포맷 (None이면 OLIST_DATETIME_FORMATS)
+        
+    Returns:
+    --------
+    Tuple[pd.Series, int]
+        (datetime64 시리즈, 결측이 아니었는데 NaT로 바뀐 값 개수)
+    """
+    
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return series, 0
+    
+    formats = OLIST_DATETIME_FORMATS if formats is None else formats
+    sample = series.iloc[:DEDUP_SAMPLE_SIZE]
+    dedup = len(sample) > 0 and sample.nunique() <= DEDUP_MAX_UNIQUE_RATIO * len(sample)
+    
+    if dedup:
+        codes, uniques = pd.factorize(series)
+        parsed = _parse_with_formats(pd.Series(uniques, dtype=object), formats)
+        result = pd.Series(
+            pd.DatetimeIndex(parsed).take(codes, allow_fill=True, fill_value=pd.NaT),
+            index=series.index,
+            name=series.name
+        )
+    else:
+        result = _parse_with_formats(series, formats)
+    
+    coerced = int((result.isna() & series.notna()).sum())
+    
+    return result, coerced
+
+
+@instrumented
+def convert_to_datetime(df: pd.DataFrame,
+                        columns: List[str],
+                        fast: bool = False,
+                        inplace: bool = False,
+                        verbose: bool = True,
+                        return_report: bool = False) -> Union[pd.DataFrame, Tuple[pd.DataFrame, Dict[str, int]]]:
     """
     컬럼들을 datetime 타입으로 변환
     
@@ -170,23 +437,53 @@ def convert_to_datetime(df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
         데이터프레임
     columns : List[str]
         변환할 컬럼 리스트
+    fast : bool
+        True면 Olist 고정 포맷 + 고유 문자열 1회 파싱 (parse_olist_datetime).
+        원본 프레임 전체를 복사하지 않고 변환된 컬럼만 새로 만든다
+    inplace : bool
+        True면 전달받은 df의 컬럼을 직접 교체
+    verbose : bool
+        컬럼별 변환 결과 출력 여부
+    return_report : bool
+        True면 (df, {컬럼: NaT로 바뀐 값 개수}) 튜플 반환
         
     Returns:
     --------
-    pd.DataFrame
-        변환된 데이터프레임
+    pd.DataFrame 또는 Tuple[pd.DataFrame, Dict[str, int]]
+        return_report=False: 변환된 데이터프레임
+        return_report=True: (변환된 데이터프레임, {컬럼: NaT로 바뀐 값 개수})
     """
     
-    df = df.copy()
+    if inplace:
+        pass
+    elif fast:
+        # 컬럼 교체만 하므로 얕은 복사로 충분 (원본 df는 바뀌지 않음)
+        df = df.copy(deep=False)
+    else:
+        df = df.copy()
+    
+    report = {}
     
     for col in columns:
         if col in df.columns:
-            df[col] = pd.to_datetime(df[col], errors='coerce')
-            print(f"✅ {col} → datetime 변환 완료")
-    
+            original = df[col]
+            if fast:
+                df[col], coerced = parse_olist_datetime(original)
+            else:
+                df[col] = pd.to_datetime(original, errors='coerce')
+                coerced = int((df[col].isna() & original.notna()).sum())
+            report[col] = coerced
+            
+            if verbose:
+                suffix = f" (NaT 변환 {coerced:,d}건)" if coerced else ""
+                print(f"✅ {col} → datetime 변환 완료{suffix}")
+    
+    if return_report:
+        return df, report
     return df
 
 
+@instrumented
 def calculate_time_diff(df: pd.DataFrame, 
                         start_col: str, 
                         end_col: str, 
@@ -233,6 +530,114 @@ def calculate_time_diff(df: pd.DataFrame,
     return df
 
 
+# 배송 분석 파생변수 정의: (시작 컬럼, 종료 컬럼, 단위, 새 컬럼명)
+DELIVERY_METRIC_SPECS = [
+    # 총 배송 시간 (주문 ~ 수령)
+    ('order_purchase_timestamp', 'order_delivered_customer_date', 'days', 'total_delivery_time'),
+    # 판매자 준비 시간 (승인 ~ 물류사 인계)
+    ('order_approved_at', 'order_delivered_carrier_date', 'days', 'seller_prep_time'),
+    # 순수 운송 시간 (물류사 인계 ~ 수령)
+    ('order_delivered_carrier_date', 'order_delivered_customer_date', 'days', 'pure_shipping_time'),
+    # 배송 정확도 (예정일 - 실제수령일) : 양수면 조기, 음수는 지연
+    ('order_delivered_customer_date', 'order_estimated_delivery_date', 'days', 'delivery_accuracy'),
+    # 심리적 예상 대기 시간 (예정일 - 주문일)
+    ('order_purchase_timestamp', 'order_estimated_delivery_date', 'days', 'estimated_wait_time'),
+    # 지연 여부 (실제수령일이 예정일보다 늦으면 1)
+    ('order_estimated_delivery_date', 'order_delivered_customer_date', 'flag', 'is_delayed'),
+]
+
+# 음수가 나올 수 없는 파생변수 (음수면 논리적 오류)
+NONNEGATIVE_DELIVERY_METRICS = ['total_delivery_time', 'seller_prep_time', 'pure_shipping_time']
+
+_NS_PER_UNIT = {
+    'days': 86_400 * 10**9,
+    'hours': 3_600 * 10**9,
+    'minutes': 60 * 10**9,
+}
+
+
+@instrumented
+def calculate_time_diffs(df: pd.DataFrame,
+                         specs: Optional[List[Tuple[str, str, str, str]]] = None,
+                         nonnegative: Optional[List[str]] = None,
+                         error_col: str = 'is_logical_error') -> pd.DataFrame:
+    """
+    여러 시간 차이 파생변수를 한 번에 계산 (calculate_time_diff 반복 호출 대체)
+    
+    각 날짜 컬럼을 한 번만 int64 나노초 배열로 꺼낸 뒤 numpy 연산으로 모든 차이를
+    계산한다. 입력 프레임은 복사하지 않고, 파생 컬럼만 담은 새 프레임을 반환하므로
+    orders.join(result)로 붙이면 된다. 문자열 컬럼은 parse_olist_datetime으로 변환한다.
+    
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        날짜 컬럼이 있는 데이터프레임 (예: orders)
+    specs : List[Tuple[str, str, str, str]]
+        (시작 컬럼, 종료 컬럼, 단위, 새 컬럼명) 리스트. None이면 DELIVERY_METRIC_SPECS
+        단위: 'days' (.dt.days와 동일하게 내림), 'hours', 'minutes',
+              'flag' (종료가 시작보다 늦으면 1, 아니거나 결측이면 0)
+    nonnegative : List[str]
+        음수면 논리적 오류로 볼 파생 컬럼 (None이면 specs가 기본값일 때
+        NONNEGATIVE_DELIVERY_METRICS, 아니면 오류 마스크를 만들지 않음)
+    error_col : str
+        논리적 오류 마스크 컬럼명
+        
+    Returns:
+    --------
+    pd.DataFrame
+        df와 같은 index의 파생 컬럼 프레임 (+ error_col: 음수 시간 여부)
+    """
+    
+    if specs is None:
+        specs = DELIVERY_METRIC_SPECS
+        if nonnegative is None:
+            nonnegative = NONNEGATIVE_DELIVERY_METRICS
+    
+    # 날짜 컬럼별 나노초 배열 (여러 spec에서 재사용)
+    ns_arrays = {}
+    
+    def as_ns(col: str) -> np.ndarray:
+        if col not in ns_arrays:
+            series = df[col]
+            if not pd.api.types.is_datetime64_any_dtype(series):
+                series, _ = parse_olist_datetime(series)
+            if getattr(series.dt, 'tz', None) is not None:
+                series = series.dt.tz_convert(None)
+            ns_arrays[col] = series.to_numpy(dtype='datetime64[ns]').view('int64')
+        return ns_arrays[col]
+    
+    nat = np.iinfo(np.int64).min
+    result = {}
+    
+    for start_col, end_col, unit, new_col_name in specs:
+        start = as_ns(start_col)
+        end = as_ns(end_col)
+        valid = (start != nat) & (end != nat)
+        diff = end - start
+        
+        if unit == 'flag':
+            result[new_col_name] = (valid & (diff > 0)).astype('int64')
+        elif unit == 'days':
+            days = np.floor_divide(diff, _NS_PER_UNIT['days'])
+            if valid.all():
+                result[new_col_name] = days
+            else:
+                result[new_col_name] = np.where(valid, days, np.nan)
+        elif unit in _NS_PER_UNIT:
+            result[new_col_name] = np.where(valid, diff / _NS_PER_UNIT[unit], np.nan)
+        else:
+            raise ValueError(f"지원하지 않는 단위: {unit}")
+    
+    metrics = pd.DataFrame(result, index=df.index)
+    
+    if nonnegative:
+        # NaN은 오류로 보지 않음 (NaN < 0 은 False)
+        metrics[error_col] = (metrics[list(nonnegative)] < 0).any(axis=1)
+    
+    return metrics
+
+
+@instrumented
 def categorize_numeric(series: pd.Series, 
                        bins: List[float], 
                        labels: List[str] = None) -> pd.Series:
@@ -260,6 +665,7 @@ def categorize_numeric(series: pd.Series,
     return pd.cut(series, bins=bins, labels=labels, include_lowest=True)
 
 
+@instrumented
 def get_top_n(df: pd.DataFrame, 
               column: str, 
               n: int = 10, 
@@ -287,6 +693,7 @@ def get_top_n(df: pd.DataFrame,
     return df.nlargest(n, column) if not ascending else df.nsmallest(n, column)
 
 
+@instrumented
 def safe_divide(numerator: pd.Series, denominator: pd.Series, fill_value: float = 0) -> pd.Series:
     """
     0으로 나누기 안전하게 처리
@@ -313,6 +720,7 @@ def safe_divide(numerator: pd.Series, denominator: pd.Series, fill_value: float
     return result
 
 
+@instrumented
 def percentage(part: float, total: float, decimals: int = 2) -> float:
     """
     퍼센트 계산